@@ -0,0 +1,344 @@
+#!/usr/bin/env python3
+"""Benchmark _replace_strings.py on synthetic corpora and on the frontend tree
+
+Synthetic corpora are generated JS files of a given size in lines, where a
+tunable fraction of the lines (--density) are alert( / confirm( /
+.innerHTML = sites, mixed in the proportions of --mix. --hit-ratio of the
+sites are copies of rule patterns or template examples; the rest are sites
+no rule covers. The real frontend/*.js tree is measured as well.
+
+Every corpus is run through two engines:
+  engine  the rule set as _replace_strings.py applies it: one Scanner pass
+          per stage, then one join
+  chain   the rules applied one after another with str.replace(), as the
+          script originally did ('old in text' counted as the match)
+Both produce the same output, which is checked through its hash.
+
+Each measurement runs in a fresh process, so its peak RSS is its own, and
+reports throughput and the time per phase: read, match, rewrite, templates,
+lex (with --lex) and write. Outputs go to a scratch directory, never over
+the corpus. Results are appended to --output as one JSON line per
+measurement, tagged with the engine version and the rule fingerprint, so
+runs before and after a change can be compared.
+
+Usage:
+    python _bench_replace.py                          # 10k, 100k and 1M lines + frontend/*.js
+    python _bench_replace.py --lines 50000 --density 0.2 --mix alert=1,confirm=1,innerhtml=4
+    python _bench_replace.py --no-real --engines engine --repeat 5 -o bench.jsonl
+"""
+
+import argparse
+import hashlib
+import multiprocessing
+import os
+import platform
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timezone
+
+import _js_lexer as lexer
+import _replace_strings as rs
+
+DEFAULT_OUTPUT = os.path.join(rs.SCRIPT_DIR, '.replace_bench.jsonl')
+ENGINES = ('engine', 'chain')
+PHASES = ('read', 'match', 'rewrite', 'templates', 'lex', 'write')
+SITE_KINDS = ('alert', 'confirm', 'innerhtml')
+
+# Lines between the sites; {n} is the line number, for some variety
+FILLER = [
+    "    const value{n} = computeValue(input, options);",
+    "    if (!project || !project.id) {{ return; }}",
+    "    // Keep the list sorted by floor before rendering",
+    "    element{n}.classList.toggle('active', isActive);",
+    "    fetch(`${{API_BASE}}/projects/${{projectId}}/walls/{n}`, {{ method: 'GET' }});",
+    "    }}",
+    "",
+    "    console.log('Loaded item', {n});",
+    "    const label = document.querySelector('#wall-{n} .label');",
+    "    return walls.filter(wall => wall.floor === floor);",
+]
+
+# Sites the rule templates cover, and sites nothing covers
+TEMPLATE_SITES = {
+    'alert': ["alert('Error saving wall: ' + error.message);",
+              "alert('Error loading project data: ' + err.message);"],
+    'confirm': [],
+    'innerhtml': ["summary.innerHTML = `<i class=\"fas fa-th-large\"></i> ${{count}} wall${{count !== 1 ? 's' : ''}} added`;"],
+}
+UNCOVERED_SITES = {
+    'alert': ["alert('Message {n} that no rule covers yet.');"],
+    'confirm': ["confirm('Discard draft {n}?')"],
+    'innerhtml': ["status{n}.innerHTML = '<i class=\"fas fa-info\"></i> Status {n}';"],
+}
+
+
+def site_kind(pattern):
+    """'alert', 'confirm' or 'innerhtml' for a rule pattern, by the site it holds."""
+    if '.innerHTML' in pattern:
+        return 'innerhtml'
+    return 'confirm' if 'confirm(' in pattern else 'alert'
+
+
+def parse_mix(text):
+    """'alert=3,confirm=1' -> {'alert': 3.0, 'confirm': 1.0, 'innerhtml': 0.0}"""
+    mix = dict.fromkeys(SITE_KINDS, 0.0)
+    for item in text.split(','):
+        kind, _, weight = item.partition('=')
+        kind = kind.strip().lower()
+        if kind not in mix:
+            raise argparse.ArgumentTypeError(f"unknown site kind '{kind}' (expected {', '.join(SITE_KINDS)})")
+        try:
+            mix[kind] = float(weight)
+        except ValueError:
+            raise argparse.ArgumentTypeError(f"bad weight for {kind}: '{weight}'") from None
+    if not any(mix.values()):
+        raise argparse.ArgumentTypeError('at least one site kind needs a positive weight')
+    return mix
+
+
+def make_corpus(directory, rules, lines, density, mix, hit_ratio, seed, file_lines):
+    """Write a synthetic corpus of `lines` lines into `directory`.
+
+    Returns (description, paths): the file, line, byte and per-kind site
+    counts plus the parameters it was generated from, and the files written.
+    """
+    rng = random.Random(seed)
+    # (text, whether it is an example taking {n}); rule patterns are used verbatim
+    covered = {kind: [] for kind in SITE_KINDS}
+    for old, _ in rules:
+        covered[site_kind(old)].append((old, False))
+    for kind, examples in TEMPLATE_SITES.items():
+        covered[kind].extend((example, True) for example in examples)
+    uncovered = {kind: [(example, True) for example in examples] for kind, examples in UNCOVERED_SITES.items()}
+    kinds = [kind for kind in SITE_KINDS if mix[kind] > 0 and covered[kind]]
+    weights = [mix[kind] for kind in kinds]
+
+    sites = dict.fromkeys(SITE_KINDS, 0)
+    paths = []
+    size = 0
+    for first in range(0, lines, file_lines):
+        out = []
+        for n in range(first, min(first + file_lines, lines)):
+            if rng.random() >= density:
+                out.append(rng.choice(FILLER).format(n=n))
+                continue
+            kind = rng.choices(kinds, weights)[0]
+            site, example = rng.choice(covered[kind] if rng.random() < hit_ratio else uncovered[kind])
+            sites[kind] += 1
+            out.append('    ' + (site.format(n=n) if example else site))
+        path = os.path.join(directory, f'corpus-{len(paths):04d}.js')
+        data = ('\n'.join(out) + '\n').encode('utf-8')
+        with open(path, 'wb') as f:
+            f.write(data)
+        paths.append(path)
+        size += len(data)
+    return {'name': f'synthetic-{lines}', 'files': len(paths), 'lines': lines, 'bytes': size,
+            'sites': sites, 'density': density, 'mix': mix, 'hit_ratio': hit_ratio, 'seed': seed}, paths
+
+
+def real_corpus(directory):
+    """(description, paths) for the *.js files of `directory`."""
+    paths = rs.expand_targets([directory])
+    lines = 0
+    size = 0
+    for path in paths:
+        with open(path, 'rb') as f:
+            data = f.read()
+        lines += data.count(b'\n')
+        size += len(data)
+    return {'name': os.path.basename(os.path.normpath(directory)), 'files': len(paths), 'lines': lines,
+            'bytes': size}, paths
+
+
+# ============================================================
+# Measurement
+# ============================================================
+def _run_engine(ruleset, text, phases):
+    for stage in ruleset.stages:
+        started = time.perf_counter()
+        if stage is ruleset.template_stage:
+            text = stage.apply(text)
+            phases['templates'] += time.perf_counter() - started
+            continue
+        _, starts, chosen = stage.match(text)
+        matched = time.perf_counter()
+        text = stage.assemble(text, starts, chosen)
+        phases['match'] += matched - started
+        phases['rewrite'] += time.perf_counter() - matched
+    return text
+
+
+def _run_chain(ruleset, text, phases):
+    for old, new in ruleset.rules:
+        started = time.perf_counter()
+        found = old in text
+        matched = time.perf_counter()
+        phases['match'] += matched - started
+        if found:
+            text = text.replace(old, new)
+            phases['rewrite'] += time.perf_counter() - matched
+    if ruleset.template_stage:
+        started = time.perf_counter()
+        text = ruleset.template_stage.apply(text)
+        phases['templates'] += time.perf_counter() - started
+    return text
+
+
+_RUNNERS = {'engine': _run_engine, 'chain': _run_chain}
+
+
+def _pass(ruleset, runner, paths, output_dir):
+    """Rewrite every path into `output_dir` once; return (phases, output digest)."""
+    phases = dict.fromkeys(PHASES, 0.0)
+    digest = hashlib.sha256()
+    for path in paths:
+        started = time.perf_counter()
+        with open(path, 'rb') as f:
+            text = f.read().decode('utf-8')
+        phases['read'] += time.perf_counter() - started
+
+        text = runner(ruleset, text, phases)
+        if ruleset.lex:
+            started = time.perf_counter()
+            text, _ = ruleset.rewrite_sites(text, lexer.tokenize(text))
+            phases['lex'] += time.perf_counter() - started
+
+        started = time.perf_counter()
+        data = text.encode('utf-8')
+        rs.atomic_write(os.path.join(output_dir, os.path.basename(path)), data)
+        phases['write'] += time.perf_counter() - started
+        digest.update(data)
+    return phases, digest.hexdigest()
+
+
+def measure(engine, paths, rules_path, pack_path, lex, repeat):
+    """Run one engine over `paths` `repeat` times, in the current process.
+
+    Meant to run in a fresh process: the peak RSS is the process's. The
+    fastest pass is reported; `base_rss` is the peak before the first one,
+    with the interpreter and the rule set loaded.
+    """
+    if rs.resource is None:
+        tracemalloc.start()
+    keys = rs.translation_keys(rs.Translations.load(rs.DEFAULT_TRANSLATIONS).values)
+    ruleset = rs.load_ruleset(rules_path, pack_path, rs.rule_templates, lex=lex, keys=keys)
+    base_rss = rs.peak_memory()['process']
+    best = None
+    with tempfile.TemporaryDirectory(prefix='replace-bench-') as output_dir:
+        for _ in range(repeat):
+            phases, digest = _pass(ruleset, _RUNNERS[engine], paths, output_dir)
+            if best is None or sum(phases.values()) < sum(best[0].values()):
+                best = phases, digest
+    phases, digest = best
+    return {'phases': phases, 'output_digest': digest, 'base_rss': base_rss,
+            'peak_rss': rs.peak_memory()['process'], 'rules': len(ruleset.rules),
+            'rules_fingerprint': ruleset.fingerprint}
+
+
+def measure_in_subprocess(*args):
+    """measure() in a newly started interpreter."""
+    context = multiprocessing.get_context('spawn')
+    with ProcessPoolExecutor(max_workers=1, mp_context=context) as pool:
+        return pool.submit(measure, *args).result()
+
+
+def bench_record(corpus, engine, result, lex, repeat):
+    """The JSON document appended to the results file for one measurement."""
+    seconds = sum(result['phases'].values())
+    return {
+        'time': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+        'corpus': corpus,
+        'engine': engine,
+        'engine_version': rs.ENGINE_VERSION,
+        'rules': result['rules'],
+        'rules_fingerprint': result['rules_fingerprint'],
+        'lex': lex,
+        'repeat': repeat,
+        'python': platform.python_version(),
+        'platform': sys.platform,
+        'seconds': seconds,
+        'mb_per_second': corpus['bytes'] / seconds / 1e6 if seconds else None,
+        'phases': result['phases'],
+        'base_rss': result['base_rss'],
+        'peak_rss': result['peak_rss'],
+        'output_digest': result['output_digest'],
+    }
+
+
+def _megabytes(value):
+    return 'n/a' if value is None else f'{value / 1e6:.1f} MB'
+
+
+def print_record(record):
+    phases = ' '.join(f"{name} {seconds:.3f}" for name, seconds in record['phases'].items() if seconds)
+    print(f"{record['corpus']['name']:<18} {record['engine']:<7} "
+          f"{record['corpus']['bytes'] / 1e6:8.2f} MB {record['seconds']:8.3f} s "
+          f"{record['mb_per_second'] or 0:7.2f} MB/s  peak RSS {_megabytes(record['peak_rss'])}  [{phases}]")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--lines', type=int, nargs='*', default=[10_000, 100_000, 1_000_000],
+                        help='sizes of the synthetic corpora in lines (default: %(default)s; none to skip them)')
+    parser.add_argument('--density', type=float, default=0.05,
+                        help='fraction of synthetic lines that are call sites (default: %(default)s)')
+    parser.add_argument('--mix', type=parse_mix, default='alert=3,confirm=1,innerhtml=2',
+                        help='relative weights of alert, confirm and innerhtml sites (default: %(default)s)')
+    parser.add_argument('--hit-ratio', type=float, default=0.8,
+                        help='fraction of sites some rule or template covers (default: %(default)s)')
+    parser.add_argument('--file-lines', type=int, default=5000,
+                        help='lines per synthetic file (default: %(default)s)')
+    parser.add_argument('--seed', type=int, default=1, help='random seed (default: %(default)s)')
+    parser.add_argument('--real', default=rs.SCRIPT_DIR,
+                        help='directory whose *.js files form the real corpus (default: %(default)s)')
+    parser.add_argument('--no-real', action='store_true', help='skip the real corpus')
+    parser.add_argument('--engines', nargs='+', choices=ENGINES, default=list(ENGINES),
+                        help='engines to measure (default: all)')
+    parser.add_argument('--lex', action='store_true', help='include the --lex call-site pass')
+    parser.add_argument('--repeat', type=int, default=3,
+                        help='passes per measurement; the fastest is reported (default: %(default)s)')
+    parser.add_argument('--rules', default=rs.DEFAULT_RULES,
+                        help='rule data file (default: %(default)s)')
+    parser.add_argument('--rule-pack', default=rs.DEFAULT_RULE_PACK,
+                        help='precompiled rule pack (default: %(default)s)')
+    parser.add_argument('-o', '--output', default=DEFAULT_OUTPUT,
+                        help='results file, one JSON line appended per measurement (default: %(default)s)')
+    args = parser.parse_args()
+    if args.repeat < 1 or args.file_lines < 1:
+        parser.error('--repeat and --file-lines must be at least 1')
+
+    # Compile (or refresh) the rule pack once, not in every measurement
+    ruleset = rs.load_ruleset(args.rules, args.rule_pack, rs.rule_templates, lex=args.lex)
+    mismatched = False
+    with tempfile.TemporaryDirectory(prefix='replace-corpus-') as scratch:
+        corpora = []
+        for lines in args.lines:
+            directory = os.path.join(scratch, str(lines))
+            os.mkdir(directory)
+            corpora.append(make_corpus(directory, ruleset.rules, lines, args.density, args.mix,
+                                       args.hit_ratio, args.seed, args.file_lines))
+        if not args.no_real:
+            corpora.append(real_corpus(args.real))
+
+        for corpus, paths in corpora:
+            digests = set()
+            for engine in args.engines:
+                result = measure_in_subprocess(engine, paths, args.rules, args.rule_pack, args.lex, args.repeat)
+                record = bench_record(corpus, engine, result, args.lex, args.repeat)
+                print_record(record)
+                rs.append_stats_json(args.output, record)
+                digests.add(record['output_digest'])
+            if len(digests) > 1:
+                mismatched = True
+                print(f"  error: the engines disagree on the output for {corpus['name']}")
+    print(f"Results appended to {os.path.relpath(args.output)}")
+    if mismatched:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
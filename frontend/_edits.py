@@ -0,0 +1,210 @@
+"""Edit offsets recorded while rewriting, and the hunks built from them
+
+Every rewriting pass reports the (start, end, replacement) edits it made to
+its input. EditLog composes them into regions of the original text and the
+final text, so the changed lines, the hunks and a unified diff come straight
+from the offsets, without diffing the two full texts against each other.
+changed_span() does the reverse for --watch: it finds the one region where
+a saved file differs from the version last seen.
+"""
+
+from bisect import bisect_right
+
+
+class EditLog:
+    """Regions (o0, o1, n0, n1): original[o0:o1] became current[n0:n1].
+
+    Text outside the regions is unchanged. Regions are sorted and never
+    overlap, in either text.
+    """
+
+    def __init__(self):
+        self.regions = []
+
+    def __bool__(self):
+        return bool(self.regions)
+
+    def record(self, text, edits):
+        """Add the edits one pass made to `text`, the current text.
+
+        `edits` are (start, end, replacement) in `text` coordinates, sorted
+        and not overlapping. Edits touching an earlier region merge with it;
+        edits that put back the text they replace are dropped.
+        """
+        edits = [edit for edit in edits if text[edit[0]:edit[1]] != edit[2]]
+        if not edits:
+            return
+        # Both lists in current-text coordinates, tagged: regions first on ties
+        spans = sorted([(n0, n1, 0, (o0, o1)) for o0, o1, n0, n1 in self.regions]
+                       + [(start, end, 1, replacement) for start, end, replacement in edits],
+                       key=lambda span: (span[0], span[2]))
+        regions = []
+        shift = 0       # current -> original, for text before the cluster
+        delta = 0       # current -> new, from the edits so far
+        i = 0
+        while i < len(spans):
+            start, end = spans[i][0], spans[i][1]
+            cluster = [spans[i]]
+            i += 1
+            while i < len(spans) and spans[i][0] <= end:
+                end = max(end, spans[i][1])
+                cluster.append(spans[i])
+                i += 1
+
+            old = [span for span in cluster if span[2] == 0]
+            new = [span for span in cluster if span[2] == 1]
+            o0 = old[0][3][0] if old and old[0][0] == start else start - shift
+            for n0, n1, _, (r0, r1) in old:
+                shift += (n1 - n0) - (r1 - r0)
+            o1 = old[-1][3][1] if old and old[-1][1] == end else end - shift
+            if not new:
+                regions.append((o0, o1, start + delta, end + delta))
+                continue
+
+            pieces = []
+            pos = start
+            for edit_start, edit_end, _, replacement in new:
+                pieces.append(text[pos:edit_start])
+                pieces.append(replacement)
+                pos = edit_end
+            pieces.append(text[pos:end])
+            length = sum(map(len, pieces))
+            regions.append((o0, o1, start + delta, start + delta + length))
+            delta += length - (end - start)
+        self.regions = regions
+
+
+def _line_starts(text):
+    starts = [0]
+    pos = text.find('\n')
+    while pos >= 0:
+        starts.append(pos + 1)
+        pos = text.find('\n', pos + 1)
+    return starts
+
+
+def _split_lines(text):
+    # Lines end at '\n' only; str.splitlines() would also split on '\r', U+2028, ...
+    lines = text.split('\n')
+    last = lines.pop()
+    lines = [line + '\n' for line in lines]
+    if last:
+        lines.append(last)
+    return lines
+
+
+def _at_line_start(text, pos):
+    return pos == 0 or text[pos - 1] == '\n'
+
+
+def line_blocks(original, content, regions):
+    """Whole-line blocks [(a0, a1, b0, b1)]: lines a0..a1 of `original` became
+    lines b0..b1 of `content` (0-based, end exclusive)."""
+    old_starts = _line_starts(original)
+    new_starts = _line_starts(content)
+    spans = []
+    for o0, o1, n0, n1 in regions:
+        if original[o0:o1] == content[n0:n1]:
+            continue
+        # The text before and after a region is the same in both texts, so
+        # widening both sides by the same amount keeps them aligned
+        back = o0 - old_starts[bisect_right(old_starts, o0) - 1]
+        o0 -= back
+        n0 -= back
+        if not (_at_line_start(original, o1) and _at_line_start(content, n1)):
+            newline = original.find('\n', o1)
+            forward = (len(original) if newline < 0 else newline + 1) - o1
+            o1 += forward
+            n1 += forward
+        if spans and o0 < spans[-1][1]:
+            # The earlier span was widened over text this region changes, so
+            # only this region's end maps reliably into the new text
+            end = max(o1, spans[-1][1])
+            spans[-1] = (spans[-1][0], end, spans[-1][2], n1 + end - o1)
+        else:
+            spans.append((o0, o1, n0, n1))
+
+    def lines(starts, a, b):
+        first = bisect_right(starts, a) - 1
+        return first, bisect_right(starts, b - 1) if b > a else first
+
+    return [lines(old_starts, o0, o1) + lines(new_starts, n0, n1)
+            for o0, o1, n0, n1 in spans]
+
+
+def changed_lines(blocks):
+    """Lines changed: per block, the larger of the lines removed and added."""
+    return sum(max(a1 - a0, b1 - b0) for a0, a1, b0, b1 in blocks)
+
+
+def hunks(original, content, blocks, context=3):
+    """Group `blocks` into unified-diff hunks with `context` lines around them.
+
+    Returns [(old_start, old_count, new_start, new_count, lines)], 0-based,
+    `lines` prefixed with ' ', '-' or '+'.
+    """
+    old_lines = _split_lines(original)
+    new_lines = _split_lines(content)
+    groups = []
+    for block in blocks:
+        if groups and block[0] - groups[-1][-1][1] <= 2 * context:
+            groups[-1].append(block)
+        else:
+            groups.append([block])
+
+    result = []
+    for group in groups:
+        a_start = max(0, group[0][0] - context)
+        a_end = min(len(old_lines), group[-1][1] + context)
+        b_start = group[0][2] - (group[0][0] - a_start)
+        b_end = group[-1][3] + (a_end - group[-1][1])
+        lines = []
+        pos = a_start
+        for a0, a1, b0, b1 in group:
+            lines.extend(' ' + line for line in old_lines[pos:a0])
+            lines.extend('-' + line for line in old_lines[a0:a1])
+            lines.extend('+' + line for line in new_lines[b0:b1])
+            pos = a1
+        lines.extend(' ' + line for line in old_lines[pos:a_end])
+        result.append((a_start, a_end - a_start, b_start, b_end - b_start, lines))
+    return result
+
+
+def _range(start, count):
+    # Unified diff numbering: 1-based, or the line before for an empty range
+    return f'{start + 1 if count else start},{count}'
+
+
+def unified_diff(name, hunk_list):
+    """The patch text of `hunk_list` for the file `name` (a/name -> b/name)."""
+    if not hunk_list:
+        return ''
+    out = [f'--- a/{name}\n', f'+++ b/{name}\n']
+    for a_start, a_count, b_start, b_count, lines in hunk_list:
+        out.append(f'@@ -{_range(a_start, a_count)} +{_range(b_start, b_count)} @@\n')
+        for line in lines:
+            out.append(line if line.endswith('\n') else line + '\n\\ No newline at end of file\n')
+    return ''.join(out)
+
+
+def changed_span(old, new):
+    """(start, old_end, new_end): old[start:old_end] became new[start:new_end],
+    the rest being the common prefix and suffix of the two texts."""
+    limit = min(len(old), len(new))
+    # Binary searches over slice comparisons, which run at memcmp speed
+    lo, hi = 0, limit
+    while lo < hi:
+        mid = (lo + hi + 1) // 2
+        if old.startswith(new[lo:mid], lo):
+            lo = mid
+        else:
+            hi = mid - 1
+    start = lo
+    lo, hi = 0, limit - start
+    while lo < hi:
+        mid = (lo + hi + 1) // 2
+        if old.endswith(new[len(new) - mid:len(new) - lo], 0, len(old) - lo):
+            lo = mid
+        else:
+            hi = mid - 1
+    return start, len(old) - lo, len(new) - lo
@@ -0,0 +1,299 @@
+"""Turn the call sites no rule covers into rules and translation entries
+
+A site qualifies when its message can move into translations.js as is:
+
+  alert( / confirm(  one string or template literal, or literals joined
+                     with '+' to plain expressions (a, a.b.c); the
+                     expressions become {placeholders} passed as params
+  .innerHTML =       one static literal holding a single run of text,
+                     optionally wrapped in markup (an icon, a <p>, ...)
+
+Identical messages share one key across the whole tree. A message whose
+English text is already in translations.js reuses that key, with its own
+placeholder names; the others get a key derived from their words, in the
+namespace their files point to (see propose_key() for clashes).
+"""
+
+import re
+import unicodedata
+from bisect import bisect_right
+from collections import namedtuple
+
+import _js_lexer as lexer
+
+# (text, params, build): `text` is the English message with {placeholders},
+# `params` the (name, expression) pairs behind them, and build(key, names)
+# returns the replacement call site for a key whose placeholders are `names`.
+Message = namedtuple('Message', 'text params build')
+
+# A site found in a file: `old` is its exact source, a rule pattern as is
+Site = namedtuple('Site', 'path line old message')
+
+# Where the messages of a file no namespace of translations.js matches go
+DEFAULT_NAMESPACE = 'common'
+
+_PATH = re.compile(r'[A-Za-z_$][\w$]*(?:\.[A-Za-z_$][\w$]*)*')
+_SUBSTITUTION = re.compile(r'\$\{\s*([^{}`]*?)\s*\}')
+_PLACEHOLDER = re.compile(r'\{(\w+)\}')
+_MARKUP_RUN = r'(?:\s*<[^<>]+>)*\s*'
+_WRAPPED_TEXT = re.compile(rf'^({_MARKUP_RUN})([^<>&]*?[A-Za-z]{{2}}[^<>&]*?)({_MARKUP_RUN})$')
+_WORD = re.compile(r'[A-Za-z]{2,}')
+
+
+def _template_chunk(raw):
+    """The value of a piece of template literal source holding no ${...}."""
+    return lexer.literal_value('`' + raw + '`', (lexer.TEMPLATE, 0, len(raw) + 2, ''))
+
+
+def _param_name(expression):
+    """error.message -> 'error', items.length -> 'count', file.name -> 'name'"""
+    parts = expression.split('.')
+    if parts[-1] == 'message' and len(parts) > 1:
+        return parts[-2]
+    if parts[-1] == 'length':
+        return 'count'
+    return parts[-1]
+
+
+def _pieces(text, by_start, start, stop):
+    """Split text[start:stop] into literal values and plain expressions;
+    `by_start` maps the start offset of each token of `text` to the token.
+
+    Returns [(is_expression, value), ...], or None when the argument is
+    anything else (calls, operators other than '+', nested templates).
+    """
+    pieces = []
+    pos = start
+    while True:
+        while pos < stop and text[pos].isspace():
+            pos += 1
+        token = by_start.get(pos)
+        if token is not None and token[0] in lexer.LITERALS and token[2] <= stop:
+            value = lexer.literal_value(text, token)
+            if value is not None:
+                pieces.append((False, value))
+            else:
+                body = text[token[1] + 1:token[2] - 1]
+                last = 0
+                for match in _SUBSTITUTION.finditer(body):
+                    if not _PATH.fullmatch(match.group(1)):
+                        return None
+                    pieces.append((False, _template_chunk(body[last:match.start()])))
+                    pieces.append((True, match.group(1)))
+                    last = match.end()
+                if '${' in body[last:]:
+                    return None
+                pieces.append((False, _template_chunk(body[last:])))
+            pos = token[2]
+        else:
+            match = _PATH.match(text, pos, stop)
+            if match is None or match.group() in ('t', 'true', 'false', 'null', 'undefined'):
+                return None
+            pieces.append((True, match.group()))
+            pos = match.end()
+        while pos < stop and text[pos].isspace():
+            pos += 1
+        if pos >= stop:
+            return pieces
+        if text[pos] != '+':
+            return None
+        pos += 1
+
+
+def _call(key, params, names):
+    if not params:
+        return f"t('{key}')"
+    fields = ', '.join(expression if name == expression else f'{name}: {expression}'
+                       for name, (_, expression) in zip(names, params))
+    return f"t('{key}', {{ {fields} }})"
+
+
+def _template_literal(value):
+    return value.replace('\\', '\\\\').replace('`', '\\`').replace('${', '\\${')
+
+
+def site_message(text, tokens, index, by_start=None):
+    """Return (old, Message) for the call site at tokens[index], or None when
+    it does not qualify (see the module docstring). `by_start` ({start: token}
+    over `tokens`) is built when not given; pass it when calling for many sites."""
+    site_start, name = tokens[index][1], tokens[index][3]
+    span = lexer.site_argument(text, tokens, index)
+    if span is None:
+        return None
+    arg_start, arg_end, end = span
+    raw = text[arg_start:arg_end]
+    start = arg_start + len(raw) - len(raw.lstrip())
+    stop = arg_end - len(raw) + len(raw.rstrip())
+    if start == stop or text.startswith('t(', start):
+        return None
+    if by_start is None:
+        by_start = {token[1]: token for token in tokens}
+    pieces = _pieces(text, by_start, start, stop)
+    if not pieces:
+        return None
+    head = text[site_start:start]
+    tail = text[stop:end]
+
+    if name == 'innerHTML':
+        if len(pieces) != 1 or pieces[0][0]:
+            return None
+        match = _WRAPPED_TEXT.match(pieces[0][1])
+        if not match or _PLACEHOLDER.search(match.group(2)):
+            return None
+        before, message, after = match.groups()
+
+        def build(key, names):
+            call = _call(key, (), names)
+            if not before and not after:
+                return head + call + tail
+            return f'{head}`{_template_literal(before)}${{{call}}}{_template_literal(after)}`{tail}'
+        return text[site_start:end], Message(message, (), build)
+
+    parts = []
+    params = []
+    taken = {}
+    for is_expression, value in pieces:
+        if not is_expression:
+            if _PLACEHOLDER.search(value):
+                return None
+            parts.append(value)
+            continue
+        param = _param_name(value)
+        if taken.get(param, value) != value:
+            param = f'{param}{len(params) + 1}'
+        if param not in taken:
+            taken[param] = value
+            params.append((param, value))
+        parts.append(f'{{{param}}}')
+    message = ''.join(parts)
+    if not _WORD.search(_PLACEHOLDER.sub(' ', message)):
+        return None
+
+    def build(key, names):
+        return head + _call(key, params, names) + tail
+    return text[site_start:end], Message(message, params, build)
+
+
+def find_sites(text, path=''):
+    """The qualifying call sites of `text`, in order."""
+    tokens = lexer.tokenize(text)
+    line_starts = [0] + [match.end() for match in re.finditer('\n', text)]
+    by_start = {token[1]: token for token in tokens}
+    sites = []
+    for index, token in enumerate(tokens):
+        if token[0] != lexer.SITE:
+            continue
+        found = site_message(text, tokens, index, by_start)
+        if found is not None:
+            sites.append(Site(path, bisect_right(line_starts, token[1]), found[0], found[1]))
+    return sites
+
+
+# ============================================================
+# Keys
+# ============================================================
+def text_shape(text):
+    """The text with its placeholders blanked, so messages differing only in
+    placeholder names are recognised as one."""
+    return _PLACEHOLDER.sub('{}', ' '.join(text.split()))
+
+
+def placeholder_names(text):
+    return _PLACEHOLDER.findall(text)
+
+
+def placeholder_order(names):
+    """['a', 'b', 'a'] -> (0, 1, 0): which distinct placeholder each occurrence is."""
+    order = {}
+    return tuple(order.setdefault(name, len(order)) for name in names)
+
+
+def file_namespace(path, namespaces):
+    """The namespace of translations.js a file's messages belong in.
+
+    The first word of the file name (or its plural) naming an existing
+    namespace wins, 'limited-' pages sharing their full version's;
+    otherwise DEFAULT_NAMESPACE.
+    """
+    words = re.split(r'[-_.]', path.replace('\\', '/').rsplit('/', 1)[-1].rsplit('.', 1)[0])
+    if words and words[0] == 'limited':
+        words = words[1:]
+    for word in words:
+        for candidate in (word, word + 's'):
+            if candidate in namespaces:
+                return candidate
+    return DEFAULT_NAMESPACE
+
+
+_KEY_PHRASES = [
+    (re.compile(r'^are you sure you want to\b', re.I), 'confirm'),
+    (re.compile(r'^please\b', re.I), ''),
+]
+# Words that say nothing about a message, left out of its key
+_FILLER = {'a', 'an', 'the', 'this', 'that', 'these', 'those', 'to', 'be', 'is', 'are', 'it', 'its'}
+# Words too vague to tell two messages apart
+_VAGUE = {'some', 'ones', 'new', 'add', 'more', 'only', 'allowed', 'please'}
+
+
+def _key_words(text):
+    """The words of `text` a key is made of: no placeholders, accents,
+    leading numbering or marks ('🚫 1. Click...'), filler words or stray letters."""
+    text = _PLACEHOLDER.sub(' ', text).strip()
+    # métallique -> metallique
+    text = ''.join(c for c in unicodedata.normalize('NFKD', text) if not unicodedata.combining(c))
+    text = re.sub(r'^[^A-Za-z]+', '', text)
+    for pattern, replacement in _KEY_PHRASES:
+        text = pattern.sub(replacement, text)
+    return [word for word in re.findall(r'[A-Za-z0-9]+', text)
+            if word.lower() not in _FILLER and (len(word) > 1 or word.isdigit())]
+
+
+def _camel(words):
+    first = words[0] if words[0].isupper() and len(words[0]) > 1 else words[0].lower()
+    return first + ''.join(word[0].upper() + word[1:] for word in words[1:])
+
+
+def key_name(text, max_words=5):
+    """'Please enter a subject.' -> 'enterSubject', 'Error: {err}' -> 'errorDetails'"""
+    words = _key_words(text)[:max_words] or ['message']
+    if len(words) == 1 and _PLACEHOLDER.search(text):
+        words.append('Details')
+    return _camel(words)
+
+
+def _same_meaning(text, other):
+    """True if `other` is `text` with other placeholder names (or the same):
+    its key can show `text` as well."""
+    return (text_shape(text) == text_shape(other)
+            and placeholder_order(placeholder_names(text)) == placeholder_order(placeholder_names(other)))
+
+
+def propose_key(namespace, text, taken):
+    """A key under `namespace` for `text`. `taken` maps the keys in use to
+    their English text (None if they have none); the key returned is added.
+
+    When the key derived from the words of `text` is taken, by the same
+    message (see _same_meaning()) it is shared; otherwise the
+    last word of `text` that the holder's text lacks is added to it, so
+    'You can only add {n} more image(s). Maximum 10 images per room.' gets
+    ...youCanOnlyAddMoreRoom. A number is the last resort.
+    """
+    base = f'{namespace}.{key_name(text)}'
+    key = base
+    if base in taken:
+        holder = taken[base]
+        if holder is not None and _same_meaning(text, holder):
+            return base
+        known = {word.lower() for word in _key_words(holder or '') + _key_words(text)[:5]}
+        for word in reversed(_key_words(text)):
+            if word.lower() in known or word.lower() in _VAGUE or word.isdigit():
+                continue
+            if f'{base}{word[0].upper()}{word[1:]}' not in taken:
+                key = f'{base}{word[0].upper()}{word[1:]}'
+                break
+        suffix = 2
+        while key in taken:
+            key = f'{base}{suffix}'
+            suffix += 1
+    taken[key] = text
+    return key
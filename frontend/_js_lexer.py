@@ -0,0 +1,272 @@
+"""Lightweight lexer for the string and template literals in a JS file
+
+Only what the i18n tooling needs is recognised: string literals, template
+literals (including the ones nested inside ${...}), comments, regex literals
+and the alert( / confirm( / .innerHTML = call sites. Everything else is plain
+code. The scan is linear: a regex jumps between interesting characters and
+each literal is consumed in one step.
+
+Tokens are (kind, start, end, name) tuples so they can be stored as JSON;
+`name` is only set for call sites ('alert', 'confirm' or 'innerHTML').
+"""
+
+import re
+
+# Bump when the token format or the recognised syntax changes
+LEXER_VERSION = 1
+
+STRING = 'str'
+TEMPLATE = 'tpl'
+COMMENT = 'comment'
+REGEX = 'regex'
+SITE = 'site'
+
+LITERALS = (STRING, TEMPLATE)
+
+_INTERESTING = re.compile(r"""['"`/]|(?<![\w$])(alert|confirm)\s*\(|\.innerHTML\s*=(?![=>])""")
+_STRING_REST = {
+    "'": re.compile(r"(?:[^'\\\n]|\\[\s\S])*'"),
+    '"': re.compile(r'(?:[^"\\\n]|\\[\s\S])*"'),
+}
+_TEMPLATE_STOP = re.compile(r'[`\\]|\$\{')
+_SUBSTITUTION_STOP = re.compile(r"""['"`{}/]""")
+_REGEX_REST = re.compile(r'(?:[^/\\\[\n]|\\.|\[(?:[^\]\\\n]|\\.)*\])+/[a-z]*')
+_BLOCK_COMMENT_END = re.compile(r'\*/')
+
+# A '/' after one of these (or at the start of the file) opens a regex literal
+_REGEX_PRECEDERS = set('(,=:[!&|?{};+-*%<>~^')
+_REGEX_KEYWORDS = {'return', 'typeof', 'case', 'do', 'else', 'in', 'of', 'void',
+                   'yield', 'await', 'delete', 'throw', 'new'}
+
+
+def _skip_string(text, pos):
+    """`pos` is just after the opening quote; return the index after the closing one."""
+    match = _STRING_REST[text[pos - 1]].match(text, pos)
+    if match:
+        return match.end()
+    # Unterminated: stop at the end of the line like a JS engine would complain
+    newline = text.find('\n', pos)
+    return len(text) if newline < 0 else newline
+
+
+def _skip_template(text, pos):
+    """`pos` is just after the opening backtick; return the index after the closing one."""
+    while True:
+        match = _TEMPLATE_STOP.search(text, pos)
+        if not match:
+            return len(text)
+        stop = match.group()
+        if stop == '`':
+            return match.end()
+        if stop == '\\':
+            pos = match.end() + 1
+        else:
+            pos = _skip_substitution(text, match.end())
+
+
+def _skip_substitution(text, pos):
+    """`pos` is just after '${'; return the index after the matching '}'."""
+    depth = 1
+    while True:
+        match = _SUBSTITUTION_STOP.search(text, pos)
+        if not match:
+            return len(text)
+        stop = match.group()
+        pos = match.end()
+        if stop in ('"', "'"):
+            pos = _skip_string(text, pos)
+        elif stop == '`':
+            pos = _skip_template(text, pos)
+        elif stop == '{':
+            depth += 1
+        elif stop == '}':
+            depth -= 1
+            if depth == 0:
+                return pos
+        else:
+            pos = _skip_slash(text, match.start())[1]
+
+
+def _starts_regex(text, pos):
+    """Whether the '/' at `pos` opens a regex literal rather than dividing."""
+    i = pos - 1
+    while i >= 0 and text[i] in ' \t\r\n':
+        i -= 1
+    if i < 0 or text[i] in _REGEX_PRECEDERS:
+        return True
+    word_start = i
+    while word_start >= 0 and (text[word_start].isalnum() or text[word_start] in '_$'):
+        word_start -= 1
+    return text[word_start + 1:i + 1] in _REGEX_KEYWORDS
+
+
+def _skip_slash(text, start):
+    """Classify the '/' at `start`; return (kind, end) with kind None for a division."""
+    follower = text[start + 1:start + 2]
+    if follower == '/':
+        newline = text.find('\n', start)
+        return COMMENT, len(text) if newline < 0 else newline
+    if follower == '*':
+        end = _BLOCK_COMMENT_END.search(text, start + 2)
+        return COMMENT, len(text) if end is None else end.end()
+    if _starts_regex(text, start):
+        regex = _REGEX_REST.match(text, start + 1)
+        if regex:
+            return REGEX, regex.end()
+    return None, start + 1
+
+
+def tokenize(text):
+    """Return the literal, comment and call-site tokens of `text` in order."""
+    tokens = []
+    pos = 0
+    while True:
+        match = _INTERESTING.search(text, pos)
+        if not match:
+            return tokens
+        start = match.start()
+        stop = match.group()
+        pos = match.end()
+        if stop in ('"', "'"):
+            pos = _skip_string(text, pos)
+            tokens.append((STRING, start, pos, ''))
+        elif stop == '`':
+            pos = _skip_template(text, pos)
+            tokens.append((TEMPLATE, start, pos, ''))
+        elif stop == '/':
+            kind, pos = _skip_slash(text, start)
+            if kind:
+                tokens.append((kind, start, pos, ''))
+        elif match.group(1):
+            # Method calls such as dialog.confirm( are not the browser globals
+            before = text[max(0, start - 7):start]
+            if not before.endswith('.') or before == 'window.':
+                tokens.append((SITE, start, pos, match.group(1)))
+        else:
+            tokens.append((SITE, start, pos, 'innerHTML'))
+
+
+# ============================================================
+# Call-site arguments
+# ============================================================
+_STRUCTURE = re.compile(r'[()\[\]{};\n]')
+_CONTINUES_AFTER = set('+-*/%=&|?:,(')
+_CONTINUES_BEFORE = set('+-*/%&|?:.,')
+
+
+def _statement_continues(text, newline):
+    """Whether the expression around a depth-0 newline carries on to the next line."""
+    i = newline - 1
+    while i >= 0 and text[i] in ' \t\r':
+        i -= 1
+    j = newline + 1
+    while j < len(text) and text[j] in ' \t\r\n':
+        j += 1
+    return (i >= 0 and text[i] in _CONTINUES_AFTER) or (j < len(text) and text[j] in _CONTINUES_BEFORE)
+
+
+def site_argument(text, tokens, index):
+    """Return (arg_start, arg_end, end) for the call site at tokens[index].
+
+    For alert( and confirm( the argument runs to the matching ')' and `end`
+    is just past it. For .innerHTML = it is the right-hand side, up to the
+    end of the statement, and `end` equals `arg_end`. Returns None when the
+    site is not closed (truncated input).
+    """
+    _, _, site_end, name = tokens[index]
+    is_call = name != 'innerHTML'
+    pos = site_end
+    depth = 0
+    k = index + 1
+    while True:
+        next_start = tokens[k][1] if k < len(tokens) else len(text)
+        match = _STRUCTURE.search(text, pos, next_start)
+        if match is None:
+            if k >= len(tokens):
+                return None if is_call else (site_end, len(text), len(text))
+            if tokens[k][0] != SITE:
+                pos = tokens[k][2]
+            k += 1
+            continue
+        char = match.group()
+        pos = match.end()
+        if char in '([{':
+            depth += 1
+        elif char in ')]}':
+            if depth == 0:
+                if is_call and char == ')':
+                    return site_end, match.start(), pos
+                if not is_call:
+                    return site_end, match.start(), match.start()
+                return None
+            depth -= 1
+        elif depth == 0 and not is_call:
+            if char == ';' or not _statement_continues(text, match.start()):
+                return site_end, match.start(), match.start()
+
+
+# ============================================================
+# Canonical form
+# ============================================================
+_ESCAPE = re.compile(r'\\(u\{[0-9a-fA-F]+\}|u[0-9a-fA-F]{4}|x[0-9a-fA-F]{2}|\r\n|[\s\S])')
+_SIMPLE_ESCAPES = {'n': '\n', 't': '\t', 'r': '\r', 'b': '\b', 'f': '\f', 'v': '\v', '0': '\0',
+                   '\n': '', '\r\n': ''}
+
+
+def _unescape(match):
+    escape = match.group(1)
+    if escape.startswith('u{'):
+        return chr(int(escape[2:-1], 16))
+    if len(escape) > 1 and escape[0] in 'ux':
+        return chr(int(escape[1:], 16))
+    return _SIMPLE_ESCAPES.get(escape, escape)
+
+
+def literal_value(text, token):
+    """The value of a string literal, or of a template literal without ${...}.
+
+    Returns None for templates with substitutions, whose value is not static.
+    """
+    kind, start, end, _ = token
+    body = text[start + 1:end - 1]
+    if kind == TEMPLATE and '${' in body.replace('\\$', ''):
+        return None
+    return _ESCAPE.sub(_unescape, body)
+
+
+def quote(value):
+    return "'" + value.replace('\\', '\\\\').replace("'", "\\'").replace('\n', '\\n') + "'"
+
+
+def _normalize_code(code):
+    code = re.sub(r'\s+', ' ', code).strip()
+    code = re.sub(r' ?([^\w\s$]) ?', r'\1', code)
+    return re.sub(r'(?<![+=])\+(?![+=])', ' + ', code)
+
+
+def canonical(text, tokens, start, end, first=0):
+    """Canonical source for text[start:end], insensitive to quote style,
+    spacing, comments and line wrapping.
+
+    String literals (and static template literals) become single-quoted,
+    other template literals are kept verbatim, and the code in between has
+    its whitespace normalised with ' + ' around concatenations. The tokens
+    are looked at from tokens[first] on: pass the index of the call site
+    the range belongs to, so a file's sites cost linear time in all.
+    """
+    parts = []
+    pos = start
+    for k in range(first, len(tokens)):
+        token = tokens[k]
+        kind, token_start, token_end, _ = token
+        if token_start >= end:
+            break
+        if token_end <= start or kind == SITE:
+            continue
+        parts.append(_normalize_code(text[pos:token_start]))
+        if kind in LITERALS:
+            value = literal_value(text, token)
+            parts.append(text[token_start:token_end] if value is None else quote(value))
+        pos = token_end
+    parts.append(_normalize_code(text[pos:end]))
+    return ''.join(parts).strip()
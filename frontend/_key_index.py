@@ -0,0 +1,180 @@
+"""Persistent index of the translation keys of the frontend tree
+
+.translation_index records, for every file frontend_files() lists, the key
+uses found in it (key -> file:line, as scan_tree() collects them) and, for
+translations.js, every language's values with the lines they are defined on.
+Each file is recorded with its size, mtime and content hash: update() only
+reads the files whose size or mtime moved, and only rescans those whose
+content changed, so keeping the index current costs one stat() per file.
+
+The per-key and per-text lookups (where is a key used, which key holds an
+English text, what are its values) are built from those records in memory
+when first asked for. The index is a pickle of plain data, like the rule
+pack, and is rebuilt from scratch when INDEX_VERSION changes.
+"""
+
+import hashlib
+import os
+import pickle
+
+from _translations import KeyUse, Translations, find_key_uses, frontend_files
+
+# Bump when the records or what find_key_uses() finds change
+INDEX_VERSION = 1
+
+INDEX_NAME = '.translation_index'
+
+
+def _stat(path):
+    stat = os.stat(path)
+    return stat.st_size, stat.st_mtime_ns
+
+
+def normalize_text(text):
+    """Messages are matched with their runs of whitespace collapsed."""
+    return ' '.join(text.split())
+
+
+class KeyIndex:
+    """Key uses per file and the translations of one frontend directory.
+
+    `files` maps a file name (relative to `root`) to its record:
+    {'stat', 'digest', 'uses': [(key, line), ...], 'prefixes': [...]}.
+    `source` is the same record for translations.js, holding 'values',
+    'lines' and 'duplicates' instead of uses.
+    """
+
+    def __init__(self, root, translations_path, files=None, source=None):
+        self.root = root
+        self.translations_path = translations_path
+        self.files = files or {}
+        self.source = source
+        # True once a record differs from the saved index, if only by its stat
+        self.dirty = False
+        self._uses = None
+        self._texts = None
+
+    @classmethod
+    def load(cls, index_path, root, translations_path):
+        """The index saved at `index_path`, or an empty one if it is missing,
+        unreadable, from another INDEX_VERSION or for another tree."""
+        try:
+            with open(index_path, 'rb') as f:
+                data = pickle.load(f)
+        except (OSError, pickle.UnpicklingError, EOFError, AttributeError, ValueError):
+            data = None
+        if (not isinstance(data, dict) or data.get('version') != INDEX_VERSION
+                or data.get('translations') != os.path.basename(translations_path)):
+            return cls(root, translations_path)
+        return cls(root, translations_path, data['files'], data['source'])
+
+    def save(self, index_path):
+        data = {'version': INDEX_VERSION, 'translations': os.path.basename(self.translations_path),
+                'files': self.files, 'source': self.source}
+        tmp_path = index_path + '.tmp'
+        with open(tmp_path, 'wb') as f:
+            pickle.dump(data, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, index_path)
+
+    def _refresh(self, path, record):
+        """(record, changed): `record` brought up to date with `path`'s content."""
+        stat = _stat(path)
+        if record is not None and record['stat'] == stat:
+            return record, False
+        with open(path, 'rb') as f:
+            data = f.read()
+        digest = hashlib.sha256(data).hexdigest()
+        self.dirty = True
+        if record is not None and record['digest'] == digest:
+            return dict(record, stat=stat), False
+        return {'stat': stat, 'digest': digest, 'text': data.decode('utf-8')}, True
+
+    def update(self):
+        """Bring the index up to date with the tree; return the names of the
+        files rescanned (translations.js included) and of those removed."""
+        changed = []
+        record, rescan = self._refresh(self.translations_path, self.source)
+        if rescan:
+            translations = Translations.parse(record.pop('text'))
+            record.update(values=translations.values, lines=translations.lines,
+                          duplicates=translations.duplicates)
+            changed.append(os.path.basename(self.translations_path))
+        self.source = record
+
+        files = {}
+        for path in frontend_files(self.root):
+            name = os.path.basename(path)
+            record, rescan = self._refresh(path, self.files.get(name))
+            if rescan:
+                uses, prefixes = find_key_uses(record.pop('text'))
+                record.update(uses=[(use.key, use.line) for use in uses], prefixes=sorted(prefixes))
+                changed.append(name)
+            files[name] = record
+        removed = sorted(set(self.files) - set(files))
+        if removed:
+            self.dirty = True
+            changed.extend(removed)
+        self.files = files
+        if changed:
+            self._uses = self._texts = None
+        return changed
+
+    # --------------------------------------------------------
+    # Lookups
+    # --------------------------------------------------------
+    @property
+    def translations(self):
+        """translations.js as a Translations (without the object spans add_entries() needs)."""
+        return Translations(self.source['values'], self.source['lines'], self.source['duplicates'])
+
+    @property
+    def uses(self):
+        """{key: [KeyUse, ...]}, like scan_tree() over the same files."""
+        if self._uses is None:
+            self._uses = {}
+            for name, record in self.files.items():
+                path = os.path.join(self.root, name)
+                for key, line in record['uses']:
+                    self._uses.setdefault(key, []).append(KeyUse(key, path, line))
+        return self._uses
+
+    @property
+    def prefixes(self):
+        return {prefix for record in self.files.values() for prefix in record['prefixes']}
+
+    def locations(self, key):
+        return self.uses.get(key, [])
+
+    def values_of(self, key):
+        """{lang: value} for every language defining `key`."""
+        return {lang: values[key] for lang, values in self.source['values'].items() if key in values}
+
+    def keys_for_text(self, text, lang='en'):
+        """The keys whose `lang` value is `text`, whitespace runs aside."""
+        if self._texts is None:
+            self._texts = {}
+        if lang not in self._texts:
+            texts = {}
+            for key, value in self.source['values'].get(lang, {}).items():
+                texts.setdefault(normalize_text(value), []).append(key)
+            self._texts[lang] = texts
+        return self._texts[lang].get(normalize_text(text), [])
+
+    def search_text(self, words, lang='en'):
+        """The keys whose `lang` value contains `words`, case aside."""
+        words = normalize_text(words).lower()
+        return [key for key, value in self.source['values'].get(lang, {}).items()
+                if words in normalize_text(value).lower()]
+
+
+def open_index(translations_path, index_path=None):
+    """The index of the directory holding `translations_path`, updated and,
+    if any file changed, saved back to `index_path` (default: .translation_index
+    in that directory)."""
+    root = os.path.dirname(os.path.abspath(translations_path))
+    index_path = index_path or os.path.join(root, INDEX_NAME)
+    index = KeyIndex.load(index_path, root, translations_path)
+    index.update()
+    if index.dirty:
+        index.save(index_path)
+    return index
@@ -0,0 +1,99 @@
+"""Content hashes of the files sw.js precaches
+
+sw.js lists its app shell in APP_SHELL_URLS. precache.manifest.js, which it
+imports, maps each of those files to a hash of its content: the service
+worker caches every file under its hash, and when a new manifest comes in
+it only downloads the files whose hash changed, instead of the whole shell
+after a CACHE_VERSION bump. The list is read from sw.js itself, so it stays
+maintained in one place; the translation bundles and pre-rendered page
+variants (_prerender.py) it spreads in come from the directory. The manifest
+also defines self.prerenderedPages, {page: {lang: variant}}, which sw.js
+serves navigations from in the language the pages report.
+"""
+
+import hashlib
+import json
+import os
+import re
+
+import _js_lexer as lexer
+from _prerender import variant_of
+from _translations import BUNDLE_NAME
+
+SERVICE_WORKER = 'sw.js'
+PRECACHE_MANIFEST = 'precache.manifest.js'
+
+_SHELL_LIST = re.compile(r'\bAPP_SHELL_URLS\s*=\s*\[')
+# ...Object.values(self.translationBundles) and the like
+_BUNDLE_SPREAD = re.compile(r'\.\.\.[^,\]]*\btranslation\w*Bundles\b')
+# ...Object.values(self.prerenderedPages).flatMap(Object.values)
+_VARIANT_SPREAD = re.compile(r'\.\.\.[^,\]]*\bprerenderedPages\b')
+
+
+def shell_urls(sw_text, directory):
+    """The files APP_SHELL_URLS names in `sw_text`, in order, with the
+    translation bundles and the variants of the listed pages found in
+    `directory` when the list spreads them in."""
+    match = _SHELL_LIST.search(sw_text)
+    if not match:
+        return []
+    tokens = [token for token in lexer.tokenize(sw_text) if token[2] > match.end()]
+    urls = []
+    code = []
+    pos = match.end()
+    for kind, start, end, _ in tokens + [(None, len(sw_text), len(sw_text), '')]:
+        close = sw_text.find(']', pos, start)
+        if close >= 0:
+            code.append(sw_text[pos:close])
+            break
+        code.append(sw_text[pos:start])
+        if kind == lexer.STRING:
+            urls.append(lexer.literal_value(sw_text, (kind, start, end, '')))
+        pos = end
+    code = ''.join(code)
+    if _BUNDLE_SPREAD.search(code):
+        urls.extend(name for name in sorted(os.listdir(directory)) if BUNDLE_NAME.match(name))
+    if _VARIANT_SPREAD.search(code):
+        pages = set(urls)
+        urls.extend(name for name in sorted(os.listdir(directory))
+                    if variant_of(name) and variant_of(name)[0] in pages)
+    return list(dict.fromkeys(url for url in urls if url))
+
+
+def precache_hashes(directory, urls):
+    """Return (hashes, missing): {url: hash} for the files found, and the urls that are not."""
+    hashes = {}
+    missing = []
+    for url in urls:
+        path = os.path.join(directory, *url.split('/'))
+        try:
+            with open(path, 'rb') as f:
+                hashes[url] = hashlib.sha256(f.read()).hexdigest()[:10]
+        except OSError:
+            missing.append(url)
+    return hashes, missing
+
+
+def prerendered_pages(urls):
+    """{page: {lang: variant}} for the page variants among `urls` whose page is there too."""
+    pages = {}
+    for url in urls:
+        variant = variant_of(url)
+        if variant and variant[0] in urls:
+            pages.setdefault(variant[0], {})[variant[1]] = url
+    return pages
+
+
+def render_precache_manifest(hashes):
+    """precache.manifest.js: the content hash of every precached file, and
+    the pre-rendered variants of the pages."""
+    entries = ''.join(f'  {json.dumps(url)}: {json.dumps(digest)},\n' for url, digest in hashes.items())
+    variants = ''.join(f'  {json.dumps(page)}: {json.dumps(langs, sort_keys=True)},\n'
+                       for page, langs in prerendered_pages(hashes).items())
+    return ('// Generated by _replace_strings.py. Do not edit.\n'
+            '// sw.js caches each file under its hash and only downloads the files\n'
+            '// whose hash changed.\n'
+            f'self.precacheManifest = {{\n{entries}}};\n'
+            '// Page -> {language: pre-rendered variant}; sw.js serves a navigation\n'
+            '// to the page from the variant of the language the pages report.\n'
+            f'self.prerenderedPages = {{\n{variants}}};\n')
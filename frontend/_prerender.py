@@ -0,0 +1,246 @@
+"""Fill data-i18n elements of a static HTML page for one language
+
+This does at build time what applyTranslations() in i18n.js does in the
+browser, with the same rules, so a page variant written for a language
+needs no DOM walk until the user switches language:
+
+  data-i18n              element without child elements: its text is replaced;
+                         otherwise the first .i18n-text descendant's text, or
+                         else its last non-blank text node, or else ' ' + text
+                         is appended
+  data-i18n-placeholder  placeholder attribute
+  data-i18n-title        title attribute
+  data-i18n-html         inner HTML, unescaped
+
+Only the edited ranges change; the rest of the page is copied byte for byte.
+The <html> tag gets lang="<lang>" and data-i18n-prerendered="<lang>", which
+tells i18n.js the page is already translated, and the bundle script tags
+of the other languages (see link_bundles()) are dropped. Where no service worker
+serves the variants (the Capacitor app), the plain pages are loaded and
+translated in the browser as before.
+"""
+
+import html
+import re
+from html.parser import HTMLParser
+
+# Elements that never have an end tag
+_VOID = {'area', 'base', 'br', 'col', 'embed', 'hr', 'img', 'input', 'link', 'meta',
+         'source', 'track', 'wbr'}
+
+PRERENDERED_ATTR = 'data-i18n-prerendered'
+
+# <page>.<lang>.html
+VARIANT_NAME = re.compile(r'\.([a-z]{2})\.html$')
+
+
+def variant_name(page, lang):
+    """dashboard.html -> dashboard.fr.html"""
+    stem, ext = page.rsplit('.', 1)
+    return f'{stem}.{lang}.{ext}'
+
+
+def variant_of(name):
+    """dashboard.fr.html -> ('dashboard.html', 'fr'); None for a page that is not a variant"""
+    match = VARIANT_NAME.search(name)
+    if not match:
+        return None
+    return name[:match.start()] + '.html', match.group(1)
+
+
+# The bundle tags --build-translations writes after translations.bundles.js
+_BUNDLE_TAG = re.compile(r'^[ \t]*<script src="(?:[^"]*/)?translations\.(?:[\w-]+\.)?(?P<lang>[\w-]+)'
+                         r'\.[0-9a-f]{10}\.js"></script>\r?\n', re.M)
+_MANIFEST_TAG = re.compile(r'^([ \t]*)<script src="(?:[^"]*/)?translations\.bundles\.js"></script>(\r?\n)', re.M)
+
+
+def link_bundles(text, sources):
+    """`text`, an HTML page, with a script tag for each of `sources` (bundle
+    URLs) right after its translations.bundles.js tag, in place of the
+    bundle tags of an earlier build. A page without that tag is returned
+    as it is.
+
+    The bundles then load with the page, before i18n.js, so t() works in
+    the page scripts that follow it without i18n.js injecting anything.
+    """
+    text = _BUNDLE_TAG.sub('', text)
+    match = _MANIFEST_TAG.search(text)
+    if not match:
+        return text
+    indent, newline = match.groups()
+    tags = ''.join(f'{indent}<script src="{html.escape(src)}"></script>{newline}' for src in sources)
+    return text[:match.end()] + tags + text[match.end():]
+
+
+class _Element:
+    __slots__ = ('tag', 'attrs', 'tag_start', 'tag_end', 'close_start', 'children', 'classes')
+
+    def __init__(self, tag, attrs, tag_start, tag_end):
+        self.tag = tag
+        self.attrs = attrs
+        self.tag_start = tag_start
+        self.tag_end = tag_end
+        # Start of the end tag; None while open, or if the element is never closed
+        self.close_start = None
+        # _Element instances, and [start, end] lists for text runs
+        self.children = []
+        self.classes = (attrs.get('class') or '').split()
+
+    def elements(self):
+        return [child for child in self.children if isinstance(child, _Element)]
+
+    def descendants(self):
+        for child in self.elements():
+            yield child
+            yield from child.descendants()
+
+
+class _TreeBuilder(HTMLParser):
+    """Element tree of a page with the source offsets of every tag and text run."""
+
+    def __init__(self, text):
+        super().__init__(convert_charrefs=False)
+        self.text = text
+        self.line_starts = [0] + [m.end() for m in re.finditer('\n', text)]
+        self.root = _Element('', {}, 0, 0)
+        self.stack = [self.root]
+        self.elements = []
+
+    def _offset(self):
+        line, column = self.getpos()
+        return self.line_starts[line - 1] + column
+
+    def _text(self, start, end):
+        children = self.stack[-1].children
+        if children and isinstance(children[-1], list) and children[-1][1] == start:
+            children[-1][1] = end
+        else:
+            children.append([start, end])
+
+    def handle_starttag(self, tag, attrs):
+        start = self._offset()
+        element = _Element(tag, dict(attrs), start, start + len(self.get_starttag_text()))
+        self.stack[-1].children.append(element)
+        self.elements.append(element)
+        if tag not in _VOID:
+            self.stack.append(element)
+
+    def handle_startendtag(self, tag, attrs):
+        start = self._offset()
+        element = _Element(tag, dict(attrs), start, start + len(self.get_starttag_text()))
+        self.stack[-1].children.append(element)
+        self.elements.append(element)
+
+    def handle_endtag(self, tag):
+        for depth in range(len(self.stack) - 1, 0, -1):
+            if self.stack[depth].tag == tag:
+                self.stack[depth].close_start = self._offset()
+                del self.stack[depth:]
+                return
+
+    def handle_data(self, data):
+        start = self._offset()
+        self._text(start, start + len(data))
+
+    def handle_entityref(self, name):
+        start = self._offset()
+        self._text(start, self.text.index(';', start) + 1)
+
+    handle_charref = handle_entityref
+
+    def handle_comment(self, data):
+        # A comment is a node of its own: the text around it is two text nodes
+        self.stack[-1].children.append(None)
+
+
+def _set_attributes(tag_text, values):
+    """`tag_text` (a whole start tag) with the attributes in `values` set."""
+    for name, value in values.items():
+        quoted = f'"{html.escape(value)}"'
+        pattern = re.compile(r'(?<![\w-])' + re.escape(name) + r'''\s*=\s*(?:"[^"]*"|'[^']*'|[^\s>]+)''', re.I)
+        if pattern.search(tag_text):
+            tag_text = pattern.sub(lambda _: f'{name}={quoted}', tag_text, count=1)
+        else:
+            close = len(tag_text) - (2 if tag_text.endswith('/>') else 1)
+            tag_text = f'{tag_text[:close].rstrip()} {name}={quoted}{tag_text[close:]}'
+    return tag_text
+
+
+def _content_edit(element, translated, text):
+    """(start, end, replacement) applying a data-i18n text, or None if it has nowhere to go."""
+    if element.close_start is None:
+        return None
+    escaped = html.escape(translated, quote=False)
+    if not element.elements():
+        return element.tag_end, element.close_start, escaped
+    span = next((child for child in element.descendants() if 'i18n-text' in child.classes), None)
+    if span is not None:
+        if span.close_start is None:
+            return None
+        return span.tag_end, span.close_start, escaped
+    for child in reversed(element.children):
+        if isinstance(child, list) and text[child[0]:child[1]].strip():
+            return child[0], child[1], '\n                    ' + escaped + '\n                '
+    return element.close_start, element.close_start, ' ' + escaped
+
+
+def prerender(text, entries, lang):
+    """Return (page, count): `text` with every data-i18n target filled from
+    `entries`, and the number of elements translated.
+
+    `entries` is one language of flat_catalog(); keys missing from it are
+    left alone, like t() returning the key. Pre-split entries are joined
+    back with their {placeholders} in place, as t() without params does.
+    """
+    builder = _TreeBuilder(text)
+    builder.feed(text)
+    builder.close()
+
+    def lookup(key):
+        value = entries.get(key) if key else None
+        if isinstance(value, list):
+            value = ''.join(part if i % 2 == 0 else f'{{{part}}}' for i, part in enumerate(value))
+        return value
+
+    edits = {}
+    for match in _BUNDLE_TAG.finditer(text):
+        if match.group('lang') != lang:
+            edits[match.start(), match.end()] = ''
+    count = 0
+    for element in builder.elements:
+        attributes = {}
+        for source, target in (('data-i18n-placeholder', 'placeholder'), ('data-i18n-title', 'title')):
+            translated = lookup(element.attrs.get(source))
+            if translated is not None:
+                attributes[target] = translated
+        translated_attributes = bool(attributes)
+        if element.tag == 'html':
+            attributes.update({'lang': lang, PRERENDERED_ATTR: lang})
+        if attributes:
+            edits[element.tag_start, element.tag_end] = _set_attributes(
+                text[element.tag_start:element.tag_end], attributes)
+
+        edit = None
+        translated = lookup(element.attrs.get('data-i18n'))
+        if translated is not None:
+            edit = _content_edit(element, translated, text)
+        translated = lookup(element.attrs.get('data-i18n-html'))
+        if translated is not None and element.close_start is not None:
+            edit = element.tag_end, element.close_start, translated
+        if edit:
+            # Document order, like querySelectorAll: a later edit of the same range wins
+            edits[edit[0], edit[1]] = edit[2]
+        if edit or translated_attributes:
+            count += 1
+
+    parts = []
+    pos = 0
+    for (start, end), replacement in sorted(edits.items()):
+        if start < pos:
+            # Inside a range an outer element already replaced
+            continue
+        parts.append(text[pos:start])
+        parts.append(replacement)
+        pos = end
+    parts.append(text[pos:])
+    return ''.join(parts), count
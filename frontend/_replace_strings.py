@@ -1,554 +1,2391 @@
 #!/usr/bin/env python3
-"""Replace hardcoded English strings with t() calls in cfss-project-details.js"""
-
+"""Replace hardcoded English strings with t() calls in the frontend JS files
+
+The rules of replace_rules.json and the rule templates below give the same
+result as applying them one after another with str.replace(), in the order
+they are listed (see RuleSet). Around the rewrite, the script checks the tree
+(--check), harvests, validates and merges translation keys (--extract,
+--validate, --consolidate) and generates what the pages load from
+translations.js: the bundles (--build-translations), the pre-rendered pages
+(--prerender) and precache.manifest.js. --help lists every option.
+
+Usage:
+    python _replace_strings.py                      # cfss-project-details.js
+    python _replace_strings.py frontend/            # every *.js in a directory
+    python _replace_strings.py "frontend/*.js" -j 4 # glob, 4 worker processes
+    python _replace_strings.py --where cfss.wallSaved   # values, file:line uses
+    python _replace_strings.py --key-for "Wall saved successfully!"
+"""
+
+import argparse
+import contextlib
+import glob
+import hashlib
+import json
+import os
+import pickle
 import re
+import shutil
+import sys
+import time
+import tracemalloc
+from bisect import bisect_right
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timezone
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+import _js_lexer as lexer
+from _edits import EditLog, changed_lines, changed_span, hunks, line_blocks, unified_diff
+from _extract import (DEFAULT_NAMESPACE, file_namespace, find_sites, placeholder_names, placeholder_order,
+                      propose_key, text_shape)
+from _key_index import open_index
+from _precache import PRECACHE_MANIFEST, SERVICE_WORKER, precache_hashes, render_precache_manifest, shell_urls
+from _prerender import VARIANT_NAME, link_bundles, prerender, variant_name, variant_of
+from _translations import (BUNDLE_MANIFEST, BUNDLE_NAME, Translations, add_entries, bundle_name, flat_catalog,
+                           frontend_files, keys_in, page_keys, remove_entries, rename_keys, render_bundle,
+                           render_bundle_manifest, render_flat_js, subset_catalog, validate)
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_TARGET = os.path.join(SCRIPT_DIR, 'cfss-project-details.js')
+DEFAULT_CACHE = os.path.join(SCRIPT_DIR, '.replace_strings_cache.json')
+DEFAULT_TOKENS_DIR = os.path.join(SCRIPT_DIR, '.replace_strings_tokens')
+DEFAULT_TRANSLATIONS = os.path.join(SCRIPT_DIR, 'translations.js')
+DEFAULT_RULES = os.path.join(SCRIPT_DIR, 'replace_rules.json')
+DEFAULT_RULE_PACK = os.path.join(SCRIPT_DIR, '.replace_rules.pack')
+CACHE_VERSION = 2
+PACK_VERSION = 2
+
+# Bump when the engine changes in a way that alters output for the same rules
+ENGINE_VERSION = 2
+
+# ============================================================
+# Rule templates - families of strings sharing one shape
+# ============================================================
+# Each template is a regex whose named groups capture the variable parts, a
+# `key` function deriving the key name from those groups, and a str.format()
+# `replacement` filled with the groups plus {key}. The key is that name in
+# the namespace of the file being rewritten (see file_namespace()). An
+# optional `fields` function adds more format fields. `overrides` maps a
+# derived key to the key actually used, for messages translated before the
+# naming scheme existed. An optional `text` is the English value of the key,
+# a str.format() of the groups: --extract gives a call site that is a whole
+# match that key and the template's replacement. A match is only rewritten when translations.js
+# defines its key in every language, and never inside the arguments of a
+# console.* call; the others are reported as unmatched. Templates run after
+# the literal rules of replace_rules.json.
+def camel(*words):
+    """camel('error', 'saving CFSS', 'data') -> 'errorSavingCFSSData'"""
+    parts = ' '.join(words).split()
+    return parts[0].lower() + ''.join(part[0].upper() + part[1:] for part in parts[1:])
+
+
+def _error_alert_key(groups):
+    return camel('error', groups['what'])
+
+
+def _summary_key(groups):
+    noun = groups['noun']
+    if groups['plural']:
+        noun += 's'
+    return camel(noun, 'added')
+
+
+def _summary_fields(groups):
+    count = groups['count']
+    return {'params': 'count' if count == 'count' else f'count: {count}'}
+
+
+rule_templates = [
+    # alert('Error saving parapet: ' + error.message)
+    {
+        'name': 'error-alert',
+        'pattern': r"alert\('Error (?P<what>[A-Za-z ]+?): ' \+ (?P<err>\w+)\.message\)",
+        'key': _error_alert_key,
+        'replacement': "alert(t('{key}') + ': ' + {err}.message)",
+        'text': 'Error {what}',
+        'overrides': {
+            'cfss.errorSavingProjectDetails': 'project.errorSavingDetails',
+            'cfss.errorGeneratingCFSSReport': 'cfss.errorGeneratingReport',
+            'cfss.errorCreatingFirstRevision': 'cfss.errorCreatingRevision',
+            'cfss.errorReloadingProjectData': 'cfss.errorReloadingData',
+            'cfss.errorSavingCurrentState': 'cfss.errorSavingState',
+            'cfss.errorSavingCFSSOptions': 'cfss.errorSavingOptions',
+        },
+    },
+    # `${count} parapet${count !== 1 ? 's' : ''} added` and `${n} soffites added`
+    {
+        'name': 'added-summary',
+        'pattern': (r"\$\{(?P<count>[\w.]+)\} (?P<noun>[a-z]+(?: [a-z]+)*)"
+                    r"(?P<plural>\$\{(?P=count) (?:=== 1 \? '' : 's'|!== 1 \? 's' : '')\})? added"),
+        'key': _summary_key,
+        'fields': _summary_fields,
+        'replacement': "${{t('{key}', {{ {params} }})}}",
+    },
+]
+
+
+# ============================================================
+# Rule engine
+# ============================================================
+# The patterns are found with str.find(), which runs in C, rather than by
+# stepping through the text one character at a time in Python. Patterns
+# sharing their first ANCHOR_LENGTH characters share one sweep of str.find()
+# for those characters, so a stage costs one sweep over the text per distinct
+# prefix rather than one per rule: most rules start with alert( or confirm(,
+# and the current rules need fewer than twenty sweeps. The output is then
+# assembled with a single join, however many rules fired.
+ANCHOR_LENGTH = 6
+
+
+class Scanner:
+    """Finds every occurrence of a list of literal patterns.
+
+    The patterns are grouped by their anchor, their first ANCHOR_LENGTH
+    characters. Each anchor is searched for through the text, and wherever
+    it occurs the patterns of its group are looked up by as many characters
+    as the group's shortest pattern has, then compared in full.
+    """
+
+    def __init__(self, patterns):
+        self.patterns = list(patterns)
+        groups = {}
+        for index, pattern in enumerate(self.patterns):
+            groups.setdefault(pattern[:ANCHOR_LENGTH], []).append(index)
+        self.groups = []
+        for anchor, indexes in groups.items():
+            head = min(len(self.patterns[index]) for index in indexes)
+            heads = {}
+            for index in indexes:
+                heads.setdefault(self.patterns[index][:head], []).append(index)
+            self.groups.append((anchor, head, heads))
+
+    def iter_matches(self, text):
+        """Yield (end, pattern index) for every occurrence, overlapping ones included.
+
+        The occurrences of one pattern come in text order; those of
+        different patterns are not interleaved by position.
+        """
+        patterns = self.patterns
+        find = text.find
+        startswith = text.startswith
+        for anchor, head, heads in self.groups:
+            pos = find(anchor)
+            while pos >= 0:
+                for index in heads.get(text[pos:pos + head], ()):
+                    if startswith(patterns[index], pos):
+                        yield pos + len(patterns[index]), index
+                pos = find(anchor, pos + 1)
+
+
+def _interferes(replacement, pattern):
+    """Whether `pattern` could match text that touches an inserted `replacement`."""
+    if not replacement or pattern in replacement or replacement in pattern:
+        return True
+    for k in range(1, min(len(pattern), len(replacement))):
+        if replacement.endswith(pattern[:k]) or replacement.startswith(pattern[-k:]):
+            return True
+    return False
+
+
+def stage_starts(rules):
+    """Indexes of the rules that start a new stage, the first rule included.
+
+    A rule joins the current stage unless an earlier replacement in it could
+    create or break one of its matches. This pairwise check is most of the
+    cost of building a RuleSet, which is why rule packs store its result.
+    """
+    starts = []
+    stage = []
+    for index, (old, _) in enumerate(rules):
+        if not stage or any(_interferes(new, old) for new in stage):
+            starts.append(index)
+            stage = []
+        stage.append(rules[index][1])
+    return starts
+
+
+class _Stage:
+    """Rules that can be applied together in a single scan.
+
+    `first` is the position of the stage's first rule in the rule set, so
+    statistics can be reported against the full rule list.
+    """
+
+    def __init__(self, rules, first=0):
+        self.rules = rules
+        self.first = first
+        self.lengths = [len(old) for old, _ in rules]
+        self.scanner = Scanner([old for old, _ in rules])
+
+    def match(self, text):
+        """Scan `text` once. Returns (hits, starts, chosen): every occurrence
+        start per rule, and the sorted starts of the matches that are
+        replaced, each mapped to (end, rule index)."""
+        hits = {}
+        for end, index in self.scanner.iter_matches(text):
+            hits.setdefault(index, []).append(end - self.lengths[index])
+
+        # Earlier rules claim their matches first; a later rule only keeps the
+        # occurrences that survive, scanned left to right like str.replace().
+        starts = []
+        chosen = {}
+        for index in sorted(hits):
+            length = self.lengths[index]
+            last_end = 0
+            for start in hits[index]:
+                end = start + length
+                if start < last_end:
+                    continue
+                k = bisect_right(starts, start)
+                if k and chosen[starts[k - 1]][0] > start:
+                    continue
+                if k < len(starts) and starts[k] < end:
+                    continue
+                starts.insert(k, start)
+                chosen[start] = (end, index)
+                last_end = end
+        return hits, starts, chosen
+
+    def assemble(self, text, starts, chosen):
+        """`text` with the matches chosen by match() replaced."""
+        pieces = []
+        pos = 0
+        for start in starts:
+            end, index = chosen[start]
+            pieces.append(text[pos:start])
+            pieces.append(self.rules[index][1])
+            pos = end
+        pieces.append(text[pos:])
+        return ''.join(pieces)
+
+    def apply(self, text, stats=None, log=None):
+        started = time.perf_counter() if stats is not None else 0
+        hits, starts, chosen = self.match(text)
+        result = self.assemble(text, starts, chosen)
+        if log is not None:
+            log.record(text, [(start, chosen[start][0], self.rules[chosen[start][1]][1]) for start in starts])
+
+        if stats is not None:
+            seconds = time.perf_counter() - started
+            applied = {}
+            for end, index in chosen.values():
+                applied[index] = applied.get(index, 0) + 1
+            for index in range(len(self.rules)):
+                counters = stats.rule(self.first + index)
+                counters['candidates'] += len(hits.get(index, ()))
+                counters['hits'] += applied.get(index, 0)
+            # One scan serves the whole stage: its cost cannot be split by rule
+            stats.stage(f'rules #{self.first}-#{self.first + len(self.rules) - 1}',
+                        len(text.encode('utf-8')), seconds)
+            stats.phase('rules', seconds)
+        return result
+
+
+_CONSOLE_CALL = re.compile(r'(?<![\w$.])console\.\w+\(')
+
+
+def _in_console_call(text, pos):
+    """Whether `pos` is inside the arguments of a console.*() call opened on its line."""
+    line_start = text.rfind('\n', 0, pos) + 1
+    calls = list(_CONSOLE_CALL.finditer(text, line_start, pos))
+    if not calls:
+        return False
+    between = text[calls[-1].end():pos]
+    return between.count('(') >= between.count(')')
+
+
+class _TemplateStage:
+    """All rule templates compiled into one alternation regex.
+
+    With `keys`, the keys every language of translations.js defines, a
+    match whose key is not among them is left as it is.
+    """
+
+    def __init__(self, templates, keys=None):
+        self.templates = templates
+        self.keys = keys
+        self.group_names = []
+        alternatives = []
+        for i, template in enumerate(templates):
+            # Group names must be unique across the alternation, so prefix
+            # each template's groups (and backreferences) with its index.
+            pattern = re.sub(r'\(\?P([<=])(\w+)', rf'(?P\1t{i}_\2', template['pattern'])
+            alternatives.append(f'(?P<t{i}>{pattern})')
+            self.group_names.append(list(re.compile(template['pattern']).groupindex))
+        self.regex = re.compile('|'.join(alternatives))
+
+    def expansion(self, match, namespace=DEFAULT_NAMESPACE):
+        """(key, replacement) for a match of self.regex in a file of `namespace`.
+
+        `replacement` is None when the match must stay as it is: inside a
+        console.*() call (`key` is None then), or when `key` is not defined.
+        """
+        if _in_console_call(match.string, match.start()):
+            return None, None
+        key, replacement = self.shape(match, namespace)
+        if self.keys is not None and key not in self.keys:
+            return key, None
+        return key, replacement
+
+    def shape(self, match, namespace=DEFAULT_NAMESPACE):
+        """(key, replacement) for a match, whether its key is defined or not."""
+        # The wrapping group closes last, so it is the one lastgroup reports
+        i = int(match.lastgroup[1:])
+        template = self.templates[i]
+        groups = {name: match.group(f't{i}_{name}') for name in self.group_names[i]}
+        key = f"{namespace}.{template['key'](groups)}"
+        key = template.get('overrides', {}).get(key, key)
+        fields = template['fields'](groups) if 'fields' in template else {}
+        return key, template['replacement'].format(key=key, **groups, **fields)
+
+    def site_shape(self, old, namespace=DEFAULT_NAMESPACE):
+        """(key, English text, replacement) if a whole call site `old` is a
+        match of a template with a 'text', else None."""
+        match = self.regex.fullmatch(old)
+        if match is None:
+            return None
+        i = int(match.lastgroup[1:])
+        template = self.templates[i]
+        if 'text' not in template:
+            return None
+        groups = {name: match.group(f't{i}_{name}') for name in self.group_names[i]}
+        key, replacement = self.shape(match, namespace)
+        return key, template['text'].format(**groups), replacement
+
+    def apply(self, text, stats=None, counter='hits', log=None, namespace=DEFAULT_NAMESPACE, unmatched=None):
+        """Expand every template match in `text`, with keys in `namespace`.
+
+        With `stats`, matches are counted per template under `counter`; only
+        'hits' (a whole-file pass) also records the scan's bytes and time, for
+        the stage as a whole.
+        With `log`, the expansions are recorded in it. Matches left alone
+        for want of a translation are appended to `unmatched`, if given, as
+        (line, template name, description), lines counted in `text`.
+        """
+        started = time.perf_counter()
+        counts = [0] * len(self.templates)
+        edits = []
+
+        def expand(match):
+            key, replacement = self.expansion(match, namespace)
+            if replacement is None:
+                if key is not None and unmatched is not None:
+                    name = self.templates[int(match.lastgroup[1:])]['name']
+                    unmatched.append((text.count('\n', 0, match.start()) + 1, name,
+                                      f'{key} (not in translations.js): {match.group()}'))
+                return match.group()
+            counts[int(match.lastgroup[1:])] += 1
+            edits.append((match.start(), match.end(), replacement))
+            return replacement
+
+        result = self.regex.sub(expand, text)
+        if log is not None:
+            log.record(text, edits)
+        if stats is None:
+            return result
+        seconds = time.perf_counter() - started
+        for index, count in enumerate(counts):
+            stats.template(index)[counter] += count
+        if counter == 'hits':
+            stats.stage('templates', len(text.encode('utf-8')), seconds)
+            stats.phase('templates', seconds)
+        return result
+
+
+def _template_signature(template):
+    functions = [template[name].__code__ for name in ('key', 'fields') if name in template]
+    return repr((template['name'], template['pattern'], template['replacement'],
+                 sorted(template.get('overrides', {}).items()),
+                 [(code.co_code, code.co_consts, code.co_names) for code in functions]))
+
+
+class RuleSet:
+    """Ordered (old, new) literal rules compiled into scanned stages.
+
+    When two matches overlap, the rule listed first wins, exactly as if it
+    had been applied first with str.replace(). A rule whose pattern could be
+    created or broken by an earlier replacement cannot share a scan with it,
+    so the rules are split into stages at those points (the current rules
+    fit in one). Rule templates follow as one more stage, a single regex
+    pass over the result.
+
+    With `lex` set, rewrite_sites() additionally matches call sites found by
+    the lexer against the rules, ignoring quoting, spacing and line breaks.
+
+    `compiled` is the output of compile_rules() for the same rules, as kept in
+    a rule pack; with it the stages are not worked out again. `keys`, from
+    translation_keys(), limits the templates to the keys translations.js
+    defines in every language, and gives the namespaces files map to.
+    """
+
+    def __init__(self, rules, templates=(), lex=False, compiled=None, keys=None):
+        self.rules = list(rules)
+        self.templates = list(templates)
+        self.lex = lex
+        self.keys = keys
+        self.namespaces = {key.split('.', 1)[0] for key in keys or ()}
+        for old, _ in self.rules:
+            if not old:
+                raise ValueError('Replacement rules need a non-empty pattern')
+
+        digest = hashlib.sha256(f'engine {ENGINE_VERSION}\0'.encode('utf-8'))
+        for old, new in self.rules:
+            digest.update(f'{old}\0{new}\0'.encode('utf-8'))
+        for template in self.templates:
+            digest.update(_template_signature(template).encode('utf-8'))
+        if lex:
+            digest.update(f'lexer {lexer.LEXER_VERSION}\0'.encode('utf-8'))
+        if keys is not None:
+            digest.update('keys\0{}'.format('\0'.join(sorted(keys))).encode('utf-8'))
+        self.fingerprint = digest.hexdigest()
+
+        if compiled is None:
+            compiled = compile_rules(self.rules, lex)
+        bounds = compiled['stages'] + [len(self.rules)]
+        self.stages = [_Stage(self.rules[first:end], first) for first, end in zip(bounds, bounds[1:])]
+        self.template_stage = _TemplateStage(self.templates, keys) if self.templates else None
+        if self.template_stage:
+            self.stages.append(self.template_stage)
+        self.site_table = compiled['site_table'] if lex else {}
+
+    def namespace(self, path):
+        """The namespace of the keys templates derive in the file at `path`."""
+        return file_namespace(path, self.namespaces)
+
+    def apply(self, text, stats=None, log=None, path='', unmatched=None):
+        """Run every stage over `text`, the content of the file at `path`.
+        Template matches left alone are appended to `unmatched`, if given
+        (see _TemplateStage.apply())."""
+        for stage in self.stages:
+            if stage is self.template_stage:
+                text = stage.apply(text, stats, log=log, namespace=self.namespace(path), unmatched=unmatched)
+            else:
+                text = stage.apply(text, stats, log=log)
+        return text
+
+    def rewrite_sites(self, text, tokens, stats=None, log=None, window=None, path=''):
+        return rewrite_sites(text, tokens, self.site_table, self.template_stage, stats, log, window,
+                             self.namespace(path))
+
+
+def compile_rules(rules, lex=True):
+    """The parts of a RuleSet that depend only on `rules`, as plain data:
+    the index of each stage's first rule, and the --lex site table (left
+    empty without `lex`)."""
+    return {
+        'stages': stage_starts(rules),
+        'site_table': build_site_table(rules) if lex else {},
+    }
+
+
+# ============================================================
+# Call-site pass (--lex)
+# ============================================================
+def _split_site(snippet):
+    """Split a rule snippet holding one call site into its parts.
+
+    Returns (name, before, argument, after, canonical argument), or None when
+    the snippet is not a single alert( / confirm( / .innerHTML = site.
+    """
+    tokens = lexer.tokenize(snippet)
+    sites = [i for i, token in enumerate(tokens) if token[0] == lexer.SITE]
+    if len(sites) != 1:
+        return None
+    index = sites[0]
+    span = lexer.site_argument(snippet, tokens, index)
+    if span is None:
+        return None
+    arg_start, arg_end, end = span
+    argument = snippet[arg_start:arg_end].strip()
+    return (tokens[index][3], snippet[:tokens[index][1]], argument, snippet[end:],
+            lexer.canonical(snippet, tokens, arg_start, arg_end, index + 1))
+
+
+def build_site_table(rules):
+    """Map (site name, canonical argument) to (new argument, rule index), from the literal rules.
+
+    Only rules that change nothing but the argument of one site qualify. The
+    receiver of .innerHTML is not part of the key, so a label rule covers
+    every button showing that label. The first rule wins, as in the engine.
+    """
+    table = {}
+    for index, (old, new) in enumerate(rules):
+        before = _split_site(old)
+        after = _split_site(new)
+        if before is None or after is None:
+            continue
+        name, prefix, _, suffix, key = before
+        if (after[0], after[1], after[3]) == (name, prefix, suffix):
+            table.setdefault((name, key), (after[2], index))
+    return table
+
+
+_MARKUP = re.compile(r'<[^>]*>|\$\{[^}]*\}|&\w+;')
+_WORD = re.compile(r'[A-Za-z]{2,}')
+_TRANSLATION_CALL = re.compile(r'(?<![\w$.])t\(\s*$')
+
+
+def _is_user_facing(text, tokens, start, end, first=0):
+    """Whether the literals in text[start:end] carry words a user would read.
+    The tokens are looked at from tokens[first] on, as in lexer.canonical()."""
+    for k in range(first, len(tokens)):
+        kind, token_start, token_end, _ = tokens[k]
+        if token_start >= end:
+            break
+        if token_end <= start or kind not in lexer.LITERALS:
+            continue
+        if _TRANSLATION_CALL.search(text, max(0, token_start - 8), token_start):
+            continue
+        if _WORD.search(_MARKUP.sub(' ', text[token_start + 1:token_end - 1])):
+            return True
+    return False
+
+
+def site_edits(text, tokens, table, template_stage=None, stats=None, window=None, unmatched=None,
+               namespace=DEFAULT_NAMESPACE):
+    """Yield the (start, stop, new) edits rewrite_sites() makes, in order.
+
+    The sites with user-facing strings that nothing matched are appended to
+    `unmatched`, if given, as described in rewrite_sites(). The edits are
+    produced lazily, so a caller only asking whether there is one stops the
+    scan at the first.
+    """
+    line_starts = [0] + [m.end() for m in re.finditer('\n', text)]
+    line_shift = 0
+    last_end = 0
+    for index, token in enumerate(tokens):
+        if token[0] != lexer.SITE:
+            continue
+        if window is not None and not window[0] <= token[1] < window[1]:
+            if token[1] >= window[1]:
+                break
+            continue
+        span = lexer.site_argument(text, tokens, index)
+        if span is None:
+            continue
+        arg_start, arg_end, end = span
+        raw = text[arg_start:arg_end]
+        start = arg_start + len(raw) - len(raw.lstrip())
+        stop = arg_end - len(raw) + len(raw.rstrip())
+        if start == stop or text.startswith('t(', start):
+            continue
+
+        name = token[3]
+        key = lexer.canonical(text, tokens, start, stop, index + 1)
+        new, rule = table.get((name, key), (None, None))
+        site_stats = None
+        if new is None and template_stage is not None:
+            # Counted only once the rewrite is known to be kept
+            site_stats = RunStats() if stats is not None else None
+            if name == 'innerHTML':
+                rewritten = template_stage.apply(key, site_stats, 'site_hits', namespace=namespace)
+                if rewritten != key:
+                    new = rewritten
+            else:
+                call = f'{name}({key})'
+                rewritten = template_stage.apply(call, site_stats, 'site_hits', namespace=namespace)
+                if rewritten != call:
+                    start, stop, new = token[1], end, rewritten
+
+        if new is None:
+            if unmatched is not None and _is_user_facing(text, tokens, start, stop, index + 1):
+                unmatched.append((bisect_right(line_starts, start) + line_shift, name, key))
+            continue
+        if start < last_end or new == text[start:stop]:
+            continue
+        if stats is not None:
+            if rule is not None:
+                stats.rule(rule)['site_hits'] += 1
+            elif site_stats is not None:
+                stats.merge(site_stats)
+        yield start, stop, new
+        line_shift += new.count('\n') - text.count('\n', start, stop)
+        last_end = stop
+
+
+def rewrite_sites(text, tokens, table, template_stage=None, stats=None, log=None, window=None,
+                  namespace=DEFAULT_NAMESPACE):
+    """Rewrite the call sites that match `table` or a template.
+
+    Returns (text, unmatched) where unmatched lists (line, site name,
+    canonical argument) for the sites with user-facing strings that nothing
+    matched. Line numbers refer to the returned text. With `stats`, each
+    rewrite is counted as a site hit of the rule or template behind it;
+    with `log`, the edits are recorded in it. With `window` (start, end),
+    only the sites starting in text[start:end] are visited. Templates
+    derive their keys in `namespace`.
+    """
+    unmatched = []
+    edits = list(site_edits(text, tokens, table, template_stage, stats, window, unmatched, namespace))
+    if not edits:
+        return text, unmatched
+    if log is not None:
+        log.record(text, edits)
+    pieces = []
+    pos = 0
+    for start, stop, new in edits:
+        pieces.append(text[pos:start])
+        pieces.append(new)
+        pos = stop
+    pieces.append(text[pos:])
+    return ''.join(pieces), unmatched
+
+
+def merge_unmatched(misses, sites):
+    """The template matches left alone and the unmatched call sites of one
+    file, in line order; a site on the line of a template match is the same
+    message, reported once."""
+    reported = {line for line, _, _ in misses}
+    return sorted(misses + [site for site in sites if site[0] not in reported])
+
+
+def load_tokens(path, text, tokens_dir=None):
+    """Token stream for `text`, reused from `tokens_dir` when the content is unchanged."""
+    if tokens_dir is None:
+        return lexer.tokenize(text)
+
+    digest = hashlib.sha256(text.encode('utf-8')).hexdigest()
+    name = hashlib.sha1(_cache_key(path).encode('utf-8')).hexdigest()
+    token_path = os.path.join(tokens_dir, name + '.json')
+    try:
+        with open(token_path, 'r', encoding='utf-8') as f:
+            cached = json.load(f)
+        if cached.get('lexer') == lexer.LEXER_VERSION and cached.get('digest') == digest:
+            return cached['tokens']
+    except (OSError, ValueError, AttributeError):
+        pass
+
+    tokens = lexer.tokenize(text)
+    os.makedirs(tokens_dir, exist_ok=True)
+    with open(token_path + '.tmp', 'w', encoding='utf-8') as f:
+        json.dump({'lexer': lexer.LEXER_VERSION, 'digest': digest, 'tokens': tokens}, f)
+    os.replace(token_path + '.tmp', token_path)
+    return tokens
+
+
+# ============================================================
+# File processing
+# ============================================================
+def expand_targets(patterns):
+    """Turn files, directories (their *.js) and glob patterns into a file list."""
+    paths = []
+    seen = set()
+    for pattern in patterns:
+        if os.path.isdir(pattern):
+            matches = sorted(glob.glob(os.path.join(pattern, '*.js')))
+        else:
+            matches = sorted(glob.glob(pattern)) or [pattern]
+        for path in matches:
+            key = os.path.normcase(os.path.abspath(path))
+            if key not in seen:
+                seen.add(key)
+                paths.append(path)
+    return paths
+
+
+def atomic_write(path, data):
+    """Replace `path` with `data` through a temporary file, so it is never half written."""
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'wb') as f:
+        f.write(data)
+    if os.path.exists(path):
+        shutil.copymode(path, tmp_path)
+    os.replace(tmp_path, path)
+
+
+def _patch_name(path):
+    return os.path.relpath(path).replace(os.sep, '/')
+
+
+# `changes` counts changed lines and `hunks` the unified-diff hunks they
+# form; `digest` is None when a dry run left pending changes unwritten, or
+# when the file could not be read or decoded, `error` then saying why.
+FileResult = namedtuple('FileResult', 'changes digest skipped unmatched stats diff hunks error',
+                        defaults=(None, None, 0, None))
+
+
+def rewrite_file(path, ruleset, cached_digest=None, tokens_dir=None, profile=False, dry_run=False,
+                 diff=False, chunk_size=None):
+    """Apply the rules to one file in place and return a FileResult.
+
+    The file is left alone when its content hash equals `cached_digest`,
+    i.e. it has not been touched since the last run with the same rule set;
+    `unmatched` is then None and the caller keeps the previous report.
+    It is not written either when the rules change nothing, so its mtime
+    stays put, nor with `dry_run`; otherwise a temporary file is renamed
+    over it. The lines changed and hunks come from the offsets of the edits
+    the rules made (_edits.py), not from diffing the texts. With `diff`,
+    the result carries the unified diff of the changes (--diff, --patch);
+    with `profile`, the file's RunStats.
+    With `chunk_size`, the file is streamed through stream_file() instead.
+    """
+    if chunk_size:
+        return stream_file(path, ruleset, cached_digest, chunk_size, profile)
+    stats = RunStats() if profile else None
+    started = time.perf_counter()
+    with open(path, 'rb') as f:
+        data = f.read()
+
+    digest = hashlib.sha256(data).hexdigest()
+    if digest == cached_digest:
+        return FileResult(0, digest, True, None)
+
+    original = data.decode('utf-8')
+    if stats is not None:
+        stats.files += 1
+        stats.bytes += len(data)
+        stats.phase('read', time.perf_counter() - started)
+    log = EditLog()
+    unmatched = []
+    content = ruleset.apply(original, stats, log, path, unmatched)
+    if ruleset.lex:
+        started = time.perf_counter()
+        tokens = load_tokens(path, content, tokens_dir)
+        content, sites = ruleset.rewrite_sites(content, tokens, stats, log, path=path)
+        unmatched = merge_unmatched(unmatched, sites)
+        if stats is not None:
+            stats.phase('lex', time.perf_counter() - started)
+    if content == original:
+        return FileResult(0, digest, False, unmatched, stats)
+
+    started = time.perf_counter()
+    blocks = line_blocks(original, content, log.regions)
+    hunk_list = hunks(original, content, blocks)
+    patch = unified_diff(_patch_name(path), hunk_list) if diff else None
+    if stats is not None:
+        stats.phase('diff', time.perf_counter() - started)
+    if dry_run:
+        return FileResult(changed_lines(blocks), None, False, unmatched, stats, patch, len(hunk_list))
+
+    started = time.perf_counter()
+    data = content.encode('utf-8')
+    atomic_write(path, data)
+    if stats is not None:
+        stats.phase('write', time.perf_counter() - started)
+    return FileResult(changed_lines(blocks), hashlib.sha256(data).hexdigest(), False, unmatched, stats,
+                      patch, len(hunk_list))
+
+
+# ============================================================
+# Streaming (--stream)
+# ============================================================
+DEFAULT_CHUNK_SIZE = 1 << 20
+
+
+def stream_limits(ruleset):
+    """(reach, spanning) for stream_file(): the longest pattern, and the
+    patterns holding a line break, which a cut between two lines must avoid.
+
+    Template matches never cross a line, nor a ';' (see _statement_cut()).
+    A pattern spanning lines is only checked against the input, so it must
+    be in the first stage, where no earlier replacement can produce it;
+    otherwise ValueError is raised.
+    """
+    reach = max((len(old) for old, _ in ruleset.rules), default=0)
+    spanning = []
+    for stage in ruleset.stages:
+        for old, _ in getattr(stage, 'rules', ()):
+            if '\n' in old:
+                if stage is not ruleset.stages[0]:
+                    raise ValueError(f'rule {old[:40]!r} spans lines and can be produced by an earlier '
+                                     f'rule, so --stream cannot split the input around it')
+                spanning.append(old)
+    return reach, spanning
+
+
+def _safe_cut(text, limit, spanning):
+    """The last line start of text[:limit + 1] that no pattern of `spanning`
+    occurs across, or -1. text[limit:] must be as long as the longest pattern."""
+    newline = text.rfind('\n', 0, limit)
+    while newline >= 0:
+        cut = newline + 1
+        # An occurrence inside this slice necessarily straddles the cut
+        if not any(old in text[max(0, cut - len(old) + 1):cut + len(old) - 1] for old in spanning):
+            return cut
+        newline = text.rfind('\n', 0, newline)
+    return -1
+
+
+def _statement_cut(text, limit, reach, scanners):
+    """The last position of text[:limit + 1] right after a ';' that the rules
+    cannot act across, or -1. text[limit:] must hold 2 * `reach` characters.
+
+    No pattern of a literal stage (`scanners`) may occur within 2 * `reach`
+    of the cut: no stage then touches the `reach` characters on either side
+    of it, so no later stage finds a match across it either. Templates, the
+    last stage, match within a statement, so they stop at the ';'; the cut
+    must not be inside a console.*() call, which they look back for.
+    """
+    semicolon = text.rfind(';', 0, limit)
+    while semicolon >= 0:
+        cut = semicolon + 1
+        window = text[max(0, cut - 2 * reach):cut + 2 * reach]
+        if (not any(next(scanner.iter_matches(window), None) for scanner in scanners)
+                and not _in_console_call(text, cut)):
+            return cut
+        semicolon = text.rfind(';', 0, semicolon)
+    return -1
+
+
+def stream_segments(f, chunk_size, reach, spanning=(), scanners=None):
+    """Yield the text of `f` in pieces of about `chunk_size` characters that
+    the rules can be applied to one at a time.
+
+    A piece ends at a line start, with at least `reach` characters read
+    beyond it, so no literal match is split: a match crossing the cut would
+    contain its line break. With `scanners`, those of the literal stages, a
+    line longer than `chunk_size` (a minified bundle) is cut after a ';'
+    instead, where _statement_cut() finds the rules cannot act across.
+    Only a line with no such place makes a piece grow past `chunk_size`.
+    """
+    buffer = ''
+    while True:
+        chunk = f.read(chunk_size)
+        if not chunk:
+            if buffer:
+                yield buffer
+            return
+        buffer += chunk
+        if len(buffer) >= max(chunk_size, 2 * reach + 1):
+            cut = _safe_cut(buffer, len(buffer) - reach, spanning)
+            if cut <= 0 and scanners is not None:
+                cut = _statement_cut(buffer, len(buffer) - 2 * reach, reach, scanners)
+            if cut > 0:
+                yield buffer[:cut]
+                buffer = buffer[cut:]
+
+
+def _file_digest(path, chunk_size=DEFAULT_CHUNK_SIZE):
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(chunk_size), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def stream_file(path, ruleset, cached_digest=None, chunk_size=DEFAULT_CHUNK_SIZE, profile=False):
+    """rewrite_file() for inputs too large to hold in memory.
+
+    The file is read `chunk_size` characters at a time and the rules run
+    over each piece stream_segments() cuts, the output going to a temporary
+    file as it is produced, so memory stays around a few pieces whatever
+    the file size, so generated bundles far larger than the sources can be
+    processed. The output is identical to rewrite_file()'s. Lines changed
+    and hunks are counted per piece; there is no --lex pass, --diff or
+    --patch.
+    """
+    digest = _file_digest(path)
+    if digest == cached_digest:
+        return FileResult(0, digest, True, None)
+
+    stats = RunStats() if profile else None
+    if stats is not None:
+        stats.files += 1
+    reach, spanning = stream_limits(ruleset)
+    scanners = [stage.scanner for stage in ruleset.stages if stage is not ruleset.template_stage]
+    output = hashlib.sha256()
+    changed = False
+    changes = 0
+    hunk_count = 0
+    tmp_path = path + '.tmp'
+    try:
+        with open(path, 'r', encoding='utf-8', newline='') as src, open(tmp_path, 'wb') as dst:
+            for segment in stream_segments(src, chunk_size, reach, spanning, scanners):
+                log = EditLog()
+                content = ruleset.apply(segment, stats, log, path)
+                if content != segment:
+                    changed = True
+                    blocks = line_blocks(segment, content, log.regions)
+                    changes += changed_lines(blocks)
+                    hunk_count += len(hunks(segment, content, blocks))
+                data = content.encode('utf-8')
+                output.update(data)
+                dst.write(data)
+                if stats is not None:
+                    stats.bytes += len(segment.encode('utf-8'))
+        if not changed:
+            os.remove(tmp_path)
+            return FileResult(0, digest, False, [], stats)
+        shutil.copymode(path, tmp_path)
+        os.replace(tmp_path, path)
+    except BaseException:
+        with contextlib.suppress(OSError):
+            os.remove(tmp_path)
+        raise
+    return FileResult(changes, output.hexdigest(), False, [], stats, None, hunk_count)
+
+
+# ============================================================
+# Check mode (--check)
+# ============================================================
+def check_text(text, ruleset, find_all=False, tokens=None, path=''):
+    """The places where the rules would rewrite `text`, found without
+    building the rewritten text: [(start, end, description)], sorted.
+
+    Each literal stage is searched with its Scanner (one str.find() sweep
+    per anchor group) and the templates with one regex scan, all over `text`
+    as is, and the scan stops at the first hit unless
+    `find_all` is set. A stage's hits are exact as long as no earlier stage
+    rewrites the text around them. With `tokens` (the --lex pass), call
+    sites the site table or a template would rewrite count too. `path`
+    sets the namespace of template keys, as in RuleSet.apply().
+    """
+    hits = []
+    namespace = ruleset.namespace(path)
+    for stage in ruleset.stages:
+        if isinstance(stage, _TemplateStage):
+            for match in stage.regex.finditer(text):
+                replacement = stage.expansion(match, namespace)[1]
+                if replacement is not None and replacement != match.group():
+                    name = stage.templates[int(match.lastgroup[1:])]['name']
+                    hits.append((match.start(), match.end(), f"template {name}"))
+                    if not find_all:
+                        return hits
+            continue
+        for end, index in stage.scanner.iter_matches(text):
+            old, new = stage.rules[index]
+            if old != new:
+                hits.append((end - len(old), end, f"rule {stage.first + index + 1}: {' '.join(old.split())[:60]}"))
+                if not find_all:
+                    return hits
+    if tokens is not None:
+        for start, stop, _ in site_edits(text, tokens, ruleset.site_table, ruleset.template_stage,
+                                         namespace=namespace):
+            if not any(start < hit_end and hit_start < stop for hit_start, hit_end, _ in hits):
+                hits.append((start, stop, f"call site: {' '.join(text[start:stop].split())[:60]}"))
+                if not find_all:
+                    return hits
+    return sorted(hits)
+
+
+def check_file(path, ruleset, find_all=False, tokens_dir=None):
+    """[(line, description)] for check_text() over the file at `path`."""
+    with open(path, 'rb') as f:
+        text = f.read().decode('utf-8')
+    hits = check_text(text, ruleset, find_all, path=path)
+    if ruleset.lex and (find_all or not hits):
+        hits = check_text(text, ruleset, find_all, load_tokens(path, text, tokens_dir), path)
+    if not hits:
+        return []
+    line_starts = [0] + [m.end() for m in re.finditer('\n', text)]
+    return [(bisect_right(line_starts, start), description) for start, _, description in hits]
+
+
+def run_check(targets, ruleset, args):
+    """--check: report where the targets still hold something the rules
+    would rewrite, as file:line; return True if anything was found or a file
+    could not be checked.
+
+    Each file is searched with check_text(), up to its first hit (every hit
+    with --all), and the rewritten text is never built. main() adds the
+    pre-rendered pages and the precache manifest when the whole tree is
+    checked.
+    """
+    started = time.perf_counter()
+    paths = expand_targets(targets)
+    if len(paths) <= 1 or args.jobs == 1:
+        results = {path: check_or_error(path, ruleset, args.all, args.tokens_dir) for path in paths}
+    else:
+        workers = min(args.jobs or os.cpu_count() or 1, len(paths))
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                 initargs=(ruleset, args.tokens_dir, {'find_all': args.all})) as pool:
+            results = dict(pool.map(_check_in_worker, paths))
+
+    dirty = 0
+    locations = 0
+    errors = 0
+    for path in paths:
+        hits, error = results[path]
+        if error is not None:
+            print(f"{os.path.relpath(path)}: error: {error}")
+            errors += 1
+            continue
+        for line, description in hits:
+            print(f"{os.path.relpath(path)}:{line}: {description}")
+        dirty += bool(hits)
+        locations += len(hits)
+    wall = time.perf_counter() - started
+    if dirty:
+        found = f"{locations} location(s)" if args.all else "first location shown per file"
+        print(f"{dirty} of {len(paths)} file(s) would be rewritten ({found}, {wall:.2f} s)")
+    else:
+        print(f"{len(paths) - errors} file(s) checked, nothing to rewrite ({wall:.2f} s)")
+    if errors:
+        print(f"{errors} file(s) could not be checked")
+    return dirty > 0 or errors > 0
+
+
+# ============================================================
+# Incremental cache
+# ============================================================
+def _cache_key(path):
+    return os.path.normcase(os.path.abspath(path))
+
 
-# Read the file
-with open(r'c:\stuff\Protection Seismic\practice\projects\test-real-thing\stable\ps2000\frontend\cfss-project-details.js', 'r', encoding='utf-8') as f:
-    content = f.read()
+def load_cache(cache_path, ruleset):
+    """Return the {file: {'digest', 'unmatched'}} map from the last run, or {} if it is stale.
+
+    Files whose content hash and rule set are unchanged since then are
+    skipped (--force processes them anyway, --clear-cache drops the cache).
+    """
+    try:
+        with open(cache_path, 'r', encoding='utf-8') as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    if (not isinstance(cache, dict) or cache.get('version') != CACHE_VERSION
+            or cache.get('rules') != ruleset.fingerprint):
+        return {}
+    return cache.get('files', {})
+
+
+def save_cache(cache_path, ruleset, files):
+    text = json.dumps({'version': CACHE_VERSION, 'rules': ruleset.fingerprint, 'files': files},
+                      indent=1, sort_keys=True)
+    atomic_write(cache_path, text.encode('utf-8'))
 
-original = content
 
 # ============================================================
-# ALERT replacements - simple string alerts
+# Rule data and rule packs
 # ============================================================
-alert_replacements = {
-    # Floor grouping
-    "alert('Please select at least 2 floors to group.');": "alert(t('cfss.selectAtLeast2Floors'));",
-    "alert('Please select consecutive floors only.');": "alert(t('cfss.selectConsecutiveFloors'));",
-    "alert('One or more selected floors are already in a group. Please ungroup them first.');": "alert(t('cfss.floorsAlreadyGrouped'));",
-    "alert('Failed to save floor grouping. Please try again.');": "alert(t('cfss.failedSaveGrouping'));",
-
-    # Permission errors
-    "alert('You do not have permission to edit this project.');": "alert(t('project.noEditPermission'));",
-    "alert('You do not have permission to add parapets to this project.');": "alert(t('cfss.noPermissionAddParapets'));",
-    "alert('You do not have permission to add walls to this project.');": "alert(t('cfss.noPermissionAddWalls'));",
-    "alert('You do not have permission to edit walls in this project.');": "alert(t('cfss.noPermissionEditWalls'));",
-    "alert('You do not have permission to delete walls from this project.');": "alert(t('cfss.noPermissionDeleteWalls'));",
-    "alert('You do not have permission to add CFSS data to this project.');": "alert(t('cfss.noPermissionAddCFSSData'));",
-    "alert('You do not have permission to modify CFSS data for this project.');": "alert(t('cfss.noPermissionModifyCFSSData'));",
-    "alert('You do not have permission to edit windows in this project.');": "alert(t('cfss.noPermissionEditWindows'));",
-    "alert('You do not have permission to modify options for this project.');": "alert(t('cfss.noPermissionModifyOptions'));",
-
-    # Project details
-    "alert('Please fill in all required fields.');": "alert(t('common.fillRequiredFields'));",
-    "alert('Project details updated successfully!');": "alert(t('project.detailsUpdated'));",
-
-    # Compositions
-    "alert('You must have at least one composition');": "alert(t('cfss.mustHaveOneComposition'));",
-
-    # Parapet validation
-    "alert('Please enter a parapet name.');": "alert(t('cfss.enterParapetName'));",
-    "alert('Please select a parapet type.');": "alert(t('cfss.selectParapetType'));",
-    "alert('Please enter hauteur max.');": "alert(t('cfss.enterHauteurMax'));",
-    "alert('Please select a unit for hauteur max.');": "alert(t('cfss.selectHauteurMaxUnit'));",
-    "alert('Please select montant métallique.');": "alert(t('cfss.selectMontantMetallique'));",
-    "alert('Please select espacement.');": "alert(t('cfss.selectEspacement'));",
-    "alert('Please enter lisse Inférieure.');": "alert(t('cfss.enterLisseInferieure'));",
-    "alert('Please enter lisse Supérieure.');": "alert(t('cfss.enterLisseSuperieure'));",
-    "alert('Please select entremise.');": "alert(t('cfss.selectEntremise'));",
-
-    # Parapet CRUD
-    "alert('Parapet saved successfully!');": "alert(t('cfss.parapetSaved'));",
-    "alert('Parapet updated successfully!');": "alert(t('cfss.parapetUpdated'));",
-    "alert('Parapet not found.');": "alert(t('cfss.parapetNotFound'));",
-    "alert('Parapet deleted successfully!');": "alert(t('cfss.parapetDeleted'));",
-
-    # Image upload
-    "alert('Please select valid image files.');": "alert(t('cfss.selectValidImages'));",
-    "alert('Maximum 1 image allowed per parapet. Please remove existing image to add a new one.');": "alert(t('cfss.maxOneImageParapet'));",
-    "alert('Maximum 1 image allowed per parapet.');": "alert(t('cfss.maxOneImageParapetShort'));",
-    "alert('Maximum 2 images allowed per wall. Please remove existing images to add new ones.');": "alert(t('cfss.maxTwoImagesWall'));",
-
-    # Soffite
-    "alert('Please enter a soffite name.');": "alert(t('cfss.enterSoffiteName'));",
-
-    # File operations
-    "alert('Please enter a file name');": "alert(t('cfss.enterFileName'));",
-    "alert('Please enter a link URL');": "alert(t('cfss.enterLinkUrl'));",
-    "alert('Please select a file');": "alert(t('cfss.selectFile'));",
-    "alert('File uploaded successfully!');": "alert(t('cfss.fileUploaded'));",
-    "alert('File not found');": "alert(t('cfss.fileNotFound'));",
-    "alert('File deleted successfully');": "alert(t('cfss.fileDeleted'));",
-
-    # Revisions
-    "alert('Maximum of 5 revisions allowed. Please delete an old revision first.');": "alert(t('cfss.maxRevisionsReached'));",
-    "alert('Failed to save wall. Please try again.');": "alert(t('cfss.failedSaveWall'));",
-    "alert('No revisions found. Please add walls to create revisions first.');": "alert(t('cfss.noRevisionsFound'));",
-
-    # Report generation
-    "alert('Please select a revision.');": "alert(t('cfss.selectRevision'));",
-    "alert('Selected revision not found.');": "alert(t('cfss.revisionNotFound'));",
-    "alert('Error: No project selected');": "alert(t('cfss.noProjectSelected'));",
-    "alert('Report sent to Google Drive successfully!');": "alert(t('cfss.reportSentToDrive'));",
-    "alert('CFSS PDF generation timed out. Please try again in a few minutes.');": "alert(t('cfss.pdfTimedOut'));",
-    "alert('Please select a revision to generate the report for.');": "alert(t('cfss.selectRevisionForReport'));",
-    "alert('No walls found to include in the report. Please add walls first.');": "alert(t('cfss.noWallsForReport'));",
-
-    # Project data
-    "alert('Current state saved successfully');": "alert(t('cfss.stateSaved'));",
-
-    # Wall validation
-    "alert('Please enter a wall name.');": "alert(t('cfss.enterWallName'));",
-    "alert('Please enter a floor.');": "alert(t('cfss.enterFloor'));",
-    "alert('Please enter at least one height value.');": "alert(t('cfss.enterHeightValue'));",
-    "alert('Please select units.');": "alert(t('cfss.selectUnits'));",
-    "alert('Please select a déflexion max.');": "alert(t('cfss.selectDeflexionMax'));",
-    "alert('Please select montant métallique 2.');": "alert(t('cfss.selectMontantMetallique2'));",
-    "alert('Please select espacement 2.');": "alert(t('cfss.selectEspacement2'));",
-    "alert('Please enter lisse Supérieure 2.');": "alert(t('cfss.enterLisseSuperieure2'));",
-    "alert('Please enter lisse Inférieure 2.');": "alert(t('cfss.enterLisseInferieure2'));",
-    "alert('Please select entremise 2.');": "alert(t('cfss.selectEntremise2'));",
-    "alert('Please select an espacement.');": "alert(t('cfss.selectAnEspacement'));",
-    "alert('Please select entremise spacing.');": "alert(t('cfss.selectEntremiseSpacing'));",
-    "alert('Please select montant métallique.');": "alert(t('cfss.selectMontantMetallique'));",
-
-    # Wall CRUD
-    "alert('Wall updated successfully!');": "alert(t('cfss.wallUpdated'));",
-    "alert('Wall saved successfully!');": "alert(t('cfss.wallSaved'));",
-
-    # CFSS data
-    "alert('CFSS Data Saved Successfully!');": "alert(t('cfss.dataSaved'));",
-    "alert('Add at least one floor with valid data (either calculated with H > 0, or manual ULS/SLS values).');": "alert(t('cfss.addValidFloorData'));",
-
-    # Window validation
-    "alert('Please select a window type.');": "alert(t('cfss.selectWindowType'));",
-    "alert('Please enter valid dimensions.');": "alert(t('cfss.enterValidDimensions'));",
-    "alert('Window updated successfully!');": "alert(t('cfss.windowUpdated'));",
-    "alert('Window not found.');": "alert(t('cfss.windowNotFound'));",
-    "alert('Window form not found.');": "alert(t('cfss.windowFormNotFound'));",
-    "alert('Window saved successfully!');": "alert(t('cfss.windowSaved'));",
-
-    # Options
-    "alert('No breakdown available. Please ensure the calculation inputs are complete.');": "alert(t('cfss.noBreakdownAvailable'));",
-    "alert('Fill in all wind calculation fields.');": "alert(t('cfss.fillWindCalcFields'));",
-    "alert('No walls found in the current revision.');": "alert(t('cfss.noWallsInRevision'));",
+# The literal rules live in replace_rules.json: sections whose "rules" are
+# [old, new] pairs, applied in file order, with "# ..." strings as comments.
+# Compiling them costs a noticeable fraction of a second, so the result is
+# kept in a rule pack (plain lists and dicts, pickled) and reused until the
+# data file, the engine or the lexer changes.
+RuleEntry = namedtuple('RuleEntry', 'section position old new')
+
+# How the text of rule i holds the pattern of rule j, for every pair whose
+# relative order matters:
+#   'unreachable'  i's pattern contains the pattern of an earlier rule j,
+#                  which always claims the text first, so i never fires
+#   'shadows'      i's pattern contains the pattern of a later rule j; moving
+#                  j before i would make i unreachable
+#   'feeds'        i's replacement contains the pattern of a later rule j,
+#                  which rewrites it again (they run in separate stages)
+#   'feeds-back'   i's replacement contains the pattern of an earlier rule j;
+#                  moving j after i would rewrite it
+#   'repeats'      i's replacement contains its own pattern (j == i), so every
+#                  run rewrites the file again
+_DEPENDENCY_MESSAGES = {
+    'unreachable': '{i} never fires: its pattern contains the pattern of {j}, listed earlier',
+    'shadows': '{i} must stay before {j}: its pattern contains the pattern of {j}',
+    'feeds': '{j} rewrites the replacement of {i}, listed earlier',
+    'feeds-back': '{i} must stay after {j}: its replacement contains the pattern of {j}',
+    'repeats': '{i} is not idempotent: its replacement contains its own pattern',
 }
 
-for old, new in alert_replacements.items():
-    content = content.replace(old, new)
+
+def parse_rules(source, path):
+    """Return the RuleEntry list of the rule data `source`, read from `path`.
+
+    `position` counts the rules of a section from 1, comments left out.
+    Raises ValueError when the data does not have the expected shape.
+    """
+    data = json.loads(source)
+    if not isinstance(data, dict) or data.get('format') != 1 or not isinstance(data.get('sections'), list):
+        raise ValueError(f'{path}: not a format 1 rule file')
+    entries = []
+    for section in data['sections']:
+        position = 0
+        for item in section['rules']:
+            if isinstance(item, str) and item.startswith('#'):
+                continue
+            if not (isinstance(item, list) and len(item) == 2 and all(isinstance(part, str) for part in item)):
+                raise ValueError(f'{path}: {section["name"]}: expected an [old, new] pair, got {item!r}')
+            position += 1
+            entries.append(RuleEntry(section['name'], position, *item))
+    return entries
+
+
+def render_rules(data):
+    """The text of rule data `data`, laid out like replace_rules.json: one
+    rule per line, and a blank line before a comment that follows a rule."""
+    out = ['{', f'  "format": {json.dumps(data["format"])},', '  "sections": [']
+    for number, section in enumerate(data['sections'], 1):
+        out.append('    {')
+        out.append(f'      "name": {json.dumps(section["name"], ensure_ascii=False)},')
+        out.append(f'      "title": {json.dumps(section["title"], ensure_ascii=False)},')
+        out.append('      "rules": [')
+        items = section['rules']
+        for index, item in enumerate(items):
+            if isinstance(item, str) and index and not isinstance(items[index - 1], str):
+                out.append('')
+            comma = ',' if index < len(items) - 1 else ''
+            out.append(f'        {json.dumps(item, ensure_ascii=False)}{comma}')
+        out.append('      ]')
+        out.append('    }' + (',' if number < len(data['sections']) else ''))
+    out += ['  ]', '}', '']
+    return '\n'.join(out)
+
+
+def dedupe_rules(entries):
+    """Return (kept, duplicates, conflicts) for the RuleEntry list `entries`.
+
+    Only the first entry for a pattern is kept: it is the one that fires, as
+    with str.replace(). `duplicates` pairs every later entry repeating it
+    exactly with the kept one, and `conflicts` every later entry giving the
+    same pattern another replacement.
+    """
+    first = {}
+    kept, duplicates, conflicts = [], [], []
+    for entry in entries:
+        earlier = first.get(entry.old)
+        if earlier is None:
+            first[entry.old] = entry
+            kept.append(entry)
+        elif earlier.new == entry.new:
+            duplicates.append((entry, earlier))
+        else:
+            conflicts.append((entry, earlier))
+    return kept, duplicates, conflicts
+
+
+def rule_dependencies(rules):
+    """Return (kind, i, j) for every ordered pair of rules whose texts
+    contain each other's patterns (see _DEPENDENCY_MESSAGES)."""
+    scanner = Scanner([old for old, _ in rules])
+    found = []
+    for i, (old, new) in enumerate(rules):
+        for j in sorted({index for _, index in scanner.iter_matches(old)} - {i}):
+            found.append(('unreachable' if j < i else 'shadows', i, j))
+        for j in sorted({index for _, index in scanner.iter_matches(new)}):
+            found.append(('repeats' if j == i else 'feeds' if j > i else 'feeds-back', i, j))
+    return found
+
+
+def _rule_label(entry):
+    return f'{entry.section} #{entry.position}'
+
+
+def _pack_key(source):
+    digest = hashlib.sha256(f'pack {PACK_VERSION}\0engine {ENGINE_VERSION}\0lexer {lexer.LEXER_VERSION}\0'
+                            .encode('utf-8'))
+    digest.update(source)
+    return digest.hexdigest()
+
+
+def compile_rule_file(path, source=None):
+    """Compile the rule data file `path` (whose bytes are `source`, if already read).
+
+    Returns (pack, kept, duplicates): the rule pack and dedupe_rules()'s
+    output. Raises ValueError when a pattern is listed twice with different
+    replacements, since which one was meant is unclear.
+    """
+    if source is None:
+        with open(path, 'rb') as f:
+            source = f.read()
+    kept, duplicates, conflicts = dedupe_rules(parse_rules(source, path))
+    if conflicts:
+        raise ValueError('\n'.join(
+            f'{path}: {_rule_label(entry)} gives the pattern of {_rule_label(earlier)} another replacement: '
+            f'{entry.old}' for entry, earlier in conflicts))
+    rules = [(entry.old, entry.new) for entry in kept]
+    pack = {'version': PACK_VERSION, 'key': _pack_key(source), 'rules': rules,
+            'compiled': compile_rules(rules)}
+    return pack, kept, duplicates
+
+
+def read_rule_pack(pack_path, source):
+    """The rule pack at `pack_path`, or None if it is missing, unreadable or
+    was not compiled from `source` by this engine."""
+    try:
+        with open(pack_path, 'rb') as f:
+            pack = pickle.load(f)
+    except (OSError, EOFError, pickle.UnpicklingError, ValueError, TypeError, AttributeError, ImportError):
+        return None
+    if not isinstance(pack, dict) or pack.get('version') != PACK_VERSION or pack.get('key') != _pack_key(source):
+        return None
+    return pack
+
+
+def write_rule_pack(pack_path, pack):
+    atomic_write(pack_path, pickle.dumps(pack, protocol=pickle.HIGHEST_PROTOCOL))
+
+
+def load_ruleset(rules_path, pack_path, templates=(), lex=False, keys=None):
+    """RuleSet for the rule data file `rules_path`, taken from the rule pack
+    when it is up to date; otherwise the rules are compiled and the pack is
+    rewritten."""
+    with open(rules_path, 'rb') as f:
+        source = f.read()
+    pack = read_rule_pack(pack_path, source)
+    if pack is None:
+        pack = compile_rule_file(rules_path, source)[0]
+        write_rule_pack(pack_path, pack)
+    return RuleSet(pack['rules'], templates, lex, compiled=pack['compiled'], keys=keys)
+
+
+def translation_keys(values):
+    """The keys every language of `values` ({lang: {key: text}}, as in
+    Translations.values) defines: the only ones rule templates may emit."""
+    languages = list(values.values())
+    if not languages:
+        return frozenset()
+    return frozenset(key for key in languages[0] if all(key in other for other in languages[1:]))
+
+
+def run_compile_rules(rules_path, pack_path):
+    """--compile-rules: rebuild the rule pack and report duplicates and
+    order-dependent rules. Returns True when a rule never fires or is not
+    idempotent."""
+    pack, kept, duplicates = compile_rule_file(rules_path)
+    write_rule_pack(pack_path, pack)
+    stages = len(pack['compiled']['stages'])
+    print(f"Compiled {len(kept)} rules from {os.path.relpath(rules_path)} into {os.path.relpath(pack_path)} "
+          f"({stages} stage{'s' if stages != 1 else ''}, {os.path.getsize(pack_path) / 1e3:.1f} kB)")
+    if duplicates:
+        print(f'{len(duplicates)} duplicate rule(s) dropped:')
+        for entry, earlier in duplicates:
+            print(f'  {_rule_label(entry)} repeats {_rule_label(earlier)}: {entry.old}')
+
+    dependencies = rule_dependencies(pack['rules'])
+    if dependencies:
+        print(f'{len(dependencies)} order-dependent rule pair(s):')
+        for kind, i, j in dependencies:
+            message = _DEPENDENCY_MESSAGES[kind].format(i=_rule_label(kept[i]), j=_rule_label(kept[j]))
+            print(f'  {kind}: {message}')
+    return any(kind in ('unreachable', 'repeats') for kind, _, _ in dependencies)
+
 
 # ============================================================
-# Alert replacements with dynamic content (template literals or concatenation)
+# Parallel runs
 # ============================================================
-# alert('Error saving project details: ' + error.message)
-content = content.replace(
-    "alert('Error saving project details: ' + error.message)",
-    "alert(t('project.errorSavingDetails') + ': ' + error.message)"
-)
-
-# alert('Error saving parapet: ' + error.message)
-content = content.replace(
-    "alert('Error saving parapet: ' + error.message)",
-    "alert(t('cfss.errorSavingParapet') + ': ' + error.message)"
-)
-
-# alert('Error updating parapet: ' + error.message)
-content = content.replace(
-    "alert('Error updating parapet: ' + error.message)",
-    "alert(t('cfss.errorUpdatingParapet') + ': ' + error.message)"
-)
-
-# alert('Error saving soffites: ' + error.message)
-content = content.replace(
-    "alert('Error saving soffites: ' + error.message)",
-    "alert(t('cfss.errorSavingSoffites') + ': ' + error.message)"
-)
-
-# alert('Error uploading file: ' + error.message)
-content = content.replace(
-    "alert('Error uploading file: ' + error.message)",
-    "alert(t('cfss.errorUploadingFile') + ': ' + error.message)"
-)
-
-# alert('Error downloading file: ' + error.message)
-content = content.replace(
-    "alert('Error downloading file: ' + error.message)",
-    "alert(t('cfss.errorDownloadingFile') + ': ' + error.message)"
-)
-
-# alert('Error deleting file: ' + error.message)
-content = content.replace(
-    "alert('Error deleting file: ' + error.message)",
-    "alert(t('cfss.errorDeletingFile') + ': ' + error.message)"
-)
-
-# alert('Error saving description: ' + error.message)
-content = content.replace(
-    "alert('Error saving description: ' + error.message)",
-    "alert(t('cfss.errorSavingDescription') + ': ' + error.message)"
-)
-
-# alert('Error generating CFSS report: ' + error.message)
-content = content.replace(
-    "alert('Error generating CFSS report: ' + error.message)",
-    "alert(t('cfss.errorGeneratingReport') + ': ' + error.message)"
-)
-
-# alert('Error creating first revision: ' + error.message)
-content = content.replace(
-    "alert('Error creating first revision: ' + error.message)",
-    "alert(t('cfss.errorCreatingRevision') + ': ' + error.message)"
-)
-
-# alert('Error reloading project data: ' + error.message)
-content = content.replace(
-    "alert('Error reloading project data: ' + error.message)",
-    "alert(t('cfss.errorReloadingData') + ': ' + error.message)"
-)
-
-# alert('Error saving current state: ' + error.message)
-content = content.replace(
-    "alert('Error saving current state: ' + error.message)",
-    "alert(t('cfss.errorSavingState') + ': ' + error.message)"
-)
-
-# alert('Error saving wall: ' + error.message)
-content = content.replace(
-    "alert('Error saving wall: ' + error.message)",
-    "alert(t('cfss.errorSavingWall') + ': ' + error.message)"
-)
-
-# alert('Error saving wall changes: ' + error.message)
-content = content.replace(
-    "alert('Error saving wall changes: ' + error.message)",
-    "alert(t('cfss.errorSavingWallChanges') + ': ' + error.message)"
-)
-
-# alert('Error saving walls: ' + error.message)
-content = content.replace(
-    "alert('Error saving walls: ' + error.message)",
-    "alert(t('cfss.errorSavingWalls') + ': ' + error.message)"
-)
-
-# alert('Error displaying wall details: ' + error.message)
-content = content.replace(
-    "alert('Error displaying wall details: ' + error.message)",
-    "alert(t('cfss.errorDisplayingWallDetails') + ': ' + error.message)"
-)
-
-# alert('Error saving wall: ' + error.message)  - duplicate is fine, replace_all
-content = content.replace(
-    "alert('Error saving CFSS data: ' + error.message)",
-    "alert(t('cfss.errorSavingCFSSData') + ': ' + error.message)"
-)
-
-# alert('Error updating window: ' + error.message)
-content = content.replace(
-    "alert('Error updating window: ' + error.message)",
-    "alert(t('cfss.errorUpdatingWindow') + ': ' + error.message)"
-)
-
-# alert('Error saving CFSS options: ' + error.message)
-content = content.replace(
-    "alert('Error saving CFSS options: ' + error.message)",
-    "alert(t('cfss.errorSavingOptions') + ': ' + error.message)"
-)
-
-# alert('Error saving windows: ' + err.message)
-content = content.replace(
-    "alert('Error saving windows: ' + err.message)",
-    "alert(t('cfss.errorSavingWindows') + ': ' + err.message)"
-)
-
-# alert(`Error displaying options. Please try again.`)
-content = content.replace(
-    "alert('Error displaying options. Please try again.');",
-    "alert(t('cfss.errorDisplayingOptions'));"
-)
-
-# alert with template literals for dynamic content
-# alert(`Maximum ${MAX_COMPOSITIONS} compositions reached`)
-content = content.replace(
-    "alert(`Maximum ${MAX_COMPOSITIONS} compositions reached`)",
-    "alert(t('cfss.maxCompositionsReached', { max: MAX_COMPOSITIONS }))"
-)
-
-# alert(`Error uploading ${file.name}: ${error.message}`)
-content = content.replace(
-    "alert(`Error uploading ${file.name}: ${error.message}`)",
-    "alert(t('cfss.errorUploadingImage', { name: file.name, error: error.message }))"
-)
-
-# alert(`You can only add ${remainingSlots} more image(s). Maximum 2 images allowed per wall.`)
-content = content.replace(
-    "alert(`You can only add ${remainingSlots} more image(s). Maximum 2 images allowed per wall.`)",
-    "alert(t('cfss.remainingImageSlots', { remaining: remainingSlots }))"
-)
-
-# alert(`Revision ${selectedRevision.number} contains no walls. Please select a revision with walls.`)
-content = content.replace(
-    "alert(`Revision ${selectedRevision.number} contains no walls. Please select a revision with walls.`)",
-    "alert(t('cfss.revisionNoWalls', { number: selectedRevision.number }))"
-)
-
-# alert(`Successfully saved ${selectedCFSSOptions.length} CFSS construction options!`)
-content = content.replace(
-    "alert(`Successfully saved ${selectedCFSSOptions.length} CFSS construction options!`)",
-    "alert(t('cfss.optionsSaved', { count: selectedCFSSOptions.length }))"
-)
-
-# alert('Error deleting template: ' + error.message)
-content = content.replace(
-    "alert('Error deleting template: ' + error.message)",
-    "alert(t('cfss.errorDeletingTemplate') + ': ' + error.message)"
-)
+# The rule set is compiled once in the parent and handed to each worker when
+# the pool starts, instead of every worker (or every file) rebuilding it.
+_worker_ruleset = None
+_worker_tokens_dir = None
+_worker_options = {}
+
+
+def _init_worker(ruleset, tokens_dir, options=None):
+    global _worker_ruleset, _worker_tokens_dir, _worker_options
+    _worker_ruleset = ruleset
+    _worker_tokens_dir = tokens_dir
+    _worker_options = options or {}
+
+
+def _rewrite_in_worker(job):
+    path, cached_digest = job
+    return path, rewrite_or_error(path, _worker_ruleset, cached_digest, _worker_tokens_dir, **_worker_options)
+
+
+def _check_in_worker(path):
+    return path, check_or_error(path, _worker_ruleset, tokens_dir=_worker_tokens_dir, **_worker_options)
+
+
+def rewrite_or_error(path, ruleset, cached_digest=None, tokens_dir=None, **options):
+    """rewrite_file(), with a file that cannot be read or is not UTF-8
+    reported in the FileResult instead of ending the whole run."""
+    try:
+        return rewrite_file(path, ruleset, cached_digest, tokens_dir, **options)
+    except (OSError, UnicodeDecodeError) as exc:
+        return FileResult(0, None, False, [], error=str(exc))
+
+
+def check_or_error(path, ruleset, find_all=False, tokens_dir=None):
+    """(hits, error): check_file()'s hits, or None and why the file could not be checked."""
+    try:
+        return check_file(path, ruleset, find_all, tokens_dir), None
+    except (OSError, UnicodeDecodeError) as exc:
+        return None, str(exc)
+
+
+def rewrite_files(paths, ruleset, jobs=None, cache=None, force=False, tokens_dir=None, **options):
+    """Rewrite every path, in parallel when there is more than one.
+
+    `cache` maps cache keys to the entries recorded by the last run; it is
+    updated in place, and ignored for lookups when `force` is set. Skipped
+    files get their unmatched-site report back from the cache. `options`
+    (profile, dry_run, diff) are passed on to rewrite_file(). A file that
+    cannot be read or decoded gets a FileResult with its `error` and is
+    dropped from the cache; the other files are processed all the same.
+    Returns {path: FileResult}.
+    """
+    cache = {} if cache is None else cache
+    work = []
+    for path in paths:
+        entry = None if force else cache.get(_cache_key(path))
+        work.append((path, entry['digest'] if entry else None))
+
+    if len(paths) <= 1 or jobs == 1:
+        results = {path: rewrite_or_error(path, ruleset, cached, tokens_dir, **options) for path, cached in work}
+    else:
+        workers = min(jobs or os.cpu_count() or 1, len(paths))
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                 initargs=(ruleset, tokens_dir, options)) as pool:
+            results = dict(pool.map(_rewrite_in_worker, work))
+
+    for path, result in results.items():
+        key = _cache_key(path)
+        if result.skipped:
+            results[path] = result._replace(unmatched=cache[key].get('unmatched', []))
+        elif result.digest is None:
+            # Changes left pending by a dry run, or a file that could not be
+            # processed: it must be looked at again
+            cache.pop(key, None)
+        else:
+            cache[key] = {'digest': result.digest, 'unmatched': result.unmatched}
+    return results
+
 
 # ============================================================
-# CONFIRM replacements
+# Run statistics (--stats)
 # ============================================================
-content = content.replace(
-    "confirm('Are you sure you want to delete this soffite?')",
-    "confirm(t('cfss.confirmDeleteSoffite'))"
-)
-content = content.replace(
-    "confirm('Are you sure you want to delete this file?')",
-    "confirm(t('cfss.confirmDeleteFile'))"
-)
-content = content.replace(
-    "confirm('Are you sure you want to logout?')",
-    "confirm(t('auth.confirmLogout'))"
-)
-content = content.replace(
-    "confirm('Are you sure you want to delete this wall and all its images?')",
-    "confirm(t('cfss.confirmDeleteWallAndImages'))"
-)
-content = content.replace(
-    "confirm('Are you sure you want to delete this window?')",
-    "confirm(t('cfss.confirmDeleteWindow'))"
-)
-# confirm with template literal for parapet name
-content = content.replace(
-    'confirm(`Are you sure you want to delete parapet "${parapet.parapetName}"?`)',
-    'confirm(t("cfss.confirmDeleteParapet", { name: parapet.parapetName }))'
-)
-# confirm with template literal for wall name
-content = content.replace(
-    'confirm(`Are you sure you want to delete wall "${wallName}" and all its images?`)',
-    'confirm(t("cfss.confirmDeleteWallNamed", { name: wallName }))'
-)
-# confirm('Delete this template?')
-content = content.replace(
-    "confirm('Delete this template?')",
-    "confirm(t('cfss.confirmDeleteTemplate'))"
-)
+class RunStats:
+    """Counters behind --stats, collected per file and merged in the parent.
+
+    `rules` and `templates` map a position in the rule set to its counters:
+      candidates  occurrences of the pattern the scan found (literal rules)
+      hits        replacements made by the whole-file pass
+      site_hits   call sites rewritten by the --lex pass
+    The rules of a stage, and the templates, are found by one shared scan,
+    so time is only known per stage: `stages` maps a stage name ('rules
+    #0-#120', 'templates') to the bytes it scanned and its seconds.
+    """
+
+    def __init__(self):
+        self.files = 0
+        self.bytes = 0
+        self.phases = {}
+        self.rules = {}
+        self.templates = {}
+        self.stages = {}
+
+    def phase(self, name, seconds):
+        self.phases[name] = self.phases.get(name, 0.0) + seconds
+
+    def stage(self, name, scanned=0, seconds=0.0):
+        counters = self.stages.setdefault(name, {'bytes': 0, 'seconds': 0.0})
+        counters['bytes'] += scanned
+        counters['seconds'] += seconds
+        return counters
+
+    def rule(self, index):
+        return self.rules.setdefault(index, {'candidates': 0, 'hits': 0, 'site_hits': 0})
+
+    def template(self, index):
+        return self.templates.setdefault(index, {'hits': 0, 'site_hits': 0})
+
+    def merge(self, other):
+        self.files += other.files
+        self.bytes += other.bytes
+        for name, seconds in other.phases.items():
+            self.phase(name, seconds)
+        for name, counters in other.stages.items():
+            self.stage(name, counters['bytes'], counters['seconds'])
+        for mine, theirs, new in ((self.rules, other.rules, self.rule),
+                                  (self.templates, other.templates, self.template)):
+            for index, counters in theirs.items():
+                merged = new(index)
+                for field, value in counters.items():
+                    merged[field] += value
+
+
+def peak_memory():
+    """{'process': bytes, 'workers': bytes} of peak memory, None where unknown.
+
+    Peak resident set size where the resource module exists; elsewhere the
+    peak of the Python heap traced since --stats started tracemalloc.
+    """
+    if resource is not None:
+        # ru_maxrss is in kilobytes, except on macOS where it is in bytes
+        scale = 1 if sys.platform == 'darwin' else 1024
+        return {'process': resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * scale,
+                'workers': resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss * scale}
+    if tracemalloc.is_tracing():
+        return {'process': tracemalloc.get_traced_memory()[1], 'workers': None}
+    return {'process': None, 'workers': None}
+
+
+def _rule_status(old, new, counters):
+    if old == new:
+        return 'no-op'
+    if counters['hits'] or counters['site_hits']:
+        return 'live'
+    # Found, but always inside the match of a rule listed earlier
+    return 'shadowed' if counters['candidates'] else 'dead'
+
+
+def stats_record(stats, ruleset, wall, skipped):
+    """The JSON document --stats-json appends for one run."""
+    rules = []
+    for index, (old, new) in enumerate(ruleset.rules):
+        counters = stats.rule(index)
+        rules.append({'index': index,
+                      'id': hashlib.sha1(old.encode('utf-8')).hexdigest()[:10],
+                      'pattern': ' '.join(old.split())[:80],
+                      'status': _rule_status(old, new, counters),
+                      **counters})
+    templates = []
+    for index, template in enumerate(ruleset.templates):
+        counters = stats.template(index)
+        templates.append({'index': index, 'name': template['name'],
+                          'status': 'live' if counters['hits'] or counters['site_hits'] else 'dead',
+                          **counters})
+    return {
+        'time': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+        'rules_fingerprint': ruleset.fingerprint,
+        'files': stats.files,
+        'skipped': skipped,
+        'bytes': stats.bytes,
+        'wall_seconds': wall,
+        'mb_per_second': stats.bytes / wall / 1e6 if wall else None,
+        'peak_memory': peak_memory(),
+        'phases': stats.phases,
+        'stages': [{'name': name, **counters} for name, counters in stats.stages.items()],
+        'rules': rules,
+        'templates': templates,
+    }
+
+
+def _megabytes(value):
+    return 'n/a' if value is None else f'{value / 1e6:.1f} MB'
+
+
+def print_stats(record):
+    memory = record['peak_memory']
+    rate = record['mb_per_second']
+    print(f"Stats: {record['files']} file(s), {record['bytes'] / 1e3:.1f} KB in "
+          f"{record['wall_seconds']:.3f} s wall" + (f" ({rate:.1f} MB/s)" if rate else '')
+          + f", peak memory {_megabytes(memory['process'])} (workers {_megabytes(memory['workers'])})")
+    if record['skipped']:
+        print(f"  {record['skipped']} file(s) skipped by the cache were not scanned; "
+              f"use --force to profile them too")
+    for name, seconds in sorted(record['phases'].items(), key=lambda item: -item[1]):
+        print(f"  {name:<10} {seconds:8.3f} s")
+    # Rules sharing a stage are found by one scan, so there is no time per rule
+    for stage in record['stages']:
+        print(f"  stage {stage['name']}: {stage['seconds']:.3f} s over {stage['bytes'] / 1e3:.1f} KB")
+
+    live = [rule for rule in record['rules'] if rule['status'] == 'live']
+    live.sort(key=lambda rule: -(rule['hits'] + rule['site_hits']))
+    if live:
+        print(f"  {'hits':>6} {'sites':>6} {'found':>6}  rule")
+    for rule in live:
+        print(f"  {rule['hits']:6d} {rule['site_hits']:6d} {rule['candidates']:6d}  "
+              f"#{rule['index']} {rule['pattern'][:70]}")
+    for template in record['templates']:
+        print(f"  {template['hits']:6d} {template['site_hits']:6d} {'':>6}  "
+              f"template {template['name']}" + (' (dead)' if template['status'] == 'dead' else ''))
+
+    for status, meaning in (('dead', 'pattern found in no scanned file'),
+                            ('shadowed', 'always inside an earlier rule\'s match'),
+                            ('no-op', 'replacement equals the pattern')):
+        flagged = [rule for rule in record['rules'] if rule['status'] == status]
+        if flagged:
+            print(f"{len(flagged)} {status} rule(s) ({meaning}):")
+            for rule in flagged:
+                print(f"  #{rule['index']} {rule['pattern'][:70]}")
+
+
+def append_stats_json(path, record):
+    """Append `record` as one line of JSON, so successive runs can be trended."""
+    with open(path, 'a', encoding='utf-8') as f:
+        f.write(json.dumps(record, ensure_ascii=False, sort_keys=True) + '\n')
+
+
+# ============================================================
+# Translation key validation
+# ============================================================
+def rule_keys(ruleset):
+    """Every translation key the rules and templates can emit, as far as it is static."""
+    keys = keys_in(new for _, new in ruleset.rules)
+    for template in ruleset.templates:
+        keys |= set(template.get('overrides', {}).values())
+    return keys
+
+
+def run_validation(translations_path, ruleset, index_path=None):
+    """--validate: check every key the rules emit and every key used in the
+    frontend tree next to translations.js (t() calls, data-i18n attributes)
+    against it, reporting missing fr/en entries and unused keys. Return
+    True if a used key is missing.
+
+    The uses and the translations come from the key index (_key_index.py),
+    which only rescans the files changed since it was last updated.
+    """
+    index = open_index(translations_path, index_path)
+    translations = index.translations
+    uses, prefixes = index.uses, index.prefixes
+    emitted = rule_keys(ruleset)
+    report = validate(translations, uses, prefixes, emitted)
+
+    name = os.path.relpath(translations_path)
+    counts = ', '.join(f'{lang}: {len(values)}' for lang, values in translations.values.items())
+    print(f"Validated {len(uses)} used key(s) and {len(emitted)} rule key(s) against {name} ({counts})")
+    for lang, keys in report.missing.items():
+        for key in keys:
+            where = [f'{os.path.relpath(use.path)}:{use.line}' for use in uses.get(key, ())]
+            if not where:
+                where = ['emitted by a rule']
+            more = f' (+{len(where) - 1} more)' if len(where) > 1 else ''
+            print(f"  missing {lang}: {key} - {where[0]}{more}")
+    for lang, keys in report.untranslated.items():
+        for key in keys:
+            other = next(other for other in translations.languages if key in translations.values[other])
+            print(f"{name}:{translations.lines[other][key]}: {key} has no {lang} entry")
+    for lang, key, line in report.duplicates:
+        print(f"{name}:{line}: {lang}.{key} is defined more than once")
+    for key in report.unused:
+        lang = next(lang for lang in translations.languages if key in translations.values[lang])
+        print(f"{name}:{translations.lines[lang][key]}: unused key {key}")
+
+    missing = sum(len(keys) for keys in report.missing.values())
+    untranslated = sum(len(keys) for keys in report.untranslated.values())
+    print(f"{missing} missing, {untranslated} untranslated, {len(report.unused)} unused, "
+          f"{len(report.duplicates)} duplicate key(s)")
+    return missing > 0
+
+
+def run_queries(translations_path, index_path, keys=(), texts=()):
+    """--where / --key-for: answer from the key index; return True if a query found nothing."""
+    index = open_index(translations_path, index_path)
+    name = os.path.relpath(translations_path)
+    not_found = False
+    for key in keys:
+        values = index.values_of(key)
+        uses = index.locations(key)
+        if not values and not uses:
+            print(f"{key}: neither defined nor used")
+            not_found = True
+            continue
+        print(key)
+        for lang, value in values.items():
+            print(f"  {name}:{index.source['lines'][lang][key]}: {lang}: {value!r}")
+        for use in uses:
+            print(f"  {os.path.relpath(use.path)}:{use.line}")
+        if not uses:
+            print("  never used")
+    for text in texts:
+        found = index.keys_for_text(text)
+        similar = '' if found else ' (containing)'
+        found = found or index.search_text(text)
+        if not found:
+            print(f"{text!r}: no English entry")
+            not_found = True
+            continue
+        print(f"{text!r}{similar}:")
+        for key in found:
+            print(f"  {key}: {index.source['values']['en'][key]!r} ({len(index.locations(key))} use(s))")
+    return not_found
+
 
 # ============================================================
-# innerHTML button labels
+# Extraction (--extract)
 # ============================================================
+EXTRACTED_SECTION = 'extracted'
+
+# `sites` are the _extract.Site instances sharing the message; `reused` is
+# True when the key already existed in translations.js, or was given to an
+# earlier message of the same meaning
+Extraction = namedtuple('Extraction', 'key text reused sites')
+
+
+def _message_index_key(text):
+    return text_shape(text), placeholder_order(placeholder_names(text))
+
+
+def extract_messages(paths, ruleset, translations):
+    """Harvest the call sites no rule covers in `paths` and give every
+    distinct message a key.
+
+    Each file is rewritten in memory first (with the --lex pass if
+    `ruleset` has it), so only what the current rules leave behind is
+    collected. Messages are indexed by their text with the placeholder
+    names blanked, across all files at once, and matched the same way
+    against the English entries of `translations`. A site that is a whole
+    match of a rule template with a `text` gets the template's key, value
+    and call instead; other sites holding a template match are left to it.
+    Returns (extractions, rules), `rules` as (path, old, new) in order of
+    first appearance, one per distinct source snippet.
+    """
+    english = translations.values.get('en', {})
+    known = {}
+    for key, value in english.items():
+        known.setdefault(_message_index_key(value), key)
+    namespaces = {key.split('.', 1)[0] for key in translations.keys()}
+    taken = {key: english.get(key) for key in translations.keys()}
+
+    templates = ruleset.template_stage
+    groups = {}
+    shaped_sites = {}
+    for path in paths:
+        with open(path, 'rb') as f:
+            content = ruleset.apply(f.read().decode('utf-8'), path=path)
+        if ruleset.lex:
+            content, _ = ruleset.rewrite_sites(content, lexer.tokenize(content), path=path)
+        for site in find_sites(content, path):
+            if templates is not None and templates.regex.search(site.old):
+                # Left to the template, whose rewrite of the other sites of
+                # the family must show the same value
+                shaped = templates.site_shape(site.old, ruleset.namespace(path))
+                if shaped is not None:
+                    shaped_sites.setdefault(shaped[:2], []).append((site, shaped[2]))
+                continue
+            groups.setdefault(_message_index_key(site.message.text), []).append(site)
+
+    extractions = []
+    rules = []
+    seen = set()
+    proposed = set()
+    for (key, text), sites in shaped_sites.items():
+        for site, replacement in sites:
+            if site.old not in seen:
+                seen.add(site.old)
+                rules.append((site.path, site.old, replacement))
+        extractions.append(Extraction(key, text, key in english or key in proposed,
+                                      [site for site, _ in sites]))
+        proposed.add(key)
+        taken[key] = text
+    for index_key, sites in groups.items():
+        text = sites[0].message.text
+        key = known.get(index_key)
+        if key is None:
+            spaces = {file_namespace(site.path, namespaces) for site in sites}
+            key = propose_key(spaces.pop() if len(spaces) == 1 else DEFAULT_NAMESPACE, text, taken)
+        # The placeholder names of the text the key holds, which may be
+        # another message's of the same meaning (see propose_key())
+        names = list(dict.fromkeys(placeholder_names(taken[key])))
+        for site in sites:
+            if site.old not in seen:
+                seen.add(site.old)
+                rules.append((site.path, site.old, site.message.build(key, names)))
+        extractions.append(Extraction(key, text, key in english or key in proposed, sites))
+        proposed.add(key)
+    return extractions, rules
+
+
+def run_extract(paths, ruleset, rules_path, translations_path):
+    """--extract: append rules for the uncovered call sites of `paths` to the
+    rule data file, and their new English entries to translations.js.
+
+    The sites are those --lex reports (see _extract.py). The rules go to
+    the EXTRACTED_SECTION section, so running with --lex afterwards applies
+    them; the other languages are missing until translated.
+    """
+    with open(translations_path, 'r', encoding='utf-8', newline='') as f:
+        source = f.read()
+    translations = Translations.parse(source)
+    extractions, rules = extract_messages(paths, ruleset, translations)
+    if not rules:
+        print(f"No call site left to extract in {len(paths)} file(s)")
+        return
+
+    with open(rules_path, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+    section = next((section for section in data['sections'] if section['name'] == EXTRACTED_SECTION), None)
+    if section is None:
+        section = {'name': EXTRACTED_SECTION, 'title': 'Rules written by --extract', 'rules': []}
+        data['sections'].append(section)
+    current = None
+    for path, old, new in rules:
+        if path != current:
+            section['rules'].append(f'# {os.path.basename(path)}')
+            current = path
+        section['rules'].append([old, new])
+    atomic_write(rules_path, render_rules(data).encode('utf-8'))
+
+    entries = [(extraction.key, extraction.text) for extraction in extractions if not extraction.reused]
+    if entries:
+        atomic_write(translations_path, add_entries(source, translations, 'en', entries).encode('utf-8'))
+
+    sites = sum(len(extraction.sites) for extraction in extractions)
+    files = len({site.path for extraction in extractions for site in extraction.sites})
+    print(f"Extracted {sites} call site(s) in {files} file(s): {len(extractions)} message(s), "
+          f"{len(extractions) - len(entries)} with an existing key, {len(entries)} new")
+    for extraction in extractions:
+        state = 'existing' if extraction.reused else 'new'
+        where = f'{os.path.relpath(extraction.sites[0].path)}:{extraction.sites[0].line}'
+        more = f' (+{len(extraction.sites) - 1} more)' if len(extraction.sites) > 1 else ''
+        print(f"  {extraction.key} ({state}) {' '.join(extraction.text.split())[:60]!r} - {where}{more}")
+    print(f"{len(rules)} rule(s) added to section '{EXTRACTED_SECTION}' of {os.path.relpath(rules_path)}")
+    if entries:
+        print(f"{len(entries)} English entries added to {os.path.relpath(translations_path)}; "
+              f"their other languages are missing until translated (see --validate)")
+    print("Apply them with --lex on the same files, then run --build-translations")
 
-# Edit Project Details button
-content = content.replace(
-    """editBtn.innerHTML = '<i class="fas fa-times"></i> Cancel Edit';""",
-    """editBtn.innerHTML = `<i class="fas fa-times"></i> ${t('common.cancelEdit')}`;"""
-)
-content = content.replace(
-    """editBtn.innerHTML = '<i class="fas fa-edit"></i> Edit Project Details';""",
-    """editBtn.innerHTML = `<i class="fas fa-edit"></i> ${t('project.editProjectDetails')}`;"""
-)
-
-# Save Changes button (spinner)
-content = content.replace(
-    """saveBtn.innerHTML = '<i class="fas fa-spinner fa-spin"></i> Saving...';""",
-    """saveBtn.innerHTML = `<i class="fas fa-spinner fa-spin"></i> ${t('common.saving')}`;"""
-)
-
-# Save Changes button
-content = content.replace(
-    """saveBtn.innerHTML = '<i class="fas fa-save"></i> Save Changes';""",
-    """saveBtn.innerHTML = `<i class="fas fa-save"></i> ${t('common.saveChanges')}`;"""
-)
-
-# Max compositions button
-content = content.replace(
-    'btn.innerHTML = `<i class="fas fa-check"></i> Max (${MAX_COMPOSITIONS})`;',
-    'btn.innerHTML = `<i class="fas fa-check"></i> ${t("cfss.maxComps", { max: MAX_COMPOSITIONS })}`;'
-)
-content = content.replace(
-    """btn.innerHTML = `<i class="fas fa-plus"></i> Add`;""",
-    """btn.innerHTML = `<i class="fas fa-plus"></i> ${t('common.add')}`;"""
-)
-
-# Add Parapet button
-content = content.replace(
-    """addParapetButton.innerHTML = '<i class="fas fa-building"></i> Add Parapet';""",
-    """addParapetButton.innerHTML = `<i class="fas fa-building"></i> ${t('cfss.addParapet')}`;"""
-)
-
-# Hide Form button (parapet)
-content = content.replace(
-    """addParapetButton.innerHTML = '<i class="fas fa-times"></i> Hide Form';""",
-    """addParapetButton.innerHTML = `<i class="fas fa-times"></i> ${t('common.hideForm')}`;"""
-)
-
-# Add Parapet button (in getElementById)
-content = content.replace(
-    """document.getElementById('addParapetButton').innerHTML = '<i class="fas fa-building"></i> Add Parapet';""",
-    """document.getElementById('addParapetButton').innerHTML = `<i class="fas fa-building"></i> ${t('cfss.addParapet')}`;"""
-)
-
-# Add Soffites button
-content = content.replace(
-    """addSoffitesButton.innerHTML = '<i class="fas fa-grip-lines-vertical"></i> Add Soffites';""",
-    """addSoffitesButton.innerHTML = `<i class="fas fa-grip-lines-vertical"></i> ${t('cfss.addSoffites')}`;"""
-)
-content = content.replace(
-    """document.getElementById('addSoffitesButton').innerHTML = '<i class="fas fa-grip-lines-vertical"></i> Add Soffites';""",
-    """document.getElementById('addSoffitesButton').innerHTML = `<i class="fas fa-grip-lines-vertical"></i> ${t('cfss.addSoffites')}`;"""
-)
-
-# Hide Form button (soffites)
-content = content.replace(
-    """addSoffitesButton.innerHTML = '<i class="fas fa-times"></i> Hide Form';""",
-    """addSoffitesButton.innerHTML = `<i class="fas fa-times"></i> ${t('common.hideForm')}`;"""
-)
-content = content.replace(
-    """document.getElementById('addSoffitesButton').innerHTML = '<i class="fas fa-times"></i> Hide Form';""",
-    """document.getElementById('addSoffitesButton').innerHTML = `<i class="fas fa-times"></i> ${t('common.hideForm')}`;"""
-)
-
-# Upload button
-content = content.replace(
-    """submitBtn.innerHTML = '<i class="fas fa-spinner fa-spin"></i> Uploading...';""",
-    """submitBtn.innerHTML = `<i class="fas fa-spinner fa-spin"></i> ${t('common.uploading')}`;"""
-)
-content = content.replace(
-    """submitBtn.innerHTML = '<i class="fas fa-upload"></i> Upload';""",
-    """submitBtn.innerHTML = `<i class="fas fa-upload"></i> ${t('common.upload')}`;"""
-)
-
-# Generate CFSS Report buttons
-content = content.replace(
-    """generateButton.innerHTML = `<i class="fas fa-spinner fa-spin"></i> Generating CFSS Report...`;""",
-    """generateButton.innerHTML = `<i class="fas fa-spinner fa-spin"></i> ${t('cfss.generatingReport')}`;"""
-)
-content = content.replace(
-    """generateButton.innerHTML = '<i class="fas fa-file-pdf"></i> Generate CFSS Report';""",
-    """generateButton.innerHTML = `<i class="fas fa-file-pdf"></i> ${t('cfss.generateReport')}`;"""
-)
-content = content.replace(
-    """generateButton.innerHTML = '<i class="fas fa-spinner fa-spin"></i> Generating CFSS PDF... (up to 30 seconds)';""",
-    """generateButton.innerHTML = `<i class="fas fa-spinner fa-spin"></i> ${t('cfss.generatingPDF')}`;"""
-)
-content = content.replace(
-    'generateButton.innerHTML = `<i class="fas fa-spinner fa-spin"></i> Generating Revision ${selectedRevision.number} PDF...`;',
-    'generateButton.innerHTML = `<i class="fas fa-spinner fa-spin"></i> ${t("cfss.generatingRevisionPDF", { number: selectedRevision.number })}`;'
-)
-
-# Add Wall button
-content = content.replace(
-    """newCalcButton.innerHTML = '<i class="fas fa-th-large"></i> Add Wall';""",
-    """newCalcButton.innerHTML = `<i class="fas fa-th-large"></i> ${t('cfss.addWall')}`;"""
-)
-
-# Hide Form button (wall)
-content = content.replace(
-    """newCalcButton.innerHTML = '<i class="fas fa-times"></i> Hide Form';""",
-    """newCalcButton.innerHTML = `<i class="fas fa-times"></i> ${t('common.hideForm')}`;"""
-)
-
-# Cancel button for newCalcButton
-content = content.replace(
-    """document.getElementById('newCalculationButton').innerHTML = '<i class="fas fa-th-large"></i> Cancel';""",
-    """document.getElementById('newCalculationButton').innerHTML = `<i class="fas fa-th-large"></i> ${t('common.cancel')}`;"""
-)
-
-# CFSS button text
-content = content.replace(
-    """cfssButton.innerHTML = '<i class="fas fa-times"></i> Hide Form';""",
-    """cfssButton.innerHTML = `<i class="fas fa-times"></i> ${t('common.hideForm')}`;"""
-)
-
-# Hide CFSS Data button
-content = content.replace(
-    """btn.innerHTML = '<i class="fas fa-times"></i> <span id="cfss-btn-text">Hide CFSS Data</span>';""",
-    """btn.innerHTML = `<i class="fas fa-times"></i> <span id="cfss-btn-text">${t('cfss.hideCFSSData')}</span>`;"""
-)
-
-# Add Window button
-content = content.replace(
-    """addWindowButton.innerHTML = '<i class="fas fa-window-maximize"></i> Add Window';""",
-    """addWindowButton.innerHTML = `<i class="fas fa-window-maximize"></i> ${t('cfss.addWindow')}`;"""
-)
-
-# Add Window hide form
-content = content.replace(
-    """addWindowButton.innerHTML = '<i class="fas fa-times"></i> Hide Form';""",
-    """addWindowButton.innerHTML = `<i class="fas fa-times"></i> ${t('common.hideForm')}`;"""
-)
-
-# Window button with this.innerHTML
-content = content.replace(
-    """this.innerHTML = '<i class="fas fa-window-maximize"></i> Add Window';""",
-    """this.innerHTML = `<i class="fas fa-window-maximize"></i> ${t('cfss.addWindow')}`;"""
-)
-content = content.replace(
-    """this.innerHTML = '<i class="fas fa-times"></i> Hide Form';""",
-    """this.innerHTML = `<i class="fas fa-times"></i> ${t('common.hideForm')}`;"""
-)
-
-# Exterior Wall Calculation button
-content = content.replace(
-    """exteriorWallCalcButton.innerHTML = '<i class="fas fa-calculator"></i> Exterior Wall Calculation';""",
-    """exteriorWallCalcButton.innerHTML = `<i class="fas fa-calculator"></i> ${t('cfss.exteriorWallCalc')}`;"""
-)
-
-# Saving... spinner for other buttons
-content = content.replace(
-    """saveBtn.innerHTML = '<i class="fas fa-spinner fa-spin"></i> Saving...'; }""",
-    """saveBtn.innerHTML = `<i class="fas fa-spinner fa-spin"></i> ${t('common.saving')}`; }"""
-)
-
-# Options save button
-content = content.replace(
-    """saveButton.innerHTML = '<i class="fas fa-spinner fa-spin"></i> Saving Options...';""",
-    """saveButton.innerHTML = `<i class="fas fa-spinner fa-spin"></i> ${t('cfss.savingOptions')}`;"""
-)
-content = content.replace(
-    """saveButton.innerHTML = '<i class="fas fa-save"></i> Save Options';""",
-    """saveButton.innerHTML = `<i class="fas fa-save"></i> ${t('cfss.saveOptions')}`;"""
-)
-
-# Summary labels
-content = content.replace(
-    'el.innerHTML = `<i class="fas fa-th-large"></i> ${n} wall${n === 1 ? \'\' : \'s\'} added`;',
-    'el.innerHTML = `<i class="fas fa-th-large"></i> ${t("cfss.wallsAdded", { count: n })}`;'
-)
-
-# Parapet summary
-content = content.replace(
-    "summary.innerHTML = `<i class=\"fas fa-building\"></i> ${count} parapet${count !== 1 ? 's' : ''} added`;",
-    "summary.innerHTML = `<i class=\"fas fa-building\"></i> ${t('cfss.parapetsAdded', { count })}`;",
-)
-
-# Custom pages summary
-content = content.replace(
-    "el.innerHTML = `<i class=\"fas fa-file-alt\"></i> ${count} custom page${count !== 1 ? 's' : ''} added`;",
-    "el.innerHTML = `<i class=\"fas fa-file-alt\"></i> ${t('cfss.customPagesAdded', { count })}`;",
-)
-
-# Soffites summary
-content = content.replace(
-    "summary.innerHTML = `<i class=\"fas fa-grip-lines-vertical\"></i> ${projectSoffites.length} soffites added`;",
-    "summary.innerHTML = `<i class=\"fas fa-grip-lines-vertical\"></i> ${t('cfss.soffitesAdded', { count: projectSoffites.length })}`;",
-)
-
-# Window summary
-content = content.replace(
-    "summary.innerHTML = `<i class=\"fas fa-window-maximize\"></i> ${count} window${count !== 1 ? 's' : ''} added`;",
-    "summary.innerHTML = `<i class=\"fas fa-window-maximize\"></i> ${t('cfss.windowsAdded', { count })}`;",
-)
 
 # ============================================================
-# Write the file
+# Consolidation (--consolidate)
 # ============================================================
-with open(r'c:\stuff\Protection Seismic\practice\projects\test-real-thing\stable\ps2000\frontend\cfss-project-details.js', 'w', encoding='utf-8') as f:
-    f.write(content)
+def consolidation_plan(translations, uses, pinned=()):
+    """Group the keys whose value is the same in every language and pick one
+    key per group to keep.
+
+    Returns (clusters, renames): clusters as (canonical, [key, ...]) and
+    renames {key: canonical} for the keys to drop. Only keys every language
+    defines are grouped. A group spanning namespaces keeps its 'common.'
+    key if it has one, then the most used key, then the first defined.
+    `pinned` keys (looked up under a computed name, or emitted by a rule
+    template) are never renamed; a group holding some keeps one of them.
+    """
+    languages = translations.languages
+    english = translations.lines.get('en') or translations.lines[languages[0]]
+    groups = {}
+    for key in sorted(translations.keys()):
+        if all(key in translations.values[lang] for lang in languages):
+            groups.setdefault(tuple(translations.values[lang][key] for lang in languages), []).append(key)
+
+    clusters = []
+    renames = {}
+    for keys in groups.values():
+        if len(keys) < 2:
+            continue
+        keys.sort(key=lambda key: english.get(key, 0))
+        candidates = [key for key in keys if key in pinned] or keys
+        spread = len({key.split('.', 1)[0] for key in keys}) > 1
+        canonical = min(candidates, key=lambda key: (not (spread and key.startswith('common.')),
+                                                     -len(uses.get(key, ())), english.get(key, 0)))
+        dropped = [key for key in keys if key != canonical and key not in pinned]
+        if dropped:
+            clusters.append((canonical, dropped))
+            renames.update((key, canonical) for key in dropped)
+    return clusters, renames
+
+
+def run_consolidate(translations_path, rules_path, ruleset, index_path=None):
+    """--consolidate: merge the keys sharing all their values into one, renaming
+    their uses in the frontend files and the rule data, then drop the others
+    from translations.js. Return True if anything was merged; the bundles and
+    pre-rendered pages are then stale (see rebuild_generated())."""
+    index = open_index(translations_path, index_path)
+    with open(translations_path, 'r', encoding='utf-8', newline='') as f:
+        source = f.read()
+    translations = Translations.parse(source)
+    prefixes = tuple(index.prefixes)
+    pinned = {key for key in translations.keys() if prefixes and key.startswith(prefixes)}
+    pinned |= {key for template in ruleset.templates for key in template.get('overrides', {}).values()}
+    clusters, renames = consolidation_plan(translations, index.uses, pinned)
+    if not renames:
+        print("No two keys share all their values")
+        return False
+
+    sample = translations.values[translations.languages[0]]
+    for canonical, dropped in clusters:
+        print(f"  {canonical} <- {', '.join(dropped)}: {' '.join(sample[canonical].split())[:60]!r}")
+    renamed = 0
+    files = 0
+    for name, record in sorted(index.files.items()):
+        if not any(key in renames for key, _ in record['uses']):
+            continue
+        path = os.path.join(index.root, name)
+        with open(path, 'r', encoding='utf-8', newline='') as f:
+            text, count = rename_keys(f.read(), renames)
+        atomic_write(path, text.encode('utf-8'))
+        renamed += count
+        files += 1
+
+    with open(rules_path, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+    rule_count = 0
+    for section in data['sections']:
+        for i, entry in enumerate(section['rules']):
+            if isinstance(entry, list):
+                new, count = rename_keys(entry[1], renames)
+                if count:
+                    section['rules'][i] = [entry[0], new]
+                    rule_count += 1
+    if rule_count:
+        atomic_write(rules_path, render_rules(data).encode('utf-8'))
+
+    before = len(source.encode('utf-8'))
+    source = remove_entries(source, translations, renames)
+    atomic_write(translations_path, source.encode('utf-8'))
+    saved = {lang: sum(len(json.dumps(key)) + len(json.dumps(values[key], ensure_ascii=False)) + 2
+                       for key in renames)
+             for lang, values in translations.values.items()}
+    print(f"Merged {len(renames)} key(s) into {len(clusters)}: {renamed} use(s) renamed in {files} file(s), "
+          f"{rule_count} rule(s) updated")
+    print(f"{os.path.relpath(translations_path)}: {len(renames)} entries dropped per language, "
+          f"{before - len(source.encode('utf-8'))} bytes; bundles shrink by about "
+          + ', '.join(f'{lang} {size} bytes' for lang, size in saved.items()))
+    return True
 
-# Count changes
-changes = 0
-for i, (a, b) in enumerate(zip(original.split('\n'), content.split('\n'))):
-    if a != b:
-        changes += 1
 
-print(f"Phase 1 complete: {changes} lines changed in cfss-project-details.js")
+# ============================================================
+# Translation build outputs
+# ============================================================
+def write_if_changed(path, text):
+    """Write `text` to `path` unless it already holds exactly that; return True if written."""
+    data = text.encode('utf-8')
+    try:
+        with open(path, 'rb') as f:
+            if f.read() == data:
+                return False
+    except OSError:
+        pass
+    atomic_write(path, data)
+    return True
+
+
+def _write_bundles(catalog, output_dir, page=None):
+    """Write one bundle per language of `catalog`; return {lang: file name}."""
+    names = {}
+    for lang, entries in catalog.items():
+        text = render_bundle(lang, entries)
+        names[lang] = bundle_name(lang, text, page)
+        written = write_if_changed(os.path.join(output_dir, names[lang]), text)
+        state = 'written' if written else 'up to date'
+        print(f"{names[lang]} {state} ({len(entries)} keys, {len(text.encode('utf-8')) // 1024} KB)")
+    return names
+
+
+def build_translations(translations_path, output_dir, flat_output=None, pages=(), per_page=False):
+    """Write the per-language bundles and their manifest into `output_dir`.
+
+    A bundle, translations.<lang>.<hash>.js, holds the flat key -> string map
+    of a language as a JSON string; the hash follows the content, so the
+    bundles can be cached for good, and translations.bundles.js names the
+    current ones.
+
+    Every HTML page in `pages` gets the script tags of its bundles, one per
+    language, written after its translations.bundles.js tag (see
+    link_bundles()). With `per_page`, those are subset bundles holding only
+    the keys the page references (see page_keys()); otherwise the full
+    ones. Bundles of an older build are deleted once the manifest no longer
+    names them. With `flat_output`, every
+    language is also written to one plain script (window.translationsFlat =
+    {...}) for tools that want it.
+    """
+    translations = Translations.load(translations_path)
+    catalog = flat_catalog(translations)
+
+    names = _write_bundles(catalog, output_dir)
+    page_names = {}
+    for path in pages if per_page else ():
+        keys, prefixes = page_keys(path)
+        page = os.path.basename(path)
+        page_names[page] = _write_bundles(subset_catalog(catalog, keys, prefixes), output_dir,
+                                          os.path.splitext(page)[0])
+    write_if_changed(os.path.join(output_dir, BUNDLE_MANIFEST), render_bundle_manifest(names, page_names))
+    for path in pages:
+        bundles = page_names.get(os.path.basename(path), names)
+        sources = [os.path.relpath(os.path.join(output_dir, name), os.path.dirname(path)).replace(os.sep, '/')
+                   for name in bundles.values()]
+        with open(path, 'r', encoding='utf-8', newline='') as f:
+            text = f.read()
+        if write_if_changed(path, link_bundles(text, sources)):
+            print(f"{os.path.relpath(path)}: bundle tags updated")
+
+    current = set(names.values()).union(*(langs.values() for langs in page_names.values()))
+    for name in sorted(os.listdir(output_dir)):
+        match = BUNDLE_NAME.match(name)
+        if match and name not in current:
+            os.remove(os.path.join(output_dir, name))
+            print(f"{name} removed (stale)")
+
+    if flat_output:
+        write_if_changed(flat_output, render_flat_js(catalog, os.path.basename(translations_path)))
+
+
+def precache_manifest(directory, report=True):
+    """(text, count): precache.manifest.js as the sw.js of `directory` and the
+    files it precaches call for (see _precache.py), or None without sw.js.
+    With `report`, precached files that do not exist are printed."""
+    sw_path = os.path.join(directory, SERVICE_WORKER)
+    if not os.path.exists(sw_path):
+        return None
+    with open(sw_path, 'r', encoding='utf-8') as f:
+        urls = shell_urls(f.read(), directory)
+    hashes, missing = precache_hashes(directory, urls)
+    if report:
+        for url in missing:
+            print(f"{os.path.relpath(sw_path)}: precached file {url} does not exist")
+    return render_precache_manifest(hashes), len(hashes)
+
+
+def write_precache_manifest(directory):
+    """Regenerate precache.manifest.js for the sw.js of `directory`.
+
+    Every run that writes files ends with this, so the service worker only
+    downloads the files whose content hash changed (see _precache.py).
+    """
+    manifest = precache_manifest(directory)
+    if manifest is not None and write_if_changed(os.path.join(directory, PRECACHE_MANIFEST), manifest[0]):
+        print(f"{PRECACHE_MANIFEST} updated ({manifest[1]} file(s))")
+
+
+def check_precache_manifest(directory):
+    """--check: return True, after saying so, if precache.manifest.js does not
+    match the files it hashes, so the service worker would keep stale copies."""
+    manifest = precache_manifest(directory, report=False)
+    if manifest is None:
+        return False
+    path = os.path.join(directory, PRECACHE_MANIFEST)
+    try:
+        with open(path, 'r', encoding='utf-8', newline='') as f:
+            current = f.read()
+    except OSError:
+        current = None
+    if current == manifest[0]:
+        return False
+    print(f"{os.path.relpath(path)}: out of date with the files sw.js precaches "
+          f"(any run that writes files, e.g. --build-translations, regenerates it)")
+    return True
+
+
+def html_pages(directory):
+    """The *.html pages in `directory`, without their pre-rendered variants."""
+    return [path for path in sorted(glob.glob(os.path.join(directory, '*.html')))
+            if not VARIANT_NAME.search(path)]
+
+
+def prerender_pages(translations_path, pages, languages):
+    """--prerender: write <page>.<lang>.html for every page and language,
+    data-i18n filled in (see _prerender.py), so i18n.js only walks the DOM
+    when the user switches language. sw.js answers a navigation to a page
+    with the variant of the language i18n.js last reported."""
+    catalog = flat_catalog(Translations.load(translations_path))
+    for lang in languages:
+        if lang not in catalog:
+            raise SystemExit(f"--prerender: no '{lang}' in {os.path.basename(translations_path)}")
+    for path in pages:
+        with open(path, 'r', encoding='utf-8', newline='') as f:
+            text = f.read()
+        for lang in languages:
+            page, count = prerender(text, catalog[lang], lang)
+            output = os.path.join(os.path.dirname(path), variant_name(os.path.basename(path), lang))
+            state = 'written' if write_if_changed(output, page) else 'up to date'
+            print(f"{os.path.relpath(output)} {state} ({count} elements)")
+
+
+def rebuild_generated(translations_path, output_dir, flat_output, pages_dir):
+    """Rebuild what is generated from translations.js the way it was last
+    built: the bundles, per page too if `output_dir` holds page bundles, and
+    the pre-rendered pages of `pages_dir` in the languages they exist in."""
+    bundles = os.listdir(output_dir) if os.path.isdir(output_dir) else []
+    per_page = any(BUNDLE_NAME.match(name) and name.count('.') == 4 for name in bundles)
+    build_translations(translations_path, output_dir, flat_output, html_pages(pages_dir), per_page)
+    prerender_again(translations_path, pages_dir)
+
+
+def prerender_again(translations_path, pages_dir):
+    """Write the pre-rendered pages of `pages_dir` again, in the languages
+    they exist in (none if there are none)."""
+    languages = sorted({found[1] for found in map(variant_of, os.listdir(pages_dir)) if found})
+    if languages:
+        prerender_pages(translations_path, html_pages(pages_dir), languages)
+
+
+def check_prerendered(translations_path, pages):
+    """--check: return True, after saying which, if a <page>.<lang>.html next
+    to one of `pages` differs from what --prerender would write now."""
+    variants = {}
+    for directory in sorted({os.path.dirname(path) for path in pages}):
+        for variant in sorted(glob.glob(os.path.join(glob.escape(directory), '*.html'))):
+            found = variant_of(os.path.basename(variant))
+            if found:
+                variants.setdefault(os.path.join(directory, found[0]), []).append((found[1], variant))
+    catalog = None
+    stale = False
+    for path in pages:
+        if path not in variants:
+            continue
+        if catalog is None:
+            catalog = flat_catalog(Translations.load(translations_path))
+        with open(path, 'r', encoding='utf-8', newline='') as f:
+            text = f.read()
+        for lang, variant in variants[path]:
+            with open(variant, 'r', encoding='utf-8', newline='') as f:
+                current = f.read()
+            if lang not in catalog or prerender(text, catalog[lang], lang)[0] != current:
+                print(f"{os.path.relpath(variant)}: out of date with {os.path.basename(path)} "
+                      f"(run --prerender {lang})")
+                stale = True
+    return stale
+
+
+def run_rewrite(targets, ruleset, args):
+    """Rewrite the targets and report; return True if a file could not be processed."""
+    dry_run = args.diff or bool(args.patch)
+    started = time.perf_counter()
+    cache = load_cache(args.cache, ruleset)
+    paths = expand_targets(targets)
+    results = rewrite_files(paths, ruleset, args.jobs, cache, args.force, args.tokens_dir,
+                            profile=args.stats, dry_run=dry_run, diff=dry_run,
+                            chunk_size=args.chunk_size if args.stream else None)
+    save_cache(args.cache, ruleset, cache)
+    wall = time.perf_counter() - started
+
+    patch = ''.join(results[path].diff or '' for path in paths)
+    if args.patch:
+        with open(args.patch, 'w', encoding='utf-8', newline='') as f:
+            f.write(patch)
+    if args.diff:
+        sys.stdout.write(patch)
+        # Keep stdout a clean patch; the report goes to stderr
+        with contextlib.redirect_stdout(sys.stderr):
+            _report_rewrite(paths, results, ruleset, args, wall, dry_run)
+    else:
+        _report_rewrite(paths, results, ruleset, args, wall, dry_run)
+    return any(results[path].error for path in paths)
+
+
+def _report_rewrite(paths, results, ruleset, args, wall, dry_run):
+    verb = 'would change' if dry_run else 'changed'
+    total = 0
+    skipped = 0
+    unmatched = 0
+    errors = 0
+    for path in paths:
+        result = results[path]
+        if result.error:
+            errors += 1
+            print(f"{os.path.relpath(path)}: error: {result.error}")
+            continue
+        total += result.changes
+        skipped += result.skipped
+        if result.changes:
+            print(f"{result.changes:6d} lines {verb} in {os.path.relpath(path)} ({result.hunks} hunk(s))")
+        for line, name, argument in result.unmatched or ():
+            unmatched += 1
+            print(f"{os.path.relpath(path)}:{line}: no rule for {name}: {' '.join(argument.split())[:100]}")
+    if unmatched:
+        print(f"{unmatched} user-facing call site(s) not covered by any rule")
+    if skipped:
+        print(f"{skipped} file(s) unchanged since the last run, skipped")
+    print(f"Phase 1 complete: {total} lines {verb} in {len(paths) - errors} file(s)")
+    if errors:
+        print(f"{errors} file(s) could not be processed")
+    if args.patch:
+        print(f"Patch written to {args.patch}; apply it with: git apply {args.patch}")
+
+    if args.stats:
+        stats = RunStats()
+        for result in results.values():
+            if result.stats is not None:
+                stats.merge(result.stats)
+        record = stats_record(stats, ruleset, wall, skipped)
+        print_stats(record)
+        if args.stats_json:
+            append_stats_json(args.stats_json, record)
+
+
+# ============================================================
+# Watch mode (--watch)
+# ============================================================
+# Files are polled with os.stat(), which needs no platform-specific API and
+# costs next to nothing for a tree of this size. The rule set stays compiled
+# in memory, and a saved file is only rescanned around the text that changed:
+# everything else was already rewritten by an earlier pass.
+def _signature(path):
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+def rewrite_window(text, start, end, ruleset, path=''):
+    """Apply the rules to the lines of `text` around text[start:end], the
+    rest of `text` being rewritten already.
+
+    A literal match touching the range starts or ends within the length of
+    the longest pattern from it, and template matches never cross a line,
+    so the rules only run over the lines that close to the range; with
+    --lex, only the call sites starting in those lines are visited.
+    `path` is the file's, for the namespace of template keys.
+    Returns (content, blocks, unmatched), `blocks` as from line_blocks().
+    """
+    reach = max((len(old) for old, _ in ruleset.rules), default=0)
+    window_start = text.rfind('\n', 0, max(0, start - reach)) + 1
+    newline = text.find('\n', min(len(text), end + reach))
+    window_end = len(text) if newline < 0 else newline + 1
+
+    window_log = EditLog()
+    misses = []
+    window = ruleset.apply(text[window_start:window_end], log=window_log, path=path, unmatched=misses)
+    content = text[:window_start] + window + text[window_end:]
+    log = EditLog()
+    log.regions = [(o0 + window_start, o1 + window_start, n0 + window_start, n1 + window_start)
+                   for o0, o1, n0, n1 in window_log.regions]
+    first_line = text.count('\n', 0, window_start)
+    unmatched = [(line + first_line, name, argument) for line, name, argument in misses]
+    if ruleset.lex:
+        content, sites = ruleset.rewrite_sites(content, lexer.tokenize(content), log=log,
+                                               window=(window_start, window_start + len(window)), path=path)
+        unmatched = merge_unmatched(unmatched, sites)
+    return content, line_blocks(text, content, log.regions), unmatched
+
+
+def _watch_update(path, old, new, ruleset):
+    """Rewrite the part of `path` that changed from `old` to `new`; return the content now on disk."""
+    started = time.perf_counter()
+    start, _, end = changed_span(old, new)
+    content, blocks, unmatched = rewrite_window(new, start, end, ruleset, path)
+    if content != new:
+        atomic_write(path, content.encode('utf-8'))
+    elapsed = (time.perf_counter() - started) * 1000
+    name = os.path.relpath(path)
+    for a0, a1, b0, b1 in blocks:
+        print(f"{name}:{b0 + 1}: {max(a1 - a0, b1 - b0)} line(s) rewritten ({elapsed:.0f} ms)")
+    for line, site, argument in unmatched:
+        print(f"{name}:{line}: no rule for {site}: {' '.join(argument.split())[:100]}")
+    return content
+
+
+def watch(targets, ruleset, args):
+    """--watch: rewrite the targets, then rewrite every file again as it is
+    saved, until interrupted. Only the lines around each edit are rescanned
+    (see rewrite_window()), with the rules kept compiled in memory; with
+    --lex, call sites the edit added that no rule covers are reported.
+    Files created later are picked up, and the rules are reloaded when
+    their data file or translations.js (which holds the keys templates may
+    emit) changes."""
+    pages_dir = os.path.dirname(os.path.abspath(args.translations))
+    run_rewrite(targets, ruleset, args)
+    write_precache_manifest(pages_dir)
+    rules_signature = (_signature(args.rules), _signature(args.translations))
+    seen = {}
+
+    def snapshot(paths):
+        for path in paths:
+            signature = _signature(path)
+            try:
+                with open(path, 'rb') as f:
+                    seen[path] = (signature, f.read().decode('utf-8'))
+            except (OSError, UnicodeDecodeError):
+                seen.pop(path, None)
+
+    snapshot(expand_targets(targets))
+    print(f"Watching {len(seen)} file(s) every {args.interval:g} s (Ctrl+C to stop)")
+    try:
+        while True:
+            time.sleep(args.interval)
+            if (_signature(args.rules), _signature(args.translations)) != rules_signature:
+                rules_signature = (_signature(args.rules), _signature(args.translations))
+                try:
+                    ruleset = ruleset_for(args)
+                except (ValueError, OSError) as exc:
+                    print(f"error: {exc}; keeping the previous rules")
+                    continue
+                print(f"Rules reloaded from {os.path.relpath(args.rules)} and {os.path.relpath(args.translations)}")
+                run_rewrite(targets, ruleset, args)
+                write_precache_manifest(pages_dir)
+                seen.clear()
+                snapshot(expand_targets(targets))
+                continue
+
+            saved = False
+            for path in expand_targets(targets):
+                signature = _signature(path)
+                if signature is None:
+                    seen.pop(path, None)
+                    continue
+                previous = seen.get(path)
+                if previous is not None and previous[0] == signature:
+                    continue
+                try:
+                    with open(path, 'rb') as f:
+                        text = f.read().decode('utf-8')
+                except (OSError, UnicodeDecodeError):
+                    # Most likely caught halfway through a save; look again next time
+                    continue
+                old = previous[1] if previous is not None else ''
+                if text != old:
+                    text = _watch_update(path, old, text, ruleset)
+                    saved = True
+                seen[path] = (_signature(path), text)
+            if saved:
+                write_precache_manifest(pages_dir)
+    except KeyboardInterrupt:
+        print("Stopped watching")
+
+
+def ruleset_for(args, lex=None):
+    """The RuleSet of --rules, its templates limited to the keys of --translations."""
+    keys = translation_keys(Translations.load(args.translations).values)
+    return load_ruleset(args.rules, args.rule_pack, rule_templates, args.lex if lex is None else lex, keys)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('targets', nargs='*',
+                        help='JS files, directories or glob patterns (default: cfss-project-details.js, '
+                             'every *.js file here with --watch, --extract or --check, or nothing when only '
+                             '--validate/--build-translations/--prerender/--compile-rules is asked for)')
+    parser.add_argument('-j', '--jobs', type=int, default=None,
+                        help='number of worker processes (default: one per CPU)')
+    parser.add_argument('--force', action='store_true',
+                        help='process every file even if the cache says it is up to date')
+    parser.add_argument('--cache', default=DEFAULT_CACHE,
+                        help='cache file location (default: %(default)s)')
+    parser.add_argument('--clear-cache', action='store_true',
+                        help='delete the cache file before running')
+    parser.add_argument('--lex', action='store_true',
+                        help='also rewrite call sites that differ from a rule only by quoting, '
+                             'spacing or line breaks, and report the ones no rule covers')
+    parser.add_argument('--tokens-dir', default=DEFAULT_TOKENS_DIR,
+                        help='where --lex keeps token streams between runs (default: %(default)s)')
+    parser.add_argument('--diff', action='store_true',
+                        help='print the changes as a unified diff instead of writing the files')
+    parser.add_argument('--patch', metavar='PATH',
+                        help='write the changes to PATH as a patch instead of writing the files')
+    parser.add_argument('--check', action='store_true',
+                        help='only report where the targets still hold text the rules would rewrite, '
+                             'without rewriting anything; exit status 1 if there is any')
+    parser.add_argument('--all', action='store_true',
+                        help='with --check, report every location instead of the first per file')
+    parser.add_argument('--check-precache', action='store_true',
+                        help='only check that precache.manifest.js matches the files sw.js precaches, '
+                             'and the --prerender pages their pages (as --check without targets does '
+                             'too); exit status 1 if not')
+    parser.add_argument('--stream', action='store_true',
+                        help='read and write the files piece by piece, for generated bundles too large '
+                             'to hold in memory (no --lex, --diff or --patch)')
+    parser.add_argument('--chunk-size', type=int, default=DEFAULT_CHUNK_SIZE,
+                        help='characters read at a time with --stream (default: %(default)s)')
+    parser.add_argument('--stats', '--profile', action='store_true',
+                        help='report hits per rule, bytes scanned and time per stage (the rules of a '
+                             'stage share one scan), time per phase and peak memory, and flag dead rules')
+    parser.add_argument('--stats-json', metavar='PATH',
+                        help='append the --stats report to PATH as one JSON line per run (implies --stats)')
+    parser.add_argument('--validate', action='store_true',
+                        help='check used and emitted translation keys against translations.js')
+    parser.add_argument('--translations', default=DEFAULT_TRANSLATIONS,
+                        help='translations source file (default: %(default)s)')
+    parser.add_argument('--index', default=None,
+                        help='key index kept up to date for --validate, --where and --key-for '
+                             '(default: .translation_index next to the translations file)')
+    parser.add_argument('--where', nargs='+', metavar='KEY',
+                        help='print the values of KEY and every file:line using it, then exit')
+    parser.add_argument('--key-for', nargs='+', metavar='TEXT',
+                        help='print the keys whose English text is TEXT (or contains it), then exit')
+    parser.add_argument('--build-translations', action='store_true',
+                        help='regenerate the per-language translation bundles and the script tags '
+                             'loading them in every *.html page')
+    parser.add_argument('--bundle-dir', default=SCRIPT_DIR,
+                        help='where --build-translations writes the bundles (default: the script directory)')
+    parser.add_argument('--per-page', action='store_true',
+                        help='with --build-translations, also write a subset bundle for every *.html page '
+                             'holding only the keys it references')
+    parser.add_argument('--prerender', nargs='+', metavar='LANG',
+                        help='write <page>.<lang>.html variants of every *.html page with the '
+                             'data-i18n elements already translated')
+    parser.add_argument('--flat-output', default=None,
+                        help='also write every language to this single script (window.translationsFlat)')
+    parser.add_argument('--rules', default=DEFAULT_RULES,
+                        help='rule data file (default: %(default)s)')
+    parser.add_argument('--rule-pack', default=DEFAULT_RULE_PACK,
+                        help='precompiled rule pack, rebuilt whenever the rule data changes '
+                             '(default: %(default)s)')
+    parser.add_argument('--compile-rules', action='store_true',
+                        help='rebuild the rule pack and report duplicate and order-dependent rules')
+    parser.add_argument('--extract', action='store_true',
+                        help='instead of rewriting the targets, add rules for the call sites no rule '
+                             'covers to the rule data file, and their English texts to translations.js')
+    parser.add_argument('--consolidate', action='store_true',
+                        help='merge translation keys whose values are identical in every language into '
+                             'one, renaming their uses, drop the others from translations.js and rebuild '
+                             'the bundles and pre-rendered pages')
+    parser.add_argument('--watch', action='store_true',
+                        help='after rewriting the targets (default: every *.js file here), keep '
+                             'rewriting each file as it is saved, until interrupted')
+    parser.add_argument('--interval', type=float, default=0.5,
+                        help='seconds between two checks for saved files with --watch (default: %(default)s)')
+    args = parser.parse_args()
+    args.stats = args.stats or bool(args.stats_json)
+    if args.watch and (args.diff or args.patch):
+        parser.error('--watch writes the files; it cannot be combined with --diff or --patch')
+    if args.extract and args.watch:
+        parser.error('--extract cannot be combined with --watch')
+    if args.stream and (args.lex or args.diff or args.patch or args.watch):
+        parser.error('--stream cannot be combined with --lex, --diff, --patch or --watch')
+    if args.check and (args.diff or args.patch or args.watch or args.stream or args.extract):
+        parser.error('--check cannot be combined with --diff, --patch, --watch, --stream or --extract')
+    if args.all and not args.check:
+        parser.error('--all only applies to --check')
+    if args.chunk_size < 1:
+        parser.error('--chunk-size must be at least 1')
+    if args.stats and resource is None:
+        tracemalloc.start()
+
+    if args.where or args.key_for:
+        try:
+            not_found = run_queries(args.translations, args.index, args.where or (), args.key_for or ())
+        except ValueError as exc:
+            sys.exit(f'error: {exc}')
+        sys.exit(1 if not_found else 0)
+
+    if args.check_precache:
+        pages_dir = os.path.dirname(os.path.abspath(args.translations))
+        stale = check_prerendered(args.translations, html_pages(pages_dir))
+        if check_precache_manifest(pages_dir) or stale:
+            sys.exit(1)
+        print(f"{PRECACHE_MANIFEST} and the pre-rendered pages are up to date")
+        sys.exit(0)
+
+    if args.clear_cache and os.path.exists(args.cache):
+        os.remove(args.cache)
+
+    failed = False
+    try:
+        if args.compile_rules:
+            failed = run_compile_rules(args.rules, args.rule_pack)
+        ruleset = ruleset_for(args)
+        if args.stream:
+            stream_limits(ruleset)
+    except (ValueError, OSError) as exc:
+        sys.exit(f'error: {exc}')
+    pages_dir = os.path.dirname(os.path.abspath(args.translations))
+    targets = args.targets
+    if args.watch and not targets:
+        targets = [SCRIPT_DIR]
+    if not targets and not (args.validate or args.build_translations or args.prerender or args.compile_rules
+                            or args.extract or args.consolidate or args.check):
+        targets = [DEFAULT_TARGET]
+    # Only runs that write files sw.js precaches can leave its manifest stale
+    wrote = False
+    if args.extract:
+        paths = (expand_targets(targets) if targets
+                 else [path for path in frontend_files(SCRIPT_DIR) if path.endswith('.js')])
+        extract_ruleset = ruleset if ruleset.lex else ruleset_for(args, lex=True)
+        run_extract(paths, extract_ruleset, args.rules, args.translations)
+    elif args.check:
+        if run_check(targets or [SCRIPT_DIR], ruleset, args):
+            failed = True
+        # The whole tree is checked: so are the pre-rendered pages and the manifest
+        if not targets and check_prerendered(args.translations, html_pages(pages_dir)):
+            failed = True
+        if not targets and check_precache_manifest(pages_dir):
+            failed = True
+    elif targets and not args.watch:
+        if run_rewrite(targets, ruleset, args):
+            failed = True
+        wrote = not (args.diff or args.patch)
+
+    if args.consolidate:
+        if run_consolidate(args.translations, args.rules, ruleset, args.index):
+            # The bundles and pre-rendered pages still hold the dropped keys
+            rebuild_generated(args.translations, args.bundle_dir, args.flat_output, pages_dir)
+        # The rules may emit other keys now
+        ruleset = ruleset_for(args)
+        wrote = True
+    if args.build_translations:
+        build_translations(args.translations, args.bundle_dir, args.flat_output, html_pages(pages_dir),
+                           args.per_page)
+        if not args.prerender:
+            # The pages name the new bundles now, their variants must too
+            prerender_again(args.translations, pages_dir)
+        wrote = True
+    if args.prerender:
+        prerender_pages(args.translations, html_pages(pages_dir), args.prerender)
+        wrote = True
+    if wrote:
+        write_precache_manifest(pages_dir)
+    if args.validate and run_validation(args.translations, ruleset, args.index):
+        failed = True
+    if failed:
+        sys.exit(1)
+    if args.watch:
+        watch(targets, ruleset, args)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,274 @@
+#!/usr/bin/env python3
+"""Serve rewrite and validation requests from memory over a Unix socket
+
+The server keeps the compiled rule set (with the --lex site table) and the
+translation key index (_key_index.py) loaded, so an editor saving a buffer
+or a git hook checking a commit gets its answer in milliseconds instead of
+paying interpreter start-up, rule loading and a tree scan every time.
+The rule data and the index are brought up to date before each request,
+which costs a stat() per file when nothing changed. Requests run on worker
+threads, so a large buffer does not hold up the other clients, and the
+socket is created readable by its owner only.
+
+Requests and responses are JSON objects, one per line; a connection may
+send any number of them:
+
+  {"op": "rewrite", "text": "...", "path": "walls.js", "lex": true}
+      -> {"ok": true, "text": "...", "edits": [{"start", "end", "line", "text"}],
+          "unmatched": [{"line", "site", "argument"}], "ms": 1.2}
+      `edits` replace text[start:end] of the request text (offsets in
+      characters, `line` 1-based); "lex" defaults to the server's --lex.
+      "path" names the file the text comes from, which sets the namespace
+      of the keys rule templates derive (optional).
+  {"op": "validate", "keys": ["cfss.wallSaved", ...]}
+  {"op": "validate", "text": "...", "path": "walls.js"}
+      -> {"ok": true, "diagnostics": [{"key", "lang", "line", "message"}], "ms": 0.4}
+      keys given, or used in `text` (t() calls, data-i18n attributes),
+      that a language of translations.js does not define.
+  {"op": "ping"}
+Errors come back as {"ok": false, "error": "..."}.
+
+Usage:
+    python _rewrite_server.py                           # serve on .replace_strings.sock
+    python _rewrite_server.py --send '{"op": "ping"}'   # one request, response on stdout
+"""
+
+import argparse
+import asyncio
+import contextlib
+import json
+import os
+import re
+import signal
+import socket
+import sys
+import threading
+import time
+from bisect import bisect_right
+
+import _js_lexer as lexer
+import _replace_strings as rs
+from _edits import EditLog
+from _key_index import open_index
+from _translations import find_key_uses
+
+DEFAULT_SOCKET = os.path.join(rs.SCRIPT_DIR, '.replace_strings.sock')
+
+# Requests are single lines; a large buffer must still fit
+LINE_LIMIT = 64 << 20
+
+
+class RequestError(ValueError):
+    pass
+
+
+class Service:
+    """The rule set and key index, and the requests they answer.
+
+    handle() may run on several threads at once: bringing the rule set and
+    the index up to date is serialized, the rewrites themselves are not.
+    """
+
+    def __init__(self, rules_path, pack_path, translations_path, index_path=None, lex=False):
+        self.rules_path = rules_path
+        self.pack_path = pack_path
+        self.translations_path = translations_path
+        self.index_path = index_path
+        self.lex = lex
+        self.rules_stat = None
+        self.keys = None
+        self.ruleset = None
+        self.lock = threading.Lock()
+        self.index = open_index(translations_path, index_path)
+        self.refresh_rules()
+
+    def refresh_rules(self):
+        """Reload the rule set if the rule data file, or the keys translations.js
+        defines (which limit the rule templates), changed since it was loaded.
+        Return the current rule set."""
+        with self.lock:
+            stat = os.stat(self.rules_path)
+            stat = (stat.st_size, stat.st_mtime_ns)
+            self.index.update()
+            keys = rs.translation_keys(self.index.source['values'])
+            if stat != self.rules_stat or keys != self.keys:
+                self.ruleset = rs.load_ruleset(self.rules_path, self.pack_path, rs.rule_templates,
+                                               lex=True, keys=keys)
+                self.rules_stat = stat
+                self.keys = keys
+            return self.ruleset
+
+    def rewrite(self, request):
+        text = request.get('text')
+        if not isinstance(text, str):
+            raise RequestError('"text" must be a string')
+        path = request.get('path', '')
+        if not isinstance(path, str):
+            raise RequestError('"path" must be a string')
+        ruleset = self.refresh_rules()
+        log = EditLog()
+        unmatched = []
+        content = ruleset.apply(text, log=log, path=path, unmatched=unmatched)
+        if request.get('lex', self.lex):
+            content, sites = ruleset.rewrite_sites(content, lexer.tokenize(content), log=log, path=path)
+            unmatched = rs.merge_unmatched(unmatched, sites)
+        edits = [(o0, o1, content[n0:n1]) for o0, o1, n0, n1 in log.regions if text[o0:o1] != content[n0:n1]]
+        line_starts = [0] + [match.end() for match in re.finditer('\n', text)] if edits else []
+        return {'text': content,
+                'edits': [{'start': start, 'end': end, 'line': bisect_right(line_starts, start), 'text': new}
+                          for start, end, new in edits],
+                'unmatched': [{'line': line, 'site': site, 'argument': argument}
+                              for line, site, argument in unmatched]}
+
+    def validate(self, request):
+        if 'text' in request:
+            if not isinstance(request['text'], str):
+                raise RequestError('"text" must be a string')
+            uses, _ = find_key_uses(request['text'], request.get('path', ''))
+            wanted = [(use.key, use.line) for use in uses]
+        else:
+            keys = request.get('keys')
+            if not isinstance(keys, list) or not all(isinstance(key, str) for key in keys):
+                raise RequestError('"keys" must be a list of strings, or "text" a string')
+            wanted = [(key, None) for key in keys]
+        with self.lock:
+            self.index.update()
+            values = self.index.source['values']
+        diagnostics = []
+        for key, line in wanted:
+            for lang, entries in values.items():
+                if key not in entries:
+                    diagnostics.append({'key': key, 'lang': lang, 'line': line,
+                                        'message': f'{key} has no {lang} entry'})
+        return {'diagnostics': diagnostics}
+
+    def handle(self, line):
+        """The response to one request line, as a dict."""
+        started = time.perf_counter()
+        try:
+            request = json.loads(line)
+            if not isinstance(request, dict):
+                raise RequestError('a request must be a JSON object')
+            op = request.get('op')
+            if op == 'rewrite':
+                response = self.rewrite(request)
+            elif op == 'validate':
+                response = self.validate(request)
+            elif op == 'ping':
+                response = {'rules': self.ruleset.fingerprint}
+            else:
+                raise RequestError(f'unknown op {op!r}')
+        except (ValueError, OSError) as exc:
+            # json.JSONDecodeError and TranslationsError are ValueErrors too
+            return {'ok': False, 'error': str(exc)}
+        response['ok'] = True
+        response['ms'] = round((time.perf_counter() - started) * 1000, 3)
+        return response
+
+
+async def _serve_connection(service, reader, writer):
+    try:
+        while True:
+            try:
+                line = await reader.readline()
+            except ValueError:
+                # Over LINE_LIMIT: the rest of the stream cannot be framed any more
+                writer.write(b'{"ok": false, "error": "request too large"}\n')
+                break
+            if not line:
+                break
+            if not line.strip():
+                continue
+            response = await asyncio.get_running_loop().run_in_executor(None, service.handle, line)
+            writer.write(json.dumps(response, ensure_ascii=False).encode('utf-8') + b'\n')
+            await writer.drain()
+    except ConnectionError:
+        pass
+    finally:
+        writer.close()
+
+
+def _claim_socket(path):
+    """Remove a socket left behind by a server that is gone; fail if one is running."""
+    if not os.path.exists(path):
+        return
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as probe:
+        try:
+            probe.connect(path)
+        except OSError:
+            os.remove(path)
+            return
+    raise RuntimeError(f'a server is already listening on {path}')
+
+
+async def serve(service, path):
+    _claim_socket(path)
+    # The socket file takes the umask at bind(); a chmod() afterwards would
+    # leave a moment where anyone may connect
+    mask = os.umask(0o077)
+    try:
+        server = await asyncio.start_unix_server(lambda reader, writer: _serve_connection(service, reader, writer),
+                                                 path, limit=LINE_LIMIT)
+    finally:
+        os.umask(mask)
+    stop = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for signum in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(signum, stop.set)
+    print(f"Serving {len(service.ruleset.rules)} rules and {len(service.index.uses)} used key(s) on {path}")
+    try:
+        async with server:
+            await stop.wait()
+    finally:
+        with contextlib.suppress(OSError):
+            os.remove(path)
+    print("Stopped")
+
+
+def send(path, request):
+    """Send one request (a dict) to the server at `path`; return its response."""
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+        client.connect(path)
+        client.sendall(json.dumps(request).encode('utf-8') + b'\n')
+        client.shutdown(socket.SHUT_WR)
+        with client.makefile('rb') as stream:
+            return json.loads(stream.readline())
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--socket', default=DEFAULT_SOCKET,
+                        help='Unix socket to listen on or send to (default: %(default)s)')
+    parser.add_argument('--send', metavar='JSON',
+                        help='send one request to a running server, print its response and exit')
+    parser.add_argument('--lex', action='store_true',
+                        help='run the --lex call-site pass on rewrite requests that do not say')
+    parser.add_argument('--rules', default=rs.DEFAULT_RULES,
+                        help='rule data file (default: %(default)s)')
+    parser.add_argument('--rule-pack', default=rs.DEFAULT_RULE_PACK,
+                        help='precompiled rule pack (default: %(default)s)')
+    parser.add_argument('--translations', default=rs.DEFAULT_TRANSLATIONS,
+                        help='translations source file (default: %(default)s)')
+    parser.add_argument('--index', default=None,
+                        help='key index (default: .translation_index next to the translations file)')
+    args = parser.parse_args()
+
+    if args.send is not None:
+        try:
+            response = send(args.socket, json.loads(args.send))
+        except ValueError as exc:
+            sys.exit(f'error: {exc}')
+        except OSError as exc:
+            sys.exit(f'error: no server on {args.socket}: {exc}')
+        print(json.dumps(response, ensure_ascii=False, indent=1))
+        sys.exit(0 if response.get('ok') else 1)
+
+    try:
+        service = Service(args.rules, args.rule_pack, args.translations, args.index, args.lex)
+        asyncio.run(serve(service, args.socket))
+    except (ValueError, RuntimeError) as exc:
+        sys.exit(f'error: {exc}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,560 @@
+"""Read translations.js and check the keys the frontend uses against it
+
+translations.js is parsed once into a flat {key: value} index per language
+('cfss.wallSaved' -> 'Wall saved successfully!'), so every lookup after that
+is a dict or set operation. Key uses are collected from t('...') calls and
+data-i18n* attributes across the JS and HTML files. The same index is
+rendered into the runtime files i18n.js loads: one JSON bundle per language
+with a content-hashed name, listed in translations.bundles.js.
+"""
+
+import hashlib
+import json
+import os
+import re
+from bisect import bisect_right
+from collections import deque, namedtuple
+
+import _js_lexer as lexer
+from _prerender import VARIANT_NAME
+
+_TOKEN = re.compile(r"""
+    (?P<skip>\s+|//[^\n]*|/\*.*?\*/)
+  | (?P<string>'(?:[^'\\\n]|\\.)*'|"(?:[^"\\\n]|\\.)*"|`(?:[^`\\]|\\.)*`)
+  | (?P<name>[A-Za-z_$][\w$]*|\d+)
+  | (?P<punct>[{}:,])
+""", re.S | re.X)
+
+_ASSIGNMENT = re.compile(r'window\.translations\s*=\s*(?=\{)')
+
+
+class TranslationsError(ValueError):
+    pass
+
+
+# Offsets in translations.js of an object's closing '}' and of the end of its
+# last entry, and whether that entry lacks a trailing comma
+ObjectSpan = namedtuple('ObjectSpan', 'close last_end needs_comma')
+
+
+def _line_of(line_starts, pos):
+    return bisect_right(line_starts, pos)
+
+
+def _line_starts(text):
+    return [0] + [m.end() for m in re.finditer('\n', text)]
+
+
+class Translations:
+    """Flat key index of translations.js, one {key: value} dict per language.
+
+    `lines` gives the line each key is defined on, and `duplicates` lists
+    (language, key, line) for keys defined twice in the same object (the
+    last definition wins, as in JS). `objects` maps each object's path
+    ('en', 'en.cfss', ...) to an ObjectSpan, for add_entries(), and `spans`
+    gives the (start, end) offsets of every definition of each key, its
+    trailing comma included, for remove_entries().
+    """
+
+    def __init__(self, values, lines, duplicates=(), objects=None, spans=None):
+        self.values = values
+        self.lines = lines
+        self.duplicates = list(duplicates)
+        self.objects = objects or {}
+        self.spans = spans or {}
+
+    @property
+    def languages(self):
+        return list(self.values)
+
+    def keys(self):
+        """Every key defined in at least one language."""
+        return set().union(*self.values.values()) if self.values else set()
+
+    @classmethod
+    def load(cls, path):
+        with open(path, 'r', encoding='utf-8') as f:
+            return cls.parse(f.read())
+
+    @classmethod
+    def parse(cls, text):
+        assignment = _ASSIGNMENT.search(text)
+        if not assignment:
+            raise TranslationsError('translations.js: no "window.translations = {" found')
+        parser = _Parser(text, assignment.end())
+        parser.parse_object('')
+
+        values = {}
+        lines = {}
+        spans = {}
+        duplicates = []
+        for lang, line in parser.top_level:
+            values[lang] = {}
+            lines[lang] = {}
+            spans[lang] = {}
+        for key, value, line, span in parser.entries:
+            lang, _, rest = key.partition('.')
+            if not rest:
+                raise TranslationsError(f'translations.js:{line}: {key!r} is not a language object')
+            if rest in values[lang]:
+                duplicates.append((lang, rest, line))
+            values[lang][rest] = value
+            lines[lang][rest] = line
+            spans[lang].setdefault(rest, []).append(span)
+        return cls(values, lines, duplicates, parser.objects, spans)
+
+
+class _Parser:
+    """Recursive-descent parser for the object literal in translations.js."""
+
+    def __init__(self, text, pos):
+        self.text = text
+        self.pos = pos
+        self.line_starts = _line_starts(text)
+        self.entries = []
+        self.top_level = []
+        self.objects = {}
+
+    def _error(self, message, pos):
+        line = _line_of(self.line_starts, pos)
+        return TranslationsError(f'translations.js:{line}: {message}')
+
+    def _next(self):
+        while True:
+            match = _TOKEN.match(self.text, self.pos)
+            if not match:
+                if self.pos >= len(self.text):
+                    raise self._error('unexpected end of file', self.pos)
+                raise self._error(f'unexpected {self.text[self.pos]!r}', self.pos)
+            self.pos = match.end()
+            if match.lastgroup != 'skip':
+                return match.lastgroup, match.group(), match.start()
+
+    def _expect(self, value):
+        kind, token, start = self._next()
+        if token != value:
+            raise self._error(f'expected {value!r}, found {token!r}', start)
+
+    def _value(self, token, kind, start):
+        if kind != 'string':
+            raise self._error(f'expected a string or an object, found {token!r}', start)
+        value = lexer.literal_value(self.text, (lexer.TEMPLATE if token[0] == '`' else lexer.STRING,
+                                                start, start + len(token), ''))
+        if value is None:
+            raise self._error('template literals with ${...} are not supported', start)
+        return value
+
+    def parse_object(self, prefix):
+        """Parse from just before '{'; record every string entry under `prefix`."""
+        self._expect('{')
+        last_end = self.pos
+        while True:
+            kind, token, start = self._next()
+            if token == '}':
+                self.objects[prefix[:-1]] = ObjectSpan(start, last_end, False)
+                return
+            if kind == 'string':
+                name = self._value(token, kind, start)
+            elif kind == 'name':
+                name = token
+            else:
+                raise self._error(f'expected a key, found {token!r}', start)
+            self._expect(':')
+            key = prefix + name
+            if not prefix:
+                self.top_level.append((name, _line_of(self.line_starts, start)))
+
+            save = self.pos
+            kind, token, value_start = self._next()
+            entry = None
+            if token == '{':
+                self.pos = save
+                self.parse_object(key + '.')
+            else:
+                entry = [key, self._value(token, kind, value_start), _line_of(self.line_starts, start),
+                         (start, self.pos)]
+                self.entries.append(entry)
+            last_end = self.pos
+
+            kind, token, start = self._next()
+            if token == '}':
+                self.objects[prefix[:-1]] = ObjectSpan(start, last_end, True)
+                return
+            if token != ',':
+                raise self._error(f"expected ',' or '}}', found {token!r}", start)
+            if entry is not None:
+                entry[3] = (entry[3][0], self.pos)
+
+
+def _indent_of(text, pos):
+    line_start = text.rfind('\n', 0, pos) + 1
+    return text[line_start:pos] if not text[line_start:pos].strip() else ''
+
+
+def add_entries(text, translations, lang, entries):
+    """`text` (translations.js, as parsed into `translations`) with `entries`
+    [(key, value)] added to the `lang` object.
+
+    Each entry is appended to its namespace object, which is created at the
+    end of the language when missing, as a "name: 'value'," line indented
+    one step deeper than the object's closing brace.
+    """
+    if lang not in translations.objects:
+        raise TranslationsError(f"translations.js: no '{lang}' object")
+    grouped = {}
+    for key, value in entries:
+        namespace, _, name = key.rpartition('.')
+        grouped.setdefault(namespace, []).append((name, value))
+
+    edits = []
+    created = []
+    for namespace, items in grouped.items():
+        span = translations.objects.get(f'{lang}.{namespace}' if namespace else lang)
+        if span is None:
+            created.append((namespace, items))
+            continue
+        indent = _indent_of(text, span.close) + '  '
+        edits.append(_append_lines(text, span, [f'{indent}{name}: {lexer.quote(value)},\n'
+                                                 for name, value in items]))
+    if created:
+        span = translations.objects[lang]
+        indent = _indent_of(text, span.close) + '  '
+        lines = []
+        for namespace, items in created:
+            lines.append(f'{indent}{namespace}: {{\n')
+            lines.extend(f'{indent}  {name}: {lexer.quote(value)},\n' for name, value in items)
+            lines.append(f'{indent}}},\n')
+        edits.append(_append_lines(text, span, lines))
+
+    pieces = []
+    pos = 0
+    for start, comma, block in sorted(edits):
+        if comma is not None:
+            pieces.append(text[pos:comma])
+            pieces.append(',')
+            pos = comma
+        pieces.append(text[pos:start])
+        pieces.append(block)
+        pos = start
+    pieces.append(text[pos:])
+    return ''.join(pieces)
+
+
+def _append_lines(text, span, lines):
+    """(insert at, comma at or None, text) adding `lines` at the end of an object."""
+    comma = span.last_end if span.needs_comma else None
+    line_start = text.rfind('\n', 0, span.close) + 1
+    if text[line_start:span.close].strip():
+        # The closing brace shares its line with other code
+        return span.close, comma, '\n' + ''.join(lines)
+    return line_start, comma, ''.join(lines)
+
+
+def remove_entries(text, translations, keys):
+    """`text` (translations.js, as parsed into `translations`) without any
+    definition of `keys`, in every language.
+
+    An entry alone on its line takes the whole line with it; otherwise only
+    the entry and the spaces after it go.
+    """
+    keys = set(keys)
+    cuts = []
+    for spans in translations.spans.values():
+        for key in keys.intersection(spans):
+            for start, end in spans[key]:
+                line_start = text.rfind('\n', 0, start) + 1
+                newline = text.find('\n', end)
+                line_end = len(text) if newline < 0 else newline + 1
+                if not text[line_start:start].strip() and not text[end:line_end].strip():
+                    cuts.append((line_start, line_end))
+                else:
+                    while end < len(text) and text[end] in ' \t':
+                        end += 1
+                    cuts.append((start, end))
+    pieces = []
+    pos = 0
+    for start, end in sorted(cuts):
+        pieces.append(text[pos:start])
+        pos = end
+    pieces.append(text[pos:])
+    return ''.join(pieces)
+
+
+# ============================================================
+# Key uses
+# ============================================================
+# t('key') / t("key") / t(`key`) with a literal key, followed by ')' or ','
+_T_CALL = re.compile(r"""(?<![\w$.])t\(\s*(?:'([\w.-]+)'|"([\w.-]+)"|`([\w.-]+)`)(?=\s*[,)])""")
+# t('prefix.' + name) and t(`prefix.${name}`): every key under the prefix may be used
+_T_PREFIX = re.compile(r"""(?<![\w$.])t\(\s*(?:(['"])([\w.-]*\.)\1\s*\+|`([\w.-]*\.)\$\{)""")
+_DATA_I18N = re.compile(r"""\bdata-i18n(?:-placeholder|-title|-html)?\s*=\s*(?:"([^"]*)"|'([^']*)')""")
+# Quoted keys inside a computed attribute, e.g. data-i18n="${done ? 'a.x' : 'a.y'}"
+_QUOTED_KEY = re.compile(r"""['"]([\w-]+(?:\.[\w-]+)+)['"]""")
+
+KeyUse = namedtuple('KeyUse', 'key path line')
+
+
+def find_key_uses(text, path=''):
+    """Return (uses, prefixes): the KeyUses in `text` and its dynamic key prefixes."""
+    line_starts = _line_starts(text)
+    uses = []
+    for pattern in (_T_CALL, _DATA_I18N):
+        for match in pattern.finditer(text):
+            key = next(group for group in match.groups() if group is not None)
+            keys = _QUOTED_KEY.findall(key) if '${' in key else [key] if key else []
+            for key in keys:
+                uses.append(KeyUse(key, path, _line_of(line_starts, match.start())))
+    prefixes = {match.group(2) or match.group(3) for match in _T_PREFIX.finditer(text)}
+    return uses, prefixes
+
+
+def rename_keys(text, renames):
+    """Return (text, count): `text` with every key use find_key_uses() sees
+    renamed through `renames` {old: new}, and the number of uses renamed."""
+    edits = []
+    for match in _T_CALL.finditer(text):
+        group = next(i for i in range(1, 4) if match.group(i) is not None)
+        if match.group(group) in renames:
+            edits.append((match.start(group), match.end(group), renames[match.group(group)]))
+    for match in _DATA_I18N.finditer(text):
+        group = 1 if match.group(1) is not None else 2
+        value = match.group(group)
+        if '${' in value:
+            for quoted in _QUOTED_KEY.finditer(value):
+                if quoted.group(1) in renames:
+                    start = match.start(group) + quoted.start(1)
+                    edits.append((start, start + len(quoted.group(1)), renames[quoted.group(1)]))
+        elif value in renames:
+            edits.append((match.start(group), match.end(group), renames[value]))
+    pieces = []
+    pos = 0
+    for start, end, key in sorted(edits):
+        pieces.append(text[pos:start])
+        pieces.append(key)
+        pos = end
+    pieces.append(text[pos:])
+    return ''.join(pieces), len(edits)
+
+
+def _is_runtime_file(name):
+    """translations.js, i18n.js and the bundles generated from them."""
+    return name in ('translations.js', 'i18n.js', BUNDLE_MANIFEST) or bool(BUNDLE_NAME.match(name))
+
+
+def frontend_files(directory):
+    """The JS and HTML files whose key uses count, the translation runtime and
+    pre-rendered page variants excluded."""
+    paths = []
+    for name in sorted(os.listdir(directory)):
+        if name.endswith(('.js', '.html')) and not _is_runtime_file(name) and not VARIANT_NAME.search(name):
+            paths.append(os.path.join(directory, name))
+    return paths
+
+
+def scan_tree(paths):
+    """Collect {key: [KeyUse, ...]} and the dynamic prefixes over `paths`."""
+    uses = {}
+    prefixes = set()
+    for path in paths:
+        with open(path, 'r', encoding='utf-8') as f:
+            file_uses, file_prefixes = find_key_uses(f.read(), path)
+        for use in file_uses:
+            uses.setdefault(use.key, []).append(use)
+        prefixes |= file_prefixes
+    return uses, prefixes
+
+
+def keys_in(snippets):
+    """Translation keys referenced by t('...') calls in the given code snippets."""
+    keys = set()
+    for snippet in snippets:
+        for match in _T_CALL.finditer(snippet):
+            keys.add(next(group for group in match.groups() if group is not None))
+    return keys
+
+
+# ============================================================
+# Validation
+# ============================================================
+Report = namedtuple('Report', 'missing untranslated unused duplicates')
+
+
+def validate(translations, uses, prefixes=(), rule_keys=()):
+    """Check used keys (and keys the rules emit) against `translations`.
+
+    Returns a Report:
+      missing       {lang: [key, ...]} keys used or emitted but not defined
+      untranslated  {lang: [key, ...]} keys defined in another language only
+      unused        [key, ...] keys defined but never referenced
+      duplicates    [(lang, key, line), ...] keys defined twice
+    """
+    wanted = set(uses) | set(rule_keys)
+    defined = translations.keys()
+    prefixes = tuple(prefixes)
+
+    missing = {}
+    untranslated = {}
+    for lang, values in translations.values.items():
+        missing[lang] = sorted(key for key in wanted if key not in values)
+        untranslated[lang] = sorted(key for key in defined if key not in values and key not in wanted)
+    unused = sorted(key for key in defined
+                    if key not in wanted and not (prefixes and key.startswith(prefixes)))
+    return Report(missing, untranslated, unused, translations.duplicates)
+
+
+# ============================================================
+# Flat runtime catalog
+# ============================================================
+# Same token syntax as interpolate() in i18n.js
+_PLACEHOLDER = re.compile(r'\{(\w+)\}')
+
+
+def split_placeholders(value):
+    """'Hi {name}!' -> ['Hi ', 'name', '!']; strings without placeholders stay strings.
+
+    Even indices are literal text and odd indices placeholder names, so the
+    runtime can interpolate by concatenation instead of running a regex.
+    """
+    parts = _PLACEHOLDER.split(value)
+    return value if len(parts) == 1 else parts
+
+
+def flat_catalog(translations, fallback='en'):
+    """{lang: {key: entry}} ready for t() to look up in one step.
+
+    Each language gets the `fallback` language's entries for the keys it
+    lacks, and every value with placeholders is pre-split.
+    """
+    base = translations.values.get(fallback, {})
+    catalog = {}
+    for lang, values in translations.values.items():
+        merged = dict(values)
+        for key, value in base.items():
+            merged.setdefault(key, value)
+        catalog[lang] = {key: split_placeholders(value) for key, value in merged.items()}
+    return catalog
+
+
+def _json(value):
+    # U+2028/U+2029 are valid in JSON but end a line in older JS engines
+    return json.dumps(value, ensure_ascii=False).replace('\u2028', '\\u2028').replace('\u2029', '\\u2029')
+
+
+def render_flat_js(catalog, source='translations.js'):
+    """The translations.flat.js script assigning `catalog` to window.translationsFlat."""
+    lines = [
+        f'// Generated from {source} by _replace_strings.py --build-translations. Do not edit.',
+        "// One flat key -> string map per language, English filled in for missing keys.",
+        "// Strings with {placeholders} are pre-split: [text, name, text, ..., text].",
+        'window.translationsFlat = {',
+    ]
+    for i, (lang, entries) in enumerate(catalog.items()):
+        lines.append(f'  {_json(lang)}: {{')
+        lines.extend(f'    {_json(key)}: {_json(entry)},' for key, entry in entries.items())
+        lines.append('  },' if i < len(catalog) - 1 else '  }')
+    lines.append('};')
+    return '\n'.join(lines) + '\n'
+
+
+# ============================================================
+# Per-language bundles
+# ============================================================
+BUNDLE_MANIFEST = 'translations.bundles.js'
+# translations.<lang>.<hash>.js, or translations.<page>.<lang>.<hash>.js for a page subset
+BUNDLE_NAME = re.compile(r'^translations\.(?:[\w-]+\.)?[\w-]+\.[0-9a-f]{10}\.js$')
+
+
+def _js_string(text):
+    """`text` as a single-quoted JS string literal."""
+    return "'" + (text.replace('\\', '\\\\').replace("'", "\\'")
+                  .replace('\u2028', '\\u2028').replace('\u2029', '\\u2029')) + "'"
+
+
+def render_bundle(lang, entries):
+    """The script for one language: its entries as a JSON string handed to JSON.parse.
+
+    Engines parse a JSON string much faster than the equivalent object
+    literal, and the bundle only carries the one language a page needs.
+    """
+    payload = json.dumps(entries, ensure_ascii=False, separators=(',', ':'))
+    return (f'// Generated by _replace_strings.py --build-translations. Do not edit.\n'
+            f'(self.translationsFlat || (self.translationsFlat = {{}}))[{_json(lang)}] = '
+            f'JSON.parse({_js_string(payload)});\n')
+
+
+def bundle_name(lang, text, page=None):
+    """translations.[<page>.]<lang>.<hash>.js, the hash covering the bundle content."""
+    digest = hashlib.sha256(text.encode('utf-8')).hexdigest()[:10]
+    stem = f'translations.{page}' if page else 'translations'
+    return f'{stem}.{lang}.{digest}.js'
+
+
+def render_bundle_manifest(names, page_names=None):
+    """translations.bundles.js: which hashed bundle holds each language.
+
+    `page_names` maps a page ('dashboard.html') to its own {lang: name}
+    subset bundles; pages not listed use the full ones.
+    """
+    entries = ''.join(f'  {_json(lang)}: {_json(name)},\n' for lang, name in names.items())
+    pages = ''.join(f'  {_json(page)}: {_json(langs)},\n' for page, langs in (page_names or {}).items())
+    return ('// Generated by _replace_strings.py --build-translations. Do not edit.\n'
+            '// i18n.js loads the bundle of the active language (the page subset when there\n'
+            '// is one); sw.js precaches all of them.\n'
+            f'self.translationBundles = {{\n{entries}}};\n'
+            f'self.translationPageBundles = {{\n{pages}}};\n')
+
+
+# ============================================================
+# Per-page subsets
+# ============================================================
+# Local scripts only: a src with a scheme (https://...) is a CDN
+_SCRIPT_SRC = re.compile(r"""<script\b[^>]*?\bsrc\s*=\s*["']([^"':?#]+)["']""", re.I)
+# Scripts a script loads itself, e.g. authScript.src = 'auth-helper.js'
+_SCRIPT_NAME = re.compile(r"""['"`]([\w./-]+\.js)['"`]""")
+
+
+def page_scripts(html_path):
+    """The local scripts `html_path` runs: its <script src> tags, then the
+    .js files those scripts name, transitively.
+
+    Service workers (anything calling importScripts) are not followed, as
+    they run outside the page.
+    """
+    directory = os.path.dirname(html_path)
+    with open(html_path, 'r', encoding='utf-8') as f:
+        pending = deque(match.group(1) for match in _SCRIPT_SRC.finditer(f.read()))
+    scripts = []
+    seen = set()
+    while pending:
+        name = os.path.normpath(pending.popleft())
+        path = os.path.join(directory, name)
+        if name in seen or _is_runtime_file(os.path.basename(name)) or not os.path.isfile(path):
+            continue
+        seen.add(name)
+        with open(path, 'r', encoding='utf-8') as f:
+            text = f.read()
+        if 'importScripts(' in text:
+            continue
+        scripts.append(path)
+        pending.extend(match.group(1) for match in _SCRIPT_NAME.finditer(text))
+    return scripts
+
+
+def page_keys(html_path):
+    """(keys, prefixes) a page can look up: the data-i18n attributes and t()
+    calls in its HTML and inline scripts plus the t() calls in page_scripts()."""
+    uses, prefixes = scan_tree([html_path] + page_scripts(html_path))
+    return set(uses), prefixes
+
+
+def subset_catalog(catalog, keys, prefixes=()):
+    """The entries of `catalog` a page needs.
+
+    Every language keeps the same key set. Since flat_catalog() has already
+    filled the English value into keys a language lacks, the English
+    fallbacks come along with it.
+    """
+    prefixes = tuple(prefixes)
+    return {lang: {key: entry for key, entry in entries.items()
+                   if key in keys or (prefixes and key.startswith(prefixes))}
+            for lang, entries in catalog.items()}
@@ -5,18 +5,83 @@
     const DEFAULT_LANG = 'fr';
     const SUPPORTED_LANGS = ['fr', 'en'];
     const STORAGE_KEY = 'lang';
+    let currentLang = null;
 
-    // Get current language from localStorage
+    // Get current language from localStorage (read once, then kept in memory)
     function getCurrentLanguage() {
+        if (currentLang) return currentLang;
         const stored = localStorage.getItem(STORAGE_KEY);
-        if (stored && SUPPORTED_LANGS.includes(stored)) return stored;
-        return DEFAULT_LANG;
+        currentLang = stored && SUPPORTED_LANGS.includes(stored) ? stored : DEFAULT_LANG;
+        return currentLang;
+    }
+
+    // translations.bundles.js names one hashed bundle per language
+    // (translations.<lang>.<hash>.js), plus smaller per-page subsets holding
+    // only the keys a page uses. _replace_strings.py --build-translations
+    // writes the script tags of the page's bundles after translations.bundles.js,
+    // so they have run by the time this file does; a bundle the page lacks
+    // (the other language of a pre-rendered page) is loaded on demand
+    // Pages written by _replace_strings.py --prerender (dashboard.fr.html) come
+    // with their data-i18n elements already translated into this language
+    const prerendered = document.documentElement.getAttribute('data-i18n-prerendered');
+
+    function bundleFor(lang) {
+        let page = location.pathname.split('/').pop() || 'index.html';
+        if (prerendered) page = page.replace(`.${prerendered}.html`, '.html');
+        const pages = window.translationPageBundles;
+        if (pages && pages[page] && pages[page][lang]) return pages[page][lang];
+        return window.translationBundles && window.translationBundles[lang];
+    }
+
+    function hasBundle(lang) {
+        return !!(window.translationsFlat && window.translationsFlat[lang]);
+    }
+
+    function loadBundle(lang, done) {
+        const src = bundleFor(lang);
+        if (!src || hasBundle(lang)) {
+            done();
+            return;
+        }
+        const script = document.createElement('script');
+        script.src = src;
+        script.onload = done;
+        script.onerror = done;
+        document.head.appendChild(script);
+    }
+
+    // Another tab switched language
+    window.addEventListener('storage', (e) => {
+        if (e.key !== STORAGE_KEY && e.key !== null) return;
+        const stored = localStorage.getItem(STORAGE_KEY);
+        const lang = stored && SUPPORTED_LANGS.includes(stored) ? stored : DEFAULT_LANG;
+        loadBundle(lang, () => { currentLang = null; });
+    });
+
+    // Fill a pre-split bundle entry: [text, name, text, ..., text]
+    function render(parts, params) {
+        let out = parts[0];
+        for (let i = 1; i < parts.length; i += 2) {
+            const k = parts[i];
+            out += (params && k in params ? params[k] : `{${k}}`) + parts[i + 1];
+        }
+        return out;
     }
 
     // Translate a key like 'section.key' or 'section.nested.key'
     // Optional params object replaces {placeholder} tokens in the string.
     function t(key, params) {
         const lang = getCurrentLanguage();
+
+        // Bundles generated by _replace_strings.py --build-translations: one
+        // lookup, English already filled in for missing keys
+        const flat = window.translationsFlat && window.translationsFlat[lang];
+        if (flat) {
+            const entry = flat[key];
+            if (entry === undefined) return key;
+            return typeof entry === 'string' ? entry : render(entry, params);
+        }
+
         const dict = window.translations && window.translations[lang];
         if (!dict) return key;
 
@@ -116,12 +181,23 @@
         updateToggleState();
     }
 
+    // sw.js serves the pages pre-rendered in the language it was last told
+    function tellServiceWorker(lang) {
+        const worker = navigator.serviceWorker && navigator.serviceWorker.controller;
+        if (worker) worker.postMessage({ type: 'SET_LANGUAGE', lang });
+    }
+
     // Set language and re-apply
     function setLanguage(lang) {
         if (!SUPPORTED_LANGS.includes(lang)) return;
         localStorage.setItem(STORAGE_KEY, lang);
-        applyTranslations();
-        window.dispatchEvent(new CustomEvent('languageChanged', { detail: { lang } }));
+        tellServiceWorker(lang);
+        // Keep the old language until its bundle is in, so t() never sees a gap
+        loadBundle(lang, () => {
+            currentLang = lang;
+            applyTranslations();
+            window.dispatchEvent(new CustomEvent('languageChanged', { detail: { lang } }));
+        });
     }
 
     // Toggle between FR and EN
@@ -251,14 +327,23 @@
     }
 
     // Auto-initialize on DOM ready
+    // (no DOM walk needed when the page was pre-rendered in the active language)
+    // t() calls the page scripts make before DOMContentLoaded only find their
+    // text in the bundle script tags written into the page: a bundle loaded
+    // here arrives too late for them. With those tags missing, a page
+    // pre-rendered in the active language still shows its text, since
+    // applyTranslations() is skipped, but those t() calls return the keys.
+    tellServiceWorker(getCurrentLanguage());
     if (document.readyState === 'loading') {
         document.addEventListener('DOMContentLoaded', () => {
             initLanguageToggle();
-            applyTranslations();
+            const lang = getCurrentLanguage();
+            loadBundle(lang, () => { if (prerendered !== lang) applyTranslations(); });
         });
     } else {
         initLanguageToggle();
-        applyTranslations();
+        const lang = getCurrentLanguage();
+        loadBundle(lang, () => { if (prerendered !== lang) applyTranslations(); });
     }
 
     // Expose globally
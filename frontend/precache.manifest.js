@@ -0,0 +1,140 @@
+// Generated by _replace_strings.py. Do not edit.
+// sw.js caches each file under its hash and only downloads the files
+// whose hash changed.
+self.precacheManifest = {
+  "auth.html": "8da018b892",
+  "index.html": "b19095dd4c",
+  "dashboard.html": "1cb307256e",
+  "create-project.html": "1d37c5a480",
+  "create-project-overview.html": "65783f7a67",
+  "project-details.html": "3a383e65ed",
+  "cfss-dashboard.html": "3dd8a13d8b",
+  "cfss-create-project.html": "c9b3dae7d0",
+  "cfss-project-details.html": "cd7af648b6",
+  "cfss-verify-bulk-projects.html": "e6d8b4cb52",
+  "email-classifications.html": "1924f7b303",
+  "user-management.html": "7b07dcd440",
+  "limited-cfss-dashboard.html": "02389df6c7",
+  "limited-cfss-create-project.html": "c5bce46a32",
+  "limited-cfss-project-details.html": "b857022c0c",
+  "auth.js": "83766b87ea",
+  "auth-helper.js": "5482f74edc",
+  "scripts.js": "0f6da3d2ba",
+  "dashboard.js": "79a20452e7",
+  "create-project.js": "d8baafd778",
+  "project-details.js": "41d9dc78cd",
+  "project-details-init.js": "74e5be18da",
+  "project-reassign.js": "8b9231b649",
+  "cfss-dashboard.js": "2b05e033b4",
+  "cfss-create-project.js": "e42262afb3",
+  "cfss-project-details.js": "b12fbca757",
+  "cfss-project-details-init.js": "991345b432",
+  "cfss-custom-pages.js": "425e7ffd71",
+  "cfss-wall-calc-data.js": "a9d517be5c",
+  "cfss-wall-calc-logic.js": "a13517c027",
+  "cfss-wall-calc-ui.js": "1af84564a1",
+  "cfss-verify-bulk-projects.js": "6256f9e99b",
+  "user-management.js": "774d52bcf8",
+  "limited-cfss-dashboard.js": "cfe97c35be",
+  "limited-cfss-create-project.js": "310aa153ad",
+  "limited-cfss-project-details.js": "b93a0d500b",
+  "translations.bundles.js": "ce5258d756",
+  "i18n.js": "afd129c7f3",
+  "offline-store.js": "d2c416b72f",
+  "offline-sync.js": "4864255e0a",
+  "offline-ui.js": "ebbd132e27",
+  "sw-register.js": "8f0f1686f0",
+  "styles.css": "8106e9c930",
+  "auth.css": "5775ae8ee0",
+  "dashboard.css": "f470373954",
+  "create-project.css": "8e30dc1e02",
+  "project-details.css": "a756571ff6",
+  "cfss-project-details.css": "cb9a61cece",
+  "email.css": "70b657165a",
+  "review-tab.css": "d59432781b",
+  "user-management.css": "7a6460885f",
+  "manifest.json": "c221f02fdb",
+  "icons/icon-192.png": "918963a7a1",
+  "icons/icon-512.png": "e83395d47c",
+  "translations.auth.en.84737f5e71.js": "84737f5e71",
+  "translations.auth.fr.2447f2e8dc.js": "2447f2e8dc",
+  "translations.cfss-create-project.en.6967ad5f5d.js": "6967ad5f5d",
+  "translations.cfss-create-project.fr.d3b5de37db.js": "d3b5de37db",
+  "translations.cfss-dashboard.en.7414442f70.js": "7414442f70",
+  "translations.cfss-dashboard.fr.76d91851c2.js": "76d91851c2",
+  "translations.cfss-project-details.en.cd85662f2e.js": "cd85662f2e",
+  "translations.cfss-project-details.fr.337435c83d.js": "337435c83d",
+  "translations.cfss-verify-bulk-projects.en.24cc7969fd.js": "24cc7969fd",
+  "translations.cfss-verify-bulk-projects.fr.5b893b6910.js": "5b893b6910",
+  "translations.create-project-overview.en.78bac5064c.js": "78bac5064c",
+  "translations.create-project-overview.fr.2ded5a940e.js": "2ded5a940e",
+  "translations.create-project.en.0b0861ecaf.js": "0b0861ecaf",
+  "translations.create-project.fr.121f5437fc.js": "121f5437fc",
+  "translations.dashboard.en.241cb0c820.js": "241cb0c820",
+  "translations.dashboard.fr.51b16c45c8.js": "51b16c45c8",
+  "translations.email-classifications.en.0c2301a50c.js": "0c2301a50c",
+  "translations.email-classifications.fr.31081949a5.js": "31081949a5",
+  "translations.en.ab97a94689.js": "ab97a94689",
+  "translations.fr.cc4fa10633.js": "cc4fa10633",
+  "translations.index.en.885e549a60.js": "885e549a60",
+  "translations.index.fr.696dee8cc9.js": "696dee8cc9",
+  "translations.limited-cfss-create-project.en.e62465e38f.js": "e62465e38f",
+  "translations.limited-cfss-create-project.fr.d583ad838b.js": "d583ad838b",
+  "translations.limited-cfss-dashboard.en.56d4f23b72.js": "56d4f23b72",
+  "translations.limited-cfss-dashboard.fr.9bfc74b380.js": "9bfc74b380",
+  "translations.limited-cfss-project-details.en.8b35e64c30.js": "8b35e64c30",
+  "translations.limited-cfss-project-details.fr.57a13eb8f6.js": "57a13eb8f6",
+  "translations.project-details.en.12a2eca738.js": "12a2eca738",
+  "translations.project-details.fr.6909e7ec69.js": "6909e7ec69",
+  "translations.user-management.en.d14cf63738.js": "d14cf63738",
+  "translations.user-management.fr.16578b8f79.js": "16578b8f79",
+  "auth.en.html": "4f9130cbb3",
+  "auth.fr.html": "750198482d",
+  "cfss-create-project.en.html": "110cd61b2e",
+  "cfss-create-project.fr.html": "97e066d05d",
+  "cfss-dashboard.en.html": "b0a0abdc0f",
+  "cfss-dashboard.fr.html": "73bae2165c",
+  "cfss-project-details.en.html": "906e1587e9",
+  "cfss-project-details.fr.html": "9c9c04294e",
+  "cfss-verify-bulk-projects.en.html": "5f9ac8ad33",
+  "cfss-verify-bulk-projects.fr.html": "2d32268558",
+  "create-project-overview.en.html": "cfefe5d3aa",
+  "create-project-overview.fr.html": "ce592c40d2",
+  "create-project.en.html": "6386ec9cb0",
+  "create-project.fr.html": "00a2346a15",
+  "dashboard.en.html": "02f3593775",
+  "dashboard.fr.html": "a5bc7959ca",
+  "email-classifications.en.html": "17e2866732",
+  "email-classifications.fr.html": "533fa85121",
+  "index.en.html": "910bb339e0",
+  "index.fr.html": "c3240c8dc3",
+  "limited-cfss-create-project.en.html": "bc025668ac",
+  "limited-cfss-create-project.fr.html": "2b0f8262de",
+  "limited-cfss-dashboard.en.html": "7e70c5eacc",
+  "limited-cfss-dashboard.fr.html": "c468410207",
+  "limited-cfss-project-details.en.html": "91ebb3ca96",
+  "limited-cfss-project-details.fr.html": "bec27b97fe",
+  "project-details.en.html": "9df69322cf",
+  "project-details.fr.html": "ecd57492ed",
+  "user-management.en.html": "3f60306d88",
+  "user-management.fr.html": "0176a2357e",
+};
+// Page -> {language: pre-rendered variant}; sw.js serves a navigation
+// to the page from the variant of the language the pages report.
+self.prerenderedPages = {
+  "auth.html": {"en": "auth.en.html", "fr": "auth.fr.html"},
+  "cfss-create-project.html": {"en": "cfss-create-project.en.html", "fr": "cfss-create-project.fr.html"},
+  "cfss-dashboard.html": {"en": "cfss-dashboard.en.html", "fr": "cfss-dashboard.fr.html"},
+  "cfss-project-details.html": {"en": "cfss-project-details.en.html", "fr": "cfss-project-details.fr.html"},
+  "cfss-verify-bulk-projects.html": {"en": "cfss-verify-bulk-projects.en.html", "fr": "cfss-verify-bulk-projects.fr.html"},
+  "create-project-overview.html": {"en": "create-project-overview.en.html", "fr": "create-project-overview.fr.html"},
+  "create-project.html": {"en": "create-project.en.html", "fr": "create-project.fr.html"},
+  "dashboard.html": {"en": "dashboard.en.html", "fr": "dashboard.fr.html"},
+  "email-classifications.html": {"en": "email-classifications.en.html", "fr": "email-classifications.fr.html"},
+  "index.html": {"en": "index.en.html", "fr": "index.fr.html"},
+  "limited-cfss-create-project.html": {"en": "limited-cfss-create-project.en.html", "fr": "limited-cfss-create-project.fr.html"},
+  "limited-cfss-dashboard.html": {"en": "limited-cfss-dashboard.en.html", "fr": "limited-cfss-dashboard.fr.html"},
+  "limited-cfss-project-details.html": {"en": "limited-cfss-project-details.en.html", "fr": "limited-cfss-project-details.fr.html"},
+  "project-details.html": {"en": "project-details.en.html", "fr": "project-details.fr.html"},
+  "user-management.html": {"en": "user-management.en.html", "fr": "user-management.fr.html"},
+};
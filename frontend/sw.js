@@ -1,11 +1,26 @@
 // Service Worker for Protection Sismique PWA
-const CACHE_VERSION = 4;
-const APP_SHELL_CACHE = `ps-app-shell-v${CACHE_VERSION}`;
+// App shell files are versioned one by one through precache.manifest.js;
+// CACHE_VERSION only needs a bump when the CDN or API caches change.
+const CACHE_VERSION = 7;
+const APP_SHELL_CACHE = 'ps-app-shell';
 const CDN_CACHE = `ps-cdn-v${CACHE_VERSION}`;
 const API_CACHE = `ps-api-v${CACHE_VERSION}`;
 const ALL_CACHES = [APP_SHELL_CACHE, CDN_CACHE, API_CACHE];
 
-// All local files to precache on install
+// Defines self.translationBundles and self.translationPageBundles, the
+// content-hashed translation bundles of each language and page (regenerated
+// by _replace_strings.py --build-translations)
+importScripts('translations.bundles.js');
+
+// Defines self.precacheManifest, the content hash of every file below
+// (regenerated by every _replace_strings.py run that writes files), and
+// self.prerenderedPages, the language variants of the pages written by
+// _replace_strings.py --prerender. A new hash makes this worker update, and
+// only the files whose hash changed are downloaded again.
+importScripts('precache.manifest.js');
+
+// All local files to precache on install; _replace_strings.py reads this
+// list to build precache.manifest.js
 const APP_SHELL_URLS = [
   // HTML pages
   'auth.html',
@@ -23,6 +38,8 @@ const APP_SHELL_URLS = [
   'limited-cfss-dashboard.html',
   'limited-cfss-create-project.html',
   'limited-cfss-project-details.html',
+  // Pre-rendered language variants of the pages above (dashboard.fr.html, ...)
+  ...Object.values(self.prerenderedPages).flatMap(Object.values),
   // JavaScript files
   'auth.js',
   'auth-helper.js',
@@ -45,7 +62,9 @@ const APP_SHELL_URLS = [
   'limited-cfss-dashboard.js',
   'limited-cfss-create-project.js',
   'limited-cfss-project-details.js',
-  'translations.js',
+  'translations.bundles.js',
+  ...Object.values(self.translationBundles),
+  ...Object.values(self.translationPageBundles).flatMap(Object.values),
   'i18n.js',
   // config.js excluded — gitignored, will lazy-cache at runtime via cache-first strategy
   'offline-store.js',
@@ -68,12 +87,82 @@ const APP_SHELL_URLS = [
   'icons/icon-512.png'
 ];
 
-// --- Install: precache app shell ---
+// --- App shell entries, keyed by content hash ---
+const SCOPE_PATH = new URL(self.registration.scope).pathname;
+
+// 'auth.js' -> absolute URL of auth.js?v=<hash>; files missing from the
+// manifest get no version and are fetched again on every install
+function shellKey(path) {
+  const url = new URL(path, self.registration.scope);
+  const hash = self.precacheManifest[path];
+  if (hash) {
+    url.searchParams.set('v', hash);
+  }
+  return url.href;
+}
+
+// The APP_SHELL_URLS entry a same-origin URL stands for, or null
+function shellPath(url) {
+  if (!url.pathname.startsWith(SCOPE_PATH)) {
+    return null;
+  }
+  const path = decodeURIComponent(url.pathname.slice(SCOPE_PATH.length));
+  return self.precacheManifest[path] ? path : null;
+}
+
+// --- Page language, as i18n.js reports it ---
+// Kept in the app shell cache too, so it outlives this worker's restarts
+const LANGUAGE_KEY = new URL('__language', self.registration.scope).href;
+let pageLanguage;
+
+async function currentLanguage() {
+  if (pageLanguage === undefined) {
+    const stored = await caches.match(LANGUAGE_KEY);
+    pageLanguage = stored ? await stored.text() : null;
+  }
+  return pageLanguage;
+}
+
+async function setLanguage(lang) {
+  if (lang === await currentLanguage()) {
+    return;
+  }
+  pageLanguage = lang;
+  const cache = await caches.open(APP_SHELL_CACHE);
+  await cache.put(LANGUAGE_KEY, new Response(lang));
+}
+
+// The file to answer a request for `path` with: for a navigation, the page's
+// pre-rendered variant in the current language when there is one
+async function variantPath(request, path) {
+  const variants = self.prerenderedPages[path];
+  if (request.mode !== 'navigate' || !variants) {
+    return path;
+  }
+  return variants[await currentLanguage()] || path;
+}
+
+// --- Install: precache the app shell files whose hash changed ---
 self.addEventListener('install', event => {
-  console.log('[SW] Installing, cache version:', CACHE_VERSION);
   event.waitUntil(
     caches.open(APP_SHELL_CACHE)
-      .then(cache => cache.addAll(APP_SHELL_URLS))
+      .then(async cache => {
+        const stale = [];
+        for (const path of APP_SHELL_URLS) {
+          if (!self.precacheManifest[path] || !(await cache.match(shellKey(path)))) {
+            stale.push(path);
+          }
+        }
+        console.log(`[SW] Installing, ${stale.length} of ${APP_SHELL_URLS.length} app shell files to download`);
+        await Promise.all(stale.map(async path => {
+          // Bypass the HTTP cache, which may still hold the previous version
+          const response = await fetch(path, { cache: 'no-cache' });
+          if (!response.ok) {
+            throw new Error(`${path}: HTTP ${response.status}`);
+          }
+          await cache.put(shellKey(path), response);
+        }));
+      })
       .then(() => self.skipWaiting())
       .catch(err => {
         console.error('[SW] Precache failed:', err);
@@ -82,9 +171,10 @@ self.addEventListener('install', event => {
   );
 });
 
-// --- Activate: clean old caches ---
+// --- Activate: clean old caches and app shell versions ---
 self.addEventListener('activate', event => {
   console.log('[SW] Activating, cleaning old caches');
+  const current = new Set(APP_SHELL_URLS.map(shellKey));
   event.waitUntil(
     caches.keys()
       .then(keys => Promise.all(
@@ -95,6 +185,13 @@ self.addEventListener('activate', event => {
             return caches.delete(key);
           })
       ))
+      .then(() => caches.open(APP_SHELL_CACHE))
+      .then(cache => cache.keys().then(requests => Promise.all(
+        requests
+          // Versioned entries only; files cached at runtime (config.js) stay
+          .filter(request => new URL(request.url).searchParams.has('v') && !current.has(request.url))
+          .map(request => cache.delete(request))
+      )))
       .then(() => self.clients.claim())
   );
 });
@@ -108,8 +205,13 @@ self.addEventListener('fetch', event => {
     return;
   }
 
-  // App shell files (same origin) — cache-first
+  // App shell files (same origin) — cache-first, precached ones under their hash
   if (url.origin === self.location.origin) {
+    const path = shellPath(url);
+    if (path) {
+      event.respondWith(shellFirst(event.request, path));
+      return;
+    }
     event.respondWith(cacheFirst(event.request, APP_SHELL_CACHE));
     return;
   }
@@ -179,6 +281,16 @@ async function cacheFirst(request, cacheName) {
   }
 }
 
+// Precached app shell file: serve the version the manifest names, whatever
+// the query string (project-details.html?id=...), else as cacheFirst()
+async function shellFirst(request, path) {
+  const cached = await caches.match(shellKey(await variantPath(request, path)));
+  if (cached) {
+    return cached;
+  }
+  return cacheFirst(request, APP_SHELL_CACHE);
+}
+
 // Network-first: try network, fall back to cache
 async function networkFirst(request, cacheName) {
   try {
@@ -207,4 +319,7 @@ self.addEventListener('message', event => {
   if (event.data && event.data.type === 'SKIP_WAITING') {
     self.skipWaiting();
   }
+  if (event.data && event.data.type === 'SET_LANGUAGE' && typeof event.data.lang === 'string') {
+    event.waitUntil(setLanguage(event.data.lang));
+  }
 });
@@ -0,0 +1,123 @@
+// Load the translation bundles the way a page does and check that t() gives
+// the same text from them as from translations.js, for every key, language
+// and placeholder. Page bundles must agree with the full bundle of their
+// language. Given a JSON file of {page: {keys: [...], prefixes: [...]}}, the
+// keys each page looks up (see page_keys() in _translations.py), every one
+// of them the full bundle defines must be in the page's bundle. Prints one
+// line per problem; exit status 1 if there is any.
+//
+//   node tests/check_bundles.js [frontend directory [page keys JSON]]
+
+const fs = require('fs');
+const path = require('path');
+const vm = require('vm');
+
+const dir = path.resolve(process.argv[2] || path.join(__dirname, '..'));
+const pageKeys = process.argv[3] ? JSON.parse(fs.readFileSync(process.argv[3], 'utf8')) : {};
+const problems = [];
+
+function run(context, file) {
+  vm.runInContext(fs.readFileSync(path.join(dir, file), 'utf8'), context, { filename: file });
+}
+
+// A window with just enough of the DOM for i18n.js to start in `lang`
+function page(lang, scripts) {
+  const element = () => ({ style: {}, classList: { toggle() {} }, appendChild() {}, insertBefore() {} });
+  const window = {
+    localStorage: { getItem: () => lang, setItem() {} },
+    location: { pathname: '/index.html' },
+    navigator: {},
+    addEventListener() {},
+    dispatchEvent() {},
+    CustomEvent: class {},
+    document: {
+      readyState: 'complete',
+      documentElement: { getAttribute: () => null },
+      head: element(),
+      addEventListener() {},
+      createElement: element,
+      querySelector: () => null,
+      querySelectorAll: () => [],
+      getElementById: () => null,
+    },
+  };
+  window.self = window.window = window;
+  const context = vm.createContext(window);
+  for (const file of scripts) {
+    run(context, file);
+  }
+  return window;
+}
+
+// {key: value} of one language of translations.js, nested sections joined with '.'
+function flatten(object, prefix, out) {
+  for (const [name, value] of Object.entries(object)) {
+    if (typeof value === 'object' && value !== null) {
+      flatten(value, `${prefix}${name}.`, out);
+    } else {
+      out[`${prefix}${name}`] = value;
+    }
+  }
+  return out;
+}
+
+const source = page('en', ['translations.js']).translations;
+const keys = new Set();
+for (const lang of Object.keys(source)) {
+  Object.keys(flatten(source[lang], '', {})).forEach(key => keys.add(key));
+}
+
+const manifest = page('en', ['translations.bundles.js']);
+for (const lang of Object.keys(source)) {
+  const bundle = manifest.translationBundles[lang];
+  if (!bundle || !fs.existsSync(path.join(dir, bundle))) {
+    problems.push(`${lang}: no bundle (${bundle})`);
+    continue;
+  }
+  const fromBundle = page(lang, ['translations.bundles.js', bundle, 'i18n.js']);
+  const fromSource = page(lang, ['translations.js', 'i18n.js']);
+  for (const key of keys) {
+    const text = fromSource.t(key);
+    const params = {};
+    for (const match of String(text).matchAll(/\{(\w+)\}/g)) {
+      params[match[1]] = `<${match[1]}>`;
+    }
+    const expected = fromSource.t(key, params);
+    const actual = fromBundle.t(key, params);
+    if (actual !== expected) {
+      problems.push(`${bundle}: ${key} is ${JSON.stringify(actual)}, translations.js has ${JSON.stringify(expected)}`);
+    }
+  }
+
+  const full = fromBundle.translationsFlat[lang];
+  for (const [pageName, bundles] of Object.entries(manifest.translationPageBundles || {})) {
+    const file = bundles[lang];
+    if (!file) {
+      continue;
+    }
+    if (!fs.existsSync(path.join(dir, file))) {
+      problems.push(`${pageName}: missing bundle ${file}`);
+      continue;
+    }
+    const subset = page(lang, ['translations.bundles.js', file]).translationsFlat[lang];
+    for (const [key, entry] of Object.entries(subset)) {
+      if (JSON.stringify(entry) !== JSON.stringify(full[key])) {
+        problems.push(`${file}: ${key} differs from ${bundle}`);
+      }
+    }
+    const uses = pageKeys[pageName];
+    if (uses) {
+      const needed = Object.keys(full).filter(key => uses.keys.includes(key)
+        || uses.prefixes.some(prefix => key.startsWith(prefix)));
+      for (const key of needed) {
+        if (!(key in subset)) {
+          problems.push(`${file}: ${key} is used by ${pageName} but missing`);
+        }
+      }
+    }
+  }
+}
+
+problems.forEach(problem => console.log(problem));
+console.log(`${keys.size} key(s) checked, ${problems.length} problem(s)`);
+process.exit(problems.length ? 1 : 0);
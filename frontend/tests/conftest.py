@@ -0,0 +1,50 @@
+"""Shared fixtures: the frontend scripts on sys.path and the rule sets of the tree."""
+
+import glob
+import os
+import sys
+
+import pytest
+
+FRONTEND = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, FRONTEND)
+
+import _js_lexer as lexer  # noqa: E402
+import _replace_strings as rs  # noqa: E402
+from _translations import Translations  # noqa: E402
+
+
+def tree_scripts():
+    """The *.js files of the frontend, generated bundles aside."""
+    return [path for path in sorted(glob.glob(os.path.join(FRONTEND, '*.js')))
+            if not os.path.basename(path).startswith('translations.')]
+
+
+def read(path):
+    with open(path, 'r', encoding='utf-8', newline='') as f:
+        return f.read()
+
+
+def full_rewrite(text, ruleset, path=''):
+    """What rewrite_file() writes for `text`: the rules, then the --lex pass."""
+    content = ruleset.apply(text, path=path)
+    if ruleset.lex:
+        content, _ = ruleset.rewrite_sites(content, lexer.tokenize(content), path=path)
+    return content
+
+
+@pytest.fixture(scope='session')
+def keys():
+    return rs.translation_keys(Translations.load(rs.DEFAULT_TRANSLATIONS).values)
+
+
+@pytest.fixture(scope='session')
+def ruleset(keys, tmp_path_factory):
+    pack = tmp_path_factory.mktemp('pack') / 'rules.pack'
+    return rs.load_ruleset(rs.DEFAULT_RULES, str(pack), rs.rule_templates, lex=False, keys=keys)
+
+
+@pytest.fixture(scope='session')
+def lex_ruleset(keys, tmp_path_factory):
+    pack = tmp_path_factory.mktemp('pack') / 'rules.pack'
+    return rs.load_ruleset(rs.DEFAULT_RULES, str(pack), rs.rule_templates, lex=True, keys=keys)
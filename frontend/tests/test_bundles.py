@@ -0,0 +1,28 @@
+"""The translation bundles: their names, and t() from them under node (check_bundles.js)."""
+
+import os
+import shutil
+import subprocess
+
+import pytest
+
+from _translations import BUNDLE_NAME, bundle_name, render_bundle
+from conftest import FRONTEND
+
+NODE = shutil.which('node')
+
+
+@pytest.mark.skipif(NODE is None, reason='node is not installed')
+def test_bundles_translate_like_translations_js():
+    result = subprocess.run([NODE, os.path.join(FRONTEND, 'tests', 'check_bundles.js'), FRONTEND],
+                            capture_output=True, text=True)
+    assert result.returncode == 0, result.stdout + result.stderr
+    assert ' 0 problem(s)' in result.stdout
+
+
+def test_bundle_name_follows_the_content():
+    text = render_bundle('fr', {'walls.saved': 'Mur enregistré'})
+    assert text.endswith("JSON.parse('{\"walls.saved\":\"Mur enregistré\"}');\n")
+    assert bundle_name('fr', text) != bundle_name('fr', render_bundle('fr', {'walls.saved': 'Enregistré'}))
+    assert bundle_name('fr', text, 'dashboard').startswith('translations.dashboard.fr.')
+    assert BUNDLE_NAME.match(bundle_name('fr', text)) and BUNDLE_NAME.match(bundle_name('fr', text, 'dashboard'))
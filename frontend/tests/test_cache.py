@@ -0,0 +1,46 @@
+"""Incremental runs: files whose content and rule set are unchanged since the
+last run are skipped, with their report taken from the cache."""
+
+import _replace_strings as rs
+
+RULES = [("alert('Saved');", "alert(t('walls.saved'));")]
+
+
+def run(path, ruleset, cache_path):
+    cache = rs.load_cache(cache_path, ruleset)
+    result = rs.rewrite_files([path], ruleset, cache=cache)[path]
+    rs.save_cache(cache_path, ruleset, cache)
+    return result
+
+
+def test_unchanged_file_is_skipped_with_its_report(tmp_path):
+    path = tmp_path / 'walls.js'
+    path.write_text("alert('Saved');\nalert('Not covered by any rule');\n", encoding='utf-8')
+    cache_path = str(tmp_path / 'cache.json')
+    ruleset = rs.RuleSet(RULES, lex=True)
+    first = run(str(path), ruleset, cache_path)
+    assert not first.skipped and first.changes == 1 and first.unmatched
+    second = run(str(path), ruleset, cache_path)
+    assert second.skipped and second.changes == 0
+    assert [tuple(site) for site in second.unmatched] == [tuple(site) for site in first.unmatched]
+
+
+def test_edited_file_is_processed_again(tmp_path):
+    path = tmp_path / 'walls.js'
+    path.write_text("alert('Saved');\n", encoding='utf-8')
+    cache_path = str(tmp_path / 'cache.json')
+    ruleset = rs.RuleSet(RULES)
+    run(str(path), ruleset, cache_path)
+    with open(path, 'a', encoding='utf-8') as f:
+        f.write("alert('Saved');\n")
+    result = run(str(path), ruleset, cache_path)
+    assert not result.skipped and result.changes == 1
+
+
+def test_other_rules_drop_the_cache(tmp_path):
+    path = tmp_path / 'walls.js'
+    path.write_text("alert('Saved');\n", encoding='utf-8')
+    cache_path = str(tmp_path / 'cache.json')
+    run(str(path), rs.RuleSet(RULES), cache_path)
+    assert rs.load_cache(cache_path, rs.RuleSet(RULES))
+    assert rs.load_cache(cache_path, rs.RuleSet(RULES + [("confirm('Sure?')", "confirm(t('common.sure'))")])) == {}
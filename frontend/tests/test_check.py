@@ -0,0 +1,69 @@
+"""--check: the places a rewrite would change, found without rewriting."""
+
+import os
+import subprocess
+import sys
+
+import pytest
+
+import _js_lexer as lexer
+import _replace_strings as rs
+from conftest import FRONTEND, full_rewrite, read, tree_scripts
+
+SCRIPTS = tree_scripts()
+SCRIPT = os.path.join(FRONTEND, '_replace_strings.py')
+
+
+def names(paths):
+    return [os.path.basename(path) for path in paths]
+
+
+@pytest.mark.parametrize('path', SCRIPTS, ids=names(SCRIPTS))
+def test_check_finds_what_a_rewrite_changes(path, ruleset):
+    text = read(path)
+    content = ruleset.apply(text, path=path)
+    assert bool(rs.check_text(text, ruleset, path=path)) == (content != text)
+    assert bool(rs.check_text(content, ruleset, path=path)) == (ruleset.apply(content, path=path) != content)
+
+
+@pytest.mark.parametrize('path', SCRIPTS, ids=names(SCRIPTS))
+def test_check_lex_finds_what_a_lex_rewrite_changes(path, lex_ruleset):
+    text = read(path)
+    changed = full_rewrite(text, lex_ruleset, path) != text
+    assert bool(rs.check_text(text, lex_ruleset, tokens=lexer.tokenize(text), path=path)) == changed
+
+
+def test_check_stops_at_the_first_hit_unless_asked_for_all():
+    ruleset = rs.RuleSet([("alert('Saved');", "alert(t('walls.saved'));"), ('same', 'same')])
+    text = "same\nalert('Saved');\nx;\nalert('Saved');\n"
+    assert rs.check_text(text, ruleset) == [(5, 20, "rule 1: alert('Saved');")]
+    assert rs.check_text(text, ruleset, find_all=True) == [(5, 20, "rule 1: alert('Saved');"),
+                                                           (24, 39, "rule 1: alert('Saved');")]
+    # A rule that changes nothing is no pending rewrite
+    assert rs.check_text('same\n', ruleset, find_all=True) == []
+
+
+def run_script(*args):
+    return subprocess.run([sys.executable, SCRIPT, *args], capture_output=True, text=True, cwd=FRONTEND)
+
+
+def test_check_exit_status_before_and_after_a_rewrite(tmp_path):
+    path = tmp_path / 'walls.js'
+    path.write_text("function f() {\n    alert('Please select valid image files.');\n}\n", encoding='utf-8')
+    cache = str(tmp_path / 'cache.json')
+
+    dirty = run_script('--check', str(path), '--cache', cache)
+    assert dirty.returncode == 1
+    assert 'walls.js:2: rule' in dirty.stdout
+    assert "alert('Please select" in path.read_text(encoding='utf-8')
+
+    assert run_script(str(path), '--cache', cache).returncode == 0
+    assert "t('" in path.read_text(encoding='utf-8')
+    clean = run_script('--check', str(path), '--cache', cache)
+    assert clean.returncode == 0, clean.stdout
+
+
+def test_check_reports_missing_files(tmp_path):
+    result = run_script('--check', str(tmp_path / 'missing.js'), '--cache', str(tmp_path / 'cache.json'))
+    assert result.returncode == 1
+    assert 'missing.js: error:' in result.stdout
@@ -0,0 +1,121 @@
+"""--consolidate: keys sharing all their values merged, their uses renamed and
+everything generated from translations.js rebuilt."""
+
+import json
+import os
+import subprocess
+import sys
+
+import _replace_strings as rs
+from _translations import Translations
+from conftest import FRONTEND, read
+
+SCRIPT = os.path.join(FRONTEND, '_replace_strings.py')
+
+TRANSLATIONS = """window.translations = {
+  en: {
+    common: {
+      save: 'Save',
+    },
+    walls: {
+      save: 'Save',
+      title: 'Walls',
+    },
+  },
+  fr: {
+    common: {
+      save: 'Enregistrer',
+    },
+    walls: {
+      save: 'Enregistrer',
+      title: 'Murs',
+    },
+  },
+};
+"""
+
+PAGE = """<!DOCTYPE html>
+<html>
+<head>
+    <script src="translations.bundles.js"></script>
+    <script src="i18n.js"></script>
+    <script src="walls.js"></script>
+</head>
+<body>
+    <h1 data-i18n="walls.title">Walls</h1>
+    <button data-i18n="walls.save">Save</button>
+</body>
+</html>
+"""
+
+SERVICE_WORKER = """const APP_SHELL_URLS = [
+  'walls.html',
+  ...Object.values(self.prerenderedPages).flatMap(Object.values),
+  'walls.js',
+  'translations.bundles.js',
+  ...Object.values(self.translationBundles),
+  ...Object.values(self.translationPageBundles).flatMap(Object.values),
+];
+"""
+
+RULES = {'format': 1, 'sections': [{'name': 'alert', 'title': 'Alerts', 'rules': [
+    ["alert('Saved');", "alert(t('walls.save'));"],
+]}]}
+
+
+def run_script(tree, *args):
+    return subprocess.run([sys.executable, SCRIPT, '--translations', str(tree / 'translations.js'),
+                           '--rules', str(tree / 'rules.json'), '--rule-pack', str(tree / 'rules.pack'),
+                           '--bundle-dir', str(tree), '--cache', str(tree / 'cache.json'), *args],
+                          capture_output=True, text=True, cwd=tree)
+
+
+def make_tree(tree):
+    (tree / 'translations.js').write_text(TRANSLATIONS, encoding='utf-8')
+    (tree / 'walls.html').write_text(PAGE, encoding='utf-8')
+    (tree / 'walls.js').write_text("label.textContent = t('walls.save');\n", encoding='utf-8')
+    (tree / 'i18n.js').write_text(read(os.path.join(FRONTEND, 'i18n.js')), encoding='utf-8')
+    (tree / 'sw.js').write_text(SERVICE_WORKER, encoding='utf-8')
+    (tree / 'rules.json').write_text(json.dumps(RULES), encoding='utf-8')
+    built = run_script(tree, '--build-translations', '--per-page', '--prerender', 'en', 'fr')
+    assert built.returncode == 0, built.stdout + built.stderr
+
+
+def test_consolidate_renames_the_uses_and_drops_the_duplicates(tmp_path):
+    make_tree(tmp_path)
+    result = run_script(tmp_path, '--consolidate')
+    assert result.returncode == 0, result.stdout + result.stderr
+
+    assert (tmp_path / 'walls.js').read_text(encoding='utf-8') == "label.textContent = t('common.save');\n"
+    assert 'data-i18n="common.save"' in (tmp_path / 'walls.html').read_text(encoding='utf-8')
+    assert json.loads((tmp_path / 'rules.json').read_text(encoding='utf-8'))['sections'][0]['rules'] == [
+        ["alert('Saved');", "alert(t('common.save'));"]]
+    translations = Translations.load(str(tmp_path / 'translations.js'))
+    assert sorted(rs.translation_keys(translations.values)) == ['common.save', 'walls.title']
+
+
+def test_consolidate_rebuilds_the_bundles_variants_and_manifest(tmp_path):
+    make_tree(tmp_path)
+    before = set(os.listdir(tmp_path))
+    assert run_script(tmp_path, '--consolidate').returncode == 0
+
+    bundles = {name for name in os.listdir(tmp_path) if rs.BUNDLE_NAME.match(name)}
+    assert len(bundles) == 4 and not bundles & before
+    for name in bundles:
+        assert 'walls.save' not in read(str(tmp_path / name))
+    assert 'data-i18n="common.save"' in (tmp_path / 'walls.en.html').read_text(encoding='utf-8')
+    assert 'Enregistrer' in (tmp_path / 'walls.fr.html').read_text(encoding='utf-8')
+
+    check = run_script(tmp_path, '--check-precache')
+    assert check.returncode == 0, check.stdout
+
+
+def test_consolidate_without_duplicates_writes_nothing(tmp_path):
+    make_tree(tmp_path)
+    assert run_script(tmp_path, '--consolidate').returncode == 0
+    files = {name: (tmp_path / name).read_bytes() for name in os.listdir(tmp_path)
+             if not name.startswith('.')}
+    result = run_script(tmp_path, '--consolidate')
+    assert result.returncode == 0
+    assert 'No two keys share all their values' in result.stdout
+    assert {name: (tmp_path / name).read_bytes() for name in files} == files
@@ -0,0 +1,118 @@
+"""EditLog composition, line blocks, hunks and changed_span() against brute force."""
+
+import random
+
+import pytest
+
+from _edits import EditLog, changed_lines, changed_span, hunks, line_blocks, unified_diff
+
+ALPHABET = 'ab \n'
+
+
+def random_text(rng, size):
+    return ''.join(rng.choice(ALPHABET) for _ in range(size))
+
+
+def random_edits(rng, text):
+    """Sorted, non-overlapping (start, end, replacement) edits of `text`."""
+    points = sorted(rng.sample(range(len(text) + 1), min(len(text) + 1, 2 * rng.randint(0, 4))))
+    edits = []
+    for start, end in zip(points[::2], points[1::2]):
+        if rng.random() < 0.3:
+            end = start
+        edits.append((start, end, random_text(rng, rng.randint(0, 6))))
+    return edits
+
+
+def apply_edits(text, edits):
+    out = []
+    pos = 0
+    for start, end, replacement in edits:
+        out.append(text[pos:start])
+        out.append(replacement)
+        pos = end
+    out.append(text[pos:])
+    return ''.join(out)
+
+
+def rewritten(seed, passes=3):
+    """(original, content, log) after a few random passes over a random text."""
+    rng = random.Random(seed)
+    original = random_text(rng, rng.randint(0, 60))
+    text = original
+    log = EditLog()
+    for _ in range(passes):
+        edits = random_edits(rng, text)
+        log.record(text, edits)
+        text = apply_edits(text, edits)
+    return original, text, log
+
+
+def split_lines(text):
+    # ALPHABET has no other line break than '\n'
+    return text.splitlines(keepends=True)
+
+
+@pytest.mark.parametrize('seed', range(300))
+def test_regions_rebuild_the_content(seed):
+    original, content, log = rewritten(seed)
+    previous = (0, 0)
+    out = []
+    for o0, o1, n0, n1 in log.regions:
+        assert o0 >= previous[0] and n0 >= previous[1], 'regions overlap or are out of order'
+        assert original[previous[0]:o0] == content[previous[1]:n0], 'text between regions changed'
+        out.append(original[previous[0]:o0])
+        out.append(content[n0:n1])
+        previous = (o1, n1)
+    assert original[previous[0]:] == content[previous[1]:]
+    out.append(original[previous[0]:])
+    assert ''.join(out) == content
+
+
+@pytest.mark.parametrize('seed', range(300))
+def test_hunks_patch_the_original_into_the_content(seed):
+    original, content, log = rewritten(seed)
+    blocks = line_blocks(original, content, log.regions)
+    old_lines = split_lines(original)
+    new_lines = split_lines(content)
+    patched = []
+    pos = 0
+    for a_start, a_count, b_start, b_count, lines in hunks(original, content, blocks):
+        patched.extend(old_lines[pos:a_start])
+        assert [line[1:] for line in lines if line[0] != '+'] == old_lines[a_start:a_start + a_count]
+        assert [line[1:] for line in lines if line[0] != '-'] == new_lines[b_start:b_start + b_count]
+        patched.extend(line[1:] for line in lines if line[0] != '-')
+        pos = a_start + a_count
+    patched.extend(old_lines[pos:])
+    assert ''.join(patched) == content
+    assert (changed_lines(blocks) > 0) == (original != content)
+
+
+def test_unified_diff_header_and_ranges():
+    original = 'one\ntwo\nthree\n'
+    content = 'one\n2\nthree\n'
+    log = EditLog()
+    log.record(original, [(4, 7, '2')])
+    patch = unified_diff('f.js', hunks(original, content, line_blocks(original, content, log.regions)))
+    assert patch == '--- a/f.js\n+++ b/f.js\n@@ -1,3 +1,3 @@\n one\n-two\n+2\n three\n'
+
+
+def test_record_drops_edits_that_change_nothing():
+    log = EditLog()
+    log.record('abc', [(0, 1, 'a'), (1, 2, 'x')])
+    assert log.regions == [(1, 2, 1, 2)]
+
+
+@pytest.mark.parametrize('seed', range(200))
+def test_changed_span_is_the_common_prefix_and_suffix(seed):
+    rng = random.Random(seed)
+    old = random_text(rng, rng.randint(0, 30))
+    new = apply_edits(old, random_edits(rng, old))
+    start, old_end, new_end = changed_span(old, new)
+    prefix = 0
+    while prefix < min(len(old), len(new)) and old[prefix] == new[prefix]:
+        prefix += 1
+    suffix = 0
+    while suffix < min(len(old), len(new)) - prefix and old[-1 - suffix] == new[-1 - suffix]:
+        suffix += 1
+    assert (start, old_end, new_end) == (prefix, len(old) - suffix, len(new) - suffix)
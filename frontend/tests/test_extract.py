@@ -0,0 +1,61 @@
+"""Keys --extract proposes for new messages."""
+
+import pytest
+
+import _replace_strings as rs
+from _extract import key_name, propose_key
+from _translations import Translations
+
+
+@pytest.mark.parametrize('text, name', [
+    ('Please enter a subject.', 'enterSubject'),
+    ('Are you sure you want to delete this room?', 'confirmDeleteRoom'),
+    ('Error: {err}', 'errorDetails'),
+    ('🚫 {error}1. Click "Demote" to remove admin privileges', 'clickDemoteRemoveAdminPrivileges'),
+    ('Select montant métallique...', 'selectMontantMetallique'),
+    ('No CFSS data', 'noCFSSData'),
+])
+def test_key_name(text, name):
+    assert key_name(text) == name
+
+
+def test_clash_takes_the_word_that_sets_the_message_apart():
+    taken = {'cfss.youCanOnlyAddMore': 'You can only add {remaining} more image(s).'}
+    key = propose_key('cfss', 'You can only add {n} more image(s). Maximum 10 images per room.', taken)
+    assert key == 'cfss.youCanOnlyAddMoreRoom'
+    assert taken[key].endswith('per room.')
+
+
+def test_clash_with_other_placeholder_names_shares_the_key():
+    taken = {'cfss.errorDetails': 'Error: {err}'}
+    assert propose_key('cfss', 'Error:  {error}', taken) == 'cfss.errorDetails'
+
+
+def test_clash_with_a_longer_message_does_not_share_the_key():
+    taken = {'cfss.saveTemplate': 'Save the template'}
+    assert propose_key('cfss', 'Save template', taken) == 'cfss.saveTemplate2'
+
+
+def test_number_is_the_last_resort():
+    taken = {'cfss.saveTemplate': 'Save Template {name}'}
+    assert propose_key('cfss', 'Save template', taken) == 'cfss.saveTemplate2'
+
+
+def test_extract_and_the_error_template_agree(tmp_path, ruleset, keys):
+    """Sites --extract rewrites and sites the error-alert template rewrites
+    once the key is translated show the same text."""
+    extracted = tmp_path / 'cfss-walls.js'
+    extracted.write_text("alert('Error frobbing walls: ' + error.message);\n", encoding='utf-8')
+    templated = tmp_path / 'cfss-parapets.js'
+    templated.write_text("alert('Error frobbing walls: ' + err.message);\n", encoding='utf-8')
+
+    translations = Translations.load(rs.DEFAULT_TRANSLATIONS)
+    extractions, rules = rs.extract_messages([str(extracted)], ruleset, translations)
+    assert [(extraction.key, extraction.text) for extraction in extractions] == [
+        ('cfss.errorFrobbingWalls', 'Error frobbing walls')]
+    content = rs.RuleSet([(old, new) for _, old, new in rules]).apply(extracted.read_text(encoding='utf-8'))
+    assert content == "alert(t('cfss.errorFrobbingWalls') + ': ' + error.message);\n"
+
+    translated = rs.RuleSet([], rs.rule_templates, keys=keys | {'cfss.errorFrobbingWalls'})
+    content = translated.apply(templated.read_text(encoding='utf-8'), path=str(templated))
+    assert content == "alert(t('cfss.errorFrobbingWalls') + ': ' + err.message);\n"
@@ -0,0 +1,43 @@
+"""The flattened translation map t() looks keys up in."""
+
+import pytest
+
+from _translations import Translations, flat_catalog, split_placeholders
+
+SOURCE = """window.translations = {
+  en: {
+    walls: {
+      saved: 'Wall {name} saved',
+      status: {
+        open: 'Open',
+      },
+    },
+    extra: 'English only',
+  },
+  fr: {
+    walls: {
+      saved: 'Mur {name} enregistré',
+      status: {
+        open: 'Ouvert',
+      },
+    },
+  },
+};
+"""
+
+
+@pytest.mark.parametrize('value, parts', [
+    ('Saved', 'Saved'),
+    ('Wall {name} saved', ['Wall ', 'name', ' saved']),
+    ('{count}/{total}', ['', 'count', '/', 'total', '']),
+])
+def test_split_placeholders(value, parts):
+    assert split_placeholders(value) == parts
+
+
+def test_nested_sections_become_dotted_keys_with_english_filled_in():
+    catalog = flat_catalog(Translations.parse(SOURCE))
+    assert catalog['fr'] == {'walls.saved': ['Mur ', 'name', ' enregistré'],
+                             'walls.status.open': 'Ouvert',
+                             'extra': 'English only'}
+    assert catalog['en']['walls.saved'] == ['Wall ', 'name', ' saved']
@@ -0,0 +1,107 @@
+"""The persistent key index: incremental updates and its lookups."""
+
+import os
+
+from _key_index import KeyIndex, open_index
+from _translations import frontend_files, scan_tree
+from conftest import FRONTEND
+
+TRANSLATIONS = """window.translations = {
+  en: {
+    walls: {
+      save: 'Save',
+      saveAll: 'Save   all',
+      title: 'Walls',
+    },
+  },
+  fr: {
+    walls: {
+      save: 'Enregistrer',
+      saveAll: 'Tout enregistrer',
+      title: 'Murs',
+    },
+  },
+};
+"""
+
+
+def write(path, text, mtime):
+    path.write_text(text, encoding='utf-8')
+    os.utime(path, ns=(mtime, mtime))
+
+
+def make_tree(tmp_path):
+    write(tmp_path / 'translations.js', TRANSLATIONS, 1)
+    write(tmp_path / 'walls.js', "a = t('walls.save');\nb = t(`walls.${name}`);\n", 1)
+    write(tmp_path / 'walls.html', '<h1 data-i18n="walls.title">Walls</h1>\n', 1)
+    return str(tmp_path / 'translations.js'), str(tmp_path / '.translation_index')
+
+
+def test_update_rescans_only_what_changed(tmp_path):
+    translations, index_path = make_tree(tmp_path)
+    index = KeyIndex.load(index_path, str(tmp_path), translations)
+    assert index.update() == ['translations.js', 'walls.html', 'walls.js']
+    index.save(index_path)
+
+    index = KeyIndex.load(index_path, str(tmp_path), translations)
+    assert index.update() == [] and not index.dirty
+    # A new mtime with the same content is recorded but not rescanned
+    write(tmp_path / 'walls.html', '<h1 data-i18n="walls.title">Walls</h1>\n', 2)
+    assert index.update() == [] and index.dirty
+    write(tmp_path / 'walls.js', "a = t('walls.saveAll');\n", 2)
+    assert index.update() == ['walls.js']
+    assert [use.line for use in index.locations('walls.saveAll')] == [1]
+    assert index.locations('walls.save') == []
+    assert index.prefixes == set()
+
+    os.remove(tmp_path / 'walls.html')
+    assert index.update() == ['walls.html']
+    assert index.locations('walls.title') == []
+
+
+def test_index_matches_a_scan_of_the_tree(tmp_path):
+    index = open_index(os.path.join(FRONTEND, 'translations.js'), str(tmp_path / 'index'))
+    uses, prefixes = scan_tree(frontend_files(FRONTEND))
+    assert {key: sorted((use.path, use.line) for use in found) for key, found in index.uses.items()} == \
+        {key: sorted((use.path, use.line) for use in found) for key, found in uses.items()}
+    assert index.prefixes == prefixes
+    assert open_index(os.path.join(FRONTEND, 'translations.js'), str(tmp_path / 'index')).files == index.files
+
+
+def test_open_index_saves_only_when_something_changed(tmp_path):
+    translations, index_path = make_tree(tmp_path)
+    open_index(translations)
+    saved = os.stat(index_path).st_mtime_ns
+    os.utime(index_path, ns=(0, 0))
+    open_index(translations)
+    assert os.stat(index_path).st_mtime_ns == 0 != saved
+
+
+def test_other_version_or_tree_starts_afresh(tmp_path):
+    translations, index_path = make_tree(tmp_path)
+    open_index(translations)
+    assert KeyIndex.load(index_path, str(tmp_path), str(tmp_path / 'other.js')).files == {}
+    (tmp_path / '.translation_index').write_bytes(b'garbage')
+    assert KeyIndex.load(index_path, str(tmp_path), translations).files == {}
+
+
+def test_text_lookups(tmp_path):
+    translations, _ = make_tree(tmp_path)
+    index = open_index(translations)
+    assert index.keys_for_text('Save') == ['walls.save']
+    assert index.keys_for_text(' Save\n all ') == ['walls.saveAll']
+    assert index.keys_for_text('Murs', 'fr') == ['walls.title']
+    assert index.keys_for_text('Missing') == []
+    assert index.search_text('save') == ['walls.save', 'walls.saveAll']
+    assert index.search_text('TOUT', 'fr') == ['walls.saveAll']
+    assert index.values_of('walls.title') == {'en': 'Walls', 'fr': 'Murs'}
+
+
+def test_text_lookups_follow_updates(tmp_path):
+    translations, _ = make_tree(tmp_path)
+    index = open_index(translations)
+    assert index.keys_for_text('Walls') == ['walls.title']
+    write(tmp_path / 'translations.js', TRANSLATIONS.replace("'Walls'", "'Wall list'"), 2)
+    assert index.update() == ['translations.js']
+    assert index.keys_for_text('Walls') == []
+    assert index.keys_for_text('Wall list') == ['walls.title']
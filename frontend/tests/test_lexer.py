@@ -0,0 +1,61 @@
+"""The JS lexer behind --lex: its tokens, the token cache, and a site pass
+that grows in step with the file."""
+
+import os
+import time
+
+import pytest
+
+import _js_lexer as lexer
+import _replace_strings as rs
+from conftest import FRONTEND, read
+
+
+def kinds(text):
+    return [(kind, text[start:end]) for kind, start, end, _ in lexer.tokenize(text)]
+
+
+def test_tokens_tell_regexes_from_division_and_skip_template_substitutions():
+    text = "a = '1' / 2; b = /x\\/y/g; // c\nalert(`n ${x + '}'} m`); el.innerHTML = \"h\";"
+    assert kinds(text) == [
+        ('str', "'1'"), ('regex', '/x\\/y/g'), ('comment', '// c'), ('site', 'alert('),
+        ('tpl', "`n ${x + '}'} m`"), ('site', '.innerHTML ='), ('str', '"h"')]
+
+
+def test_method_calls_are_not_sites():
+    assert kinds("dialog.confirm('Sure?'); window.alert('Hi');") == [
+        ('str', "'Sure?'"), ('site', 'alert('), ('str', "'Hi'")]
+
+
+def test_token_cache_is_reused_until_the_content_changes(tmp_path, monkeypatch):
+    tokens_dir = str(tmp_path / 'tokens')
+    text = "alert('Saved');\n"
+    tokens = rs.load_tokens('walls.js', text, tokens_dir)
+    assert len(os.listdir(tokens_dir)) == 1
+
+    def tokenize(_):
+        raise AssertionError('tokenized again')
+    monkeypatch.setattr(lexer, 'tokenize', tokenize)
+    assert [tuple(token) for token in rs.load_tokens('walls.js', text, tokens_dir)] == tokens
+    with pytest.raises(AssertionError):
+        rs.load_tokens('walls.js', text + "alert('More');\n", tokens_dir)
+
+
+def site_pass_seconds(text, ruleset):
+    tokens = lexer.tokenize(text)
+    best = None
+    for _ in range(3):
+        started = time.perf_counter()
+        ruleset.rewrite_sites(text, tokens)
+        seconds = time.perf_counter() - started
+        best = seconds if best is None else min(best, seconds)
+    return best
+
+
+def test_site_pass_grows_linearly(lex_ruleset):
+    """Eight copies of a file take about eight times as long, not sixty-four
+    (the pass once walked the tokens from the start for every site)."""
+    text = read(os.path.join(FRONTEND, 'cfss-project-details.js'))
+    one = site_pass_seconds(text, lex_ruleset)
+    eight = site_pass_seconds(text * 8, lex_ruleset)
+    assert eight < 24 * one
@@ -0,0 +1,78 @@
+"""Per-page subset bundles: every key a page can look up is in them."""
+
+import json
+import os
+import re
+import shutil
+import subprocess
+
+import pytest
+
+import _js_lexer as lexer
+import _replace_strings as rs
+from _translations import Translations, flat_catalog, page_keys, page_scripts
+from conftest import FRONTEND, read
+
+NODE = shutil.which('node')
+PAGES = rs.html_pages(FRONTEND)
+
+
+def page_bundles():
+    """{page: {lang: bundle}} from translations.bundles.js."""
+    text = read(os.path.join(FRONTEND, 'translations.bundles.js')).split('self.translationPageBundles', 1)[1]
+    return {json.loads(match.group(1)): json.loads(match.group(2))
+            for match in re.finditer(r'^  ("[^"]+"): (\{.*\}),$', text, re.M)}
+
+
+def bundle_entries(name):
+    text = read(os.path.join(FRONTEND, name))
+    # The last literal is the argument of JSON.parse()
+    token = [token for token in lexer.tokenize(text) if token[0] == lexer.STRING][-1]
+    return json.loads(lexer.literal_value(text, token))
+
+
+@pytest.fixture(scope='module')
+def catalog():
+    return flat_catalog(Translations.load(rs.DEFAULT_TRANSLATIONS))
+
+
+@pytest.mark.parametrize('path', PAGES, ids=[os.path.basename(path) for path in PAGES])
+def test_page_bundle_holds_every_key_the_page_uses(path, catalog):
+    keys, prefixes = page_keys(path)
+    prefixes = tuple(prefixes)
+    bundles = page_bundles()[os.path.basename(path)]
+    assert sorted(bundles) == sorted(catalog)
+    for lang, name in bundles.items():
+        entries = bundle_entries(name)
+        needed = {key for key in catalog[lang] if key in keys or (prefixes and key.startswith(prefixes))}
+        assert needed <= set(entries), sorted(needed - set(entries))
+        assert all(entries[key] == catalog[lang][key] for key in entries)
+
+
+def test_page_scripts_follow_the_scripts_a_script_loads(tmp_path):
+    (tmp_path / 'walls.html').write_text('<script src="translations.bundles.js"></script>\n'
+                                         '<script src="i18n.js"></script>\n<script src="walls.js"></script>\n'
+                                         '<script src="https://cdn.example.com/lib.js"></script>\n', encoding='utf-8')
+    (tmp_path / 'walls.js').write_text("helper.src = 'walls-helper.js';\nnavigator.serviceWorker.register('sw.js');\n",
+                                       encoding='utf-8')
+    (tmp_path / 'walls-helper.js').write_text("t('walls.helped');\n", encoding='utf-8')
+    (tmp_path / 'sw.js').write_text("importScripts('translations.bundles.js');\nt('walls.worker');\n",
+                                    encoding='utf-8')
+    (tmp_path / 'i18n.js').write_text("t('runtime.key');\n", encoding='utf-8')
+    page = str(tmp_path / 'walls.html')
+    assert page_scripts(page) == [str(tmp_path / 'walls.js'), str(tmp_path / 'walls-helper.js')]
+    assert page_keys(page)[0] == {'walls.helped'}
+
+
+@pytest.mark.skipif(NODE is None, reason='node is not installed')
+def test_page_bundles_load_every_key_their_page_uses(tmp_path):
+    """check_bundles.js given the keys of each page, as i18n.js sees the bundles."""
+    uses = {}
+    for path in PAGES:
+        keys, prefixes = page_keys(path)
+        uses[os.path.basename(path)] = {'keys': sorted(keys), 'prefixes': sorted(prefixes)}
+    page_uses = tmp_path / 'page-keys.json'
+    page_uses.write_text(json.dumps(uses), encoding='utf-8')
+    result = subprocess.run([NODE, os.path.join(FRONTEND, 'tests', 'check_bundles.js'), FRONTEND, str(page_uses)],
+                            capture_output=True, text=True)
+    assert result.returncode == 0, result.stdout + result.stderr
@@ -0,0 +1,41 @@
+"""rewrite_files() over several files: worker processes write what one
+process writes, and a file that cannot be read does not stop the others."""
+
+import os
+import shutil
+
+import _replace_strings as rs
+from conftest import tree_scripts
+
+SCRIPTS = [path for path in tree_scripts() if os.path.basename(path).startswith(('cfss-', 'dashboard'))][:4]
+
+
+def copy_scripts(directory):
+    directory.mkdir()
+    return [shutil.copy(path, directory) for path in SCRIPTS]
+
+
+def test_workers_rewrite_like_one_process(tmp_path, ruleset):
+    serial = copy_scripts(tmp_path / 'serial')
+    parallel = copy_scripts(tmp_path / 'parallel')
+    one = rs.rewrite_files(serial, ruleset, jobs=1)
+    many = rs.rewrite_files(parallel, ruleset, jobs=2)
+    for a, b in zip(serial, parallel):
+        with open(a, 'rb') as f, open(b, 'rb') as g:
+            assert f.read() == g.read()
+        assert one[a].changes == many[b].changes
+        assert one[a].unmatched == many[b].unmatched
+
+
+def test_missing_and_undecodable_files_are_reported_per_file(tmp_path, ruleset):
+    good = tmp_path / 'walls.js'
+    good.write_text("alert('Please select consecutive floors only.');\n", encoding='utf-8')
+    binary = tmp_path / 'binary.js'
+    binary.write_bytes(b'\xff\xfe\x00alert(')
+    missing = tmp_path / 'missing.js'
+    cache = {}
+    results = rs.rewrite_files([str(missing), str(binary), str(good)], ruleset, jobs=2, cache=cache)
+    assert results[str(missing)].error and results[str(binary)].error
+    assert results[str(good)].error is None and results[str(good)].changes == 1
+    assert "t('cfss.selectConsecutiveFloors')" in good.read_text(encoding='utf-8')
+    assert list(cache) == [rs._cache_key(str(good))]
@@ -0,0 +1,75 @@
+"""precache.manifest.js: the files sw.js lists, their hashes, and --check-precache."""
+
+import os
+import subprocess
+import sys
+
+import _replace_strings as rs
+from _precache import PRECACHE_MANIFEST, precache_hashes, shell_urls
+from conftest import FRONTEND
+
+SW = """importScripts('precache.manifest.js');
+const APP_SHELL_URLS = [
+  'index.html',
+  // 'commented.js',
+  'app.js',
+  ...Object.values(self.translationBundles),
+  './icons/icon.png',
+];
+const OTHER = ['not-listed.js'];
+"""
+
+
+def make_tree(directory):
+    (directory / 'sw.js').write_text(SW, encoding='utf-8')
+    for name in ('index.html', 'app.js', 'not-listed.js', 'translations.en.0123456789.js',
+                 'translations.walls.fr.abcdef0123.js', 'translations.js'):
+        (directory / name).write_text(name, encoding='utf-8')
+
+
+def test_shell_urls_follow_the_list_and_spread_the_bundles(tmp_path):
+    make_tree(tmp_path)
+    assert shell_urls(SW, str(tmp_path)) == ['index.html', 'app.js', './icons/icon.png',
+                                             'translations.en.0123456789.js',
+                                             'translations.walls.fr.abcdef0123.js']
+
+
+def test_missing_files_are_reported_not_hashed(tmp_path, capsys):
+    make_tree(tmp_path)
+    hashes, missing = precache_hashes(str(tmp_path), shell_urls(SW, str(tmp_path)))
+    assert missing == ['./icons/icon.png']
+    assert len(hashes['app.js']) == 10
+    text, count = rs.precache_manifest(str(tmp_path))
+    assert count == 4 and '"app.js": "' in text
+    assert 'precached file ./icons/icon.png does not exist' in capsys.readouterr().out
+
+
+def test_manifest_is_written_only_when_a_hash_changes(tmp_path, capsys):
+    make_tree(tmp_path)
+    manifest = tmp_path / PRECACHE_MANIFEST
+    rs.write_precache_manifest(str(tmp_path))
+    assert f'{PRECACHE_MANIFEST} updated (4 file(s))' in capsys.readouterr().out
+    os.utime(manifest, ns=(0, 0))
+    rs.write_precache_manifest(str(tmp_path))
+    assert os.stat(manifest).st_mtime_ns == 0
+    assert 'updated' not in capsys.readouterr().out
+
+
+def test_stale_manifest_is_reported(tmp_path, capsys):
+    make_tree(tmp_path)
+    rs.write_precache_manifest(str(tmp_path))
+    assert not rs.check_precache_manifest(str(tmp_path))
+    (tmp_path / 'app.js').write_text('changed', encoding='utf-8')
+    assert rs.check_precache_manifest(str(tmp_path))
+    assert PRECACHE_MANIFEST in capsys.readouterr().out
+
+
+def test_no_service_worker_no_manifest(tmp_path):
+    assert rs.precache_manifest(str(tmp_path)) is None
+    assert not rs.check_precache_manifest(str(tmp_path))
+
+
+def test_tree_manifest_and_variants_are_current():
+    result = subprocess.run([sys.executable, '_replace_strings.py', '--check-precache'],
+                            capture_output=True, text=True, cwd=FRONTEND)
+    assert result.returncode == 0, result.stdout
@@ -0,0 +1,124 @@
+"""--prerender: pages filled in by the rules of applyTranslations() in i18n.js,
+the bundle tags written into them, and the variants sw.js precaches."""
+
+import pytest
+
+import _replace_strings as rs
+from _precache import shell_urls
+from _prerender import link_bundles, prerender, variant_of
+
+ENTRIES = {
+    'walls.title': 'Murs',
+    'walls.save': 'Enregistrer',
+    'walls.search': 'Rechercher...',
+    'walls.help': 'Aide <b>murs</b>',
+    'walls.count': ['', 'count', ' murs'],
+    'walls.amp': 'Murs & toits',
+}
+
+
+def body(html):
+    page, _ = prerender(f'<html><body>{html}</body></html>', ENTRIES, 'fr')
+    return page[page.index('<body>') + 6:page.index('</body>')]
+
+
+@pytest.mark.parametrize('html, expected', [
+    # No child elements: el.textContent = translated
+    ('<h1 data-i18n="walls.title">Walls</h1>', '<h1 data-i18n="walls.title">Murs</h1>'),
+    ('<p data-i18n="walls.amp">Walls</p>', '<p data-i18n="walls.amp">Murs &amp; toits</p>'),
+    # Child elements: the .i18n-text descendant's text...
+    ('<button data-i18n="walls.save"><i class="fa"></i> <span class="i18n-text">Save</span></button>',
+     '<button data-i18n="walls.save"><i class="fa"></i> <span class="i18n-text">Enregistrer</span></button>'),
+    # ...else the last non-blank text node, padded as i18n.js pads it...
+    ('<button data-i18n="walls.save"><i class="fa"></i> Save </button>',
+     '<button data-i18n="walls.save"><i class="fa"></i>\n                    Enregistrer\n                </button>'),
+    # ...else ' ' + text appended
+    ('<button data-i18n="walls.save"><i class="fa"></i></button>',
+     '<button data-i18n="walls.save"><i class="fa"></i> Enregistrer</button>'),
+    # A missing key is left, like t() returning the key
+    ('<h1 data-i18n="walls.none">Walls</h1>', '<h1 data-i18n="walls.none">Walls</h1>'),
+    # t() without params keeps the {placeholders}
+    ('<span data-i18n="walls.count">0 walls</span>', '<span data-i18n="walls.count">{count} murs</span>'),
+    ('<input data-i18n-placeholder="walls.search" placeholder="Search...">',
+     '<input data-i18n-placeholder="walls.search" placeholder="Rechercher...">'),
+    ('<a data-i18n-title="walls.title" href="#">?</a>', '<a data-i18n-title="walls.title" href="#" title="Murs">?</a>'),
+    # innerHTML, unescaped
+    ('<div data-i18n-html="walls.help">Help</div>', '<div data-i18n-html="walls.help">Aide <b>murs</b></div>'),
+])
+def test_prerender_follows_apply_translations(html, expected):
+    assert body(html) == expected
+
+
+def test_prerendered_page_is_marked_with_its_language():
+    page, count = prerender('<html lang="en"><body><h1 data-i18n="walls.title">Walls</h1></body></html>',
+                            ENTRIES, 'fr')
+    assert page.startswith('<html lang="fr" data-i18n-prerendered="fr">')
+    assert count == 1
+
+
+PAGE = ('<head>\n    <script src="translations.bundles.js"></script>\n    <script src="i18n.js"></script>\n'
+        '</head>\n')
+
+
+def test_bundle_tags_follow_the_manifest_tag_and_replace_older_ones():
+    linked = link_bundles(PAGE, ['translations.walls.en.0123456789.js', 'translations.walls.fr.abcdef0123.js'])
+    assert linked == ('<head>\n    <script src="translations.bundles.js"></script>\n'
+                      '    <script src="translations.walls.en.0123456789.js"></script>\n'
+                      '    <script src="translations.walls.fr.abcdef0123.js"></script>\n'
+                      '    <script src="i18n.js"></script>\n</head>\n')
+    assert link_bundles(linked, ['translations.fr.9999999999.js']) == link_bundles(
+        PAGE, ['translations.fr.9999999999.js'])
+    assert link_bundles('<head></head>', ['translations.fr.9999999999.js']) == '<head></head>'
+
+
+def test_variant_keeps_the_bundle_tag_of_its_language():
+    linked = link_bundles(PAGE, ['translations.walls.en.0123456789.js', 'translations.walls.fr.abcdef0123.js'])
+    page, _ = prerender(linked, ENTRIES, 'fr')
+    assert 'translations.walls.fr.abcdef0123.js' in page
+    assert 'translations.walls.en.0123456789.js' not in page
+
+
+def test_variant_names():
+    assert variant_of('dashboard.fr.html') == ('dashboard.html', 'fr')
+    assert variant_of('dashboard.html') is None
+
+
+SW = """importScripts('precache.manifest.js');
+const APP_SHELL_URLS = [
+  'index.html',
+  ...Object.values(self.prerenderedPages).flatMap(Object.values),
+  'app.js',
+];
+"""
+
+
+def make_tree(directory):
+    (directory / 'sw.js').write_text(SW, encoding='utf-8')
+    for name in ('index.html', 'index.fr.html', 'index.en.html', 'other.fr.html', 'app.js'):
+        (directory / name).write_text(name, encoding='utf-8')
+
+
+def test_shell_urls_spread_the_variants_of_listed_pages(tmp_path):
+    make_tree(tmp_path)
+    # Spread-in files come after the listed ones
+    assert shell_urls(SW, str(tmp_path)) == ['index.html', 'app.js', 'index.en.html', 'index.fr.html']
+
+
+def test_manifest_maps_pages_to_their_variants(tmp_path):
+    make_tree(tmp_path)
+    text, count = rs.precache_manifest(str(tmp_path))
+    assert count == 4
+    assert '"index.html": {"en": "index.en.html", "fr": "index.fr.html"},' in text
+
+
+def test_stale_variant_is_reported(tmp_path, capsys):
+    translations = tmp_path / 'translations.js'
+    translations.write_text("window.translations = {\n  fr: {\n    walls: {\n      title: 'Murs',\n    },\n  },\n};\n",
+                            encoding='utf-8')
+    page = tmp_path / 'walls.html'
+    page.write_text('<html><body><h1 data-i18n="walls.title">Walls</h1></body></html>', encoding='utf-8')
+    rs.prerender_pages(str(translations), [str(page)], ['fr'])
+    assert not rs.check_prerendered(str(translations), [str(page)])
+    page.write_text('<html><body><h2 data-i18n="walls.title">Walls</h2></body></html>', encoding='utf-8')
+    assert rs.check_prerendered(str(translations), [str(page)])
+    assert 'walls.fr.html: out of date with walls.html (run --prerender fr)' in capsys.readouterr().out
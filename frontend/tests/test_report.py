@@ -0,0 +1,35 @@
+"""rewrite_file(): lines changed and hunks from the edits, --diff, and files
+only written when their content changes."""
+
+import os
+
+import _replace_strings as rs
+
+RULES = [("alert('Saved');", "alert(t('walls.saved'));")]
+TEXT = "function f() {\n    alert('Saved');\n}\n" + "\n" * 8 + "alert('Saved');\n"
+
+
+def test_changes_are_counted_in_lines_and_hunks(tmp_path):
+    path = tmp_path / 'walls.js'
+    path.write_text(TEXT, encoding='utf-8')
+    result = rs.rewrite_file(str(path), rs.RuleSet(RULES))
+    assert (result.changes, result.hunks) == (2, 2)
+    assert path.read_text(encoding='utf-8') == TEXT.replace("alert('Saved')", "alert(t('walls.saved'))")
+
+
+def test_diff_leaves_the_file_alone(tmp_path):
+    path = tmp_path / 'walls.js'
+    path.write_text(TEXT, encoding='utf-8')
+    result = rs.rewrite_file(str(path), rs.RuleSet(RULES), dry_run=True, diff=True)
+    assert path.read_text(encoding='utf-8') == TEXT
+    assert result.diff.startswith('--- a/')
+    assert "-    alert('Saved');\n+    alert(t('walls.saved'));\n" in result.diff
+
+
+def test_unchanged_file_is_not_written(tmp_path):
+    path = tmp_path / 'walls.js'
+    path.write_text(TEXT, encoding='utf-8')
+    os.utime(path, ns=(1_000_000_000, 1_000_000_000))
+    result = rs.rewrite_file(str(path), rs.RuleSet([("alert('Other');", "alert(t('walls.other'));")]))
+    assert result.changes == 0
+    assert os.stat(path).st_mtime_ns == 1_000_000_000
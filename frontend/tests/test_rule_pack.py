@@ -0,0 +1,67 @@
+"""The rule pack: rules compiled from the data file once and reused until it changes."""
+
+import json
+import os
+
+import pytest
+
+import _replace_strings as rs
+
+
+def write_rules(path, rules):
+    path.write_text(json.dumps({'format': 1, 'sections': [{'name': 'alert', 'title': 'Alerts', 'rules': rules}]}),
+                    encoding='utf-8')
+
+
+def test_pack_is_written_then_reused(tmp_path, monkeypatch):
+    rules, pack = tmp_path / 'rules.json', tmp_path / 'rules.pack'
+    write_rules(rules, [["alert('Saved');", "alert(t('walls.saved'));"]])
+    assert rs.load_ruleset(str(rules), str(pack)).rules == [("alert('Saved');", "alert(t('walls.saved'));")]
+    assert pack.exists()
+
+    def compile_again(*args):
+        raise AssertionError('the pack was not reused')
+    monkeypatch.setattr(rs, 'compile_rule_file', compile_again)
+    assert rs.load_ruleset(str(rules), str(pack)).rules == [("alert('Saved');", "alert(t('walls.saved'));")]
+
+
+def test_changed_rules_rebuild_the_pack(tmp_path):
+    rules, pack = tmp_path / 'rules.json', tmp_path / 'rules.pack'
+    write_rules(rules, [["alert('Saved');", "alert(t('walls.saved'));"]])
+    rs.load_ruleset(str(rules), str(pack))
+    write_rules(rules, [["alert('Done');", "alert(t('walls.done'));"]])
+    assert rs.load_ruleset(str(rules), str(pack)).rules == [("alert('Done');", "alert(t('walls.done'));")]
+    assert rs.read_rule_pack(str(pack), rules.read_bytes())['rules'] == [("alert('Done');", "alert(t('walls.done'));")]
+
+
+def test_unreadable_pack_is_ignored(tmp_path):
+    rules, pack = tmp_path / 'rules.json', tmp_path / 'rules.pack'
+    write_rules(rules, [["a", "b"]])
+    pack.write_bytes(b'not a pickle')
+    assert rs.read_rule_pack(str(pack), rules.read_bytes()) is None
+    assert rs.load_ruleset(str(rules), str(pack)).rules == [('a', 'b')]
+
+
+def test_duplicates_are_dropped_and_conflicts_refused(tmp_path):
+    rules = tmp_path / 'rules.json'
+    write_rules(rules, [["a", "b"], "# a comment", ["c", "d"], ["a", "b"]])
+    pack, kept, duplicates = rs.compile_rule_file(str(rules))
+    assert pack['rules'] == [('a', 'b'), ('c', 'd')]
+    assert [(entry.position, earlier.position) for entry, earlier in duplicates] == [(3, 1)]
+    write_rules(rules, [["a", "b"], ["a", "x"]])
+    with pytest.raises(ValueError, match='another replacement'):
+        rs.compile_rule_file(str(rules))
+
+
+def test_compile_rules_flags_rules_that_never_fire(tmp_path, capsys):
+    rules, pack = tmp_path / 'rules.json', tmp_path / 'rules.pack'
+    write_rules(rules, [["Save", "Store"], ["'Save'", "t('save')"]])
+    assert rs.run_compile_rules(str(rules), str(pack))
+    assert os.path.exists(pack)
+    assert 'unreachable: alert #2 never fires' in capsys.readouterr().out
+    write_rules(rules, [["'Save'", "t('save')"], ["Save", "Store"]])
+    assert not rs.run_compile_rules(str(rules), str(pack))
+
+
+def test_tree_rules_compile_cleanly(tmp_path):
+    assert not rs.run_compile_rules(rs.DEFAULT_RULES, str(tmp_path / 'rules.pack'))
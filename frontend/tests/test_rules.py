@@ -0,0 +1,51 @@
+"""The rule engine against the str.replace() chain it stands for."""
+
+import random
+
+import pytest
+
+import _replace_strings as rs
+
+
+def random_rules(rng, alphabet='abc'):
+    """Rules with short and long patterns sharing prefixes, and replacements
+    that may produce later patterns."""
+    rules = []
+    for _ in range(rng.randint(1, 12)):
+        old = ''.join(rng.choice(alphabet) for _ in range(rng.randint(1, 9)))
+        new = ''.join(rng.choice(alphabet + 'XY') for _ in range(rng.randint(0, 5)))
+        rules.append((old, new))
+    return rules
+
+
+def replace_chain(text, rules):
+    for old, new in rules:
+        text = text.replace(old, new)
+    return text
+
+
+@pytest.mark.parametrize('seed', range(400))
+def test_apply_matches_the_replace_chain(seed):
+    rng = random.Random(seed)
+    rules = random_rules(rng)
+    text = ''.join(rng.choice('abc \n') for _ in range(rng.randint(0, 200)))
+    assert rs.RuleSet(rules).apply(text) == replace_chain(text, rules)
+
+
+@pytest.mark.parametrize('seed', range(200))
+def test_scanner_finds_every_occurrence(seed):
+    rng = random.Random(seed)
+    patterns = list(dict.fromkeys(old for old, _ in random_rules(rng)))
+    text = ''.join(rng.choice('abc') for _ in range(rng.randint(0, 120)))
+    expected = {(start + len(pattern), index)
+                for index, pattern in enumerate(patterns)
+                for start in range(len(text)) if text.startswith(pattern, start)}
+    found = list(rs.Scanner(patterns).iter_matches(text))
+    assert len(found) == len(expected)
+    assert set(found) == expected
+
+
+def test_tree_rules_match_the_replace_chain(ruleset):
+    text = '\n'.join(old for old, _ in ruleset.rules[::3]) + '\n' + ruleset.rules[0][0] * 2
+    literal = rs.RuleSet(ruleset.rules)
+    assert literal.apply(text) == replace_chain(text, ruleset.rules)
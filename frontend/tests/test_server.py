@@ -0,0 +1,150 @@
+"""The rewrite server: its requests, answered in memory, and the socket protocol."""
+
+import json
+import os
+import socket
+import stat
+import subprocess
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+import _rewrite_server as server
+from conftest import FRONTEND
+
+TRANSLATIONS = """window.translations = {
+  en: {
+    walls: {
+      saved: 'Saved',
+      title: 'Walls',
+    },
+  },
+  fr: {
+    walls: {
+      saved: 'Enregistré',
+    },
+  },
+};
+"""
+
+RULES = {'format': 1, 'sections': [{'name': 'alert', 'title': 'Alerts', 'rules': [
+    ["alert('Saved');", "alert(t('walls.saved'));"],
+]}]}
+
+TEXT = "const a = 1;\nalert('Saved');\nalert(\"Saved\");\n"
+
+
+def make_tree(tree):
+    (tree / 'translations.js').write_text(TRANSLATIONS, encoding='utf-8')
+    (tree / 'rules.json').write_text(json.dumps(RULES), encoding='utf-8')
+    return [str(tree / 'rules.json'), str(tree / 'rules.pack'), str(tree / 'translations.js'),
+            str(tree / 'index')]
+
+
+@pytest.fixture
+def service(tmp_path):
+    return server.Service(*make_tree(tmp_path))
+
+
+def test_rewrite_returns_the_text_and_its_edits(service):
+    response = service.handle(json.dumps({'op': 'rewrite', 'text': TEXT, 'path': 'walls.js'}))
+    assert response['ok']
+    assert response['text'] == "const a = 1;\nalert(t('walls.saved'));\nalert(\"Saved\");\n"
+    start = TEXT.index('alert')
+    assert response['edits'] == [{'start': start, 'end': start + 15, 'line': 2,
+                                  'text': "alert(t('walls.saved'));"}]
+    assert response['ms'] >= 0
+
+
+def test_rewrite_with_lex_covers_other_quoting(service):
+    response = service.handle(json.dumps({'op': 'rewrite', 'text': TEXT, 'lex': True}))
+    assert response['text'] == "const a = 1;\nalert(t('walls.saved'));\nalert(t('walls.saved'));\n"
+    assert [edit['line'] for edit in response['edits']] == [2, 3]
+
+
+def test_rewrite_follows_the_rule_file(service, tmp_path):
+    rules = dict(RULES, sections=[dict(RULES['sections'][0], rules=[["const a", "let a"]])])
+    (tmp_path / 'rules.json').write_text(json.dumps(rules), encoding='utf-8')
+    response = service.handle(json.dumps({'op': 'rewrite', 'text': TEXT}))
+    assert response['text'] == TEXT.replace('const a', 'let a')
+
+
+def test_validate_keys_and_text(service):
+    response = service.handle(json.dumps({'op': 'validate', 'keys': ['walls.saved', 'walls.title', 'walls.none']}))
+    assert [(entry['key'], entry['lang']) for entry in response['diagnostics']] == [
+        ('walls.title', 'fr'), ('walls.none', 'en'), ('walls.none', 'fr')]
+    response = service.handle(json.dumps({'op': 'validate', 'text': "a();\nt('walls.title');\n"}))
+    assert response['diagnostics'] == [{'key': 'walls.title', 'lang': 'fr', 'line': 2,
+                                        'message': 'walls.title has no fr entry'}]
+
+
+@pytest.mark.parametrize('line, error', [
+    ('{', 'Expecting property name'),
+    ('[]', 'a request must be a JSON object'),
+    ('{"op": "drop"}', "unknown op 'drop'"),
+    ('{"op": "rewrite", "text": 1}', '"text" must be a string'),
+    ('{"op": "rewrite", "text": "", "path": 1}', '"path" must be a string'),
+    ('{"op": "validate", "keys": [1]}', '"keys" must be a list of strings'),
+])
+def test_bad_requests_get_an_error(service, line, error):
+    response = service.handle(line)
+    assert not response['ok']
+    assert error in response['error']
+
+
+def test_ping_names_the_rules(service):
+    response = service.handle('{"op": "ping"}')
+    assert response['ok'] and response['rules'] == service.ruleset.fingerprint
+
+
+@pytest.fixture
+def running(tmp_path):
+    rules, pack, translations, index = make_tree(tmp_path)
+    path = str(tmp_path / 's.sock')
+    process = subprocess.Popen([sys.executable, os.path.join(FRONTEND, '_rewrite_server.py'), '--socket', path,
+                                '--rules', rules, '--rule-pack', pack, '--translations', translations,
+                                '--index', index], stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True)
+    deadline = time.monotonic() + 30
+    while not os.path.exists(path):
+        assert process.poll() is None, process.stdout.read()
+        assert time.monotonic() < deadline, 'the server did not start'
+        time.sleep(0.05)
+    yield path
+    process.terminate()
+    assert process.wait(10) == 0
+    assert not os.path.exists(path)
+
+
+def test_socket_is_its_owners_only(running):
+    assert stat.S_IMODE(os.stat(running).st_mode) & 0o077 == 0
+
+
+def test_send_over_the_socket(running):
+    assert server.send(running, {'op': 'ping'})['ok']
+    response = server.send(running, {'op': 'rewrite', 'text': TEXT})
+    assert response['text'] == "const a = 1;\nalert(t('walls.saved'));\nalert(\"Saved\");\n"
+
+
+def test_one_connection_sends_many_requests(running):
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+        client.connect(running)
+        client.sendall(b'{"op": "ping"}\n\n{"op": "nope"}\n{"op": "validate", "keys": ["walls.saved"]}\n')
+        client.shutdown(socket.SHUT_WR)
+        with client.makefile('rb') as stream:
+            responses = [json.loads(line) for line in stream]
+    assert [response['ok'] for response in responses] == [True, False, True]
+
+
+def test_concurrent_clients(running):
+    texts = [TEXT * count for count in range(1, 41)]
+    with ThreadPoolExecutor(8) as pool:
+        responses = list(pool.map(lambda text: server.send(running, {'op': 'rewrite', 'text': text}), texts))
+    for text, response in zip(texts, responses):
+        assert response['text'] == text.replace("alert('Saved');", "alert(t('walls.saved'));")
+
+
+def test_a_second_server_is_refused(running):
+    with pytest.raises(RuntimeError, match='already listening'):
+        server._claim_socket(running)
@@ -0,0 +1,77 @@
+"""--stats: the counters RunStats collects and the record --stats-json writes."""
+
+import _replace_strings as rs
+
+TEXT = ("alert('Saved');\nalert('Saved');\nalert('Error saving wall: ' + error.message);\n"
+        "label = 'Save';\n")
+RULES = [("alert('Saved');", "alert(t('walls.saved'));"),
+         ("'Save'", "t('walls.save')"),
+         ("Saved", "Stored"),
+         ("'Missing'", "t('walls.missing')"),
+         ("same", "same")]
+
+
+def apply(text, ruleset):
+    stats = rs.RunStats()
+    return ruleset.apply(text, stats), stats
+
+
+def test_rule_counters():
+    _, stats = apply(TEXT, rs.RuleSet(RULES))
+    assert stats.rules == {
+        0: {'candidates': 2, 'hits': 2, 'site_hits': 0},
+        1: {'candidates': 1, 'hits': 1, 'site_hits': 0},
+        # Both inside the matches of rule #0
+        2: {'candidates': 2, 'hits': 0, 'site_hits': 0},
+        3: {'candidates': 0, 'hits': 0, 'site_hits': 0},
+        4: {'candidates': 0, 'hits': 0, 'site_hits': 0},
+    }
+
+
+def test_time_is_kept_per_stage():
+    ruleset = rs.RuleSet(RULES, rs.rule_templates)
+    _, stats = apply(TEXT, ruleset)
+    assert list(stats.stages) == ['rules #0-#4', 'templates']
+    # The templates scan what the rules left
+    assert stats.stages['rules #0-#4']['bytes'] == len(TEXT.encode('utf-8'))
+    assert stats.stages['templates']['bytes'] == len(rs.RuleSet(RULES).apply(TEXT).encode('utf-8'))
+    assert all(counters['seconds'] >= 0 for counters in stats.stages.values())
+    assert set(stats.phases) == {'rules', 'templates'}
+    assert stats.templates[0] == {'hits': 1, 'site_hits': 0}
+
+
+def test_merge_sums_the_counters():
+    ruleset = rs.RuleSet(RULES, rs.rule_templates)
+    _, first = apply(TEXT, ruleset)
+    _, second = apply(TEXT * 2, ruleset)
+    first.files, second.files = 1, 1
+    total = rs.RunStats()
+    total.merge(first)
+    total.merge(second)
+    assert total.files == 2
+    assert total.rules[0] == {'candidates': 6, 'hits': 6, 'site_hits': 0}
+    assert total.templates[0]['hits'] == 3
+    assert total.stages['rules #0-#4']['bytes'] == 3 * len(TEXT.encode('utf-8'))
+
+
+def test_record_gives_each_rule_a_status():
+    ruleset = rs.RuleSet(RULES, rs.rule_templates)
+    _, stats = apply(TEXT, ruleset)
+    stats.files, stats.bytes = 1, len(TEXT)
+    record = rs.stats_record(stats, ruleset, 0.5, 0)
+    assert [rule['status'] for rule in record['rules']] == ['live', 'live', 'shadowed', 'dead', 'no-op']
+    assert [template['status'] for template in record['templates']][0] == 'live'
+    assert record['stages'][0]['name'] == 'rules #0-#4'
+    assert record['mb_per_second'] == len(TEXT) / 0.5 / 1e6
+
+
+def test_print_stats(capsys):
+    ruleset = rs.RuleSet(RULES)
+    _, stats = apply(TEXT, ruleset)
+    rs.print_stats(rs.stats_record(stats, ruleset, 0.0, 3))
+    out = capsys.readouterr().out
+    assert '3 file(s) skipped by the cache' in out
+    assert 'stage rules #0-#4:' in out
+    assert "#0 alert('Saved');" in out
+    assert "1 dead rule(s) (pattern found in no scanned file):\n  #3 'Missing'\n" in out
+    assert '1 shadowed rule(s)' in out and '1 no-op rule(s)' in out
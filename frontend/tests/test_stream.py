@@ -0,0 +1,75 @@
+"""--stream: pieces cut from a large input rewrite like the whole of it."""
+
+import io
+import os
+import shutil
+
+import pytest
+
+import _replace_strings as rs
+from conftest import FRONTEND, read, tree_scripts
+
+SCRIPTS = tree_scripts()
+
+
+def names(paths):
+    return [os.path.basename(path) for path in paths]
+
+
+def stream_pieces(text, ruleset, chunk_size):
+    reach, spanning = rs.stream_limits(ruleset)
+    scanners = [stage.scanner for stage in ruleset.stages if stage is not ruleset.template_stage]
+    return list(rs.stream_segments(io.StringIO(text), chunk_size, reach, spanning, scanners))
+
+
+@pytest.mark.parametrize('one_line', [False, True], ids=['lines', 'one-line'])
+@pytest.mark.parametrize('path', SCRIPTS, ids=names(SCRIPTS))
+def test_stream_pieces_rewrite_like_the_whole(path, one_line, ruleset):
+    """Pieces cut at line starts, or after a ';' in a minified line, rewrite
+    to the same text as the whole file."""
+    text = read(path)
+    if one_line:
+        text = text.replace('\n', ' ')
+    expected = ruleset.apply(text, path=path)
+    for chunk_size in (300, 4096):
+        pieces = stream_pieces(text, ruleset, chunk_size)
+        assert ''.join(pieces) == text
+        assert ''.join(ruleset.apply(piece, path=path) for piece in pieces) == expected
+
+
+def test_stream_cuts_a_long_line(ruleset):
+    text = read(os.path.join(FRONTEND, 'cfss-project-details.js')).replace('\n', ' ')
+    pieces = stream_pieces(text, ruleset, 4096)
+    assert len(pieces) > 10
+    assert max(len(piece) for piece in pieces) < 4 * 4096
+
+
+def test_no_cut_splits_a_pattern():
+    ruleset = rs.RuleSet([('ab\ncd', 'X')])
+    text = 'ab\ncd\n' * 50
+    pieces = stream_pieces(text, ruleset, 8)
+    assert len(pieces) > 1
+    assert ''.join(ruleset.apply(piece) for piece in pieces) == 'X\n' * 50
+
+
+def test_stream_file_matches_rewrite_file(tmp_path, ruleset):
+    source = os.path.join(FRONTEND, 'cfss-project-details.js')
+    whole = tmp_path / 'whole.js'
+    streamed = tmp_path / 'streamed.js'
+    shutil.copy(source, whole)
+    shutil.copy(source, streamed)
+    expected = rs.rewrite_file(str(whole), ruleset)
+    result = rs.stream_file(str(streamed), ruleset, chunk_size=4096)
+    assert streamed.read_bytes() == whole.read_bytes()
+    assert result.error is None
+    assert result.changes == expected.changes
+    assert not (tmp_path / 'streamed.js.tmp').exists()
+
+
+def test_stream_file_skips_a_cached_file(tmp_path, ruleset):
+    path = tmp_path / 'walls.js'
+    shutil.copy(os.path.join(FRONTEND, 'cfss-project-details.js'), path)
+    before = path.read_bytes()
+    digest = rs.stream_file(str(path), ruleset, chunk_size=4096).digest
+    assert path.read_bytes() != before
+    assert rs.stream_file(str(path), ruleset, cached_digest=digest).skipped
@@ -0,0 +1,29 @@
+"""Rule templates only expand into keys translations.js defines."""
+
+import _replace_strings as rs
+
+ALERT = "alert('Error saving walls: ' + err.message)"
+
+
+def test_template_expands_into_a_defined_key():
+    ruleset = rs.RuleSet([], rs.rule_templates, keys=frozenset({'cfss.errorSavingWalls'}))
+    assert ruleset.apply(ALERT, path='cfss-walls.js') == "alert(t('cfss.errorSavingWalls') + ': ' + err.message)"
+
+
+def test_template_key_takes_the_file_namespace():
+    keys = frozenset({'cfss.errorSavingWalls', 'dashboard.errorSavingWalls'})
+    ruleset = rs.RuleSet([], rs.rule_templates, keys=keys)
+    assert 'dashboard.errorSavingWalls' in ruleset.apply(ALERT, path='dashboard.js')
+
+
+def test_undefined_key_is_left_and_reported():
+    ruleset = rs.RuleSet([], rs.rule_templates, keys=frozenset({'cfss.somethingElse'}))
+    unmatched = []
+    assert ruleset.apply('x;\n' + ALERT, path='cfss-walls.js', unmatched=unmatched) == 'x;\n' + ALERT
+    assert unmatched == [(2, 'error-alert', f'cfss.errorSavingWalls (not in translations.js): {ALERT}')]
+
+
+def test_console_arguments_are_left_alone():
+    ruleset = rs.RuleSet([], rs.rule_templates, keys=frozenset({'cfss.errorSavingWalls'}))
+    text = f"console.error('failed', {ALERT});"
+    assert ruleset.apply(text, path='cfss-walls.js') == text
@@ -0,0 +1,57 @@
+"""--validate: used and emitted keys against translations.js."""
+
+import _replace_strings as rs
+
+TRANSLATIONS = """window.translations = {
+  en: {
+    walls: {
+      saved: 'Wall saved',
+      title: 'Walls',
+      unused: 'Never shown',
+      status: {
+        open: 'Open',
+      },
+    },
+  },
+  fr: {
+    walls: {
+      saved: 'Mur enregistré',
+      unused: 'Jamais affiché',
+      status: {
+        open: 'Ouvert',
+      },
+    },
+  },
+};
+"""
+
+
+def make_tree(tree):
+    (tree / 'translations.js').write_text(TRANSLATIONS, encoding='utf-8')
+    (tree / 'walls.js').write_text("alert(t('walls.saved'));\nlabel.textContent = t('walls.missing');\n"
+                                   "badge.textContent = t(`walls.status.${state}`);\n", encoding='utf-8')
+    (tree / 'walls.html').write_text('<h1 data-i18n="walls.title">Walls</h1>\n', encoding='utf-8')
+    return str(tree / 'translations.js')
+
+
+def test_missing_untranslated_and_unused_keys_are_reported(tmp_path, capsys, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    translations = make_tree(tmp_path)
+    ruleset = rs.RuleSet([("alert('Gone');", "alert(t('walls.gone'));")])
+    assert rs.run_validation(translations, ruleset, str(tmp_path / 'index'))
+    out = capsys.readouterr().out
+    assert 'missing en: walls.missing - walls.js:2' in out
+    assert 'missing fr: walls.gone - emitted by a rule' in out
+    assert 'missing fr: walls.title - walls.html:1' in out
+    assert 'unused key walls.unused' in out
+    # Looked up under a computed name
+    assert 'walls.status.open' not in out
+    assert out.splitlines()[-1] == '5 missing, 0 untranslated, 1 unused, 0 duplicate key(s)'
+
+
+def test_complete_tree_passes(tmp_path, capsys):
+    translations = make_tree(tmp_path)
+    (tmp_path / 'walls.js').write_text("alert(t('walls.saved'));\nt('walls.unused');\n", encoding='utf-8')
+    (tmp_path / 'walls.html').write_text('<p data-i18n="walls.status.open"></p>\n', encoding='utf-8')
+    assert not rs.run_validation(translations, rs.RuleSet([]), str(tmp_path / 'index'))
+    assert 'walls.title has no fr entry' in capsys.readouterr().out
@@ -0,0 +1,58 @@
+"""--watch: rewriting the lines around an edit agrees with a whole-file rewrite."""
+
+import os
+import random
+
+import pytest
+
+import _replace_strings as rs
+from conftest import full_rewrite, read, tree_scripts
+
+SCRIPTS = tree_scripts()
+
+
+def names(paths):
+    return [os.path.basename(path) for path in paths]
+
+
+@pytest.mark.parametrize('path', SCRIPTS, ids=names(SCRIPTS))
+def test_rewrite_window_matches_a_full_rewrite(path, lex_ruleset):
+    """Pasting original lines back into a rewritten file and rewriting just
+    that window gives what rewriting the whole file gives."""
+    text = read(path)
+    base = full_rewrite(text, lex_ruleset, path)
+    if full_rewrite(base, lex_ruleset, path) != base:
+        pytest.skip('a rewritten file the rules still change')
+    rng = random.Random(path)
+    old_lines = text.splitlines(keepends=True)
+    new_lines = base.splitlines(keepends=True)
+    for _ in range(5):
+        first = rng.randrange(len(old_lines))
+        pasted = ''.join(old_lines[first:first + rng.randint(1, 8)])
+        at = rng.randrange(len(new_lines) + 1)
+        start = len(''.join(new_lines[:at]))
+        edited = base[:start] + pasted + base[start:]
+        content, _, _ = rs.rewrite_window(edited, start, start + len(pasted), lex_ruleset, path)
+        assert content == full_rewrite(edited, lex_ruleset, path)
+
+
+def test_update_rewrites_the_saved_edit(tmp_path, capsys):
+    ruleset = rs.RuleSet([("alert('Saved');", "alert(t('walls.saved'));")])
+    path = tmp_path / 'walls.js'
+    old = 'const a = 1;\n' * 20
+    new = old + "alert('Saved');\n"
+    path.write_text(new, encoding='utf-8')
+    content = rs._watch_update(str(path), old, new, ruleset)
+    assert content == old + "alert(t('walls.saved'));\n"
+    assert path.read_text(encoding='utf-8') == content
+    assert 'walls.js:21: 1 line(s) rewritten' in capsys.readouterr().out
+
+
+def test_update_leaves_a_file_the_rules_do_not_change(tmp_path, capsys):
+    ruleset = rs.RuleSet([("alert('Saved');", "alert(t('walls.saved'));")])
+    path = tmp_path / 'walls.js'
+    path.write_text('const b = 2;\n', encoding='utf-8')
+    mtime = os.stat(path).st_mtime_ns
+    assert rs._watch_update(str(path), 'const a = 1;\n', 'const b = 2;\n', ruleset) == 'const b = 2;\n'
+    assert os.stat(path).st_mtime_ns == mtime
+    assert capsys.readouterr().out == ''
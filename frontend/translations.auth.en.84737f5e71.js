@@ -0,0 +1,2 @@
+// Generated by _replace_strings.py --build-translations. Do not edit.
+(self.translationsFlat || (self.translationsFlat = {}))["en"] = JSON.parse('{"common.loadingAuth":"Loading authentication...","common.admin":"ADMIN","common.limited":"LIMITED","auth.login":"Login","auth.signUp":"Sign Up","auth.resetPassword":"Reset Password","auth.createAccount":"Create Account","auth.email":"Email:","auth.password":"Password:","auth.confirmPassword":"Confirm Password:","auth.firstName":"First Name:","auth.lastName":"Last Name:","auth.company":"Company:","auth.phoneNumber":"Phone Number:","auth.domain":"Domain:","auth.selectDomain":"Select domain","auth.forgotPassword":"Forgot Password?","auth.backToLogin":"Back to Login","auth.sendResetCode":"Send Reset Code","auth.resendCode":"Resend Code","auth.verifyYourEmail":"Verify Your Email","auth.enterNewPassword":"Enter New Password","auth.verificationCode":"Verification Code:","auth.newPassword":"New Password:","auth.confirmNewPassword":"Confirm New Password:","auth.verify":"Verify","auth.enterEmail":"Enter your email","auth.enterCode":"Enter 6-digit code","auth.verificationCodePlaceholder":"Verification code","auth.resetPasswordDesc":"Enter your email address and we\'ll send you a verification code to reset your password.","auth.enterNewPasswordDesc":"Enter the verification code sent to your email and choose a new password.","auth.enterVerificationCode":"Enter the verification code sent to your email:","auth.emailVerified":"Email verified! Waiting for admins to authorize your account. You will receive an email once approved.","domains.plumbing":"Plumbing","domains.electricity":"Electricity","domains.interiorSystem":"Interior System","domains.sprinklers":"Sprinklers","domains.ventilation":"Ventilation"}');
@@ -0,0 +1,2 @@
+// Generated by _replace_strings.py --build-translations. Do not edit.
+(self.translationsFlat || (self.translationsFlat = {}))["fr"] = JSON.parse('{"common.loadingAuth":"Chargement de l\'authentification...","common.admin":"ADMIN","common.limited":"LIMITÉ","auth.login":"Connexion","auth.signUp":"Inscription","auth.resetPassword":"Réinitialiser le mot de passe","auth.createAccount":"Créer un compte","auth.email":"Courriel :","auth.password":"Mot de passe :","auth.confirmPassword":"Confirmer le mot de passe :","auth.firstName":"Prénom :","auth.lastName":"Nom :","auth.company":"Entreprise :","auth.phoneNumber":"Numéro de téléphone :","auth.domain":"Domaine :","auth.selectDomain":"Sélectionner un domaine","auth.forgotPassword":"Mot de passe oublié ?","auth.backToLogin":"Retour à la connexion","auth.sendResetCode":"Envoyer le code","auth.resendCode":"Renvoyer le code","auth.verifyYourEmail":"Vérifiez votre courriel","auth.enterNewPassword":"Nouveau mot de passe","auth.verificationCode":"Code de vérification :","auth.newPassword":"Nouveau mot de passe :","auth.confirmNewPassword":"Confirmer le nouveau mot de passe :","auth.verify":"Vérifier","auth.enterEmail":"Entrez votre courriel","auth.enterCode":"Entrez le code à 6 chiffres","auth.verificationCodePlaceholder":"Code de vérification","auth.resetPasswordDesc":"Entrez votre adresse courriel et nous vous enverrons un code de vérification pour réinitialiser votre mot de passe.","auth.enterNewPasswordDesc":"Entrez le code de vérification envoyé à votre courriel et choisissez un nouveau mot de passe.","auth.enterVerificationCode":"Entrez le code de vérification envoyé à votre courriel :","auth.emailVerified":"Courriel vérifié ! En attente de l\'autorisation des administrateurs. Vous recevrez un courriel une fois approuvé.","domains.plumbing":"Plomberie","domains.electricity":"Électricité","domains.interiorSystem":"Système intérieur","domains.sprinklers":"Gicleurs","domains.ventilation":"Ventilation"}');
@@ -0,0 +1,24 @@
+// Generated by _replace_strings.py --build-translations. Do not edit.
+// i18n.js loads the bundle of the active language (the page subset when there
+// is one); sw.js precaches all of them.
+self.translationBundles = {
+  "en": "translations.en.ab97a94689.js",
+  "fr": "translations.fr.cc4fa10633.js",
+};
+self.translationPageBundles = {
+  "auth.html": {"en": "translations.auth.en.84737f5e71.js", "fr": "translations.auth.fr.2447f2e8dc.js"},
+  "cfss-create-project.html": {"en": "translations.cfss-create-project.en.6967ad5f5d.js", "fr": "translations.cfss-create-project.fr.d3b5de37db.js"},
+  "cfss-dashboard.html": {"en": "translations.cfss-dashboard.en.7414442f70.js", "fr": "translations.cfss-dashboard.fr.76d91851c2.js"},
+  "cfss-project-details.html": {"en": "translations.cfss-project-details.en.cd85662f2e.js", "fr": "translations.cfss-project-details.fr.337435c83d.js"},
+  "cfss-verify-bulk-projects.html": {"en": "translations.cfss-verify-bulk-projects.en.24cc7969fd.js", "fr": "translations.cfss-verify-bulk-projects.fr.5b893b6910.js"},
+  "create-project-overview.html": {"en": "translations.create-project-overview.en.78bac5064c.js", "fr": "translations.create-project-overview.fr.2ded5a940e.js"},
+  "create-project.html": {"en": "translations.create-project.en.0b0861ecaf.js", "fr": "translations.create-project.fr.121f5437fc.js"},
+  "dashboard.html": {"en": "translations.dashboard.en.241cb0c820.js", "fr": "translations.dashboard.fr.51b16c45c8.js"},
+  "email-classifications.html": {"en": "translations.email-classifications.en.0c2301a50c.js", "fr": "translations.email-classifications.fr.31081949a5.js"},
+  "index.html": {"en": "translations.index.en.885e549a60.js", "fr": "translations.index.fr.696dee8cc9.js"},
+  "limited-cfss-create-project.html": {"en": "translations.limited-cfss-create-project.en.e62465e38f.js", "fr": "translations.limited-cfss-create-project.fr.d583ad838b.js"},
+  "limited-cfss-dashboard.html": {"en": "translations.limited-cfss-dashboard.en.56d4f23b72.js", "fr": "translations.limited-cfss-dashboard.fr.9bfc74b380.js"},
+  "limited-cfss-project-details.html": {"en": "translations.limited-cfss-project-details.en.8b35e64c30.js", "fr": "translations.limited-cfss-project-details.fr.57a13eb8f6.js"},
+  "project-details.html": {"en": "translations.project-details.en.12a2eca738.js", "fr": "translations.project-details.fr.6909e7ec69.js"},
+  "user-management.html": {"en": "translations.user-management.en.d14cf63738.js", "fr": "translations.user-management.fr.16578b8f79.js"},
+};
@@ -0,0 +1,2 @@
+// Generated by _replace_strings.py --build-translations. Do not edit.
+(self.translationsFlat || (self.translationsFlat = {}))["en"] = JSON.parse('{"common.dashboard":"Dashboard","common.admin":"ADMIN","common.limited":"LIMITED","auth.separateEmails":"Separate multiple emails with commas","auth.pleaseLoginCFSS":"Please login to create CFSS projects","auth.sessionExpired":"Session expired. Please login again.","auth.authError":"Authentication error. Please login again.","types.condo":"Condo","types.commercial":"Commercial","types.residential":"Residential","types.industrial":"Industrial","types.hospital":"Hospital","types.fireStation":"Fire-station","types.government":"Government","types.school":"School","types.other":"Other","createProject.createNewCFSSProject":"Create New CFSS Project","createProject.projectName":"Project Name:","createProject.projectNumber":"Project Number:","createProject.clientName":"Client Name:","createProject.clientEmails":"Client Email(s):","createProject.description":"Description:","createProject.type":"Type:","createProject.addressLine1":"Address Line 1:","createProject.addressLine2":"Address Line 2:","createProject.city":"City:","createProject.province":"Province:","createProject.country":"Country:","createProject.createCFSSProject":"Create CFSS Project","createProject.creatingCFSSProject":"Creating CFSS Project...","createProject.cfssProjectCreated":"CFSS Project created successfully!","createProject.errorCreatingCFSS":"Error creating CFSS project: ","createProject.emailPlaceholder":"email@example.com, email2@example.com"}');
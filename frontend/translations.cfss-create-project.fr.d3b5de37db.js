@@ -0,0 +1,2 @@
+// Generated by _replace_strings.py --build-translations. Do not edit.
+(self.translationsFlat || (self.translationsFlat = {}))["fr"] = JSON.parse('{"common.dashboard":"Tableau de bord","common.admin":"ADMIN","common.limited":"LIMITÉ","auth.separateEmails":"Séparer les courriels multiples par des virgules","auth.pleaseLoginCFSS":"Veuillez vous connecter pour créer des projets CFSS","auth.sessionExpired":"Session expirée. Veuillez vous reconnecter.","auth.authError":"Erreur d\'authentification. Veuillez vous reconnecter.","types.condo":"Condo","types.commercial":"Commercial","types.residential":"Résidentiel","types.industrial":"Industriel","types.hospital":"Hôpital","types.fireStation":"Caserne de pompiers","types.government":"Gouvernement","types.school":"École","types.other":"Autre","createProject.createNewCFSSProject":"Créer un nouveau projet CFSS","createProject.projectName":"Nom du projet :","createProject.projectNumber":"Numéro de projet :","createProject.clientName":"Nom du client :","createProject.clientEmails":"Courriel(s) du client :","createProject.description":"Description :","createProject.type":"Type :","createProject.addressLine1":"Adresse ligne 1 :","createProject.addressLine2":"Adresse ligne 2 :","createProject.city":"Ville :","createProject.province":"Province :","createProject.country":"Pays :","createProject.createCFSSProject":"Créer le projet CFSS","createProject.creatingCFSSProject":"Création du projet CFSS...","createProject.cfssProjectCreated":"Projet CFSS créé avec succès !","createProject.errorCreatingCFSS":"Erreur lors de la création du projet CFSS : ","createProject.emailPlaceholder":"courriel@exemple.com, courriel2@exemple.com"}');
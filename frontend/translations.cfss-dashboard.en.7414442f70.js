@@ -0,0 +1,2 @@
+// Generated by _replace_strings.py --build-translations. Do not edit.
+(self.translationsFlat || (self.translationsFlat = {}))["en"] = JSON.parse('{"common.loading":"Loading...","common.delete":"Delete","common.view":"View","common.copy":"Copy","common.assign":"Assign","common.selectAll":"Select All","common.admin":"ADMIN","common.limited":"LIMITED","admin.adminPanel":"Admin Panel","admin.seismicCalculation":"Seismic Calculation","admin.manageUsers":"Manage Users","admin.viewAllProjects":"View All Projects","admin.verifyBulkProjects":"Verify Bulk Projects","admin.emailClassifications":"Email Classifications","admin.newProjectSheets":"New Project (Sheets)","admin.adminRequired":"Admin access required","admin.accessRestricted":"Access restricted","admin.showingAllCFSS":"Showing all CFSS projects in the system","dashboard.cfssProjects":"CFSS Projects","dashboard.searchProjects":"Search projects...","dashboard.allStatus":"All Status","dashboard.noCFSSProjectsFound":"No CFSS projects found. Create your first CFSS project to get started!","dashboard.newCFSSProject":"New CFSS Project","dashboard.totalCFSS":"Total CFSS","dashboard.planning":"Planning","dashboard.active":"Active","dashboard.done":"Done","status.planning":"Planning","status.inProgress":"In Progress","status.completed":"Completed","project.cfssProjectDuplicated":"CFSS Project duplicated successfully!","project.deleteCFSSConfirm":"Are you sure you want to delete this CFSS project?","project.errorDeleting":"Error deleting project. Please try again.","project.errorDuplicating":"Error duplicating project: ","bulk.deleteCFSSCount":["Delete ","count"," selected CFSS project(s)? This cannot be undone."],"bulk.deletedCount":["Deleted ","success"," project(s). ","fail"," failed."],"reassign.title":"Assign Project","reassign.currentOwner":"Current Owner","reassign.searchPlaceholder":"Search by name, email, or company...","reassign.searchPrompt":"Type to search for users","reassign.noUsersFound":"No users found matching your search.","reassign.noCompany":"No company","reassign.assignBtn":"Assign Selected","reassign.assigning":"Assigning...","reassign.differentCompanyWarning":"Warning: Some selected users are from a different company than the current owner. Are you sure you want to proceed?","reassign.success":"Project assigned successfully. All assigned users have been notified by email.","reassign.error":["Failed to assign project: ","error",""],"reassign.loading":"Loading users..."}');
@@ -0,0 +1,2 @@
+// Generated by _replace_strings.py --build-translations. Do not edit.
+(self.translationsFlat || (self.translationsFlat = {}))["fr"] = JSON.parse('{"common.loading":"Chargement...","common.delete":"Supprimer","common.view":"Voir","common.copy":"Copier","common.assign":"Assigner","common.selectAll":"Tout sélectionner","common.admin":"ADMIN","common.limited":"LIMITÉ","admin.adminPanel":"Panneau d\'administration","admin.seismicCalculation":"Calcul sismique","admin.manageUsers":"Gérer les utilisateurs","admin.viewAllProjects":"Voir tous les projets","admin.verifyBulkProjects":"Vérifier les projets en lot","admin.emailClassifications":"Classifications des courriels","admin.newProjectSheets":"Nouveau projet (Sheets)","admin.adminRequired":"Accès administrateur requis","admin.accessRestricted":"Accès restreint","admin.showingAllCFSS":"Affichage de tous les projets CFSS du système","dashboard.cfssProjects":"Projets CFSS","dashboard.searchProjects":"Rechercher des projets...","dashboard.allStatus":"Tous les statuts","dashboard.noCFSSProjectsFound":"Aucun projet CFSS trouvé. Créez votre premier projet CFSS pour commencer !","dashboard.newCFSSProject":"Nouveau projet CFSS","dashboard.totalCFSS":"Total CFSS","dashboard.planning":"Planification","dashboard.active":"Actif","dashboard.done":"Terminé","status.planning":"Planification","status.inProgress":"En cours","status.completed":"Terminé","project.cfssProjectDuplicated":"Projet CFSS dupliqué avec succès !","project.deleteCFSSConfirm":"Êtes-vous sûr de vouloir supprimer ce projet CFSS ?","project.errorDeleting":"Erreur lors de la suppression du projet. Veuillez réessayer.","project.errorDuplicating":"Erreur lors de la duplication du projet : ","bulk.deleteCFSSCount":["Supprimer ","count"," projet(s) CFSS sélectionné(s) ? Cette action est irréversible."],"bulk.deletedCount":["","success"," projet(s) supprimé(s). ","fail"," échoué(s)."],"reassign.title":"Assigner le projet","reassign.currentOwner":"Propriétaire actuel","reassign.searchPlaceholder":"Rechercher par nom, courriel ou entreprise...","reassign.searchPrompt":"Tapez pour rechercher des utilisateurs","reassign.noUsersFound":"Aucun utilisateur trouvé correspondant à votre recherche.","reassign.noCompany":"Aucune entreprise","reassign.assignBtn":"Assigner la sélection","reassign.assigning":"Assignation...","reassign.differentCompanyWarning":"Attention : Certains utilisateurs sélectionnés sont d\'une entreprise différente du propriétaire actuel. Êtes-vous sûr de vouloir continuer ?","reassign.success":"Projet assigné avec succès. Tous les utilisateurs assignés ont été notifiés par courriel.","reassign.error":["Échec de l\'assignation du projet : ","error",""],"reassign.loading":"Chargement des utilisateurs..."}');
@@ -0,0 +1,2 @@
+// Generated by _replace_strings.py --build-translations. Do not edit.
+(self.translationsFlat || (self.translationsFlat = {}))["en"] = JSON.parse('{"common.loading":"Loading...","common.save":"Save","common.saving":"Saving...","common.cancel":"Cancel","common.delete":"Delete","common.edit":"Edit","common.add":"Add","common.upload":"Upload","common.dashboard":"Dashboard","common.admin":"ADMIN","common.limited":"LIMITED","common.browse":"Browse","common.details":"Details","common.duplicate":"Duplicate","common.hide":"Hide","common.hideDetails":"Hide Details","common.hideForm":"Hide Form","common.saveChanges":"Save Changes","common.uploading":"Uploading...","common.calculate":"Calculate","common.cancelEdit":"Cancel Edit","common.fillRequiredFields":"Please fill in all required fields.","common.note":"Note:","common.loadingProjectDetails":"Loading project details...","common.accessDenied":"Access Denied","common.authRequired":"Authentication Required","common.goToLogin":"Go to Login","common.actions":"Actions","common.date":"Date","common.select":"Select","common.selectOption":"Select an option","common.uploadFile":"Upload File","auth.confirmLogout":"Are you sure you want to logout?","status.planning":"Planning","status.inProgress":"In Progress","status.completed":"Completed","project.status":"Status:","project.address":"Address:","project.type":"Type:","project.projectName":"Project Name:","project.clientName":"Client Name:","project.description":"Description:","project.addressLine1":"Address Line 1:","project.addressLine2":"Address Line 2:","project.city":"City:","project.province":"Province:","project.country":"Country:","project.projectNumber":"Project Number:","project.clientEmails":"Client Email(s):","project.designedBy":"Designed by:","project.approvedBy":"Approved by:","project.separateEmailsComma":"Separate multiple emails with commas","project.editProjectDetails":"Edit Project Details","project.noEditPermission":"You don\'t have permission to edit this project.","project.detailsUpdated":"Project details updated successfully!","project.errorSavingDetails":"Error saving project details","cfss.deflectionMax":"Deflection Max:","cfss.thicknessMin":"Thickness Min:","cfss.projectFiles":"Project Files","cfss.pasteLink":"Paste Link","cfss.fileName":"File Name","cfss.selectFile":"Select File","cfss.addWall":"Add Wall","cfss.addWindow":"Add Window","cfss.customPages":"Custom Pages","cfss.floor":"Floor","cfss.source":"Source:","cfss.enterFileName":"Enter file name...","cfss.optionList":"Option List","cfss.wallList":"Wall List","cfss.parapetList":"Parapet List","cfss.windowList":"Window List","cfss.soffitesList":"Soffites List","cfss.saveOptions":"Save Options","cfss.addParapet":"Add Parapet","cfss.addSoffites":"Add Soffites","cfss.newWall":"New Wall","cfss.wallName":"Wall Name:","cfss.enterWallName":"Enter wall name...","cfss.selectDeflexionMax":"Select deflexion max...","cfss.note":"Note:","cfss.uploadImage":"Upload Image","cfss.dropOrPasteImage":"Drop or paste image here (Ctrl+V)","cfss.newParapet":"New Parapet","cfss.parapetName":"Parapet Name:","cfss.enterParapetName":"Enter parapet name...","cfss.parapetType":"Parapet Type:","cfss.selectParapetType":"Select Parapet Type","cfss.selectAType":"Select a type","cfss.saveParapet":"Save Parapet","cfss.windowType":"Window Type:","cfss.saveWindow":"Save Window","cfss.imageNotAvailable":"Image not available","cfss.enterSoffiteName":"Enter soffite name...","cfss.selectSteelStud":"Select steel stud...","cfss.enterBottomTrack":"Please enter a bottom track.","cfss.enterDeflectionTrack":"Please enter a deflection track.","cfss.calculationError":"Calculation error","cfss.exteriorWallCalculation":"Exterior Wall Calculation","cfss.component":"Component","cfss.designation":"Designation","cfss.check":"Check","cfss.status":"Status","cfss.ratioPercent":"Ratio (%)","cfss.steelStud":"Steel Stud","cfss.mCheck":"M Check","cfss.momentCheck":"Moment Check","cfss.shearCheck":"Shear Check","cfss.combination":"Combination","cfss.deflectionCheck":"Deflection Check","cfss.webCrippling":"Web Crippling","cfss.stiffener":"stiffener","cfss.deflectionTrack":"Deflection Track","cfss.bottomTrack":"Bottom Track","cfss.detailedResults":"Detailed Results","cfss.required":"Required","cfss.allowable":"Allowable","cfss.reaction":"Reaction","cfss.capacity":"Capacity","cfss.load":"Load","cfss.selectBottomTrack":"Select bottom track...","cfss.selectDeflectionTrack":"Select deflection track...","cfss.aboutToCreateFirstRevision":["You are about to ","action",". This will create the first revision of this project."],"cfss.createFirstRevision":"Create First Revision","cfss.createNewRevision":"Create a new revision","cfss.createRevision":["Create Revision ","number",""],"cfss.revisionDescriptionOptional":"Description (optional):","cfss.max100Chars":"Max 100 characters","cfss.thisWillCreate":"This will create:","cfss.revisionNumber":["Revision ","number",""],"cfss.noCurrentRevision":"No current revision","cfss.saveWallChanges":"Save Wall Changes","cfss.updateCurrentRevision":"Update current revision","cfss.chooseHowTo":["Choose how to ","action","."],"cfss.optionalDescription":"Description (optional):","cfss.maxRevisionsReached":"Maximum number of revisions reached.","cfss.errorCreatingRevision":"Error creating revision","cfss.noRevisionsFound":"No revisions found.","cfss.noDescription":"No description","cfss.current":"Current","cfss.editDescription":"Edit description","cfss.wallCount":["","count"," wall(s)"],"cfss.by":"by","cfss.availableRevisions":["Available Revisions (","count",")"],"cfss.selectedOptions":"Selected Options:","cfss.optionsWillBeIncluded":["","count"," option(s) will be included in the report."],"cfss.noOptionsSelected":"No options selected. The report will be generated without options.","cfss.optionsFromTabIncluded":"Options from the Options tab will be included.","cfss.generateReport":"Generate Report","cfss.generateReportBtn":"Generate Report","cfss.selectRevisionForReport":"Please select a revision to generate the report.","cfss.selectRevisionForReportDesc":"Select a revision to generate the report from.","cfss.generatingReport":"Generating Report...","cfss.generatingPDF":"Generating PDF...","cfss.generatingRevisionPDF":["Generating PDF for Revision ","number","..."],"cfss.errorGeneratingReport":"Error generating report","cfss.reportSentToDrive":"Report sent to Google Drive successfully!","cfss.pdfTimedOut":"PDF generation timed out. Please try again.","cfss.revisionNotFound":"Revision not found.","cfss.revisionNoWalls":["Revision ","number"," has no walls. Please add walls before generating a report."],"cfss.noProjectSelected":"No project selected.","cfss.errorDisplayingOptions":"Error displaying options.","cfss.noWallsYet":"No walls added yet.","cfss.wallsAdded":["","count"," wall(s) added"],"cfss.wallSaved":"Wall saved successfully!","cfss.wallUpdated":"Wall updated successfully!","cfss.wallImages":"Wall Images","cfss.dropImagesOrPaste":"Drop or paste images here (Ctrl+V)","cfss.dropImageOrPaste":"Drop or paste image here (Ctrl+V)","cfss.maxTwoImagesWall":"A wall can have a maximum of 2 images.","cfss.remainingImageSlots":["Only ","remaining"," image slot(s) remaining."],"cfss.selectValidImages":"Please select valid image files.","cfss.confirmDeleteWallAndImages":"Are you sure you want to delete this wall and all its images?","cfss.confirmDeleteWallNamed":["Are you sure you want to delete wall \\"","name","\\" and all its images?"],"cfss.failedSaveWall":"Failed to save wall.","cfss.errorSavingWall":"Error saving wall","cfss.errorSavingWalls":"Error saving walls","cfss.errorSavingWallChanges":"Error saving wall changes","cfss.errorDisplayingWallDetails":"Error displaying wall details","cfss.enterFloor":"Please enter a floor number.","cfss.enterHeightValue":"Please enter a height value.","cfss.selectUnits":"Please select units.","cfss.selectAnEspacement":"Please select a spacing (espacement).","cfss.selectMontantMetallique":"Please select a metal stud (montant métallique).","cfss.selectMontantMetallique2":"Please select a metal stud for Set 2.","cfss.selectEspacement":"Please select a spacing.","cfss.selectEspacement2":"Please select a spacing for Set 2.","cfss.enterLisseInferieure":"Please enter the bottom track (lisse inférieure).","cfss.enterLisseSuperieure":"Please enter the top track (lisse supérieure).","cfss.enterLisseInferieure2":"Please enter the bottom track for Set 2.","cfss.enterLisseSuperieure2":"Please enter the top track for Set 2.","cfss.selectEntremise":"Please select a bridging (entremise).","cfss.selectEntremise2":"Please select a bridging for Set 2.","cfss.selectEntremiseSpacing":"Please select a bridging spacing.","cfss.enterHauteurMax":"Please enter a maximum height (hauteur max).","cfss.selectHauteurMaxUnit":"Please select a unit for the maximum height.","cfss.enterConcreteAnchor":"Enter concrete anchor...","cfss.enterSteelAnchor":"Enter steel anchor...","cfss.noWallsInRevision":"No walls found in the selected revision.","cfss.noParapetsYet":"No parapets added yet.","cfss.noParapetsAddedYet":"No parapets added yet.","cfss.parapetsAdded":["","count"," parapet(s) added"],"cfss.parapetSaved":"Parapet saved successfully!","cfss.parapetUpdated":"Parapet updated successfully!","cfss.parapetDeleted":"Parapet deleted successfully!","cfss.parapetNotFound":"Parapet not found.","cfss.parapetImage":"Parapet Image","cfss.errorSavingParapet":"Error saving parapet","cfss.errorUpdatingParapet":"Error updating parapet","cfss.confirmDeleteParapet":"Are you sure you want to delete this parapet?","cfss.maxOneImageParapet":"A parapet can only have one image. Please remove the existing image first.","cfss.maxOneImageParapetShort":"Maximum 1 image per parapet.","cfss.mustHaveOneComposition":"You must have at least one composition item.","cfss.maxCompositionsReached":["Maximum of ","max"," compositions reached."],"cfss.maxComps":["Max (","max",")"],"cfss.noWindowsYet":"No windows added yet.","cfss.noWindowsAddedYet":"No windows added yet.","cfss.windowsAdded":["","count"," window(s) added"],"cfss.windowSaved":"Window saved successfully!","cfss.windowUpdated":"Window updated successfully!","cfss.windowNotFound":"Window not found.","cfss.windowFormNotFound":"Window form not found.","cfss.confirmDeleteWindow":"Are you sure you want to delete this window?","cfss.selectWindowType":"Please select a window type.","cfss.enterValidDimensions":"Please enter valid dimensions.","cfss.errorUpdatingWindow":"Error updating window","cfss.errorSavingWindows":"Error saving windows","cfss.soffitesAdded":["","count"," soffite(s) added"],"cfss.confirmDeleteSoffite":"Are you sure you want to delete this soffite?","cfss.errorSavingSoffites":"Error saving soffites","cfss.optionsSelected":["","count"," option(s) selected"],"cfss.optionsSaved":["","count"," option(s) saved successfully!"],"cfss.savingOptions":"Saving Options...","cfss.errorSavingOptions":"Error saving options","cfss.noPermissionModifyOptions":"You don\'t have permission to modify options.","cfss.noPermissionAddWalls":"You don\'t have permission to add walls.","cfss.noPermissionEditWalls":"You don\'t have permission to edit walls.","cfss.noPermissionDeleteWalls":"You don\'t have permission to delete walls.","cfss.noPermissionAddParapets":"You don\'t have permission to add parapets.","cfss.noPermissionEditWindows":"You don\'t have permission to edit windows.","cfss.noPermissionAddCFSSData":"You don\'t have permission to add CFSS data.","cfss.noPermissionModifyCFSSData":"You don\'t have permission to modify CFSS data.","cfss.noPermissionToView":"You don\'t have permission to view this project.","cfss.addCFSSData":"Add CFSS Data","cfss.editCFSSData":"Edit CFSS Data","cfss.hideCFSSData":"Hide CFSS Data","cfss.editCFSSDataFloors":["Edit CFSS Data (","count"," floors)"],"cfss.editCFSSDataFloorsSpecs":["Edit CFSS Data (","floors"," floors, ","specs"," specs)"],"cfss.addValidFloorData":"Please add valid floor data before saving.","cfss.dataSaved":"Data saved successfully!","cfss.errorSavingCFSSData":"Error saving CFSS data","cfss.selectFileLabel":"Select File","cfss.pasteLinkLabel":"Paste Link","cfss.enterLinkUrl":"Please enter a link URL.","cfss.fileUploaded":"File uploaded successfully!","cfss.errorUploadingFile":"Error uploading file","cfss.fileNotFound":"File not found.","cfss.errorDownloadingFile":"Error downloading file","cfss.confirmDeleteFile":"Are you sure you want to delete this file?","cfss.fileDeleted":"File deleted successfully!","cfss.errorDeletingFile":"Error deleting file","cfss.stateSaved":"State saved successfully!","cfss.errorSavingState":"Error saving state","cfss.errorSavingDescription":"Error saving description","cfss.errorReloadingData":"Error reloading data","cfss.errorUploadingImage":["Error uploading image \\"","name","\\": ","error",""],"cfss.customPagesAdded":["","count"," custom page(s) added"],"cfss.noCustomPagesYet":"No custom pages added yet.","cfss.fillWindCalcFields":"Please fill in all wind calculation fields.","cfss.noBreakdownAvailable":"No breakdown available for this storey.","cfss.exteriorWallCalc":"Exterior Wall Calc","cfss.selectAtLeast2Floors":"Please select at least 2 floors to group.","cfss.selectConsecutiveFloors":"Please select consecutive floors only.","cfss.floorsAlreadyGrouped":"One or more selected floors are already grouped.","cfss.failedSaveGrouping":"Failed to save floor grouping.","cfss.height":"Height","cfss.images":"Images","cfss.addCustomPage":"Add Custom Page","cfss.addElements":"Add Elements","cfss.addNewFloor":"Add New Floor","cfss.addNewWindow":"Add New Window","cfss.addSoffitesPage":"Add Soffites Page","cfss.backToDashboard":"Back to Dashboard","cfss.bearingLengthIn":"Bearing Length (in):","cfss.bridgingSpacingIn":"Bridging Spacing (in):","cfss.calculationResults":"Calculation Results","cfss.claddingType":"Cladding Type:","cfss.claddingWeight":"Cladding Weight:","cfss.deflectionLimit":"Deflection Limit:","cfss.enterMaxDeflection":"Enter max deflection...","cfss.enterMaxSpacing":"Enter max spacing...","cfss.enterModel":"Enter model...","cfss.enterWeight":"Enter weight...","cfss.enterFramingAssembly":"Framing Assembly:","cfss.fastenerType":"Fastener Type:","cfss.fillWallInfo":"Fill in wall information","cfss.generateWallDataSheet":"Generate Wall Data Sheet","cfss.heading":"Heading","cfss.image":"Image","cfss.jambageComposition":"Jambage Composition:","cfss.jambageType":"Jambage Type:","cfss.linteauComposition":"Linteau Composition:","cfss.linteauType":"Linteau Type:","cfss.loginToViewDetails":"Please log in to view project details.","cfss.model":"Model:","cfss.noFilesUploaded":"No files uploaded.","cfss.optionalNote":"Optional note...","cfss.pageTitle":"CFSS Project Details","cfss.projectDetails":"Project Details","cfss.properties":"Properties","cfss.review":"Review","cfss.reviewCustomPages":"Review Custom Pages","cfss.reviewOptions":"Review Options","cfss.reviewParapets":"Review Parapets","cfss.reviewWalls":"Review Walls","cfss.reviewWindows":"Review Windows","cfss.saveCFSSData":"Save CFSS Data","cfss.savePage":"Save Page","cfss.selectCladdingType":"Select cladding type...","cfss.selectElementToEdit":"Select element to edit","cfss.selectJambageType":"Select jambage type...","cfss.selectLinteauType":"Select linteau type...","cfss.selectMontant":"Select montant...","cfss.selectSeuilType":"Select seuil type...","cfss.sendReportToClients":"Send Report to Clients","cfss.seuilComposition":"Seuil Composition:","cfss.seuilType":"Seuil Type:","cfss.soffitesPages":"Soffites Pages","cfss.soffitesPagesAdded":["","count"," soffites page(s) added"],"cfss.spacingHorizontalIn":"Spacing Horizontal (in):","cfss.spacingIn":"Spacing (in):","cfss.spacingVerticalIn":"Spacing Vertical (in):","cfss.textBlock":"Text Block","cfss.thermoclip":"Thermoclip:","cfss.thermoclipDetails":"Thermoclip Details:","cfss.wallDetails":"Wall Details","cfss.weightSupportByStud":"Weight Support by Stud:","cfss.windData":"Wind Data","cfss.windloadResistanceULS":"Windload Resistance ULS:","customPages.alignCenter":"Center","customPages.alignLeft":"Left","customPages.alignment":"Alignment","customPages.alignRight":"Right","customPages.aspectRatioPreserved":"Aspect ratio preserved","customPages.clickToEditText":"Click to edit text...","customPages.color":"Color","customPages.confirmDeletePage":"Are you sure you want to delete this custom page?","customPages.confirmDeleteSoffitesPage":"Are you sure you want to delete this soffites page?","customPages.dragAndDropElements":"Drag and drop elements here","customPages.dropOrPasteHere":"Drop or paste image here...","customPages.elements":"elements","customPages.enterPageTitle":"Please enter a page title.","customPages.errorDeletingSoffitesPage":"Error deleting soffites page","customPages.errorSavingPage":"Error saving page","customPages.errorSavingSoffitesPage":"Error saving soffites page","customPages.errorUploadingImage":"Error uploading image","customPages.font":"Font","customPages.fontSize":"Font Size","customPages.height":"Height","customPages.imagePastedSuccess":"Image pasted successfully!","customPages.lastModified":"Last modified","customPages.newHeading":"New Heading","customPages.noCustomPagesYet":"No custom pages yet.","customPages.noSoffitesPagesYet":"No soffites pages yet.","customPages.pageSavedSuccess":"Page saved successfully!","customPages.position":"Position","customPages.positionX":"X","customPages.positionY":"Y","customPages.selectElementToEdit":"Select an element to edit its properties","customPages.selectValidImage":"Please select a valid image file.","customPages.size":"Size","customPages.soffitesPagesAdded":"soffites page(s) added","customPages.soffitesPageSavedSuccess":"Soffites page saved successfully!","customPages.typeface":"Typeface","customPages.untitledPage":"Untitled Page","customPages.width":"Width"}');
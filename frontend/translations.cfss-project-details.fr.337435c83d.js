@@ -0,0 +1,2 @@
+// Generated by _replace_strings.py --build-translations. Do not edit.
+(self.translationsFlat || (self.translationsFlat = {}))["fr"] = JSON.parse('{"common.loading":"Chargement...","common.save":"Enregistrer","common.saving":"Enregistrement...","common.cancel":"Annuler","common.delete":"Supprimer","common.edit":"Modifier","common.add":"Ajouter","common.upload":"Téléverser","common.dashboard":"Tableau de bord","common.admin":"ADMIN","common.limited":"LIMITÉ","common.browse":"Parcourir","common.details":"Détails","common.duplicate":"Dupliquer","common.hide":"Masquer","common.hideDetails":"Masquer les détails","common.hideForm":"Masquer le formulaire","common.saveChanges":"Enregistrer les modifications","common.uploading":"Téléversement...","common.calculate":"Calculer","common.cancelEdit":"Annuler la modification","common.fillRequiredFields":"Veuillez remplir tous les champs obligatoires.","common.note":"Note :","common.loadingProjectDetails":"Chargement des détails du projet...","common.accessDenied":"Accès refusé","common.authRequired":"Authentification requise","common.goToLogin":"Aller à la connexion","common.actions":"Actions","common.date":"Date","common.select":"Sélectionner","common.selectOption":"Sélectionner une option","common.uploadFile":"Téléverser un fichier","auth.confirmLogout":"Êtes-vous sûr de vouloir vous déconnecter ?","status.planning":"Planification","status.inProgress":"En cours","status.completed":"Terminé","project.status":"Statut :","project.address":"Adresse :","project.type":"Type :","project.projectName":"Nom du projet :","project.clientName":"Nom du client :","project.description":"Description :","project.addressLine1":"Adresse ligne 1 :","project.addressLine2":"Adresse ligne 2 :","project.city":"Ville :","project.province":"Province :","project.country":"Pays :","project.projectNumber":"Numéro de projet :","project.clientEmails":"Courriel(s) du client :","project.designedBy":"Conçu par :","project.approvedBy":"Approuvé par :","project.separateEmailsComma":"Séparez plusieurs courriels par des virgules","project.editProjectDetails":"Modifier les détails du projet","project.noEditPermission":"Vous n\'avez pas la permission de modifier ce projet.","project.detailsUpdated":"Détails du projet mis à jour avec succès !","project.errorSavingDetails":"Erreur lors de l\'enregistrement des détails du projet","cfss.deflectionMax":"Déflexion max :","cfss.thicknessMin":"Épaisseur min :","cfss.projectFiles":"Fichiers du projet","cfss.pasteLink":"Coller un lien","cfss.fileName":"Nom du fichier","cfss.selectFile":"Sélectionner un fichier","cfss.addWall":"Ajouter un mur","cfss.addWindow":"Ajouter une fenêtre","cfss.customPages":"Pages personnalisées","cfss.floor":"Étage","cfss.source":"Source :","cfss.enterFileName":"Entrer le nom du fichier...","cfss.optionList":"Liste d\'options","cfss.wallList":"Liste des murs","cfss.parapetList":"Liste des parapets","cfss.windowList":"Liste des fenêtres","cfss.soffitesList":"Liste des soffites","cfss.saveOptions":"Enregistrer les options","cfss.addParapet":"Ajouter un parapet","cfss.addSoffites":"Ajouter des soffites","cfss.newWall":"Nouveau mur","cfss.wallName":"Nom du mur :","cfss.enterWallName":"Entrer le nom du mur...","cfss.selectDeflexionMax":"Sélectionner la déflexion max...","cfss.note":"Note :","cfss.uploadImage":"Téléverser une image","cfss.dropOrPasteImage":"Déposer ou coller une image ici (Ctrl+V)","cfss.newParapet":"Nouveau parapet","cfss.parapetName":"Nom du parapet :","cfss.enterParapetName":"Entrer le nom du parapet...","cfss.parapetType":"Type de parapet :","cfss.selectParapetType":"Sélectionner le type de parapet","cfss.selectAType":"Sélectionner un type","cfss.saveParapet":"Enregistrer le parapet","cfss.windowType":"Type de fenêtre :","cfss.saveWindow":"Enregistrer la fenêtre","cfss.imageNotAvailable":"Image non disponible","cfss.enterSoffiteName":"Entrer le nom du soffite...","cfss.selectSteelStud":"Sélectionner un montant en acier...","cfss.enterBottomTrack":"Veuillez entrer une lisse inférieure.","cfss.enterDeflectionTrack":"Veuillez entrer une lisse de déflexion.","cfss.calculationError":"Erreur de calcul","cfss.exteriorWallCalculation":"Calcul de mur extérieur","cfss.component":"Composant","cfss.designation":"Désignation","cfss.check":"Vérification","cfss.status":"Statut","cfss.ratioPercent":"Ratio (%)","cfss.steelStud":"Montant en acier","cfss.mCheck":"Vérification M","cfss.momentCheck":"Vérification du moment","cfss.shearCheck":"Vérification du cisaillement","cfss.combination":"Combinaison","cfss.deflectionCheck":"Vérification de la déflexion","cfss.webCrippling":"Écrasement de l\'âme","cfss.stiffener":"raidisseur","cfss.deflectionTrack":"Lisse de déflexion","cfss.bottomTrack":"Lisse inférieure","cfss.detailedResults":"Résultats détaillés","cfss.required":"Requis","cfss.allowable":"Admissible","cfss.reaction":"Réaction","cfss.capacity":"Capacité","cfss.load":"Charge","cfss.selectBottomTrack":"Sélectionner la lisse inférieure...","cfss.selectDeflectionTrack":"Sélectionner la lisse de déflexion...","cfss.aboutToCreateFirstRevision":["Vous êtes sur le point de ","action",". Ceci créera la première révision de ce projet."],"cfss.createFirstRevision":"Créer la première révision","cfss.createNewRevision":"Créer une nouvelle révision","cfss.createRevision":["Créer la révision ","number",""],"cfss.revisionDescriptionOptional":"Description (optionnel) :","cfss.max100Chars":"Max 100 caractères","cfss.thisWillCreate":"Ceci créera :","cfss.revisionNumber":["Révision ","number",""],"cfss.noCurrentRevision":"Aucune révision en cours","cfss.saveWallChanges":"Enregistrer les modifications du mur","cfss.updateCurrentRevision":"Mettre à jour la révision en cours","cfss.chooseHowTo":["Choisissez comment ","action","."],"cfss.optionalDescription":"Description (optionnel) :","cfss.maxRevisionsReached":"Nombre maximum de révisions atteint.","cfss.errorCreatingRevision":"Erreur lors de la création de la révision","cfss.noRevisionsFound":"Aucune révision trouvée.","cfss.noDescription":"Aucune description","cfss.current":"En cours","cfss.editDescription":"Modifier la description","cfss.wallCount":["","count"," mur(s)"],"cfss.by":"par","cfss.availableRevisions":["Révisions disponibles (","count",")"],"cfss.selectedOptions":"Options sélectionnées :","cfss.optionsWillBeIncluded":["","count"," option(s) seront incluses dans le rapport."],"cfss.noOptionsSelected":"Aucune option sélectionnée. Le rapport sera généré sans options.","cfss.optionsFromTabIncluded":"Les options de l\'onglet Options seront incluses.","cfss.generateReport":"Générer le rapport","cfss.generateReportBtn":"Générer le rapport","cfss.selectRevisionForReport":"Veuillez sélectionner une révision pour générer le rapport.","cfss.selectRevisionForReportDesc":"Sélectionnez une révision à partir de laquelle générer le rapport.","cfss.generatingReport":"Génération du rapport...","cfss.generatingPDF":"Génération du PDF...","cfss.generatingRevisionPDF":["Génération du PDF pour la révision ","number","..."],"cfss.errorGeneratingReport":"Erreur lors de la génération du rapport","cfss.reportSentToDrive":"Rapport envoyé sur Google Drive avec succès !","cfss.pdfTimedOut":"La génération du PDF a expiré. Veuillez réessayer.","cfss.revisionNotFound":"Révision non trouvée.","cfss.revisionNoWalls":["La révision ","number"," n\'a aucun mur. Veuillez ajouter des murs avant de générer un rapport."],"cfss.noProjectSelected":"Aucun projet sélectionné.","cfss.errorDisplayingOptions":"Erreur lors de l\'affichage des options.","cfss.noWallsYet":"Aucun mur ajouté pour l\'instant.","cfss.wallsAdded":["","count"," mur(s) ajouté(s)"],"cfss.wallSaved":"Mur enregistré avec succès !","cfss.wallUpdated":"Mur mis à jour avec succès !","cfss.wallImages":"Images du mur","cfss.dropImagesOrPaste":"Déposer ou coller des images ici (Ctrl+V)","cfss.dropImageOrPaste":"Déposer ou coller une image ici (Ctrl+V)","cfss.maxTwoImagesWall":"Un mur peut avoir un maximum de 2 images.","cfss.remainingImageSlots":["Seulement ","remaining"," emplacement(s) d\'image restant(s)."],"cfss.selectValidImages":"Veuillez sélectionner des fichiers image valides.","cfss.confirmDeleteWallAndImages":"Êtes-vous sûr de vouloir supprimer ce mur et toutes ses images ?","cfss.confirmDeleteWallNamed":["Êtes-vous sûr de vouloir supprimer le mur « ","name"," » et toutes ses images ?"],"cfss.failedSaveWall":"Échec de l\'enregistrement du mur.","cfss.errorSavingWall":"Erreur lors de l\'enregistrement du mur","cfss.errorSavingWalls":"Erreur lors de l\'enregistrement des murs","cfss.errorSavingWallChanges":"Erreur lors de l\'enregistrement des modifications du mur","cfss.errorDisplayingWallDetails":"Erreur lors de l\'affichage des détails du mur","cfss.enterFloor":"Veuillez entrer un numéro d\'étage.","cfss.enterHeightValue":"Veuillez entrer une valeur de hauteur.","cfss.selectUnits":"Veuillez sélectionner les unités.","cfss.selectAnEspacement":"Veuillez sélectionner un espacement.","cfss.selectMontantMetallique":"Veuillez sélectionner un montant métallique.","cfss.selectMontantMetallique2":"Veuillez sélectionner un montant métallique pour le jeu 2.","cfss.selectEspacement":"Veuillez sélectionner un espacement.","cfss.selectEspacement2":"Veuillez sélectionner un espacement pour le jeu 2.","cfss.enterLisseInferieure":"Veuillez entrer la lisse inférieure.","cfss.enterLisseSuperieure":"Veuillez entrer la lisse supérieure.","cfss.enterLisseInferieure2":"Veuillez entrer la lisse inférieure pour le jeu 2.","cfss.enterLisseSuperieure2":"Veuillez entrer la lisse supérieure pour le jeu 2.","cfss.selectEntremise":"Veuillez sélectionner une entremise.","cfss.selectEntremise2":"Veuillez sélectionner une entremise pour le jeu 2.","cfss.selectEntremiseSpacing":"Veuillez sélectionner un espacement d\'entremise.","cfss.enterHauteurMax":"Veuillez entrer une hauteur maximale.","cfss.selectHauteurMaxUnit":"Veuillez sélectionner une unité pour la hauteur maximale.","cfss.enterConcreteAnchor":"Entrer l\'ancrage au béton...","cfss.enterSteelAnchor":"Entrer l\'ancrage à l\'acier...","cfss.noWallsInRevision":"Aucun mur trouvé dans la révision sélectionnée.","cfss.noParapetsYet":"Aucun parapet ajouté pour l\'instant.","cfss.noParapetsAddedYet":"Aucun parapet ajouté pour l\'instant.","cfss.parapetsAdded":["","count"," parapet(s) ajouté(s)"],"cfss.parapetSaved":"Parapet enregistré avec succès !","cfss.parapetUpdated":"Parapet mis à jour avec succès !","cfss.parapetDeleted":"Parapet supprimé avec succès !","cfss.parapetNotFound":"Parapet non trouvé.","cfss.parapetImage":"Image du parapet","cfss.errorSavingParapet":"Erreur lors de l\'enregistrement du parapet","cfss.errorUpdatingParapet":"Erreur lors de la mise à jour du parapet","cfss.confirmDeleteParapet":"Êtes-vous sûr de vouloir supprimer ce parapet ?","cfss.maxOneImageParapet":"Un parapet ne peut avoir qu\'une seule image. Veuillez d\'abord retirer l\'image existante.","cfss.maxOneImageParapetShort":"Maximum 1 image par parapet.","cfss.mustHaveOneComposition":"Vous devez avoir au moins un élément de composition.","cfss.maxCompositionsReached":["Maximum de ","max"," compositions atteint."],"cfss.maxComps":["Max (","max",")"],"cfss.noWindowsYet":"Aucune fenêtre ajoutée pour l\'instant.","cfss.noWindowsAddedYet":"Aucune fenêtre ajoutée pour l\'instant.","cfss.windowsAdded":["","count"," fenêtre(s) ajoutée(s)"],"cfss.windowSaved":"Fenêtre enregistrée avec succès !","cfss.windowUpdated":"Fenêtre mise à jour avec succès !","cfss.windowNotFound":"Fenêtre non trouvée.","cfss.windowFormNotFound":"Formulaire de fenêtre non trouvé.","cfss.confirmDeleteWindow":"Êtes-vous sûr de vouloir supprimer cette fenêtre ?","cfss.selectWindowType":"Veuillez sélectionner un type de fenêtre.","cfss.enterValidDimensions":"Veuillez entrer des dimensions valides.","cfss.errorUpdatingWindow":"Erreur lors de la mise à jour de la fenêtre","cfss.errorSavingWindows":"Erreur lors de l\'enregistrement des fenêtres","cfss.soffitesAdded":["","count"," soffite(s) ajouté(s)"],"cfss.confirmDeleteSoffite":"Êtes-vous sûr de vouloir supprimer ce soffite ?","cfss.errorSavingSoffites":"Erreur lors de l\'enregistrement des soffites","cfss.optionsSelected":["","count"," option(s) sélectionnée(s)"],"cfss.optionsSaved":["","count"," option(s) enregistrée(s) avec succès !"],"cfss.savingOptions":"Enregistrement des options...","cfss.errorSavingOptions":"Erreur lors de l\'enregistrement des options","cfss.noPermissionModifyOptions":"Vous n\'avez pas la permission de modifier les options.","cfss.noPermissionAddWalls":"Vous n\'avez pas la permission d\'ajouter des murs.","cfss.noPermissionEditWalls":"Vous n\'avez pas la permission de modifier les murs.","cfss.noPermissionDeleteWalls":"Vous n\'avez pas la permission de supprimer les murs.","cfss.noPermissionAddParapets":"Vous n\'avez pas la permission d\'ajouter des parapets.","cfss.noPermissionEditWindows":"Vous n\'avez pas la permission de modifier les fenêtres.","cfss.noPermissionAddCFSSData":"Vous n\'avez pas la permission d\'ajouter des données CFSS.","cfss.noPermissionModifyCFSSData":"Vous n\'avez pas la permission de modifier les données CFSS.","cfss.noPermissionToView":"Vous n\'avez pas la permission de voir ce projet.","cfss.addCFSSData":"Ajouter des données CFSS","cfss.editCFSSData":"Modifier les données CFSS","cfss.hideCFSSData":"Masquer les données CFSS","cfss.editCFSSDataFloors":["Modifier les données CFSS (","count"," étages)"],"cfss.editCFSSDataFloorsSpecs":["Modifier les données CFSS (","floors"," étages, ","specs"," spéc.)"],"cfss.addValidFloorData":"Veuillez ajouter des données d\'étage valides avant d\'enregistrer.","cfss.dataSaved":"Données enregistrées avec succès !","cfss.errorSavingCFSSData":"Erreur lors de l\'enregistrement des données CFSS","cfss.selectFileLabel":"Sélectionner un fichier","cfss.pasteLinkLabel":"Coller un lien","cfss.enterLinkUrl":"Veuillez entrer une URL de lien.","cfss.fileUploaded":"Fichier téléversé avec succès !","cfss.errorUploadingFile":"Erreur lors du téléversement du fichier","cfss.fileNotFound":"Fichier non trouvé.","cfss.errorDownloadingFile":"Erreur lors du téléchargement du fichier","cfss.confirmDeleteFile":"Êtes-vous sûr de vouloir supprimer ce fichier ?","cfss.fileDeleted":"Fichier supprimé avec succès !","cfss.errorDeletingFile":"Erreur lors de la suppression du fichier","cfss.stateSaved":"État enregistré avec succès !","cfss.errorSavingState":"Erreur lors de l\'enregistrement de l\'état","cfss.errorSavingDescription":"Erreur lors de l\'enregistrement de la description","cfss.errorReloadingData":"Erreur lors du rechargement des données","cfss.errorUploadingImage":["Erreur lors du téléversement de l\'image « ","name"," » : ","error",""],"cfss.customPagesAdded":["","count"," page(s) personnalisée(s) ajoutée(s)"],"cfss.noCustomPagesYet":"Aucune page personnalisée pour l\'instant.","cfss.fillWindCalcFields":"Veuillez remplir tous les champs de calcul de vent.","cfss.noBreakdownAvailable":"Aucune ventilation disponible pour cet étage.","cfss.exteriorWallCalc":"Calcul de mur extérieur","cfss.selectAtLeast2Floors":"Veuillez sélectionner au moins 2 étages à regrouper.","cfss.selectConsecutiveFloors":"Veuillez sélectionner des étages consécutifs uniquement.","cfss.floorsAlreadyGrouped":"Un ou plusieurs étages sélectionnés sont déjà regroupés.","cfss.failedSaveGrouping":"Échec de l\'enregistrement du regroupement d\'étages.","cfss.height":"Hauteur","cfss.images":"Images","cfss.addCustomPage":"Ajouter une page personnalisée","cfss.addElements":"Ajouter des éléments","cfss.addNewFloor":"Ajouter un nouvel étage","cfss.addNewWindow":"Ajouter une nouvelle fenêtre","cfss.addSoffitesPage":"Ajouter une page de soffites","cfss.backToDashboard":"Retour au tableau de bord","cfss.bearingLengthIn":"Longueur d\'appui (po) :","cfss.bridgingSpacingIn":"Espacement d\'entremise (po) :","cfss.calculationResults":"Résultats du calcul","cfss.claddingType":"Type de revêtement :","cfss.claddingWeight":"Poids du revêtement :","cfss.deflectionLimit":"Limite de déflexion :","cfss.enterMaxDeflection":"Entrer la déflexion max...","cfss.enterMaxSpacing":"Entrer l\'espacement max...","cfss.enterModel":"Entrer le modèle...","cfss.enterWeight":"Entrer le poids...","cfss.enterFramingAssembly":"Assemblage de colombage :","cfss.fastenerType":"Type d\'attache :","cfss.fillWallInfo":"Remplir les informations du mur","cfss.generateWallDataSheet":"Générer la fiche de données du mur","cfss.heading":"En-tête","cfss.image":"Image","cfss.jambageComposition":"Composition du jambage :","cfss.jambageType":"Type de jambage :","cfss.linteauComposition":"Composition du linteau :","cfss.linteauType":"Type de linteau :","cfss.loginToViewDetails":"Veuillez vous connecter pour voir les détails du projet.","cfss.model":"Modèle :","cfss.noFilesUploaded":"Aucun fichier téléversé.","cfss.optionalNote":"Note optionnelle...","cfss.pageTitle":"Détails du projet CFSS","cfss.projectDetails":"Détails du projet","cfss.properties":"Propriétés","cfss.review":"Révision","cfss.reviewCustomPages":"Réviser les pages personnalisées","cfss.reviewOptions":"Réviser les options","cfss.reviewParapets":"Réviser les parapets","cfss.reviewWalls":"Réviser les murs","cfss.reviewWindows":"Réviser les fenêtres","cfss.saveCFSSData":"Enregistrer les données CFSS","cfss.savePage":"Enregistrer la page","cfss.selectCladdingType":"Sélectionner le type de revêtement...","cfss.selectElementToEdit":"Sélectionner un élément à modifier","cfss.selectJambageType":"Sélectionner le type de jambage...","cfss.selectLinteauType":"Sélectionner le type de linteau...","cfss.selectMontant":"Sélectionner le montant...","cfss.selectSeuilType":"Sélectionner le type de seuil...","cfss.sendReportToClients":"Envoyer le rapport aux clients","cfss.seuilComposition":"Composition du seuil :","cfss.seuilType":"Type de seuil :","cfss.soffitesPages":"Pages de soffites","cfss.soffitesPagesAdded":["","count"," page(s) de soffites ajoutée(s)"],"cfss.spacingHorizontalIn":"Espacement horizontal (po) :","cfss.spacingIn":"Espacement (po) :","cfss.spacingVerticalIn":"Espacement vertical (po) :","cfss.textBlock":"Bloc de texte","cfss.thermoclip":"Thermoclip :","cfss.thermoclipDetails":"Détails du thermoclip :","cfss.wallDetails":"Détails du mur","cfss.weightSupportByStud":"Poids supporté par montant :","cfss.windData":"Données de vent","cfss.windloadResistanceULS":"Résistance à la charge de vent ULS :","customPages.alignCenter":"Centrer","customPages.alignLeft":"Gauche","customPages.alignment":"Alignement","customPages.alignRight":"Droite","customPages.aspectRatioPreserved":"Rapport d\'aspect préservé","customPages.clickToEditText":"Cliquer pour modifier le texte...","customPages.color":"Couleur","customPages.confirmDeletePage":"Êtes-vous sûr de vouloir supprimer cette page personnalisée ?","customPages.confirmDeleteSoffitesPage":"Êtes-vous sûr de vouloir supprimer cette page de soffites ?","customPages.dragAndDropElements":"Glisser-déposer les éléments ici","customPages.dropOrPasteHere":"Déposer ou coller une image ici...","customPages.elements":"éléments","customPages.enterPageTitle":"Veuillez entrer un titre de page.","customPages.errorDeletingSoffitesPage":"Erreur lors de la suppression de la page de soffites","customPages.errorSavingPage":"Erreur lors de l\'enregistrement de la page","customPages.errorSavingSoffitesPage":"Erreur lors de l\'enregistrement de la page de soffites","customPages.errorUploadingImage":"Erreur lors du téléversement de l\'image","customPages.font":"Police","customPages.fontSize":"Taille de police","customPages.height":"Hauteur","customPages.imagePastedSuccess":"Image collée avec succès !","customPages.lastModified":"Dernière modification","customPages.newHeading":"Nouveau titre","customPages.noCustomPagesYet":"Aucune page personnalisée pour l\'instant.","customPages.noSoffitesPagesYet":"Aucune page de soffites pour l\'instant.","customPages.pageSavedSuccess":"Page enregistrée avec succès !","customPages.position":"Position","customPages.positionX":"X","customPages.positionY":"Y","customPages.selectElementToEdit":"Sélectionner un élément pour modifier ses propriétés","customPages.selectValidImage":"Veuillez sélectionner un fichier image valide.","customPages.size":"Taille","customPages.soffitesPagesAdded":"page(s) de soffites ajoutée(s)","customPages.soffitesPageSavedSuccess":"Page de soffites enregistrée avec succès !","customPages.typeface":"Police de caractères","customPages.untitledPage":"Page sans titre","customPages.width":"Largeur"}');
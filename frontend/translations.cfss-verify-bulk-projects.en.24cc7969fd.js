@@ -0,0 +1,2 @@
+// Generated by _replace_strings.py --build-translations. Do not edit.
+(self.translationsFlat || (self.translationsFlat = {}))["en"] = JSON.parse('{"common.download":"Download","common.dashboard":"Dashboard","common.admin":"ADMIN","common.limited":"LIMITED","common.remove":"Remove","bulkVerify.title":"Verify Bulk Projects","bulkVerify.clearedAllFiles":"All files cleared.","bulkVerify.clearList":"Clear List","bulkVerify.description":"Upload PDF files to verify, sign, and flatten.","bulkVerify.downloadsStarted":"Downloads started.","bulkVerify.downloadToDrive":"Download to Drive","bulkVerify.downloadToPC":"Download to PC","bulkVerify.driveUploadStarted":["","count"," file(s) sent to Google Drive."],"bulkVerify.dropzoneBrowse":"or click to browse","bulkVerify.dropzoneDrag":"Drag & drop PDF files here","bulkVerify.failedToProcess":["","count"," file(s) failed to process."],"bulkVerify.failedToSendToDrive":"Failed to send to Google Drive","bulkVerify.failedToUpload":["","count"," file(s) failed to upload."],"bulkVerify.failedToVerifyFiles":"Failed to verify files","bulkVerify.fileNotReadyForDownload":"File not ready for download.","bulkVerify.filesAddedToQueue":["","count"," file(s) added to queue."],"bulkVerify.hoursAgo":["","count"," hour(s) ago"],"bulkVerify.justNow":"Just now","bulkVerify.minutesAgo":["","count"," minute(s) ago"],"bulkVerify.noFilesQueuedYet":"No files queued yet.","bulkVerify.noProcessedFilesToDownload":"No processed files to download.","bulkVerify.noVerifiedFilesForDrive":"No verified files for Drive transfer.","bulkVerify.onlyPdfAllowed":"Only PDF files are allowed.","bulkVerify.processedDescription":"Processed files will appear here.","bulkVerify.processedFiles":"Processed Files","bulkVerify.processedFilesWillAppear":"Processed files will appear here.","bulkVerify.signAndFlatten":"Sign & Flatten","bulkVerify.signed":"Signed","bulkVerify.statusError":"Error","bulkVerify.statusPending":"Pending","bulkVerify.statusUploaded":"Uploaded","bulkVerify.statusUploading":"Uploading","bulkVerify.statusVerified":"Verified","bulkVerify.statusVerifying":"Verifying","bulkVerify.successfullyProcessed":["","count"," file(s) processed successfully."],"bulkVerify.unableToStartDownload":"Unable to start download.","bulkVerify.unableToStartDownloads":"Unable to start downloads.","bulkVerify.noFilesToProcess":"No files to process. Add PDF files first.","bulkVerify.noFilesUploadedSuccessfully":"No files uploaded successfully. Cannot proceed with verification.","bulkVerify.waitBeforeRemoving":"Please wait before removing.","bulkVerify.waitForCurrentOperation":"Please wait for the current operation to complete."}');
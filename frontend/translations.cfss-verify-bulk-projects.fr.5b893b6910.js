@@ -0,0 +1,2 @@
+// Generated by _replace_strings.py --build-translations. Do not edit.
+(self.translationsFlat || (self.translationsFlat = {}))["fr"] = JSON.parse('{"common.download":"Télécharger","common.dashboard":"Tableau de bord","common.admin":"ADMIN","common.limited":"LIMITÉ","common.remove":"Retirer","bulkVerify.title":"Vérifier les projets en lot","bulkVerify.clearedAllFiles":"Tous les fichiers ont été effacés.","bulkVerify.clearList":"Effacer la liste","bulkVerify.description":"Téléverser des fichiers PDF pour vérifier, signer et aplatir.","bulkVerify.downloadsStarted":"Téléchargements démarrés.","bulkVerify.downloadToDrive":"Télécharger vers Drive","bulkVerify.downloadToPC":"Télécharger sur le PC","bulkVerify.driveUploadStarted":["","count"," fichier(s) envoyé(s) vers Google Drive."],"bulkVerify.dropzoneBrowse":"ou cliquer pour parcourir","bulkVerify.dropzoneDrag":"Glisser-déposer des fichiers PDF ici","bulkVerify.failedToProcess":["","count"," fichier(s) n\'ont pas pu être traités."],"bulkVerify.failedToSendToDrive":"Échec de l\'envoi vers Google Drive","bulkVerify.failedToUpload":["","count"," fichier(s) n\'ont pas pu être téléversés."],"bulkVerify.failedToVerifyFiles":"Échec de la vérification des fichiers","bulkVerify.fileNotReadyForDownload":"Fichier non prêt pour le téléchargement.","bulkVerify.filesAddedToQueue":["","count"," fichier(s) ajouté(s) à la file d\'attente."],"bulkVerify.hoursAgo":["Il y a ","count"," heure(s)"],"bulkVerify.justNow":"À l\'instant","bulkVerify.minutesAgo":["Il y a ","count"," minute(s)"],"bulkVerify.noFilesQueuedYet":"Aucun fichier en file d\'attente.","bulkVerify.noProcessedFilesToDownload":"Aucun fichier traité à télécharger.","bulkVerify.noVerifiedFilesForDrive":"Aucun fichier vérifié pour le transfert vers Drive.","bulkVerify.onlyPdfAllowed":"Seuls les fichiers PDF sont autorisés.","bulkVerify.processedDescription":"Les fichiers traités apparaîtront ici.","bulkVerify.processedFiles":"Fichiers traités","bulkVerify.processedFilesWillAppear":"Les fichiers traités apparaîtront ici.","bulkVerify.signAndFlatten":"Signer et aplatir","bulkVerify.signed":"Signé","bulkVerify.statusError":"Erreur","bulkVerify.statusPending":"En attente","bulkVerify.statusUploaded":"Téléversé","bulkVerify.statusUploading":"Téléversement","bulkVerify.statusVerified":"Vérifié","bulkVerify.statusVerifying":"Vérification","bulkVerify.successfullyProcessed":["","count"," fichier(s) traité(s) avec succès."],"bulkVerify.unableToStartDownload":"Impossible de démarrer le téléchargement.","bulkVerify.unableToStartDownloads":"Impossible de démarrer les téléchargements.","bulkVerify.noFilesToProcess":"Aucun fichier à traiter. Ajoutez d\'abord des fichiers PDF.","bulkVerify.noFilesUploadedSuccessfully":"Aucun fichier téléversé avec succès. Impossible de procéder à la vérification.","bulkVerify.waitBeforeRemoving":"Veuillez patienter avant de retirer.","bulkVerify.waitForCurrentOperation":"Veuillez attendre la fin de l\'opération en cours."}');
@@ -0,0 +1,2 @@
+// Generated by _replace_strings.py --build-translations. Do not edit.
+(self.translationsFlat || (self.translationsFlat = {}))["en"] = JSON.parse('{"common.loading":"Loading...","common.admin":"ADMIN","common.limited":"LIMITED","common.backToDashboard":"Back to Dashboard","project.projectDetails":"Project Details","project.projectName":"Project Name:","project.clientName":"Client Name:","project.nextProjectNumber":"Next Project Number","project.clientInformation":"Client Information","project.companyDivision":"Company / Division","project.zoneDistance":"Zone / Distance","project.classification":"Classification","project.clearForm":"Clear Form","project.projectAddress":"Project Address","project.projectField":"Field","project.projectNamePlaceholder":"Enter project name...","project.contactEmail":"Contact Email:","project.contactEmailPlaceholder":"email@example.com","project.contractType":"Contract Type:","project.entrepreneur":"Entrepreneur:","project.selectEntrepreneur":"Select entrepreneur...","project.selectField":"Select field...","project.estimationAmount":"Estimation Amount:","project.openingDate":"Opening Date:","project.financial":"Financial","project.sousCategorie":"Sub-Category:","project.promoCode":"Promo Code:","project.promoCodePlaceholder":"Enter promo code...","project.fullAddressPlaceholder":"Full address...","project.selectZone":"Select zone...","project.startTypingClient":"Start typing client name...","project.createNewProject":"Create New Project","project.createProject":"Create Project"}');
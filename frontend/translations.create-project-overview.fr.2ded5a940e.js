@@ -0,0 +1,2 @@
+// Generated by _replace_strings.py --build-translations. Do not edit.
+(self.translationsFlat || (self.translationsFlat = {}))["fr"] = JSON.parse('{"common.loading":"Chargement...","common.admin":"ADMIN","common.limited":"LIMITÉ","common.backToDashboard":"Retour au tableau de bord","project.projectDetails":"Détails du projet","project.projectName":"Nom du projet :","project.clientName":"Nom du client :","project.nextProjectNumber":"Prochain numéro de projet","project.clientInformation":"Informations du client","project.companyDivision":"Entreprise / Division","project.zoneDistance":"Zone / Distance","project.classification":"Classification","project.clearForm":"Effacer le formulaire","project.projectAddress":"Adresse du projet","project.projectField":"Domaine","project.projectNamePlaceholder":"Entrer le nom du projet...","project.contactEmail":"Courriel de contact :","project.contactEmailPlaceholder":"courriel@exemple.com","project.contractType":"Type de contrat :","project.entrepreneur":"Entrepreneur :","project.selectEntrepreneur":"Sélectionner un entrepreneur...","project.selectField":"Sélectionner un domaine...","project.estimationAmount":"Montant estimé :","project.openingDate":"Date d\'ouverture :","project.financial":"Financier","project.sousCategorie":"Sous-catégorie :","project.promoCode":"Code promo :","project.promoCodePlaceholder":"Entrer le code promo...","project.fullAddressPlaceholder":"Adresse complète...","project.selectZone":"Sélectionner une zone...","project.startTypingClient":"Commencer à taper le nom du client...","project.createNewProject":"Créer un nouveau projet","project.createProject":"Créer le projet"}');
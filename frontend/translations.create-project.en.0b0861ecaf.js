@@ -0,0 +1,2 @@
+// Generated by _replace_strings.py --build-translations. Do not edit.
+(self.translationsFlat || (self.translationsFlat = {}))["en"] = JSON.parse('{"common.dashboard":"Dashboard","common.admin":"ADMIN","common.limited":"LIMITED","auth.pleaseLogin":"Please login to create projects","auth.sessionExpired":"Session expired. Please login again.","auth.authError":"Authentication error. Please login again.","types.condo":"Condo","types.commercial":"Commercial","types.residential":"Residential","types.industrial":"Industrial","types.hospital":"Hospital","types.fireStation":"Fire-station","types.government":"Government","types.school":"School","types.other":"Other","createProject.createNewProject":"Create New Project","createProject.projectName":"Project Name:","createProject.descriptionOptional":"Description (optional):","createProject.type":"Type:","createProject.addressLine1":"Address Line 1:","createProject.addressLine2":"Address Line 2:","createProject.city":"City:","createProject.province":"Province:","createProject.country":"Country:","createProject.projectNumberOptional":"Project Number (optional):","createProject.numberOfFloors":"Number of Floors (optional):","createProject.createProject":"Create Project","createProject.creatingProject":"Creating Project...","createProject.projectCreated":"Project created successfully!","createProject.errorCreating":"Error creating project: "}');
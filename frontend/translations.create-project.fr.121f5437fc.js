@@ -0,0 +1,2 @@
+// Generated by _replace_strings.py --build-translations. Do not edit.
+(self.translationsFlat || (self.translationsFlat = {}))["fr"] = JSON.parse('{"common.dashboard":"Tableau de bord","common.admin":"ADMIN","common.limited":"LIMITÉ","auth.pleaseLogin":"Veuillez vous connecter pour créer des projets","auth.sessionExpired":"Session expirée. Veuillez vous reconnecter.","auth.authError":"Erreur d\'authentification. Veuillez vous reconnecter.","types.condo":"Condo","types.commercial":"Commercial","types.residential":"Résidentiel","types.industrial":"Industriel","types.hospital":"Hôpital","types.fireStation":"Caserne de pompiers","types.government":"Gouvernement","types.school":"École","types.other":"Autre","createProject.createNewProject":"Créer un nouveau projet","createProject.projectName":"Nom du projet :","createProject.descriptionOptional":"Description (optionnel) :","createProject.type":"Type :","createProject.addressLine1":"Adresse ligne 1 :","createProject.addressLine2":"Adresse ligne 2 :","createProject.city":"Ville :","createProject.province":"Province :","createProject.country":"Pays :","createProject.projectNumberOptional":"Numéro de projet (optionnel) :","createProject.numberOfFloors":"Nombre d\'étages (optionnel) :","createProject.createProject":"Créer le projet","createProject.creatingProject":"Création du projet...","createProject.projectCreated":"Projet créé avec succès !","createProject.errorCreating":"Erreur lors de la création du projet : "}');
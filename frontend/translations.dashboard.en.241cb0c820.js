@@ -0,0 +1,2 @@
+// Generated by _replace_strings.py --build-translations. Do not edit.
+(self.translationsFlat || (self.translationsFlat = {}))["en"] = JSON.parse('{"common.loading":"Loading...","common.delete":"Delete","common.view":"View","common.copy":"Copy","common.assign":"Assign","common.new":"New","common.selectAll":"Select All","common.admin":"ADMIN","common.limited":"LIMITED","common.unknown":"Unknown","admin.adminPanel":"Admin Panel","admin.cfssCalculation":"CFSS Calculation","admin.manageUsers":"Manage Users","admin.verifyBulkProjects":"Verify Bulk Projects","admin.emailClassifications":"Email Classifications","admin.newProjectSheets":"New Project (Sheets)","admin.adminRequired":"Admin access required","admin.accessRestricted":"Access restricted","dashboard.projects":"Projects","dashboard.searchProjects":"Search projects...","dashboard.allStatus":"All Status","dashboard.allCategories":"All Categories","dashboard.noProjectsFound":"No seismic projects found. Create your first seismic project to get started!","dashboard.errorLoadingProjects":"Error loading seismic projects: ","dashboard.total":"Total","dashboard.planning":"Planning","dashboard.active":"Active","dashboard.done":"Done","status.planning":"Planning","status.inProgress":"In Progress","status.completed":"Completed","domains.plumbing":"Plumbing","domains.electricity":"Electricity","domains.interiorSystem":"Interior System","domains.sprinklers":"Sprinklers","domains.ventilation":"Ventilation","project.projectDuplicated":"Project duplicated successfully!","project.deleteConfirm":"Are you sure you want to delete this project?","project.projectDeleted":"Project deleted successfully!","project.errorDeleting":"Error deleting project. Please try again.","project.errorDuplicating":"Error duplicating project: ","bulk.deleteCount":["Delete ","count"," selected project(s)? This cannot be undone."],"bulk.deletedCount":["Deleted ","success"," project(s). ","fail"," failed."],"dataExport.comingSoon":"Data export feature coming soon!","reassign.title":"Assign Project","reassign.currentOwner":"Current Owner","reassign.searchPlaceholder":"Search by name, email, or company...","reassign.searchPrompt":"Type to search for users","reassign.noUsersFound":"No users found matching your search.","reassign.noCompany":"No company","reassign.assignBtn":"Assign Selected","reassign.assigning":"Assigning...","reassign.differentCompanyWarning":"Warning: Some selected users are from a different company than the current owner. Are you sure you want to proceed?","reassign.success":"Project assigned successfully. All assigned users have been notified by email.","reassign.error":["Failed to assign project: ","error",""],"reassign.loading":"Loading users..."}');
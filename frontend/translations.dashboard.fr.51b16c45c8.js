@@ -0,0 +1,2 @@
+// Generated by _replace_strings.py --build-translations. Do not edit.
+(self.translationsFlat || (self.translationsFlat = {}))["fr"] = JSON.parse('{"common.loading":"Chargement...","common.delete":"Supprimer","common.view":"Voir","common.copy":"Copier","common.assign":"Assigner","common.new":"Nouveau","common.selectAll":"Tout sélectionner","common.admin":"ADMIN","common.limited":"LIMITÉ","common.unknown":"Inconnu","admin.adminPanel":"Panneau d\'administration","admin.cfssCalculation":"Calcul CFSS","admin.manageUsers":"Gérer les utilisateurs","admin.verifyBulkProjects":"Vérifier les projets en lot","admin.emailClassifications":"Classifications des courriels","admin.newProjectSheets":"Nouveau projet (Sheets)","admin.adminRequired":"Accès administrateur requis","admin.accessRestricted":"Accès restreint","dashboard.projects":"Projets","dashboard.searchProjects":"Rechercher des projets...","dashboard.allStatus":"Tous les statuts","dashboard.allCategories":"Toutes les catégories","dashboard.noProjectsFound":"Aucun projet sismique trouvé. Créez votre premier projet sismique pour commencer !","dashboard.errorLoadingProjects":"Erreur de chargement des projets sismiques : ","dashboard.total":"Total","dashboard.planning":"Planification","dashboard.active":"Actif","dashboard.done":"Terminé","status.planning":"Planification","status.inProgress":"En cours","status.completed":"Terminé","domains.plumbing":"Plomberie","domains.electricity":"Électricité","domains.interiorSystem":"Système intérieur","domains.sprinklers":"Gicleurs","domains.ventilation":"Ventilation","project.projectDuplicated":"Projet dupliqué avec succès !","project.deleteConfirm":"Êtes-vous sûr de vouloir supprimer ce projet ?","project.projectDeleted":"Projet supprimé avec succès !","project.errorDeleting":"Erreur lors de la suppression du projet. Veuillez réessayer.","project.errorDuplicating":"Erreur lors de la duplication du projet : ","bulk.deleteCount":["Supprimer ","count"," projet(s) sélectionné(s) ? Cette action est irréversible."],"bulk.deletedCount":["","success"," projet(s) supprimé(s). ","fail"," échoué(s)."],"dataExport.comingSoon":"Fonctionnalité d\'exportation bientôt disponible !","reassign.title":"Assigner le projet","reassign.currentOwner":"Propriétaire actuel","reassign.searchPlaceholder":"Rechercher par nom, courriel ou entreprise...","reassign.searchPrompt":"Tapez pour rechercher des utilisateurs","reassign.noUsersFound":"Aucun utilisateur trouvé correspondant à votre recherche.","reassign.noCompany":"Aucune entreprise","reassign.assignBtn":"Assigner la sélection","reassign.assigning":"Assignation...","reassign.differentCompanyWarning":"Attention : Certains utilisateurs sélectionnés sont d\'une entreprise différente du propriétaire actuel. Êtes-vous sûr de vouloir continuer ?","reassign.success":"Projet assigné avec succès. Tous les utilisateurs assignés ont été notifiés par courriel.","reassign.error":["Échec de l\'assignation du projet : ","error",""],"reassign.loading":"Chargement des utilisateurs..."}');
@@ -0,0 +1,2 @@
+// Generated by _replace_strings.py --build-translations. Do not edit.
+(self.translationsFlat || (self.translationsFlat = {}))["en"] = JSON.parse('{"common.loading":"Loading...","common.admin":"ADMIN","common.limited":"LIMITED","common.refresh":"Refresh","common.backToDashboard":"Back to Dashboard","email.title":"Email Classifications","email.allTime":"All Time","email.clearFilters":"Clear Filters","email.dateRange":"Date Range","email.deleteSelected":"Delete Selected","email.filterByColumn":"Filter by Column","email.filterValue":"Filter Value","email.selectColumn":"Select column...","email.showing":"Showing","email.thisMonth":"This Month","email.thisWeek":"This Week","email.thisYear":"This Year","email.today":"Today","email.total":"Total","email.typeToFilter":"Type to filter..."}');
@@ -0,0 +1,2 @@
+// Generated by _replace_strings.py --build-translations. Do not edit.
+(self.translationsFlat || (self.translationsFlat = {}))["fr"] = JSON.parse('{"common.loading":"Chargement...","common.admin":"ADMIN","common.limited":"LIMITÉ","common.refresh":"Rafraîchir","common.backToDashboard":"Retour au tableau de bord","email.title":"Classifications des courriels","email.allTime":"Toutes les périodes","email.clearFilters":"Effacer les filtres","email.dateRange":"Période","email.deleteSelected":"Supprimer la sélection","email.filterByColumn":"Filtrer par colonne","email.filterValue":"Valeur du filtre","email.selectColumn":"Sélectionner une colonne...","email.showing":"Affichage","email.thisMonth":"Ce mois-ci","email.thisWeek":"Cette semaine","email.thisYear":"Cette année","email.today":"Aujourd\'hui","email.total":"Total","email.typeToFilter":"Taper pour filtrer..."}');
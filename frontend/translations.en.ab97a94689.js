@@ -0,0 +1,2 @@
+// Generated by _replace_strings.py --build-translations. Do not edit.
+(self.translationsFlat || (self.translationsFlat = {}))["en"] = JSON.parse('{"common.loading":"Loading...","common.loadingProject":"Loading Project...","common.loadingAuth":"Loading authentication...","common.loadingUsers":"Loading users...","common.loadingProjects":"Loading CFSS Projects...","common.save":"Save","common.saving":"Saving...","common.cancel":"Cancel","common.delete":"Delete","common.close":"Close","common.edit":"Edit","common.view":"View","common.copy":"Copy","common.assign":"Assign","common.new":"New","common.add":"Add","common.upload":"Upload","common.download":"Download","common.search":"Search","common.filter":"Filter","common.back":"Back","common.next":"Next","common.yes":"Yes","common.no":"No","common.ok":"OK","common.retry":"Retry","common.submit":"Submit","common.confirm":"Confirm","common.error":"Error","common.success":"Success","common.warning":"Warning","common.selectAll":"Select All","common.deleteSelected":"Delete Selected","common.noResults":"No results found.","common.dashboard":"Dashboard","common.admin":"ADMIN","common.limited":"LIMITED","common.logout":"Logout","common.createdBy":"Created by:","common.thisIsYou":"This is you","common.unknown":"Unknown","common.none":"None","common.notAvailable":"N/A","common.optional":"optional","common.browse":"Browse","common.remove":"Remove","common.details":"Details","common.duplicate":"Duplicate","common.installApp":"Install App","common.hide":"Hide","common.hideDetails":"Hide Details","common.hideForm":"Hide Form","common.saveChanges":"Save Changes","common.uploading":"Uploading...","common.adding":"Adding...","common.noDescription":"No description","common.notSpecified":"Not specified","common.calculate":"Calculate","common.cancelEdit":"Cancel Edit","common.fillRequiredFields":"Please fill in all required fields.","common.note":"Note:","common.refresh":"Refresh","common.backToDashboard":"Back to Dashboard","common.loadingImage":"Loading image...","common.loadingProjectDetails":"Loading project details...","common.accessDenied":"Access Denied","common.authRequired":"Authentication Required","common.goToLogin":"Go to Login","common.actions":"Actions","common.date":"Date","common.select":"Select","common.selectOption":"Select an option","common.uploadFile":"Upload File","nav.protectionSismique":"Protection Sismique","nav.protectionSismiqueCFSS":"Protection Sismique - CFSS","nav.dashboard":"Dashboard","nav.backToDashboard":"Back to Dashboard","admin.adminPanel":"Admin Panel","admin.cfssCalculation":"CFSS Calculation","admin.seismicCalculation":"Seismic Calculation","admin.manageUsers":"Manage Users","admin.viewAllProjects":"View All Projects","admin.verifyBulkProjects":"Verify Bulk Projects","admin.emailClassifications":"Email Classifications","admin.newProjectSheets":"New Project (Sheets)","admin.adminRequired":"Admin access required","admin.accessRestricted":"Access restricted","admin.showingAllProjects":"Showing all projects in the system","admin.showingAllCFSS":"Showing all CFSS projects in the system","auth.login":"Login","auth.signUp":"Sign Up","auth.resetPassword":"Reset Password","auth.createAccount":"Create Account","auth.email":"Email:","auth.password":"Password:","auth.confirmPassword":"Confirm Password:","auth.firstName":"First Name:","auth.lastName":"Last Name:","auth.company":"Company:","auth.phoneNumber":"Phone Number:","auth.domain":"Domain:","auth.selectDomain":"Select domain","auth.forgotPassword":"Forgot Password?","auth.backToLogin":"Back to Login","auth.sendResetCode":"Send Reset Code","auth.resendCode":"Resend Code","auth.verifyYourEmail":"Verify Your Email","auth.enterNewPassword":"Enter New Password","auth.verificationCode":"Verification Code:","auth.newPassword":"New Password:","auth.confirmNewPassword":"Confirm New Password:","auth.verify":"Verify","auth.enterEmail":"Enter your email","auth.enterCode":"Enter 6-digit code","auth.verificationCodePlaceholder":"Verification code","auth.showPassword":"Show password","auth.hidePassword":"Hide password","auth.resetPasswordDesc":"Enter your email address and we\'ll send you a verification code to reset your password.","auth.enterNewPasswordDesc":"Enter the verification code sent to your email and choose a new password.","auth.enterVerificationCode":"Enter the verification code sent to your email:","auth.separateEmails":"Separate multiple emails with commas","auth.pleaseLogin":"Please login to create projects","auth.pleaseLoginCFSS":"Please login to create CFSS projects","auth.fillAllFields":"Please fill in all fields","auth.passwordsNoMatch":"Passwords do not match","auth.passwordMinLength":"Password must be at least 8 characters","auth.phoneFormat":"Phone number must be in E.164 format (e.g., +15551234567)","auth.authNotReady":"Authentication system not ready. Please wait or refresh the page.","auth.invalidCredentials":"Invalid email or password","auth.verifyEmailFirst":"Please verify your email first","auth.userNotFound":"User not found","auth.loginFailed":"Login failed","auth.loginSuccess":"Login successful! Redirecting...","auth.loginError":"Login error: Could not verify account status","auth.accountExists":"An account with this email already exists","auth.passwordRequirements":"Password must contain uppercase, lowercase, numbers and special characters","auth.signupFailed":"Signup failed","auth.accountCreated":"Account created! Please check your email for verification code.","auth.emailVerified":"Email verified! Waiting for admins to authorize your account. You will receive an email once approved.","auth.verificationSent":"Verification code sent to your email!","auth.verificationCodeSent":"Verification code sent! Check your email.","auth.newCodeSent":"New verification code sent! Check your email.","auth.noAccountFound":"No account found with this email address","auth.emailInvalid":"Email address is invalid","auth.tooManyAttempts":"Too many attempts. Please try again later","auth.failedSendCode":"Failed to send reset code","auth.invalidCode":"Invalid verification code. Please check and try again","auth.codeExpired":"Verification code has expired. Please request a new one","auth.invalidPasswordFormat":"Invalid password format. Please check requirements","auth.passwordResetSuccess":"Password reset successful! You can now log in with your new password.","auth.passwordResetFailed":"Password reset failed","auth.pleaseEnterEmail":"Please enter your email address","auth.pleaseEnterCode":"Please enter verification code","auth.noUserToVerify":"No user to verify","auth.failedResendCode":"Failed to resend code","auth.tooManyAttemptsWait":"Too many attempts. Please wait a few minutes and try again","auth.initiateResetFirst":"Please initiate password reset first","auth.newVerificationCode":"New verification code sent!","auth.alreadyLoggedIn":"You are already logged in. Redirecting...","auth.authSystemReady":"Authentication system loaded successfully","auth.authInitFailed":"Failed to initialize authentication. Please refresh the page.","auth.needsApproval":"Your account needs admin approval. Admins have been notified and will review your account.","auth.pendingApproval":"Your account is pending admin approval. Please wait for confirmation email.","auth.notApproved":"Your account is not approved. Please contact admin.","auth.sessionExpired":"Session expired. Please login again.","auth.authError":"Authentication error. Please login again.","auth.noUserToResend":"No user to resend code to","auth.verificationFailed":"Verification failed: ","auth.authenticationRequired":"Authentication Required","auth.pleaseLoginCFSSDetails":"Please log in to view CFSS project details.","auth.goToLogin":"Go to Login","auth.accessDenied":"Access Denied","auth.noPermissionCFSS":"You don\'t have permission to view this CFSS project.","auth.confirmLogout":"Are you sure you want to logout?","dashboard.projectDashboard":"Project Dashboard","dashboard.createNewProject":"Create New Project","dashboard.allProjects":"All Projects","dashboard.projects":"Projects","dashboard.cfssProjects":"CFSS Projects","dashboard.searchProjects":"Search projects...","dashboard.allStatus":"All Status","dashboard.allCategories":"All Categories","dashboard.noProjectsFound":"No seismic projects found. Create your first seismic project to get started!","dashboard.noCFSSProjectsFound":"No CFSS projects found. Create your first CFSS project to get started!","dashboard.errorLoadingProjects":"Error loading seismic projects: ","dashboard.errorLoadingCFSS":"Error Loading CFSS Projects","dashboard.newCFSSProject":"New CFSS Project","dashboard.totalCFSS":"Total CFSS","dashboard.total":"Total","dashboard.planning":"Planning","dashboard.active":"Active","dashboard.done":"Done","dashboard.noProjectsBasic":"No projects found. Create your first project to get started!","dashboard.errorFiltering":"Error filtering projects: ","dashboard.errorInitDashboard":"Error initializing dashboard: ","dashboard.errorDeletingCFSS":"Error deleting CFSS project: ","status.planning":"Planning","status.inProgress":"In Progress","status.completed":"Completed","domains.plumbing":"Plumbing","domains.electricity":"Electricity","domains.interiorSystem":"Interior System","domains.sprinklers":"Sprinklers","domains.ventilation":"Ventilation","types.condo":"Condo","types.commercial":"Commercial","types.residential":"Residential","types.industrial":"Industrial","types.hospital":"Hospital","types.fireStation":"Fire-station","types.government":"Government","types.school":"School","types.other":"Other","createProject.createNewProject":"Create New Project","createProject.createNewCFSSProject":"Create New CFSS Project","createProject.projectName":"Project Name:","createProject.projectNumber":"Project Number:","createProject.clientName":"Client Name:","createProject.clientEmails":"Client Email(s):","createProject.description":"Description:","createProject.descriptionOptional":"Description (optional):","createProject.type":"Type:","createProject.addressLine1":"Address Line 1:","createProject.addressLine2":"Address Line 2:","createProject.city":"City:","createProject.province":"Province:","createProject.country":"Country:","createProject.projectNumberOptional":"Project Number (optional):","createProject.numberOfFloors":"Number of Floors (optional):","createProject.createProject":"Create Project","createProject.createCFSSProject":"Create CFSS Project","createProject.creatingProject":"Creating Project...","createProject.creatingCFSSProject":"Creating CFSS Project...","createProject.projectCreated":"Project created successfully!","createProject.cfssProjectCreated":"CFSS Project created successfully!","createProject.errorCreating":"Error creating project: ","createProject.errorCreatingCFSS":"Error creating CFSS project: ","createProject.emailPlaceholder":"email@example.com, email2@example.com","createProject.companyName":"Company Name:","createProject.deflectionMax":"Deflection Max:","createProject.enterClientName":"Enter client name...","createProject.enterDescription":"Enter description...","createProject.enterLocation":"Enter location...","createProject.enterProjectName":"Enter project name...","createProject.selectDeflection":"Select deflection max...","createProject.selectThickness":"Select thickness min...","createProject.thicknessMin":"Thickness Min:","project.projectDetails":"Project Details","project.cfssProjectDetails":"CFSS Project Details","project.basicInformation":"Basic Information","project.seismicParameters":"Seismic Parameters","project.equipmentList":"Equipment List","project.addEquipment":"Add Equipment","project.model":"Model","project.tag":"Tag","project.level":"Level","project.generateReport":"Generate Report","project.deleteEquipmentConfirm":"Are you sure you want to delete this equipment?","project.logoutConfirm":"Are you sure you want to logout?","project.status":"Status:","project.address":"Address:","project.numberOfFloors":"Number of Floors:","project.lat":"Lat:","project.long":"Long:","project.finalRisk":"Final Risk:","project.projectDuplicated":"Project duplicated successfully!","project.cfssProjectDuplicated":"CFSS Project duplicated successfully!","project.deleteConfirm":"Are you sure you want to delete this project?","project.deleteCFSSConfirm":"Are you sure you want to delete this CFSS project?","project.projectDeleted":"Project deleted successfully!","project.errorDeleting":"Error deleting project. Please try again.","project.errorDuplicating":"Error duplicating project: ","project.type":"Type:","project.domain":"Domain:","project.created":"Created","project.deleteSuccess":"Project deleted successfully!","project.deleteError":"Error deleting project: ","project.createdBy":"Created by","project.noAddress":"No address","project.cfssProject":"CFSS Project","project.errorCreating":"Error creating project: ","project.enterProjectName":"Please enter a project name","project.cfssProjectCreatedSuccess":"CFSS Project created successfully!","project.errorInitPage":"Error initializing page: ","project.pleaseWaitLoading":"Please wait while we load the project details.","project.authRequired":"Authentication Required","project.pleaseLoginToView":"Please log in to view project details.","project.goToLogin":"Go to Login","project.accessDenied":"Access Denied","project.noPermission":"You don\'t have permission to view this project.","project.projectName":"Project Name:","project.companyName":"Company Name:","project.clientName":"Client Name:","project.description":"Description:","project.newEquipment":"New Equipment","project.equipment":"Equipment:","project.selectOrTypeEquipment":"Select or type equipment...","project.voiceInput":"Voice input","project.voiceMode":"Voice Mode","project.voiceModeActive":"Voice mode active — tap any field to speak","project.voiceModeOff":"Voice mode off","project.voiceNoMatch":"No match found","project.modelLabel":"Model: (optional)","project.enterModel":"Enter equipment model...","project.tagLabel":"Tag: (optional)","project.enterTag":"Enter equipment tag...","project.levelLabel":"Level: (optional)","project.whatWouldYouLikeToDo":"What would you like to do?","project.seismicCalculation":"Seismic Calculation","project.fullEngineeringAnalysis":"Full engineering analysis","project.addPhotosForCertification":"Add Photos for Certification","project.documentationOnly":"Documentation only","project.switch":"Switch","project.nbcCategory":"NBC Category:","project.selectNbcCategory":"Select NBC category...","project.pipeType":"Pipe Type:","project.selectPipeType":"Select pipe type...","project.steelPipe":"Steel Pipe","project.copperPipe":"Copper Pipe","project.pvcPipe":"PVC Pipe","project.noHubPipe":"No Hub Pipe","project.installMethodLabel":"Install Method:","project.selectInstallMethod":"Select install method...","project.fixedToSlab":"Fixed to Slab","project.fixedToWall":"Fixed to Wall","project.fixedToStructure":"Fixed to Structure","project.fixedToCeiling":"Fixed to Ceiling","project.fixedToRoof":"Fixed to Roof","project.fixedToInteriorWall":"Fixed to Interior Wall","project.fixedToWoodenSleeper":"Fixed to Wooden Sleeper","project.weight":"Weight:","project.dimensions":"Dimensions HxWxL (inches):","project.height":"Height","project.width":"Width","project.length":"Length","project.hxLabel":"Equipment Height Above Base (hx) in meters:","project.pipeWeightPerFoot":"Pipe Weight per Foot (lb/ft):","project.pipeDiameter":"Pipe Diameter:","project.selectDiameter":"Select diameter...","project.supportType":"Support Type:","project.individualClevis":"Individual Clevis","project.trapeze":"Trapeze","project.structureType":"Structure Type:","project.concreteSlab":"Concrete Slab","project.concreteDeck":"Concrete Deck","project.structuralSteel":"Structural Steel","project.woodStructure":"Wood Structure","project.numberOfAnchors":"Number of Anchors:","project.anchorTypeLabel":"Anchor Type:","project.selectAnchorType":"Select anchor type...","project.expansionAnchor":"KWIK BOLT TZ2 Expansion anchor","project.screwAnchor":"KWIK HUS EZ Screw anchor","project.anchorDiameter":"Anchor Diameter (inches):","project.selectAnchorTypeFirst":"Select anchor type first...","project.slabThickness":"Slab Thickness (inches):","project.selectFc":"Select f\'c...","project.mountingTypeLabel":"Mounting Type:","project.selectMountingType":"Select mounting type...","project.noIsolators":"1. No isolators","project.type31":"2. Restrained with Type 3-1 vibration isolators","project.type32":"3. Restrained with Type 3-2 vibration isolators","project.type35a":"4. Restrained with Type 3-5A vibration isolators","project.type35b":"5. Restrained with Type 3-5B vibration isolators","project.type35c":"6. Restrained with Type 3-5C vibration isolators","project.type35d":"7. Restrained with Type 3-5D vibration isolators","project.type310":"8. Restrained with Type 3-10 seismic snubbers","project.type311":"9. Restrained with Type 3-11 seismic snubbers","project.isolatorWidth":"Isolator/Snubber Width (B) in inches:","project.restraintHeight":"Height to Restraint Connection (H) in inches:","project.edgeDistanceA":"Edge Distance A (a) in inches:","project.edgeDistanceB":"Edge Distance B (b) in inches:","project.numberOfIsolators":"Number of Isolators/Snubbers (N):","project.hnLabel":"Total Building Height (hn) in meters:","project.images":"Images:","project.browse":"Browse","project.uploadImages":"Upload Images","project.dropOrPasteImages":"Drop or paste images here (Ctrl+V)","project.calculate":"Calculate","project.saveAndCloseForm":"Save and Close Form","project.equipmentImage":"Equipment Image","project.selectEquipmentToViewImage":"Select equipment and installation method to view image","project.calculationResults":"Calculation Results","project.clickCalculate":"Click \\"Calculate\\" to see detailed analysis and calculations","project.projectSetupRequired":"Project Setup Required","project.floorsRequiredMessage":"To perform seismic calculations, we need to know the total number of floors in this building.","project.numberOfFloorsRequired":"Number of Floors *","project.enterTotalFloors":"Enter total floors","project.saveAndContinue":"Save & Continue","project.installMethod.fixedToSlab":"Fixed to Slab","project.installMethod.fixedToWall":"Fixed to Wall","project.installMethod.fixedToStructure":"Fixed to Structure","project.installMethod.fixedToCeiling":"Fixed to Ceiling","project.installMethod.fixedToRoof":"Fixed to Roof","project.installMethod.fixedToInteriorWall":"Fixed to Interior Wall","project.installMethod.fixedToWoodenSleeper":"Fixed to Wooden Sleeper","project.mountingType.noIsolators":"No Isolators","project.mountingType.type31":"Type 3-1 vibration isolators","project.mountingType.type32":"Type 3-2 vibration isolators","project.mountingType.type35a":"Type 3-5A vibration isolators","project.mountingType.type35b":"Type 3-5B vibration isolators","project.mountingType.type35c":"Type 3-5C vibration isolators","project.mountingType.type35d":"Type 3-5D vibration isolators","project.mountingType.type310":"Type 3-10 seismic snubbers","project.mountingType.type311":"Type 3-11 seismic snubbers","project.mountingType.unknown":"Unknown mounting type","project.anchorType.expansion":"Expansion anchor","project.anchorType.screw":"Screw anchor","project.anchorType.unknown":"Unknown anchor type","project.addressLine1":"Address Line 1:","project.addressLine2":"Address Line 2:","project.city":"City:","project.province":"Province:","project.country":"Country:","project.projectNumber":"Project Number:","project.clientEmails":"Client Email(s):","project.designedBy":"Designed by:","project.approvedBy":"Approved by:","project.separateEmailsComma":"Separate multiple emails with commas","project.editProjectDetails":"Edit Project Details","project.noEditPermission":"You don\'t have permission to edit this project.","project.detailsUpdated":"Project details updated successfully!","project.errorSavingDetails":"Error saving project details","project.nextProjectNumber":"Next Project Number","project.clientInformation":"Client Information","project.companyDivision":"Company / Division","project.zoneDistance":"Zone / Distance","project.classification":"Classification","project.clearForm":"Clear Form","project.projectAddress":"Project Address","project.projectField":"Field","project.projectNamePlaceholder":"Enter project name...","project.contactEmail":"Contact Email:","project.contactEmailPlaceholder":"email@example.com","project.contractType":"Contract Type:","project.entrepreneur":"Entrepreneur:","project.selectEntrepreneur":"Select entrepreneur...","project.selectField":"Select field...","project.estimationAmount":"Estimation Amount:","project.openingDate":"Opening Date:","project.financial":"Financial","project.sousCategorie":"Sub-Category:","project.promoCode":"Promo Code:","project.promoCodePlaceholder":"Enter promo code...","project.fullAddressPlaceholder":"Full address...","project.selectZone":"Select zone...","project.startTypingClient":"Start typing client name...","project.createNewProject":"Create New Project","project.createProject":"Create Project","project.createdOn":"Created on","project.lastUpdated":"Last Updated","project.noProjectIdSpecified":"No project ID specified.","project.errorLoadingProject":"Error loading project","project.selectFile":"Select File","project.pasteLink":"Paste Link","project.enterFileName":"Please enter a file name.","project.onlyHttpsAllowed":"Only HTTPS links are allowed.","project.enterValidUrl":"Please enter a valid URL.","project.linkAddedSuccessfully":"Link added successfully!","project.errorAddingLink":"Error adding link","project.fileUploadedSuccessfully":"File uploaded successfully!","project.errorUploadingFile":"Error uploading file","project.fileNotFound":"File not found.","project.errorDownloadingFile":"Error downloading file","project.confirmDeleteFile":"Are you sure you want to delete this file?","project.fileDeletedSuccessfully":"File deleted successfully!","project.errorDeletingFile":"Error deleting file","project.errorSavingProject":"Error saving project","project.projectNotLoaded":"Project not loaded.","project.noProjectId":"No project ID specified.","project.actionRequired":"Action Required","project.aircraftCable":"Aircraft Cable","project.allowableShear":"Allowable Shear","project.allowableTension":"Allowable Tension","project.amplificationFactor":"Amplification Factor","project.analysisResults":"Analysis Results","project.anchor":"Anchor","project.anchorBoltShear":"Anchor Bolt Shear","project.anchorBoltTension":"Anchor Bolt Tension","project.anchorCannotProvideSufficientCapacity":["The ⌀","diameter","\\" anchor cannot provide sufficient capacity"],"project.anchorDiameterRecommendation":"Anchor Diameter Recommendation","project.anchors":"anchors","project.ashraeAnchorBoltAnalysis":"ASHRAE Anchor Bolt Analysis","project.ashraeCalcRequiresParams":"ASHRAE calculation requires equipment parameters","project.ashraeTboltCalcTitle":"ASHRAE Anchor Bolt Tension (Tbolt) Calculation","project.ashraeVboltCalcTitle":"ASHRAE Anchor Bolt Shear (Vbolt) Calculation","project.boltShear":"Bolt Shear","project.boltTension":"Bolt Tension","project.bothFormulasPass":"Both formulas pass","project.braceMembers":"Brace Members","project.bracePosition":"Brace Position","project.breakdown":"Breakdown","project.breakingStrength":"Breaking Strength","project.buildingHeight":"Building Height","project.cableBrace":"Cable Brace","project.cableBraceOption":"Cable Brace Option","project.cableBraceOptions":"Cable Brace Options","project.cableRequired":"Cable Required","project.cableSize":"Cable Size","project.calcOnlyVibrationIsolated":"This calculation is only available for vibration-isolated equipment","project.calculatedAs":"calculated as","project.calculation":"Calculation","project.cancelRequest":"Cancel Request","project.cantFindImage":["Cannot find image: ","name",""],"project.centerOfGravity":"center of gravity","project.cfsCalcTitle":"CFS Seismic Force Coefficient Calculation","project.changeAnchorDiameter":"Change anchor diameter in the equipment form","project.channelStrut":"Channel Strut","project.clickCalculateToSeeDetails":"Click \\"Calculate\\" to see detailed analysis","project.clickToSeeASHRAETboltDetails":"Click to see ASHRAE Tbolt details","project.clickToSeeASHRAEVboltDetails":"Click to see ASHRAE Vbolt details","project.clickToSeeBracingSpecs":"Click to see bracing specifications","project.clickToSeeCableDetails":"Click to see cable details","project.clickToSeeCFSDetails":"Click to see CFS calculation details","project.clickToSeeCompleteSpecs":"Click to see complete specifications","project.clickToSeeConcreteEmbedmentDetails":"Click to see concrete embedment details","project.clickToSeeEmbedmentDetails":"Click to see embedment details","project.clickToSeeFinalEmbedmentCalc":"Click to see final embedment calculation","project.clickToSeeFormula1Details":"Click to see Formula 1 details","project.clickToSeeFormula2Details":"Click to see Formula 2 details","project.clickToSeeHangerRodSpecs":"Click to see hanger rod specifications","project.clickToSeeLateralForceDetails":"Click to see lateral force calculation details","project.clickToSeeMaxCompressionDetails":"Click to see maximum compression details","project.clickToSeeMaxShearDetails":"Click to see maximum shear details","project.clickToSeeMaxTensionDetails":"Click to see maximum tension details","project.clickToSeeNBCVpDetails":"Click to see NBC Vp calculation details","project.clickToSeeOTMDetails":"Click to see OTM details","project.clickToSeeRMDetails":"Click to see RM details","project.clickToSeeShearDetails":"Click to see shear calculation details","project.clickToSeeSteelEmbedmentDetails":"Click to see steel embedment details","project.clickToSeeTensionDetails":"Click to see tension calculation details","project.clips":"Clips","project.coeffLateralSeismicForce":"Coefficient of Lateral Seismic Force","project.componentFactor":"Component Factor","project.concrete":"Concrete","project.concreteAnalysisNotAvailable":"Concrete analysis not available for this equipment","project.concreteFailure":"Concrete Failure","project.concreteFailureEmbedmentTitle":"Concrete Failure Embedment Analysis","project.concreteFormula1Title":"ASHRAE Concrete Structural Analysis - Formula (11-36)","project.concreteFormula2Title":"ASHRAE Concrete Structural Analysis - Formula (11-37)","project.concreteStrength":"Concrete Strength","project.concreteTensionCapacity":"Concrete Tension Capacity","project.connectionType":"Connection Type","project.constant":"Constant","project.currentAnchorInsufficient":"Current anchor diameter is insufficient","project.currentBadge":"Current","project.currentConfiguration":"Current Configuration","project.currentDiameterInsufficient":["Current ⌀","diameter","\\" diameter is insufficient"],"project.deleteImage":"Delete image","project.deleteImageConfirm":"Are you sure you want to delete this image?","project.deleteSelectedConfirm":["Delete ","count"," selected equipment item(s)? This cannot be undone."],"project.designRule":"Design Rule","project.determineMinEmbedment":"Determine minimum embedment depth","project.diameter":"Diameter","project.dropImageHere":"Drop image here","project.dropOrPasteImagesCount":["","count"," image(s) selected"],"project.dropOrPasteToAddMore":"Drop or paste to add more","project.editEquipment":"Edit Equipment","project.embedmentAnalysisNotAvailable":"Embedment analysis not available","project.equipmentHeight":"Equipment Height","project.equipmentImages":"Equipment Images","project.equipmentNotFound":"Equipment not found","project.equipmentSaved":"Equipment saved successfully!","project.equipmentUpdated":"Equipment updated successfully!","project.equipmentUpdatedSuccess":"Equipment updated successfully!","project.equipmentWeight":"Equipment Weight","project.errorCalculatingEquipment":"Error calculating equipment","project.errorDeletingEquipment":"Error deleting equipment","project.errorGeneratingReport":"Error generating report","project.errorLoadingImage":"Error loading image","project.errorNoProjectSelected":"No project selected","project.errorSavingEquipment":"Error saving equipment","project.errorSavingEquipmentChanges":"Error saving equipment changes","project.errorSavingFloors":"Error saving floors","project.errorUpdatingImageRequest":"Error updating image request","project.fail":"FAIL","project.failedDeleteImage":"Failed to delete image","project.failedDuplicateEquipment":"Failed to duplicate equipment","project.failedToProcessFile":["Failed to process file: ","name",""],"project.failedToUpload":"Failed to upload","project.finalMinEmbedmentResult":"Final Minimum Embedment","project.finalMinEmbedmentTitle":"Final Minimum Embedment","project.force":"Force","project.forces":"Forces","project.formula":"Formula","project.formula1":"Formula 1","project.formula2":"Formula 2","project.formulaVariesByMountingType":"Formula varies by mounting type","project.fromCFSCalc":"from CFS calculation","project.generatingPDF":"Generating PDF...","project.geometry":"Geometry","project.geometryAngles":"Geometry and Angles","project.governingEmbedmentNote":"The governing embedment is the largest required by all applicable checks","project.governingRequirement":"Governing Requirement","project.greaterConcreteBreakoutCapacity":"Greater concrete breakout capacity","project.hangerRod":"Hanger Rod","project.hangerRods":"Hanger Rods","project.hangerRodSpecs":"Hanger Rod Specifications","project.heightAboveBase":"Height Above Base","project.heightCoefficient":"Height Coefficient","project.heightFactor":"Height Factor","project.heightLower":"height","project.heightToRestraint":"Height to Restraint","project.higherSteelShearCapacity":"Higher steel shear capacity","project.higherSteelTensileCapacity":"Higher steel tensile capacity","project.horizontalForce":"Horizontal Force","project.horizontalSeismicForce":"Horizontal Seismic Force","project.image":"Image","project.imageNotAvailable":"Image not available","project.imageOf":"Image of","project.imageRequestAdditional":"Request additional image","project.imageRequestSent":"Image request sent","project.imageRequestSuccess":["Image request ","action"," successfully"],"project.imageRequestUpload":"Upload image","project.imageUploadFailedWarning":"Image upload failed. Equipment saved without image.","project.imagesUploadedSuccess":["","count"," image(s) uploaded successfully"],"project.importanceFactor":"Importance Factor","project.insufficient":"insufficient","project.largerAnchorsHave":"Larger anchors have:","project.largerDiameter":"larger diameter","project.largerOfTwoEmbedments":"Larger of the two embedment values","project.largestCableInsufficient":"Largest available cable is insufficient","project.lateralForce":"Lateral Force","project.lateralForceCalcTitle":"Lateral Seismic Force Calculation","project.lbsMinBreakingStrength":"lbs min breaking strength","project.lbsPerBolt":"lbs/bolt","project.limitedBetweenPerNBC":"limited between min and max values per NBC","project.maxImagesAllowed":["Maximum ","max"," images allowed"],"project.maxImagesReached":["Maximum of ","max"," images reached"],"project.maxImagesReachedCount":["Max ","max"," images reached"],"project.maxImagesReachedShort":"Max images reached","project.maximumLength":"Maximum Length","project.maximumShear":"Maximum Shear","project.maximumTension":"Maximum Tension","project.maxLength":"Max Length","project.maxUnbraced":"Max Unbraced","project.maxUnbracedLength":"Max Unbraced Length","project.microphoneAccessDenied":"Microphone access denied","project.minimumEmbedment":"Minimum Embedment","project.minimumEmbedmentAnalysis":"Minimum Embedment Analysis","project.missingEquipmentOrInstallData":"Missing equipment or installation data","project.missingPipeTypeData":"Missing pipe type data","project.momentOfInertia":"Moment of Inertia","project.moreEmbedmentOptions":"More embedment depth options","project.neitherCapacityAdequate":"Neither capacity is adequate","project.newBadge":"New","project.newImage":"New image","project.noCalculationsForType":"No calculations available for this equipment type","project.noEquipmentSelected":"No equipment selected","project.noEquipmentYet":"No equipment added yet","project.noImagesYet":"No images yet","project.noPermissionAddEquipment":"You do not have permission to add equipment","project.noPermissionDeleteEquipment":"You do not have permission to delete equipment","project.noPermissionEditEquipment":"You do not have permission to edit equipment","project.noPermissionModify":"You do not have permission to modify this project","project.noteWeightNotIncluded":"Note: Equipment weight not included for ceiling-mounted equipment","project.numberOfAnchorBolts":"Number of Anchor Bolts","project.ofEquipmentHeight":"of equipment height","project.oneOrMoreFormulasFail":"One or more formulas fail","project.onlyAdminsCanRequestImages":"Only admins can request images","project.onlyMoreImagesCanBeAdded":["Only ","count"," more image(s) can be added"],"project.onlyUploadingImages":["Only uploading ","count"," images (max ","max",")"],"project.orClickButtonToSelect":"or click button to select","project.otmCalcTitle":"Overturning Moment (OTM) Calculation","project.overallStatus":"Overall Status","project.overturningAnalysis":"Overturning Analysis","project.overturningMoment":"Overturning Moment","project.overturningOnlyRigid":"Overturning analysis is only available for rigid mounting (no isolators)","project.parameters":"Parameters","project.pass":"PASS","project.pcCalcTitle":"Pc (Maximum Compression Force) Calculation","project.pdfGenerationTimedOut":"PDF generation timed out","project.pipe":"Pipe","project.pipeWeightExceedsTableLimits":"Pipe weight exceeds table limits","project.pipeWeightExceedsTableWarning":"⚠ Pipe weight exceeds table limits","project.pipeWeightLabel":"Pipe Weight","project.pleaseEnterEquipmentName":"Please enter equipment name","project.pleaseEnterValidFloors":"Please enter a valid number of floors","project.pleaseEnterValidPipeWeight":"Please enter a valid pipe weight","project.pleaseSelectPipeDiameter":"Please select a pipe diameter","project.pleaseSelectPipeType":"Please select a pipe type","project.pleaseSelectValidImages":"Please select valid image files","project.prestretchedCable":"Pre-stretched Cable","project.problem":"Problem","project.processingImages":["Processing ","count"," image(s)..."],"project.psCalcTitle":"Ps (Shear Force per Anchor) Calculation","project.reaction":"Reaction","project.reason":"Reason","project.recommendation":"Recommendation","project.reference":"Reference","project.removeImageToAddMore":"Remove an image to add more","project.requestImage":"Request Image","project.requiredForces":"Required Forces","project.requiredMinEmbedment":"Required Min. Embedment","project.requiredShear":"Required Shear","project.requiredTension":"Required Tension","project.requiredValues":"Required Values","project.requirements":"Requirements","project.rerunAnalysis":"Re-run the analysis","project.resistingMoment":"Resisting Moment","project.responseModificationFactor":"Response Modification Factor","project.result":"Result","project.rmCalcTitle":"Resisting Moment (RM) Calculation","project.sameAsPtCalc":"Same as Pt calculation","project.seismic":"Seismic","project.seismicLevel":"Seismic Level","project.seismicLoad":"Seismic Load","project.seismicRiskCoeff":"Seismic Risk Coefficient","project.selectNBCCategory":"Select NBC Category...","project.shearCalcTitle":"Anchor Bolt Shear (V) Calculation","project.shoppingList":"Shopping List","project.siteAccelerationCoeff":"Site Acceleration Coefficient","project.solidBrace":"Solid Brace","project.solidBraceOption":"Solid Brace Option","project.solidBraceOptions":"Solid Brace Options","project.solution":"Solution","project.spectralResponseValue":"Spectral Response Value","project.standardCable":"Standard Cable","project.steel":"Steel","project.steelAngle":"Steel Angle","project.steelFailure":"Steel Failure","project.steelFailureEmbedmentTitle":"Steel Failure Embedment Analysis","project.steelSeismicShearCapacity":"Steel Seismic Shear Capacity","project.steelStructure":"Steel Structure","project.steelTensileCapacity":"Steel Tensile Capacity","project.step":"Step","project.structuralConnection":"Structural Connection","project.structuralConnections":"Structural Connections","project.sum":"Sum","project.suspendedEquipmentBracing":"Suspended Equipment Bracing","project.suspendedEquipmentBracingASHRAE10":"Suspended Equipment Bracing (ASHRAE Ch. 10)","project.suspendedPipingBracing":"Suspended Piping Bracing","project.suspendedPipingBracingSpecs":"Suspended Piping Bracing Specifications","project.tableRefExpansionConcrete":"HILTI Expansion Anchor - Concrete Embedment Table","project.tableRefExpansionSteel":"HILTI Expansion Anchor - Steel Embedment Table","project.tableRefScrewConcrete":"HILTI Screw Anchor - Concrete Embedment Table","project.tableRefScrewSteel":"HILTI Screw Anchor - Steel Embedment Table","project.tensileStrength":"Tensile Strength","project.tensionCalcTitle":"Anchor Bolt Tension (T) Calculation","project.tensionCapacity":"Tension Capacity","project.thimble":"Thimble","project.totalShear":"Total Shear","project.totalTension":"Total Tension","project.tryLargerAnchor":["Try a ","size"," anchor"],"project.turnbuckle":"Turnbuckle","project.type31VibrationIsolatorsSnubbers":"Type 3-1 Vibration Isolators / Snubbers","project.type32VibrationIsolators":"Type 3-2 Vibration Isolators","project.uploadImage":"Upload Image","project.useEmbedmentGreaterThan":["Use embedment depth greater than ","value","\\""],"project.useLargerAnchorDiameter":"Use a larger anchor diameter","project.useLargerDiameterAndReanalyze":"Use a larger diameter and reanalyze","project.valuesUsed":"Values Used","project.verticalForce":"Vertical Force","project.verticalSeismicForce":"Vertical Seismic Force","project.vibrationIsolatedEquipment":"Vibration Isolated Equipment","project.viewImage":"View image","project.voiceInputNotSupported":"Voice input is not supported in this browser","project.widthLower":"width","project.workingLoad":"Working Load","project.workLoadLimit":"Work Load Limit","project.worstAngle":"Worst Angle","project.noSufficientEmbedmentFound":"No sufficient embedment found","cfss.cfssWindData":"CFSS Wind Data","cfss.deflectionMax":"Deflection Max:","cfss.thicknessMin":"Thickness Min:","cfss.designedBy":"Designed by:","cfss.approvedBy":"Approved by:","cfss.projectFiles":"Project Files","cfss.uploadFile":"Upload File","cfss.pasteLink":"Paste Link","cfss.fileName":"File Name","cfss.selectFile":"Select File","cfss.addWall":"Add Wall","cfss.editWall":"Edit Wall","cfss.deleteWall":"Delete Wall","cfss.deleteWallConfirm":"Are you sure you want to delete this wall and all its images?","cfss.addSoffite":"Add Soffite","cfss.editSoffite":"Edit Soffite","cfss.deleteSoffiteConfirm":"Are you sure you want to delete this soffite?","cfss.addWindow":"Add Window","cfss.deleteWindowConfirm":"Are you sure you want to delete this window?","cfss.deleteTemplateConfirm":"Delete this template?","cfss.deleteFileConfirm":"Are you sure you want to delete this file?","cfss.wallCalc":"Wall Calculator","cfss.customPages":"Custom Pages","cfss.customPageSaved":"Custom page saved successfully!","cfss.soffitesPageSaved":"Soffites page saved successfully!","cfss.deleteCustomPageConfirm":"Are you sure you want to delete this custom page?","cfss.deleteSoffitesPageConfirm":"Are you sure you want to delete this soffites page?","cfss.selectValidImage":"Please select a valid image file.","cfss.enterPageTitle":"Please enter a page title","cfss.noAddress":"No address","cfss.untitled":"Untitled","cfss.floorCalculations":"Floor Calculations","cfss.floor":"Floor","cfss.addFloor":"Add Floor","cfss.source":"Source:","cfss.enterFileName":"Enter file name...","cfss.fileType":"Type","cfss.fileDate":"Date","cfss.actions":"Actions","cfss.noFilesYet":"No files uploaded yet. Click \\"Upload File\\" to add files.","cfss.submitProjectToAdmin":"Submit Project to Admin","cfss.sendForAdminReview":"Send this project for admin review and processing.","cfss.optionList":"Option List","cfss.wallList":"Wall List","cfss.parapetList":"Parapet List","cfss.windowList":"Window List","cfss.soffitesList":"Soffites List","cfss.saveOptions":"Save Options","cfss.lisseTrouee":"Lisse Trouee","cfss.doubleLisse":"Double Lisse","cfss.lisseBasse":"Lisse Basse","cfss.parapet":"Parapet","cfss.fenetre":"Fenetre","cfss.jambagesLinteauxSeuils":"Jambages, Linteaux & Seuils","cfss.addParapet":"Add Parapet","cfss.addSoffites":"Add Soffites","cfss.newWall":"New Wall","cfss.wallName":"Wall Name:","cfss.enterWallName":"Enter wall name...","cfss.floorLabel":"Floor:","cfss.floorPlaceholder":"e.g., 2-5","cfss.floorPlaceholderParapet":"e.g., NV2 - NV3","cfss.hauteurMax":"Hauteur Max:","cfss.colombage":"Colombage:","cfss.deflexionMax":"Deflexion Max:","cfss.selectDeflexionMax":"Select deflexion max...","cfss.note":"Note:","cfss.optionalNotePlaceholder":"Optional note (max 100 characters)...","cfss.saveWall":"Save Wall","cfss.browse":"Browse","cfss.uploadImages":"Upload Images","cfss.uploadImage":"Upload Image","cfss.dropOrPasteImages":"Drop or paste images here (Ctrl+V)","cfss.dropOrPasteImage":"Drop or paste image here (Ctrl+V)","cfss.newParapet":"New Parapet","cfss.parapetName":"Parapet Name:","cfss.enterParapetName":"Enter parapet name...","cfss.parapetType":"Parapet Type:","cfss.selectParapetType":"Select Parapet Type","cfss.selectAType":"Select a type","cfss.saveParapet":"Save Parapet","cfss.newWindow":"New Window","cfss.windowType":"Window Type:","cfss.enterWindowType":"Enter window type...","cfss.selectColombage":"Select colombage...","cfss.largeurMax":"Largeur Max:","cfss.l1":"L1:","cfss.l2":"L2:","cfss.saveWindow":"Save Window","cfss.imageNotAvailable":"Image not available","cfss.newSoffite":"New Soffite","cfss.soffiteName":"Soffite name:","cfss.enterSoffiteName":"Enter soffite name...","cfss.soffiteImages":"Soffite images:","cfss.soffiteImagesHelp":"Max 2 images. Drag & drop, browse, or paste (Ctrl+V).","cfss.imageDescription":"Image description:","cfss.descriptionForImage1":"Description for image 1...","cfss.image2Description":"Image 2 description:","cfss.descriptionForImage2":"Description for image 2...","cfss.saveSoffite":"Save Soffite","cfss.selectSteelStud":"Select steel stud...","cfss.enterBottomTrack":"Please enter a bottom track.","cfss.enterDeflectionTrack":"Please enter a deflection track.","cfss.calculationError":"Calculation error","cfss.exteriorWallCalculation":"Exterior Wall Calculation","cfss.component":"Component","cfss.designation":"Designation","cfss.check":"Check","cfss.status":"Status","cfss.ratioPercent":"Ratio (%)","cfss.steelStud":"Steel Stud","cfss.mCheck":"M Check","cfss.momentCheck":"Moment Check","cfss.shearCheck":"Shear Check","cfss.combination":"Combination","cfss.deflectionCheck":"Deflection Check","cfss.webCrippling":"Web Crippling","cfss.stiffener":"stiffener","cfss.deflectionTrack":"Deflection Track","cfss.bottomTrack":"Bottom Track","cfss.detailedResults":"Detailed Results","cfss.required":"Required","cfss.allowable":"Allowable","cfss.reaction":"Reaction","cfss.capacity":"Capacity","cfss.load":"Load","cfss.selectBottomTrack":"Select bottom track...","cfss.selectDeflectionTrack":"Select deflection track...","cfss.aboutToCreateFirstRevision":["You are about to ","action",". This will create the first revision of this project."],"cfss.createFirstRevision":"Create First Revision","cfss.createNewRevision":"Create a new revision","cfss.createRevision":["Create Revision ","number",""],"cfss.revisionDescriptionOptional":"Description (optional):","cfss.max100Chars":"Max 100 characters","cfss.thisWillCreate":"This will create:","cfss.revisionNumber":["Revision ","number",""],"cfss.noCurrentRevision":"No current revision","cfss.saveWallChanges":"Save Wall Changes","cfss.updateCurrentRevision":"Update current revision","cfss.chooseHowTo":["Choose how to ","action","."],"cfss.optionalDescription":"Description (optional):","cfss.maxRevisionsReached":"Maximum number of revisions reached.","cfss.errorCreatingRevision":"Error creating revision","cfss.noRevisionsFound":"No revisions found.","cfss.noDescription":"No description","cfss.current":"Current","cfss.editDescription":"Edit description","cfss.wallCount":["","count"," wall(s)"],"cfss.by":"by","cfss.availableRevisions":["Available Revisions (","count",")"],"cfss.selectedOptions":"Selected Options:","cfss.optionsWillBeIncluded":["","count"," option(s) will be included in the report."],"cfss.noOptionsSelected":"No options selected. The report will be generated without options.","cfss.optionsFromTabIncluded":"Options from the Options tab will be included.","cfss.generateReport":"Generate Report","cfss.generateReportBtn":"Generate Report","cfss.selectRevisionForReport":"Please select a revision to generate the report.","cfss.selectRevisionForReportDesc":"Select a revision to generate the report from.","cfss.generatingReport":"Generating Report...","cfss.generatingPDF":"Generating PDF...","cfss.generatingRevisionPDF":["Generating PDF for Revision ","number","..."],"cfss.errorGeneratingReport":"Error generating report","cfss.reportSentToDrive":"Report sent to Google Drive successfully!","cfss.pdfTimedOut":"PDF generation timed out. Please try again.","cfss.revisionNotFound":"Revision not found.","cfss.revisionNoWalls":["Revision ","number"," has no walls. Please add walls before generating a report."],"cfss.noProjectSelected":"No project selected.","cfss.errorDisplayingOptions":"Error displaying options.","cfss.noWallsYet":"No walls added yet.","cfss.noWallsAddedYet":"No walls added yet.","cfss.wallsAdded":["","count"," wall(s) added"],"cfss.wallSaved":"Wall saved successfully!","cfss.wallUpdated":"Wall updated successfully!","cfss.wallImages":"Wall Images","cfss.dropImagesOrPaste":"Drop or paste images here (Ctrl+V)","cfss.dropImageOrPaste":"Drop or paste image here (Ctrl+V)","cfss.maxTwoImagesWall":"A wall can have a maximum of 2 images.","cfss.remainingImageSlots":["Only ","remaining"," image slot(s) remaining."],"cfss.selectValidImages":"Please select valid image files.","cfss.confirmDeleteWallAndImages":"Are you sure you want to delete this wall and all its images?","cfss.confirmDeleteWallNamed":["Are you sure you want to delete wall \\"","name","\\" and all its images?"],"cfss.confirmDeleteWall":"Are you sure you want to delete this wall?","cfss.failedSaveWall":"Failed to save wall.","cfss.errorSavingWall":"Error saving wall","cfss.errorSavingWalls":"Error saving walls","cfss.errorSavingWallChanges":"Error saving wall changes","cfss.errorDisplayingWallDetails":"Error displaying wall details","cfss.enterFloor":"Please enter a floor number.","cfss.enterHeightValue":"Please enter a height value.","cfss.selectUnits":"Please select units.","cfss.selectAnEspacement":"Please select a spacing (espacement).","cfss.selectMontantMetallique":"Please select a metal stud (montant métallique).","cfss.selectMontantMetallique2":"Please select a metal stud for Set 2.","cfss.selectEspacement":"Please select a spacing.","cfss.selectEspacement2":"Please select a spacing for Set 2.","cfss.enterLisseInferieure":"Please enter the bottom track (lisse inférieure).","cfss.enterLisseSuperieure":"Please enter the top track (lisse supérieure).","cfss.enterLisseInferieure2":"Please enter the bottom track for Set 2.","cfss.enterLisseSuperieure2":"Please enter the top track for Set 2.","cfss.selectEntremise":"Please select a bridging (entremise).","cfss.selectEntremise2":"Please select a bridging for Set 2.","cfss.selectEntremiseSpacing":"Please select a bridging spacing.","cfss.enterHauteurMax":"Please enter a maximum height (hauteur max).","cfss.selectHauteurMaxUnit":"Please select a unit for the maximum height.","cfss.enterConcreteAnchor":"Enter concrete anchor...","cfss.enterSteelAnchor":"Enter steel anchor...","cfss.noWallsInRevision":"No walls found in the selected revision.","cfss.noParapetsYet":"No parapets added yet.","cfss.noParapetsAddedYet":"No parapets added yet.","cfss.parapetsAdded":["","count"," parapet(s) added"],"cfss.parapetSaved":"Parapet saved successfully!","cfss.parapetUpdated":"Parapet updated successfully!","cfss.parapetUpdatedSuccessfully":"Parapet updated successfully!","cfss.parapetDeleted":"Parapet deleted successfully!","cfss.parapetNotFound":"Parapet not found.","cfss.parapetImage":"Parapet Image","cfss.errorSavingParapet":"Error saving parapet","cfss.errorUpdatingParapet":"Error updating parapet","cfss.confirmDeleteParapet":"Are you sure you want to delete this parapet?","cfss.maxOneImageParapet":"A parapet can only have one image. Please remove the existing image first.","cfss.maxOneImageParapetShort":"Maximum 1 image per parapet.","cfss.mustHaveOneComposition":"You must have at least one composition item.","cfss.maxCompositionsReached":["Maximum of ","max"," compositions reached."],"cfss.maxComps":["Max (","max",")"],"cfss.noWindowsYet":"No windows added yet.","cfss.noWindowsAddedYet":"No windows added yet.","cfss.windowsAdded":["","count"," window(s) added"],"cfss.windowSaved":"Window saved successfully!","cfss.windowUpdated":"Window updated successfully!","cfss.windowUpdatedSuccessfully":"Window updated successfully!","cfss.windowNotFound":"Window not found.","cfss.windowFormNotFound":"Window form not found.","cfss.confirmDeleteWindow":"Are you sure you want to delete this window?","cfss.selectWindowType":"Please select a window type.","cfss.enterValidDimensions":"Please enter valid dimensions.","cfss.errorUpdatingWindow":"Error updating window","cfss.errorSavingWindows":"Error saving windows","cfss.soffitesAdded":["","count"," soffite(s) added"],"cfss.noSoffitesAddedYet":"No soffites added yet.","cfss.confirmDeleteSoffite":"Are you sure you want to delete this soffite?","cfss.errorSavingSoffites":"Error saving soffites","cfss.noImagesSaveSoffiteAnyway":"No images selected. Save soffite anyway?","cfss.optionsSelected":["","count"," option(s) selected"],"cfss.optionsSaved":["","count"," option(s) saved successfully!"],"cfss.savingOptions":"Saving Options...","cfss.errorSavingOptions":"Error saving options","cfss.noPermissionModifyOptions":"You don\'t have permission to modify options.","cfss.noPermissionAddWalls":"You don\'t have permission to add walls.","cfss.noPermissionEditWalls":"You don\'t have permission to edit walls.","cfss.noPermissionDeleteWalls":"You don\'t have permission to delete walls.","cfss.noPermissionAddParapets":"You don\'t have permission to add parapets.","cfss.noPermissionEditWindows":"You don\'t have permission to edit windows.","cfss.noPermissionAddCFSSData":"You don\'t have permission to add CFSS data.","cfss.noPermissionModifyCFSSData":"You don\'t have permission to modify CFSS data.","cfss.noPermissionToView":"You don\'t have permission to view this project.","cfss.addCFSSData":"Add CFSS Data","cfss.editCFSSData":"Edit CFSS Data","cfss.hideCFSSData":"Hide CFSS Data","cfss.editCFSSDataFloors":["Edit CFSS Data (","count"," floors)"],"cfss.editCFSSDataFloorsSpecs":["Edit CFSS Data (","floors"," floors, ","specs"," specs)"],"cfss.addValidFloorData":"Please add valid floor data before saving.","cfss.dataSaved":"Data saved successfully!","cfss.errorSavingCFSSData":"Error saving CFSS data","cfss.selectFileLabel":"Select File","cfss.pasteLinkLabel":"Paste Link","cfss.enterLinkUrl":"Please enter a link URL.","cfss.fileUploaded":"File uploaded successfully!","cfss.errorUploadingFile":"Error uploading file","cfss.fileNotFound":"File not found.","cfss.errorDownloadingFile":"Error downloading file","cfss.confirmDeleteFile":"Are you sure you want to delete this file?","cfss.fileDeleted":"File deleted successfully!","cfss.errorDeletingFile":"Error deleting file","cfss.stateSaved":"State saved successfully!","cfss.errorSavingState":"Error saving state","cfss.errorSavingDescription":"Error saving description","cfss.errorReloadingData":"Error reloading data","cfss.errorUploadingImage":["Error uploading image \\"","name","\\": ","error",""],"cfss.customPagesAdded":["","count"," custom page(s) added"],"cfss.noCustomPagesYet":"No custom pages added yet.","cfss.fillWindCalcFields":"Please fill in all wind calculation fields.","cfss.noBreakdownAvailable":"No breakdown available for this storey.","cfss.exteriorWallCalc":"Exterior Wall Calc","cfss.selectAtLeast2Floors":"Please select at least 2 floors to group.","cfss.selectConsecutiveFloors":"Please select consecutive floors only.","cfss.floorsAlreadyGrouped":"One or more selected floors are already grouped.","cfss.failedSaveGrouping":"Failed to save floor grouping.","cfss.atLeastOneFloorRequired":"At least one floor is required.","cfss.floorsSavedSuccessfully":"Floors saved successfully!","cfss.colombageSet1":"Colombage Set 1","cfss.colombageSet2":"Colombage Set 2","cfss.deflexionSet1":"Deflexion Set 1","cfss.deflexionSet2":"Deflexion Set 2","cfss.set1":"Set 1","cfss.set2":"Set 2","cfss.montant":"Montant","cfss.espacement":"Espacement","cfss.dimensions":"Dimensions","cfss.height":"Height","cfss.type":"Type","cfss.widthLargeur":"Width (Largeur)","cfss.heightHauteur":"Height (Hauteur)","cfss.reference":"Reference","cfss.images":"Images","cfss.noImages":"No images","cfss.selectValidImageFiles":"Please select valid image files.","cfss.max2Images":"Max 2 images.","cfss.max2ImagesWall":"Maximum 2 images per wall.","cfss.max2ImagesParapet":"Maximum 2 images per parapet.","cfss.max2ImagesSoffite":"Maximum 2 images per soffite.","cfss.max2ImagesRemoveFirst":"Maximum 2 images. Please remove an image first.","cfss.maxImagesReached":"Maximum images reached","cfss.submit":"Submit","cfss.submitting":"Submitting...","cfss.updateSubmission":"Update Submission","cfss.projectSubmittedSuccessfully":"Project submitted successfully!","cfss.projectUpdatedSuccessfully":"Project updated successfully!","cfss.errorSubmittingProject":"Error submitting project","cfss.projectHasBeenSubmitted":"This project has been submitted.","cfss.lastSubmitted":"Last submitted","cfss.addCustomPage":"Add Custom Page","cfss.addElements":"Add Elements","cfss.addNewFloor":"Add New Floor","cfss.addNewWindow":"Add New Window","cfss.addSoffitesPage":"Add Soffites Page","cfss.backToDashboard":"Back to Dashboard","cfss.bearingLengthIn":"Bearing Length (in):","cfss.bridgingSpacingIn":"Bridging Spacing (in):","cfss.calculationResults":"Calculation Results","cfss.claddingType":"Cladding Type:","cfss.claddingWeight":"Cladding Weight:","cfss.deflectionLimit":"Deflection Limit:","cfss.enterMaxDeflection":"Enter max deflection...","cfss.enterMaxSpacing":"Enter max spacing...","cfss.enterModel":"Enter model...","cfss.enterWeight":"Enter weight...","cfss.enterFramingAssembly":"Framing Assembly:","cfss.fastenerType":"Fastener Type:","cfss.fillWallInfo":"Fill in wall information","cfss.generateWallDataSheet":"Generate Wall Data Sheet","cfss.heading":"Heading","cfss.image":"Image","cfss.jambageComposition":"Jambage Composition:","cfss.jambageType":"Jambage Type:","cfss.linteauComposition":"Linteau Composition:","cfss.linteauType":"Linteau Type:","cfss.loginToViewDetails":"Please log in to view project details.","cfss.model":"Model:","cfss.noFilesUploaded":"No files uploaded.","cfss.optionalNote":"Optional note...","cfss.pageTitle":"CFSS Project Details","cfss.projectDetails":"Project Details","cfss.properties":"Properties","cfss.review":"Review","cfss.reviewCustomPages":"Review Custom Pages","cfss.reviewOptions":"Review Options","cfss.reviewParapets":"Review Parapets","cfss.reviewWalls":"Review Walls","cfss.reviewWindows":"Review Windows","cfss.saveCFSSData":"Save CFSS Data","cfss.savePage":"Save Page","cfss.selectCladdingType":"Select cladding type...","cfss.selectElementToEdit":"Select element to edit","cfss.selectJambageType":"Select jambage type...","cfss.selectLinteauType":"Select linteau type...","cfss.selectMontant":"Select montant...","cfss.selectSeuilType":"Select seuil type...","cfss.sendReportToClients":"Send Report to Clients","cfss.seuilComposition":"Seuil Composition:","cfss.seuilType":"Seuil Type:","cfss.soffitesPages":"Soffites Pages","cfss.soffitesPagesAdded":["","count"," soffites page(s) added"],"cfss.spacingHorizontalIn":"Spacing Horizontal (in):","cfss.spacingIn":"Spacing (in):","cfss.spacingVerticalIn":"Spacing Vertical (in):","cfss.textBlock":"Text Block","cfss.thermoclip":"Thermoclip:","cfss.thermoclipDetails":"Thermoclip Details:","cfss.wallDetails":"Wall Details","cfss.weightSupportByStud":"Weight Support by Stud:","cfss.windData":"Wind Data","cfss.windloadResistanceULS":"Windload Resistance ULS:","users.userManagement":"User Management","users.searchUsers":"Search users by name or email...","users.allUsers":"All Users","users.adminsOnly":"Admins Only","users.regularUsers":"Regular Users","users.limitedUsers":"Limited Users","users.allDomains":"All Domains","users.toggleDebug":"Toggle Debug","users.totalUsers":"Total Users","users.admins":"Admins","users.regular":"Regular","users.limited":"Limited","users.activeUsers":"Active","users.company":"Company:","users.domainLabel":"Domain:","users.statusLabel":"Status:","users.joined":"Joined:","users.statusActive":"Active","users.statusDisabled":"Disabled","users.approve":"Approve","users.promoteToAdmin":"Promote to Admin","users.demoteToRegular":"Demote to Regular","users.demoteToLimited":"Demote to Limited","users.promoteToRegular":"Promote to Regular","users.deleteUser":"Delete User","users.noUsersFound":"No users found matching your criteria.","users.accessDenied":"Access denied. Admin privileges required.","users.cannotDemoteSelf":"You cannot demote yourself!","users.cannotDeleteSelf":"You cannot delete yourself!","users.confirmPromote":["Are you sure you want to promote ","email"," to admin?"],"users.confirmDemote":["Are you sure you want to remove admin privileges from ","email","?"],"users.confirmDemoteToLimited":["Are you sure you want to demote ","email"," to limited user?\\n\\nLimited users can only access CFSS projects with simplified features."],"users.confirmPromoteToRegular":["Are you sure you want to promote ","email"," to regular user?"],"users.confirmDelete":["Are you sure you want to permanently delete ","email","?\\n\\nThis action cannot be undone."],"users.confirmApprove":["Approve account for ","email","?"],"users.promotedSuccess":["","email"," has been promoted to admin successfully!\\n\\nThe user will need to log out and log back in to see admin features."],"users.demotedSuccess":["","email"," has been demoted from admin successfully!\\n\\nThe user will need to log out and log back in for changes to take effect."],"users.demotedToLimitedSuccess":["","email"," has been demoted to limited user!\\n\\nThe user will need to log out and log back in for changes to take effect."],"users.promotedToRegularSuccess":["","email"," has been promoted to regular user!\\n\\nThe user will need to log out and log back in for changes to take effect."],"users.deletedSuccess":["","email"," has been permanently deleted!"],"users.approvedSuccess":["","email"," has been approved and can now log in!"],"users.errorPromoting":"Error promoting user: ","users.errorDemoting":"Error demoting user: ","users.errorDeleting":"Error deleting user: ","users.errorApproving":"Error approving user: ","users.errorDemotingToLimited":"Error demoting user to limited: ","users.errorPromotingToRegular":"Error promoting user to regular: ","users.adminDeleteWarning":["","email"," is an ADMIN user.\\n\\nTo safely delete an admin:\\n1. First demote them to regular user\\n2. Then delete them\\nWould you like to demote them first?"],"users.sampleDataWarning":"Could not load real users from API. Showing sample data instead.\\n\\nThis is normal in demo mode. Click \\"Toggle Debug\\" to see technical details.","bulkVerify.title":"Verify Bulk Projects","bulkVerify.uploadPDFs":"Upload PDFs","bulkVerify.processing":"Processing...","bulkVerify.verifyAndSign":"Verify & Sign","bulkVerify.downloadProcessed":"Download Processed","bulkVerify.clearedAllFiles":"All files cleared.","bulkVerify.clearList":"Clear List","bulkVerify.description":"Upload PDF files to verify, sign, and flatten.","bulkVerify.downloadsStarted":"Downloads started.","bulkVerify.downloadToDrive":"Download to Drive","bulkVerify.downloadToPC":"Download to PC","bulkVerify.driveUploadStarted":["","count"," file(s) sent to Google Drive."],"bulkVerify.dropzoneBrowse":"or click to browse","bulkVerify.dropzoneDrag":"Drag & drop PDF files here","bulkVerify.failedToProcess":["","count"," file(s) failed to process."],"bulkVerify.failedToSendToDrive":"Failed to send to Google Drive","bulkVerify.failedToUpload":["","count"," file(s) failed to upload."],"bulkVerify.failedToUploadFiles":"Failed to upload files","bulkVerify.failedToVerifyFiles":"Failed to verify files","bulkVerify.fileNotReadyForDownload":"File not ready for download.","bulkVerify.filesAddedToQueue":["","count"," file(s) added to queue."],"bulkVerify.filesFailedCloudUpload":["","count"," file(s) failed cloud upload: ","fileNames",""],"bulkVerify.flattenAfterSignFailed":"Flatten after sign failed","bulkVerify.flattenedStillProcessing":"Flattened files still processing...","bulkVerify.hoursAgo":["","count"," hour(s) ago"],"bulkVerify.justNow":"Just now","bulkVerify.minutesAgo":["","count"," minute(s) ago"],"bulkVerify.noFilesForDriveTransfer":"No files for Drive transfer.","bulkVerify.noFilesQueuedYet":"No files queued yet.","bulkVerify.noNewFilesToUpload":"No new files to upload.","bulkVerify.noProcessedFilesToDownload":"No processed files to download.","bulkVerify.noVerifiedFilesForDrive":"No verified files for Drive transfer.","bulkVerify.onlyPdfAllowed":"Only PDF files are allowed.","bulkVerify.processedDescription":"Processed files will appear here.","bulkVerify.processedFiles":"Processed Files","bulkVerify.processedFilesWillAppear":"Processed files will appear here.","bulkVerify.s3UploadFailed":["S3 upload failed: ","message",""],"bulkVerify.signAndFlatten":"Sign & Flatten","bulkVerify.signed":"Signed","bulkVerify.statusError":"Error","bulkVerify.statusPending":"Pending","bulkVerify.statusUploaded":"Uploaded","bulkVerify.statusUploading":"Uploading","bulkVerify.statusVerified":"Verified","bulkVerify.statusVerifying":"Verifying","bulkVerify.successfullyProcessed":["","count"," file(s) processed successfully."],"bulkVerify.unableToStartDownload":"Unable to start download.","bulkVerify.unableToStartDownloads":"Unable to start downloads.","bulkVerify.noFilesToProcess":"No files to process. Add PDF files first.","bulkVerify.noFilesUploadedSuccessfully":"No files uploaded successfully. Cannot proceed with verification.","bulkVerify.uploadedFiles":["","count"," file(s) uploaded."],"bulkVerify.waitBeforeRemoving":"Please wait before removing.","bulkVerify.waitForCurrentOperation":"Please wait for the current operation to complete.","email.title":"Email Classifications","email.review":"Review","email.date":"Date","email.from":"From","email.subject":"Subject","email.content":"Content","email.vietnameseTranslation":"Vietnamese Translation","email.emailLink":"Email Link","email.summary":"Summary","email.aiCategory":"AI Category","email.correctCategory":"Correct Category","email.processed":"Processed","email.client":"Client","email.projectNumber":"Project Number found","email.allTime":"All Time","email.clearFilters":"Clear Filters","email.dateRange":"Date Range","email.deleteSelected":"Delete Selected","email.filterByColumn":"Filter by Column","email.filterValue":"Filter Value","email.selectColumn":"Select column...","email.showing":"Showing","email.thisMonth":"This Month","email.thisWeek":"This Week","email.thisYear":"This Year","email.today":"Today","email.total":"Total","email.typeToFilter":"Type to filter...","bulk.deleteCount":["Delete ","count"," selected project(s)? This cannot be undone."],"bulk.deleteCFSSCount":["Delete ","count"," selected CFSS project(s)? This cannot be undone."],"bulk.deletedCount":["Deleted ","success"," project(s). ","fail"," failed."],"dataExport.comingSoon":"Data export feature coming soon!","errors.checkConsole":"Check console for details","errors.errorLoadingStats":"Error loading stats: HTTP ","errors.statsUnavailable":"Stats unavailable","customPages.alignCenter":"Center","customPages.alignLeft":"Left","customPages.alignment":"Alignment","customPages.alignRight":"Right","customPages.aspectRatioPreserved":"Aspect ratio preserved","customPages.clickToEditText":"Click to edit text...","customPages.color":"Color","customPages.confirmDeletePage":"Are you sure you want to delete this custom page?","customPages.confirmDeleteSoffitesPage":"Are you sure you want to delete this soffites page?","customPages.dragAndDropElements":"Drag and drop elements here","customPages.dropOrPasteHere":"Drop or paste image here...","customPages.elements":"elements","customPages.enterPageTitle":"Please enter a page title.","customPages.errorDeletingSoffitesPage":"Error deleting soffites page","customPages.errorSavingPage":"Error saving page","customPages.errorSavingSoffitesPage":"Error saving soffites page","customPages.errorUploadingImage":"Error uploading image","customPages.font":"Font","customPages.fontSize":"Font Size","customPages.height":"Height","customPages.imagePastedSuccess":"Image pasted successfully!","customPages.lastModified":"Last modified","customPages.newHeading":"New Heading","customPages.noCustomPagesYet":"No custom pages yet.","customPages.noSoffitesPagesYet":"No soffites pages yet.","customPages.pageSavedSuccess":"Page saved successfully!","customPages.position":"Position","customPages.positionX":"X","customPages.positionY":"Y","customPages.selectElementToEdit":"Select an element to edit its properties","customPages.selectValidImage":"Please select a valid image file.","customPages.size":"Size","customPages.soffitesPagesAdded":"soffites page(s) added","customPages.soffitesPageSavedSuccess":"Soffites page saved successfully!","customPages.typeface":"Typeface","customPages.untitledPage":"Untitled Page","customPages.width":"Width","reassign.title":"Assign Project","reassign.currentOwner":"Current Owner","reassign.searchPlaceholder":"Search by name, email, or company...","reassign.searchPrompt":"Type to search for users","reassign.noUsersFound":"No users found matching your search.","reassign.noCompany":"No company","reassign.assignBtn":"Assign Selected","reassign.assigning":"Assigning...","reassign.assignedTo":"Assigned to:","reassign.confirmMessage":["Assign this project to ","count"," user(s): ","names","?"],"reassign.differentCompanyWarning":"Warning: Some selected users are from a different company than the current owner. Are you sure you want to proceed?","reassign.success":"Project assigned successfully. All assigned users have been notified by email.","reassign.error":["Failed to assign project: ","error",""],"reassign.loading":"Loading users..."}');
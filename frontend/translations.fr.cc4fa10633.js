@@ -0,0 +1,2 @@
+// Generated by _replace_strings.py --build-translations. Do not edit.
+(self.translationsFlat || (self.translationsFlat = {}))["fr"] = JSON.parse('{"common.loading":"Chargement...","common.loadingProject":"Chargement du projet...","common.loadingAuth":"Chargement de l\'authentification...","common.loadingUsers":"Chargement des utilisateurs...","common.loadingProjects":"Chargement des projets CFSS...","common.save":"Enregistrer","common.saving":"Enregistrement...","common.cancel":"Annuler","common.delete":"Supprimer","common.close":"Fermer","common.edit":"Modifier","common.view":"Voir","common.copy":"Copier","common.assign":"Assigner","common.new":"Nouveau","common.add":"Ajouter","common.upload":"Téléverser","common.download":"Télécharger","common.search":"Rechercher","common.filter":"Filtrer","common.back":"Retour","common.next":"Suivant","common.yes":"Oui","common.no":"Non","common.ok":"OK","common.retry":"Réessayer","common.submit":"Soumettre","common.confirm":"Confirmer","common.error":"Erreur","common.success":"Succès","common.warning":"Avertissement","common.selectAll":"Tout sélectionner","common.deleteSelected":"Supprimer la sélection","common.noResults":"Aucun résultat trouvé.","common.dashboard":"Tableau de bord","common.admin":"ADMIN","common.limited":"LIMITÉ","common.logout":"Déconnexion","common.createdBy":"Créé par :","common.thisIsYou":"C\'est vous","common.unknown":"Inconnu","common.none":"Aucun","common.notAvailable":"N/D","common.optional":"optionnel","common.browse":"Parcourir","common.remove":"Retirer","common.details":"Détails","common.duplicate":"Dupliquer","common.installApp":"Installer l\'application","common.hide":"Masquer","common.hideDetails":"Masquer les détails","common.hideForm":"Masquer le formulaire","common.saveChanges":"Enregistrer les modifications","common.uploading":"Téléversement...","common.adding":"Ajout...","common.noDescription":"Aucune description","common.notSpecified":"Non spécifié","common.calculate":"Calculer","common.cancelEdit":"Annuler la modification","common.fillRequiredFields":"Veuillez remplir tous les champs obligatoires.","common.note":"Note :","common.refresh":"Rafraîchir","common.backToDashboard":"Retour au tableau de bord","common.loadingImage":"Chargement de l\'image...","common.loadingProjectDetails":"Chargement des détails du projet...","common.accessDenied":"Accès refusé","common.authRequired":"Authentification requise","common.goToLogin":"Aller à la connexion","common.actions":"Actions","common.date":"Date","common.select":"Sélectionner","common.selectOption":"Sélectionner une option","common.uploadFile":"Téléverser un fichier","nav.protectionSismique":"Protection Sismique","nav.protectionSismiqueCFSS":"Protection Sismique - CFSS","nav.dashboard":"Tableau de bord","nav.backToDashboard":"Retour au tableau de bord","admin.adminPanel":"Panneau d\'administration","admin.cfssCalculation":"Calcul CFSS","admin.seismicCalculation":"Calcul sismique","admin.manageUsers":"Gérer les utilisateurs","admin.viewAllProjects":"Voir tous les projets","admin.verifyBulkProjects":"Vérifier les projets en lot","admin.emailClassifications":"Classifications des courriels","admin.newProjectSheets":"Nouveau projet (Sheets)","admin.adminRequired":"Accès administrateur requis","admin.accessRestricted":"Accès restreint","admin.showingAllProjects":"Affichage de tous les projets du système","admin.showingAllCFSS":"Affichage de tous les projets CFSS du système","auth.login":"Connexion","auth.signUp":"Inscription","auth.resetPassword":"Réinitialiser le mot de passe","auth.createAccount":"Créer un compte","auth.email":"Courriel :","auth.password":"Mot de passe :","auth.confirmPassword":"Confirmer le mot de passe :","auth.firstName":"Prénom :","auth.lastName":"Nom :","auth.company":"Entreprise :","auth.phoneNumber":"Numéro de téléphone :","auth.domain":"Domaine :","auth.selectDomain":"Sélectionner un domaine","auth.forgotPassword":"Mot de passe oublié ?","auth.backToLogin":"Retour à la connexion","auth.sendResetCode":"Envoyer le code","auth.resendCode":"Renvoyer le code","auth.verifyYourEmail":"Vérifiez votre courriel","auth.enterNewPassword":"Nouveau mot de passe","auth.verificationCode":"Code de vérification :","auth.newPassword":"Nouveau mot de passe :","auth.confirmNewPassword":"Confirmer le nouveau mot de passe :","auth.verify":"Vérifier","auth.enterEmail":"Entrez votre courriel","auth.enterCode":"Entrez le code à 6 chiffres","auth.verificationCodePlaceholder":"Code de vérification","auth.showPassword":"Afficher le mot de passe","auth.hidePassword":"Masquer le mot de passe","auth.resetPasswordDesc":"Entrez votre adresse courriel et nous vous enverrons un code de vérification pour réinitialiser votre mot de passe.","auth.enterNewPasswordDesc":"Entrez le code de vérification envoyé à votre courriel et choisissez un nouveau mot de passe.","auth.enterVerificationCode":"Entrez le code de vérification envoyé à votre courriel :","auth.separateEmails":"Séparer les courriels multiples par des virgules","auth.pleaseLogin":"Veuillez vous connecter pour créer des projets","auth.pleaseLoginCFSS":"Veuillez vous connecter pour créer des projets CFSS","auth.fillAllFields":"Veuillez remplir tous les champs","auth.passwordsNoMatch":"Les mots de passe ne correspondent pas","auth.passwordMinLength":"Le mot de passe doit contenir au moins 8 caractères","auth.phoneFormat":"Le numéro de téléphone doit être au format E.164 (ex: +15551234567)","auth.authNotReady":"Le système d\'authentification n\'est pas prêt. Veuillez patienter ou rafraîchir la page.","auth.invalidCredentials":"Courriel ou mot de passe invalide","auth.verifyEmailFirst":"Veuillez d\'abord vérifier votre courriel","auth.userNotFound":"Utilisateur non trouvé","auth.loginFailed":"Échec de la connexion","auth.loginSuccess":"Connexion réussie ! Redirection...","auth.loginError":"Erreur de connexion : impossible de vérifier le statut du compte","auth.accountExists":"Un compte avec ce courriel existe déjà","auth.passwordRequirements":"Le mot de passe doit contenir des majuscules, minuscules, chiffres et caractères spéciaux","auth.signupFailed":"Échec de l\'inscription","auth.accountCreated":"Compte créé ! Veuillez vérifier votre courriel pour le code de vérification.","auth.emailVerified":"Courriel vérifié ! En attente de l\'autorisation des administrateurs. Vous recevrez un courriel une fois approuvé.","auth.verificationSent":"Code de vérification envoyé à votre courriel !","auth.verificationCodeSent":"Code de vérification envoyé ! Vérifiez votre courriel.","auth.newCodeSent":"Nouveau code de vérification envoyé ! Vérifiez votre courriel.","auth.noAccountFound":"Aucun compte trouvé avec cette adresse courriel","auth.emailInvalid":"L\'adresse courriel est invalide","auth.tooManyAttempts":"Trop de tentatives. Veuillez réessayer plus tard","auth.failedSendCode":"Échec de l\'envoi du code de réinitialisation","auth.invalidCode":"Code de vérification invalide. Veuillez vérifier et réessayer","auth.codeExpired":"Le code de vérification a expiré. Veuillez en demander un nouveau","auth.invalidPasswordFormat":"Format de mot de passe invalide. Veuillez vérifier les exigences","auth.passwordResetSuccess":"Mot de passe réinitialisé avec succès ! Vous pouvez maintenant vous connecter avec votre nouveau mot de passe.","auth.passwordResetFailed":"Échec de la réinitialisation du mot de passe","auth.pleaseEnterEmail":"Veuillez entrer votre adresse courriel","auth.pleaseEnterCode":"Veuillez entrer le code de vérification","auth.noUserToVerify":"Aucun utilisateur à vérifier","auth.failedResendCode":"Échec du renvoi du code","auth.tooManyAttemptsWait":"Trop de tentatives. Veuillez patienter quelques minutes et réessayer","auth.initiateResetFirst":"Veuillez d\'abord initier la réinitialisation du mot de passe","auth.newVerificationCode":"Nouveau code de vérification envoyé !","auth.alreadyLoggedIn":"Vous êtes déjà connecté. Redirection...","auth.authSystemReady":"Système d\'authentification chargé avec succès","auth.authInitFailed":"Échec de l\'initialisation de l\'authentification. Veuillez rafraîchir la page.","auth.needsApproval":"Votre compte nécessite l\'approbation d\'un administrateur. Les administrateurs ont été notifiés et examineront votre compte.","auth.pendingApproval":"Votre compte est en attente d\'approbation. Veuillez attendre le courriel de confirmation.","auth.notApproved":"Votre compte n\'est pas approuvé. Veuillez contacter l\'administrateur.","auth.sessionExpired":"Session expirée. Veuillez vous reconnecter.","auth.authError":"Erreur d\'authentification. Veuillez vous reconnecter.","auth.noUserToResend":"Aucun utilisateur à qui renvoyer le code","auth.verificationFailed":"Échec de la vérification : ","auth.authenticationRequired":"Authentification requise","auth.pleaseLoginCFSSDetails":"Veuillez vous connecter pour voir les détails du projet CFSS.","auth.goToLogin":"Aller à la connexion","auth.accessDenied":"Accès refusé","auth.noPermissionCFSS":"Vous n\'avez pas la permission de voir ce projet CFSS.","auth.confirmLogout":"Êtes-vous sûr de vouloir vous déconnecter ?","dashboard.projectDashboard":"Tableau de bord des projets","dashboard.createNewProject":"Créer un nouveau projet","dashboard.allProjects":"Tous les projets","dashboard.projects":"Projets","dashboard.cfssProjects":"Projets CFSS","dashboard.searchProjects":"Rechercher des projets...","dashboard.allStatus":"Tous les statuts","dashboard.allCategories":"Toutes les catégories","dashboard.noProjectsFound":"Aucun projet sismique trouvé. Créez votre premier projet sismique pour commencer !","dashboard.noCFSSProjectsFound":"Aucun projet CFSS trouvé. Créez votre premier projet CFSS pour commencer !","dashboard.errorLoadingProjects":"Erreur de chargement des projets sismiques : ","dashboard.errorLoadingCFSS":"Erreur de chargement des projets CFSS","dashboard.newCFSSProject":"Nouveau projet CFSS","dashboard.totalCFSS":"Total CFSS","dashboard.total":"Total","dashboard.planning":"Planification","dashboard.active":"Actif","dashboard.done":"Terminé","dashboard.noProjectsBasic":"Aucun projet trouvé. Créez votre premier projet pour commencer !","dashboard.errorFiltering":"Erreur de filtrage des projets : ","dashboard.errorInitDashboard":"Erreur d\'initialisation du tableau de bord : ","dashboard.errorDeletingCFSS":"Erreur de suppression du projet CFSS : ","status.planning":"Planification","status.inProgress":"En cours","status.completed":"Terminé","domains.plumbing":"Plomberie","domains.electricity":"Électricité","domains.interiorSystem":"Système intérieur","domains.sprinklers":"Gicleurs","domains.ventilation":"Ventilation","types.condo":"Condo","types.commercial":"Commercial","types.residential":"Résidentiel","types.industrial":"Industriel","types.hospital":"Hôpital","types.fireStation":"Caserne de pompiers","types.government":"Gouvernement","types.school":"École","types.other":"Autre","createProject.createNewProject":"Créer un nouveau projet","createProject.createNewCFSSProject":"Créer un nouveau projet CFSS","createProject.projectName":"Nom du projet :","createProject.projectNumber":"Numéro de projet :","createProject.clientName":"Nom du client :","createProject.clientEmails":"Courriel(s) du client :","createProject.description":"Description :","createProject.descriptionOptional":"Description (optionnel) :","createProject.type":"Type :","createProject.addressLine1":"Adresse ligne 1 :","createProject.addressLine2":"Adresse ligne 2 :","createProject.city":"Ville :","createProject.province":"Province :","createProject.country":"Pays :","createProject.projectNumberOptional":"Numéro de projet (optionnel) :","createProject.numberOfFloors":"Nombre d\'étages (optionnel) :","createProject.createProject":"Créer le projet","createProject.createCFSSProject":"Créer le projet CFSS","createProject.creatingProject":"Création du projet...","createProject.creatingCFSSProject":"Création du projet CFSS...","createProject.projectCreated":"Projet créé avec succès !","createProject.cfssProjectCreated":"Projet CFSS créé avec succès !","createProject.errorCreating":"Erreur lors de la création du projet : ","createProject.errorCreatingCFSS":"Erreur lors de la création du projet CFSS : ","createProject.emailPlaceholder":"courriel@exemple.com, courriel2@exemple.com","createProject.companyName":"Nom de l\'entreprise :","createProject.deflectionMax":"Déflexion max :","createProject.enterClientName":"Entrer le nom du client...","createProject.enterDescription":"Entrer la description...","createProject.enterLocation":"Entrer l\'emplacement...","createProject.enterProjectName":"Entrer le nom du projet...","createProject.selectDeflection":"Sélectionner la déflexion max...","createProject.selectThickness":"Sélectionner l\'épaisseur min...","createProject.thicknessMin":"Épaisseur min :","project.projectDetails":"Détails du projet","project.cfssProjectDetails":"Détails du projet CFSS","project.basicInformation":"Informations de base","project.seismicParameters":"Paramètres sismiques","project.equipmentList":"Liste d\'équipements","project.addEquipment":"Ajouter un équipement","project.model":"Modèle","project.tag":"Étiquette","project.level":"Niveau","project.generateReport":"Générer le rapport","project.deleteEquipmentConfirm":"Êtes-vous sûr de vouloir supprimer cet équipement ?","project.logoutConfirm":"Êtes-vous sûr de vouloir vous déconnecter ?","project.status":"Statut :","project.address":"Adresse :","project.numberOfFloors":"Nombre d\'étages :","project.lat":"Lat :","project.long":"Long :","project.finalRisk":"Risque final :","project.projectDuplicated":"Projet dupliqué avec succès !","project.cfssProjectDuplicated":"Projet CFSS dupliqué avec succès !","project.deleteConfirm":"Êtes-vous sûr de vouloir supprimer ce projet ?","project.deleteCFSSConfirm":"Êtes-vous sûr de vouloir supprimer ce projet CFSS ?","project.projectDeleted":"Projet supprimé avec succès !","project.errorDeleting":"Erreur lors de la suppression du projet. Veuillez réessayer.","project.errorDuplicating":"Erreur lors de la duplication du projet : ","project.type":"Type :","project.domain":"Domaine :","project.created":"Créé le","project.deleteSuccess":"Projet supprimé avec succès !","project.deleteError":"Erreur de suppression du projet : ","project.createdBy":"Créé par","project.noAddress":"Pas d\'adresse","project.cfssProject":"Projet CFSS","project.errorCreating":"Erreur de création du projet : ","project.enterProjectName":"Veuillez entrer un nom de projet","project.cfssProjectCreatedSuccess":"Projet CFSS créé avec succès !","project.errorInitPage":"Erreur d\'initialisation de la page : ","project.pleaseWaitLoading":"Veuillez patienter pendant le chargement des détails du projet.","project.authRequired":"Authentification requise","project.pleaseLoginToView":"Veuillez vous connecter pour voir les détails du projet.","project.goToLogin":"Aller à la connexion","project.accessDenied":"Accès refusé","project.noPermission":"Vous n\'avez pas la permission de voir ce projet.","project.projectName":"Nom du projet :","project.companyName":"Nom de l\'entreprise :","project.clientName":"Nom du client :","project.description":"Description :","project.newEquipment":"Nouvel équipement","project.equipment":"Équipement :","project.selectOrTypeEquipment":"Sélectionner ou saisir un équipement...","project.voiceInput":"Saisie vocale","project.voiceMode":"Mode vocal","project.voiceModeActive":"Mode vocal actif — touchez un champ pour parler","project.voiceModeOff":"Mode vocal désactivé","project.voiceNoMatch":"Aucune correspondance","project.modelLabel":"Modèle : (optionnel)","project.enterModel":"Entrer le modèle d\'équipement...","project.tagLabel":"Étiquette : (optionnel)","project.enterTag":"Entrer l\'étiquette d\'équipement...","project.levelLabel":"Niveau : (optionnel)","project.whatWouldYouLikeToDo":"Que souhaitez-vous faire ?","project.seismicCalculation":"Calcul sismique","project.fullEngineeringAnalysis":"Analyse d\'ingénierie complète","project.addPhotosForCertification":"Ajouter des photos pour certification","project.documentationOnly":"Documentation uniquement","project.switch":"Changer","project.nbcCategory":"Catégorie NBC :","project.selectNbcCategory":"Sélectionner la catégorie NBC...","project.pipeType":"Type de tuyau :","project.selectPipeType":"Sélectionner le type de tuyau...","project.steelPipe":"Tuyau en acier","project.copperPipe":"Tuyau en cuivre","project.pvcPipe":"Tuyau en PVC","project.noHubPipe":"Tuyau sans moyeu","project.installMethodLabel":"Méthode d\'installation :","project.selectInstallMethod":"Sélectionner la méthode d\'installation...","project.fixedToSlab":"Fixé à la dalle","project.fixedToWall":"Fixé au mur","project.fixedToStructure":"Fixé à la structure","project.fixedToCeiling":"Fixé au plafond","project.fixedToRoof":"Fixé au toit","project.fixedToInteriorWall":"Fixé au mur intérieur","project.fixedToWoodenSleeper":"Fixé au dormant en bois","project.weight":"Poids :","project.dimensions":"Dimensions HxLxL (pouces) :","project.height":"Hauteur","project.width":"Largeur","project.length":"Longueur","project.hxLabel":"Hauteur de l\'équipement au-dessus de la base (hx) en mètres :","project.pipeWeightPerFoot":"Poids du tuyau par pied (lb/pi) :","project.pipeDiameter":"Diamètre du tuyau :","project.selectDiameter":"Sélectionner le diamètre...","project.supportType":"Type de support :","project.individualClevis":"Chape individuelle","project.trapeze":"Trapèze","project.structureType":"Type de structure :","project.concreteSlab":"Dalle de béton","project.concreteDeck":"Pont de béton","project.structuralSteel":"Acier structural","project.woodStructure":"Structure en bois","project.numberOfAnchors":"Nombre d\'ancrages :","project.anchorTypeLabel":"Type d\'ancrage :","project.selectAnchorType":"Sélectionner le type d\'ancrage...","project.expansionAnchor":"Ancrage à expansion KWIK BOLT TZ2","project.screwAnchor":"Ancrage à vis KWIK HUS EZ","project.anchorDiameter":"Diamètre d\'ancrage (pouces) :","project.selectAnchorTypeFirst":"Sélectionner d\'abord le type d\'ancrage...","project.slabThickness":"Épaisseur de la dalle (pouces) :","project.selectFc":"Sélectionner f\'c...","project.mountingTypeLabel":"Type de montage :","project.selectMountingType":"Sélectionner le type de montage...","project.noIsolators":"1. Sans isolateurs","project.type31":"2. Retenu avec isolateurs de vibration Type 3-1","project.type32":"3. Retenu avec isolateurs de vibration Type 3-2","project.type35a":"4. Retenu avec isolateurs de vibration Type 3-5A","project.type35b":"5. Retenu avec isolateurs de vibration Type 3-5B","project.type35c":"6. Retenu avec isolateurs de vibration Type 3-5C","project.type35d":"7. Retenu avec isolateurs de vibration Type 3-5D","project.type310":"8. Retenu avec amortisseurs sismiques Type 3-10","project.type311":"9. Retenu avec amortisseurs sismiques Type 3-11","project.isolatorWidth":"Largeur de l\'isolateur/amortisseur (B) en pouces :","project.restraintHeight":"Hauteur de connexion de retenue (H) en pouces :","project.edgeDistanceA":"Distance au bord A (a) en pouces :","project.edgeDistanceB":"Distance au bord B (b) en pouces :","project.numberOfIsolators":"Nombre d\'isolateurs/amortisseurs (N) :","project.hnLabel":"Hauteur totale du bâtiment (hn) en mètres :","project.images":"Images :","project.browse":"Parcourir","project.uploadImages":"Téléverser des images","project.dropOrPasteImages":"Déposer ou coller des images ici (Ctrl+V)","project.calculate":"Calculer","project.saveAndCloseForm":"Enregistrer et fermer le formulaire","project.equipmentImage":"Image de l\'équipement","project.selectEquipmentToViewImage":"Sélectionner l\'équipement et la méthode d\'installation pour voir l\'image","project.calculationResults":"Résultats du calcul","project.clickCalculate":"Cliquer sur « Calculer » pour voir l\'analyse détaillée et les calculs","project.projectSetupRequired":"Configuration du projet requise","project.floorsRequiredMessage":"Pour effectuer les calculs sismiques, nous devons connaître le nombre total d\'étages de ce bâtiment.","project.numberOfFloorsRequired":"Nombre d\'étages *","project.enterTotalFloors":"Entrer le nombre total d\'étages","project.saveAndContinue":"Enregistrer et continuer","project.installMethod.fixedToSlab":"Fixé à la dalle","project.installMethod.fixedToWall":"Fixé au mur","project.installMethod.fixedToStructure":"Fixé à la structure","project.installMethod.fixedToCeiling":"Fixé au plafond","project.installMethod.fixedToRoof":"Fixé au toit","project.installMethod.fixedToInteriorWall":"Fixé au mur intérieur","project.installMethod.fixedToWoodenSleeper":"Fixé au dormant en bois","project.mountingType.noIsolators":"Sans isolateurs","project.mountingType.type31":"Isolateurs de vibration Type 3-1","project.mountingType.type32":"Isolateurs de vibration Type 3-2","project.mountingType.type35a":"Isolateurs de vibration Type 3-5A","project.mountingType.type35b":"Isolateurs de vibration Type 3-5B","project.mountingType.type35c":"Isolateurs de vibration Type 3-5C","project.mountingType.type35d":"Isolateurs de vibration Type 3-5D","project.mountingType.type310":"Amortisseurs sismiques Type 3-10","project.mountingType.type311":"Amortisseurs sismiques Type 3-11","project.mountingType.unknown":"Type de montage inconnu","project.anchorType.expansion":"Ancrage à expansion","project.anchorType.screw":"Ancrage à vis","project.anchorType.unknown":"Type d\'ancrage inconnu","project.addressLine1":"Adresse ligne 1 :","project.addressLine2":"Adresse ligne 2 :","project.city":"Ville :","project.province":"Province :","project.country":"Pays :","project.projectNumber":"Numéro de projet :","project.clientEmails":"Courriel(s) du client :","project.designedBy":"Conçu par :","project.approvedBy":"Approuvé par :","project.separateEmailsComma":"Séparez plusieurs courriels par des virgules","project.editProjectDetails":"Modifier les détails du projet","project.noEditPermission":"Vous n\'avez pas la permission de modifier ce projet.","project.detailsUpdated":"Détails du projet mis à jour avec succès !","project.errorSavingDetails":"Erreur lors de l\'enregistrement des détails du projet","project.nextProjectNumber":"Prochain numéro de projet","project.clientInformation":"Informations du client","project.companyDivision":"Entreprise / Division","project.zoneDistance":"Zone / Distance","project.classification":"Classification","project.clearForm":"Effacer le formulaire","project.projectAddress":"Adresse du projet","project.projectField":"Domaine","project.projectNamePlaceholder":"Entrer le nom du projet...","project.contactEmail":"Courriel de contact :","project.contactEmailPlaceholder":"courriel@exemple.com","project.contractType":"Type de contrat :","project.entrepreneur":"Entrepreneur :","project.selectEntrepreneur":"Sélectionner un entrepreneur...","project.selectField":"Sélectionner un domaine...","project.estimationAmount":"Montant estimé :","project.openingDate":"Date d\'ouverture :","project.financial":"Financier","project.sousCategorie":"Sous-catégorie :","project.promoCode":"Code promo :","project.promoCodePlaceholder":"Entrer le code promo...","project.fullAddressPlaceholder":"Adresse complète...","project.selectZone":"Sélectionner une zone...","project.startTypingClient":"Commencer à taper le nom du client...","project.createNewProject":"Créer un nouveau projet","project.createProject":"Créer le projet","project.createdOn":"Créé le","project.lastUpdated":"Dernière mise à jour","project.noProjectIdSpecified":"Aucun identifiant de projet spécifié.","project.errorLoadingProject":"Erreur de chargement du projet","project.selectFile":"Sélectionner un fichier","project.pasteLink":"Coller un lien","project.enterFileName":"Veuillez entrer un nom de fichier.","project.onlyHttpsAllowed":"Seuls les liens HTTPS sont autorisés.","project.enterValidUrl":"Veuillez entrer une URL valide.","project.linkAddedSuccessfully":"Lien ajouté avec succès !","project.errorAddingLink":"Erreur lors de l\'ajout du lien","project.fileUploadedSuccessfully":"Fichier téléversé avec succès !","project.errorUploadingFile":"Erreur lors du téléversement du fichier","project.fileNotFound":"Fichier introuvable.","project.errorDownloadingFile":"Erreur lors du téléchargement du fichier","project.confirmDeleteFile":"Êtes-vous sûr de vouloir supprimer ce fichier ?","project.fileDeletedSuccessfully":"Fichier supprimé avec succès !","project.errorDeletingFile":"Erreur lors de la suppression du fichier","project.errorSavingProject":"Erreur lors de l\'enregistrement du projet","project.projectNotLoaded":"Projet non chargé.","project.noProjectId":"Aucun identifiant de projet spécifié.","project.actionRequired":"Action requise","project.aircraftCable":"Câble en acier galvanisé","project.allowableShear":"Cisaillement admissible","project.allowableTension":"Tension admissible","project.amplificationFactor":"Facteur d\'amplification","project.analysisResults":"Résultats de l\'analyse","project.anchor":"Ancrage","project.anchorBoltShear":"Cisaillement du boulon d\'ancrage","project.anchorBoltTension":"Tension du boulon d\'ancrage","project.anchorCannotProvideSufficientCapacity":["L\'ancrage ⌀","diameter","\\" ne peut pas fournir une capacité suffisante"],"project.anchorDiameterRecommendation":"Recommandation de diamètre d\'ancrage","project.anchors":"ancrages","project.ashraeAnchorBoltAnalysis":"Analyse des boulons d\'ancrage ASHRAE","project.ashraeCalcRequiresParams":"Le calcul ASHRAE nécessite les paramètres de l\'équipement","project.ashraeTboltCalcTitle":"Calcul de la tension du boulon d\'ancrage ASHRAE (Tbolt)","project.ashraeVboltCalcTitle":"Calcul du cisaillement du boulon d\'ancrage ASHRAE (Vbolt)","project.boltShear":"Cisaillement du boulon","project.boltTension":"Tension du boulon","project.bothFormulasPass":"Les deux formules sont satisfaites","project.braceMembers":"Éléments de contreventement","project.bracePosition":"Position du contreventement","project.breakdown":"Décomposition","project.breakingStrength":"Résistance à la rupture","project.buildingHeight":"Hauteur du bâtiment","project.cableBrace":"Câble de contreventement","project.cableBraceOption":"Option de câble de contreventement","project.cableBraceOptions":"Options de câble de contreventement","project.cableRequired":"Câble requis","project.cableSize":"Taille du câble","project.calcOnlyVibrationIsolated":"Ce calcul n\'est disponible que pour les équipements à isolation de vibration","project.calculatedAs":"calculé comme","project.calculation":"Calcul","project.cancelRequest":"Annuler la demande","project.cantFindImage":["Impossible de trouver l\'image : ","name",""],"project.centerOfGravity":"centre de gravité","project.cfsCalcTitle":"Calcul du coefficient de force sismique CFS","project.changeAnchorDiameter":"Modifier le diamètre d\'ancrage dans le formulaire d\'équipement","project.channelStrut":"Profilé en U","project.clickCalculateToSeeDetails":"Cliquer sur « Calculer » pour voir l\'analyse détaillée","project.clickToSeeASHRAETboltDetails":"Cliquer pour voir les détails du Tbolt ASHRAE","project.clickToSeeASHRAEVboltDetails":"Cliquer pour voir les détails du Vbolt ASHRAE","project.clickToSeeBracingSpecs":"Cliquer pour voir les spécifications de contreventement","project.clickToSeeCableDetails":"Cliquer pour voir les détails du câble","project.clickToSeeCFSDetails":"Cliquer pour voir les détails du calcul CFS","project.clickToSeeCompleteSpecs":"Cliquer pour voir les spécifications complètes","project.clickToSeeConcreteEmbedmentDetails":"Cliquer pour voir les détails d\'encastrement dans le béton","project.clickToSeeEmbedmentDetails":"Cliquer pour voir les détails d\'encastrement","project.clickToSeeFinalEmbedmentCalc":"Cliquer pour voir le calcul d\'encastrement final","project.clickToSeeFormula1Details":"Cliquer pour voir les détails de la Formule 1","project.clickToSeeFormula2Details":"Cliquer pour voir les détails de la Formule 2","project.clickToSeeHangerRodSpecs":"Cliquer pour voir les spécifications de la tige de suspension","project.clickToSeeLateralForceDetails":"Cliquer pour voir les détails du calcul de la force latérale","project.clickToSeeMaxCompressionDetails":"Cliquer pour voir les détails de la compression maximale","project.clickToSeeMaxShearDetails":"Cliquer pour voir les détails du cisaillement maximal","project.clickToSeeMaxTensionDetails":"Cliquer pour voir les détails de la tension maximale","project.clickToSeeNBCVpDetails":"Cliquer pour voir les détails du calcul Vp selon le CNB","project.clickToSeeOTMDetails":"Cliquer pour voir les détails de l\'OTM","project.clickToSeeRMDetails":"Cliquer pour voir les détails du RM","project.clickToSeeShearDetails":"Cliquer pour voir les détails du calcul de cisaillement","project.clickToSeeSteelEmbedmentDetails":"Cliquer pour voir les détails d\'encastrement dans l\'acier","project.clickToSeeTensionDetails":"Cliquer pour voir les détails du calcul de tension","project.clips":"Colliers","project.coeffLateralSeismicForce":"Coefficient de force sismique latérale","project.componentFactor":"Facteur de composant","project.concrete":"Béton","project.concreteAnalysisNotAvailable":"Analyse du béton non disponible pour cet équipement","project.concreteFailure":"Rupture du béton","project.concreteFailureEmbedmentTitle":"Analyse d\'encastrement - Rupture du béton","project.concreteFormula1Title":"Analyse structurale ASHRAE du béton - Formule (11-36)","project.concreteFormula2Title":"Analyse structurale ASHRAE du béton - Formule (11-37)","project.concreteStrength":"Résistance du béton","project.concreteTensionCapacity":"Capacité en tension du béton","project.connectionType":"Type de connexion","project.constant":"Constante","project.currentAnchorInsufficient":"Le diamètre d\'ancrage actuel est insuffisant","project.currentBadge":"Actuel","project.currentConfiguration":"Configuration actuelle","project.currentDiameterInsufficient":["Le diamètre actuel ⌀","diameter","\\" est insuffisant"],"project.deleteImage":"Supprimer l\'image","project.deleteImageConfirm":"Êtes-vous sûr de vouloir supprimer cette image ?","project.deleteSelectedConfirm":["Supprimer ","count"," équipement(s) sélectionné(s) ? Cette action est irréversible."],"project.designRule":"Règle de conception","project.determineMinEmbedment":"Déterminer la profondeur d\'encastrement minimale","project.diameter":"Diamètre","project.dropImageHere":"Déposer l\'image ici","project.dropOrPasteImagesCount":["","count"," image(s) sélectionnée(s)"],"project.dropOrPasteToAddMore":"Déposer ou coller pour en ajouter d\'autres","project.editEquipment":"Modifier l\'équipement","project.embedmentAnalysisNotAvailable":"Analyse d\'encastrement non disponible","project.equipmentHeight":"Hauteur de l\'équipement","project.equipmentImages":"Images d\'équipement","project.equipmentNotFound":"Équipement introuvable","project.equipmentSaved":"Équipement enregistré avec succès !","project.equipmentUpdated":"Équipement mis à jour avec succès !","project.equipmentUpdatedSuccess":"Équipement mis à jour avec succès !","project.equipmentWeight":"Poids de l\'équipement","project.errorCalculatingEquipment":"Erreur lors du calcul de l\'équipement","project.errorDeletingEquipment":"Erreur lors de la suppression de l\'équipement","project.errorGeneratingReport":"Erreur lors de la génération du rapport","project.errorLoadingImage":"Erreur de chargement de l\'image","project.errorNoProjectSelected":"Aucun projet sélectionné","project.errorSavingEquipment":"Erreur lors de l\'enregistrement de l\'équipement","project.errorSavingEquipmentChanges":"Erreur lors de l\'enregistrement des modifications de l\'équipement","project.errorSavingFloors":"Erreur lors de l\'enregistrement du nombre d\'étages","project.errorUpdatingImageRequest":"Erreur lors de la mise à jour de la demande d\'image","project.fail":"ÉCHOUÉ","project.failedDeleteImage":"Échec de la suppression de l\'image","project.failedDuplicateEquipment":"Échec de la duplication de l\'équipement","project.failedToProcessFile":["Échec du traitement du fichier : ","name",""],"project.failedToUpload":"Échec du téléversement","project.finalMinEmbedmentResult":"Encastrement minimal final","project.finalMinEmbedmentTitle":"Encastrement minimal final","project.force":"Force","project.forces":"Forces","project.formula":"Formule","project.formula1":"Formule 1","project.formula2":"Formule 2","project.formulaVariesByMountingType":"La formule varie selon le type de montage","project.fromCFSCalc":"issu du calcul CFS","project.generatingPDF":"Génération du PDF...","project.geometry":"Géométrie","project.geometryAngles":"Géométrie et angles","project.governingEmbedmentNote":"L\'encastrement déterminant est le plus grand requis par tous les contrôles applicables","project.governingRequirement":"Exigence déterminante","project.greaterConcreteBreakoutCapacity":"Capacité d\'arrachement du béton plus grande","project.hangerRod":"Tige de suspension","project.hangerRods":"Tiges de suspension","project.hangerRodSpecs":"Spécifications de la tige de suspension","project.heightAboveBase":"Hauteur au-dessus de la base","project.heightCoefficient":"Coefficient de hauteur","project.heightFactor":"Facteur de hauteur","project.heightLower":"hauteur","project.heightToRestraint":"Hauteur jusqu\'à la retenue","project.higherSteelShearCapacity":"Capacité en cisaillement de l\'acier plus élevée","project.higherSteelTensileCapacity":"Capacité en traction de l\'acier plus élevée","project.horizontalForce":"Force horizontale","project.horizontalSeismicForce":"Force sismique horizontale","project.image":"Image","project.imageNotAvailable":"Image non disponible","project.imageOf":"Image de","project.imageRequestAdditional":"Demander une image supplémentaire","project.imageRequestSent":"Demande d\'image envoyée","project.imageRequestSuccess":["Demande d\'image ","action"," avec succès"],"project.imageRequestUpload":"Téléverser une image","project.imageUploadFailedWarning":"Le téléversement de l\'image a échoué. Équipement enregistré sans image.","project.imagesUploadedSuccess":["","count"," image(s) téléversée(s) avec succès"],"project.importanceFactor":"Facteur d\'importance","project.insufficient":"insuffisant","project.largerAnchorsHave":"Les ancrages plus grands ont :","project.largerDiameter":"diamètre plus grand","project.largerOfTwoEmbedments":"La plus grande des deux valeurs d\'encastrement","project.largestCableInsufficient":"Le plus grand câble disponible est insuffisant","project.lateralForce":"Force latérale","project.lateralForceCalcTitle":"Calcul de la force sismique latérale","project.lbsMinBreakingStrength":"lbs résistance à la rupture min","project.lbsPerBolt":"lb/boulon","project.limitedBetweenPerNBC":"limité entre les valeurs min et max selon le CNB","project.maxImagesAllowed":["Maximum ","max"," images autorisées"],"project.maxImagesReached":["Maximum de ","max"," images atteint"],"project.maxImagesReachedCount":["Max ","max"," images atteint"],"project.maxImagesReachedShort":"Maximum d\'images atteint","project.maximumLength":"Longueur maximale","project.maximumShear":"Cisaillement maximal","project.maximumTension":"Tension maximale","project.maxLength":"Longueur max","project.maxUnbraced":"Max. sans contreventement","project.maxUnbracedLength":"Longueur max sans contreventement","project.microphoneAccessDenied":"Accès au microphone refusé","project.minimumEmbedment":"Encastrement minimal","project.minimumEmbedmentAnalysis":"Analyse d\'encastrement minimal","project.missingEquipmentOrInstallData":"Données d\'équipement ou d\'installation manquantes","project.missingPipeTypeData":"Données de type de tuyau manquantes","project.momentOfInertia":"Moment d\'inertie","project.moreEmbedmentOptions":"Plus d\'options de profondeur d\'encastrement","project.neitherCapacityAdequate":"Aucune capacité n\'est adéquate","project.newBadge":"Nouveau","project.newImage":"Nouvelle image","project.noCalculationsForType":"Aucun calcul disponible pour ce type d\'équipement","project.noEquipmentSelected":"Aucun équipement sélectionné","project.noEquipmentYet":"Aucun équipement ajouté pour l\'instant","project.noImagesYet":"Aucune image pour l\'instant","project.noPermissionAddEquipment":"Vous n\'avez pas la permission d\'ajouter de l\'équipement","project.noPermissionDeleteEquipment":"Vous n\'avez pas la permission de supprimer l\'équipement","project.noPermissionEditEquipment":"Vous n\'avez pas la permission de modifier l\'équipement","project.noPermissionModify":"Vous n\'avez pas la permission de modifier ce projet","project.noteWeightNotIncluded":"Note : Poids de l\'équipement non inclus pour les équipements montés au plafond","project.numberOfAnchorBolts":"Nombre de boulons d\'ancrage","project.ofEquipmentHeight":"de la hauteur de l\'équipement","project.oneOrMoreFormulasFail":"Une ou plusieurs formules échouent","project.onlyAdminsCanRequestImages":"Seuls les administrateurs peuvent demander des images","project.onlyMoreImagesCanBeAdded":["Seulement ","count"," image(s) supplémentaire(s) peut être ajoutée"],"project.onlyUploadingImages":["Téléversement de ","count"," images seulement (max ","max",")"],"project.orClickButtonToSelect":"ou cliquer sur le bouton pour sélectionner","project.otmCalcTitle":"Calcul du moment de renversement (OTM)","project.overallStatus":"Statut global","project.overturningAnalysis":"Analyse de renversement","project.overturningMoment":"Moment de renversement","project.overturningOnlyRigid":"L\'analyse de renversement n\'est disponible que pour le montage rigide (sans isolateurs)","project.parameters":"Paramètres","project.pass":"RÉUSSI","project.pcCalcTitle":"Calcul de Pc (force de compression maximale)","project.pdfGenerationTimedOut":"La génération du PDF a expiré","project.pipe":"Tuyau","project.pipeWeightExceedsTableLimits":"Le poids du tuyau dépasse les limites du tableau","project.pipeWeightExceedsTableWarning":"⚠ Le poids du tuyau dépasse les limites du tableau","project.pipeWeightLabel":"Poids du tuyau","project.pleaseEnterEquipmentName":"Veuillez entrer le nom de l\'équipement","project.pleaseEnterValidFloors":"Veuillez entrer un nombre d\'étages valide","project.pleaseEnterValidPipeWeight":"Veuillez entrer un poids de tuyau valide","project.pleaseSelectPipeDiameter":"Veuillez sélectionner un diamètre de tuyau","project.pleaseSelectPipeType":"Veuillez sélectionner un type de tuyau","project.pleaseSelectValidImages":"Veuillez sélectionner des fichiers image valides","project.prestretchedCable":"Câble prétendu","project.problem":"Problème","project.processingImages":["Traitement de ","count"," image(s)..."],"project.psCalcTitle":"Calcul de Ps (force de cisaillement par ancrage)","project.reaction":"Réaction","project.reason":"Raison","project.recommendation":"Recommandation","project.reference":"Référence","project.removeImageToAddMore":"Supprimer une image pour en ajouter d\'autres","project.requestImage":"Demander une image","project.requiredForces":"Forces requises","project.requiredMinEmbedment":"Encastrement min. requis","project.requiredShear":"Cisaillement requis","project.requiredTension":"Tension requise","project.requiredValues":"Valeurs requises","project.requirements":"Exigences","project.rerunAnalysis":"Relancer l\'analyse","project.resistingMoment":"Moment résistant","project.responseModificationFactor":"Facteur de modification de réponse","project.result":"Résultat","project.rmCalcTitle":"Calcul du moment résistant (RM)","project.sameAsPtCalc":"Identique au calcul Pt","project.seismic":"Sismique","project.seismicLevel":"Niveau sismique","project.seismicLoad":"Charge sismique","project.seismicRiskCoeff":"Coefficient de risque sismique","project.selectNBCCategory":"Sélectionner la catégorie NBC...","project.shearCalcTitle":"Calcul du cisaillement du boulon d\'ancrage (V)","project.shoppingList":"Liste d\'achats","project.siteAccelerationCoeff":"Coefficient d\'accélération du site","project.solidBrace":"Contreventement rigide","project.solidBraceOption":"Option de contreventement rigide","project.solidBraceOptions":"Options de contreventement rigide","project.solution":"Solution","project.spectralResponseValue":"Valeur de réponse spectrale","project.standardCable":"Câble standard","project.steel":"Acier","project.steelAngle":"Cornière d\'acier","project.steelFailure":"Rupture de l\'acier","project.steelFailureEmbedmentTitle":"Analyse d\'encastrement - Rupture de l\'acier","project.steelSeismicShearCapacity":"Capacité sismique en cisaillement de l\'acier","project.steelStructure":"Structure en acier","project.steelTensileCapacity":"Capacité en traction de l\'acier","project.step":"Étape","project.structuralConnection":"Connexion structurale","project.structuralConnections":"Connexions structurales","project.sum":"Somme","project.suspendedEquipmentBracing":"Contreventement d\'équipement suspendu","project.suspendedEquipmentBracingASHRAE10":"Contreventement d\'équipement suspendu (ASHRAE Ch. 10)","project.suspendedPipingBracing":"Contreventement de tuyauterie suspendue","project.suspendedPipingBracingSpecs":"Spécifications de contreventement de tuyauterie suspendue","project.tableRefExpansionConcrete":"HILTI Ancrage à expansion - Tableau d\'encastrement dans le béton","project.tableRefExpansionSteel":"HILTI Ancrage à expansion - Tableau d\'encastrement dans l\'acier","project.tableRefScrewConcrete":"HILTI Ancrage à vis - Tableau d\'encastrement dans le béton","project.tableRefScrewSteel":"HILTI Ancrage à vis - Tableau d\'encastrement dans l\'acier","project.tensileStrength":"Résistance en traction","project.tensionCalcTitle":"Calcul de la tension du boulon d\'ancrage (T)","project.tensionCapacity":"Capacité en tension","project.thimble":"Cosse","project.totalShear":"Cisaillement total","project.totalTension":"Tension totale","project.tryLargerAnchor":["Essayez un ancrage ","size",""],"project.turnbuckle":"Ridoir","project.type31VibrationIsolatorsSnubbers":"Isolateurs de vibration / Amortisseurs Type 3-1","project.type32VibrationIsolators":"Isolateurs de vibration Type 3-2","project.uploadImage":"Téléverser une image","project.useEmbedmentGreaterThan":["Utiliser une profondeur d\'encastrement supérieure à ","value","\\""],"project.useLargerAnchorDiameter":"Utiliser un diamètre d\'ancrage plus grand","project.useLargerDiameterAndReanalyze":"Utiliser un diamètre plus grand et réanalyser","project.valuesUsed":"Valeurs utilisées","project.verticalForce":"Force verticale","project.verticalSeismicForce":"Force sismique verticale","project.vibrationIsolatedEquipment":"Équipement à isolation de vibration","project.viewImage":"Voir l\'image","project.voiceInputNotSupported":"La saisie vocale n\'est pas prise en charge dans ce navigateur","project.widthLower":"largeur","project.workingLoad":"Charge de travail","project.workLoadLimit":"Charge de travail limite","project.worstAngle":"Angle critique","project.noSufficientEmbedmentFound":"Aucun encastrement suffisant trouvé","cfss.cfssWindData":"Données de vent CFSS","cfss.deflectionMax":"Déflexion max :","cfss.thicknessMin":"Épaisseur min :","cfss.designedBy":"Conçu par :","cfss.approvedBy":"Approuvé par :","cfss.projectFiles":"Fichiers du projet","cfss.uploadFile":"Téléverser un fichier","cfss.pasteLink":"Coller un lien","cfss.fileName":"Nom du fichier","cfss.selectFile":"Sélectionner un fichier","cfss.addWall":"Ajouter un mur","cfss.editWall":"Modifier le mur","cfss.deleteWall":"Supprimer le mur","cfss.deleteWallConfirm":"Êtes-vous sûr de vouloir supprimer ce mur et toutes ses images ?","cfss.addSoffite":"Ajouter un soffite","cfss.editSoffite":"Modifier le soffite","cfss.deleteSoffiteConfirm":"Êtes-vous sûr de vouloir supprimer ce soffite ?","cfss.addWindow":"Ajouter une fenêtre","cfss.deleteWindowConfirm":"Êtes-vous sûr de vouloir supprimer cette fenêtre ?","cfss.deleteTemplateConfirm":"Supprimer ce modèle ?","cfss.deleteFileConfirm":"Êtes-vous sûr de vouloir supprimer ce fichier ?","cfss.wallCalc":"Calculateur de mur","cfss.customPages":"Pages personnalisées","cfss.customPageSaved":"Page personnalisée enregistrée avec succès !","cfss.soffitesPageSaved":"Page de soffites enregistrée avec succès !","cfss.deleteCustomPageConfirm":"Êtes-vous sûr de vouloir supprimer cette page personnalisée ?","cfss.deleteSoffitesPageConfirm":"Êtes-vous sûr de vouloir supprimer cette page de soffites ?","cfss.selectValidImage":"Veuillez sélectionner un fichier image valide.","cfss.enterPageTitle":"Veuillez entrer un titre de page","cfss.noAddress":"Aucune adresse","cfss.untitled":"Sans titre","cfss.floorCalculations":"Calculs par étage","cfss.floor":"Étage","cfss.addFloor":"Ajouter un étage","cfss.source":"Source :","cfss.enterFileName":"Entrer le nom du fichier...","cfss.fileType":"Type","cfss.fileDate":"Date","cfss.actions":"Actions","cfss.noFilesYet":"Aucun fichier téléversé. Cliquez sur « Téléverser un fichier » pour ajouter des fichiers.","cfss.submitProjectToAdmin":"Soumettre le projet à l\'administrateur","cfss.sendForAdminReview":"Envoyer ce projet pour révision et traitement par l\'administrateur.","cfss.optionList":"Liste d\'options","cfss.wallList":"Liste des murs","cfss.parapetList":"Liste des parapets","cfss.windowList":"Liste des fenêtres","cfss.soffitesList":"Liste des soffites","cfss.saveOptions":"Enregistrer les options","cfss.lisseTrouee":"Lisse Trouée","cfss.doubleLisse":"Double Lisse","cfss.lisseBasse":"Lisse Basse","cfss.parapet":"Parapet","cfss.fenetre":"Fenêtre","cfss.jambagesLinteauxSeuils":"Jambages, Linteaux & Seuils","cfss.addParapet":"Ajouter un parapet","cfss.addSoffites":"Ajouter des soffites","cfss.newWall":"Nouveau mur","cfss.wallName":"Nom du mur :","cfss.enterWallName":"Entrer le nom du mur...","cfss.floorLabel":"Étage :","cfss.floorPlaceholder":"ex. : 2-5","cfss.floorPlaceholderParapet":"ex. : NV2 - NV3","cfss.hauteurMax":"Hauteur max :","cfss.colombage":"Colombage :","cfss.deflexionMax":"Déflexion max :","cfss.selectDeflexionMax":"Sélectionner la déflexion max...","cfss.note":"Note :","cfss.optionalNotePlaceholder":"Note optionnelle (max 100 caractères)...","cfss.saveWall":"Enregistrer le mur","cfss.browse":"Parcourir","cfss.uploadImages":"Téléverser des images","cfss.uploadImage":"Téléverser une image","cfss.dropOrPasteImages":"Déposer ou coller des images ici (Ctrl+V)","cfss.dropOrPasteImage":"Déposer ou coller une image ici (Ctrl+V)","cfss.newParapet":"Nouveau parapet","cfss.parapetName":"Nom du parapet :","cfss.enterParapetName":"Entrer le nom du parapet...","cfss.parapetType":"Type de parapet :","cfss.selectParapetType":"Sélectionner le type de parapet","cfss.selectAType":"Sélectionner un type","cfss.saveParapet":"Enregistrer le parapet","cfss.newWindow":"Nouvelle fenêtre","cfss.windowType":"Type de fenêtre :","cfss.enterWindowType":"Entrer le type de fenêtre...","cfss.selectColombage":"Sélectionner le colombage...","cfss.largeurMax":"Largeur max :","cfss.l1":"L1 :","cfss.l2":"L2 :","cfss.saveWindow":"Enregistrer la fenêtre","cfss.imageNotAvailable":"Image non disponible","cfss.newSoffite":"Nouveau soffite","cfss.soffiteName":"Nom du soffite :","cfss.enterSoffiteName":"Entrer le nom du soffite...","cfss.soffiteImages":"Images du soffite :","cfss.soffiteImagesHelp":"Max 2 images. Glisser-déposer, parcourir ou coller (Ctrl+V).","cfss.imageDescription":"Description de l\'image :","cfss.descriptionForImage1":"Description pour l\'image 1...","cfss.image2Description":"Description de l\'image 2 :","cfss.descriptionForImage2":"Description pour l\'image 2...","cfss.saveSoffite":"Enregistrer le soffite","cfss.selectSteelStud":"Sélectionner un montant en acier...","cfss.enterBottomTrack":"Veuillez entrer une lisse inférieure.","cfss.enterDeflectionTrack":"Veuillez entrer une lisse de déflexion.","cfss.calculationError":"Erreur de calcul","cfss.exteriorWallCalculation":"Calcul de mur extérieur","cfss.component":"Composant","cfss.designation":"Désignation","cfss.check":"Vérification","cfss.status":"Statut","cfss.ratioPercent":"Ratio (%)","cfss.steelStud":"Montant en acier","cfss.mCheck":"Vérification M","cfss.momentCheck":"Vérification du moment","cfss.shearCheck":"Vérification du cisaillement","cfss.combination":"Combinaison","cfss.deflectionCheck":"Vérification de la déflexion","cfss.webCrippling":"Écrasement de l\'âme","cfss.stiffener":"raidisseur","cfss.deflectionTrack":"Lisse de déflexion","cfss.bottomTrack":"Lisse inférieure","cfss.detailedResults":"Résultats détaillés","cfss.required":"Requis","cfss.allowable":"Admissible","cfss.reaction":"Réaction","cfss.capacity":"Capacité","cfss.load":"Charge","cfss.selectBottomTrack":"Sélectionner la lisse inférieure...","cfss.selectDeflectionTrack":"Sélectionner la lisse de déflexion...","cfss.aboutToCreateFirstRevision":["Vous êtes sur le point de ","action",". Ceci créera la première révision de ce projet."],"cfss.createFirstRevision":"Créer la première révision","cfss.createNewRevision":"Créer une nouvelle révision","cfss.createRevision":["Créer la révision ","number",""],"cfss.revisionDescriptionOptional":"Description (optionnel) :","cfss.max100Chars":"Max 100 caractères","cfss.thisWillCreate":"Ceci créera :","cfss.revisionNumber":["Révision ","number",""],"cfss.noCurrentRevision":"Aucune révision en cours","cfss.saveWallChanges":"Enregistrer les modifications du mur","cfss.updateCurrentRevision":"Mettre à jour la révision en cours","cfss.chooseHowTo":["Choisissez comment ","action","."],"cfss.optionalDescription":"Description (optionnel) :","cfss.maxRevisionsReached":"Nombre maximum de révisions atteint.","cfss.errorCreatingRevision":"Erreur lors de la création de la révision","cfss.noRevisionsFound":"Aucune révision trouvée.","cfss.noDescription":"Aucune description","cfss.current":"En cours","cfss.editDescription":"Modifier la description","cfss.wallCount":["","count"," mur(s)"],"cfss.by":"par","cfss.availableRevisions":["Révisions disponibles (","count",")"],"cfss.selectedOptions":"Options sélectionnées :","cfss.optionsWillBeIncluded":["","count"," option(s) seront incluses dans le rapport."],"cfss.noOptionsSelected":"Aucune option sélectionnée. Le rapport sera généré sans options.","cfss.optionsFromTabIncluded":"Les options de l\'onglet Options seront incluses.","cfss.generateReport":"Générer le rapport","cfss.generateReportBtn":"Générer le rapport","cfss.selectRevisionForReport":"Veuillez sélectionner une révision pour générer le rapport.","cfss.selectRevisionForReportDesc":"Sélectionnez une révision à partir de laquelle générer le rapport.","cfss.generatingReport":"Génération du rapport...","cfss.generatingPDF":"Génération du PDF...","cfss.generatingRevisionPDF":["Génération du PDF pour la révision ","number","..."],"cfss.errorGeneratingReport":"Erreur lors de la génération du rapport","cfss.reportSentToDrive":"Rapport envoyé sur Google Drive avec succès !","cfss.pdfTimedOut":"La génération du PDF a expiré. Veuillez réessayer.","cfss.revisionNotFound":"Révision non trouvée.","cfss.revisionNoWalls":["La révision ","number"," n\'a aucun mur. Veuillez ajouter des murs avant de générer un rapport."],"cfss.noProjectSelected":"Aucun projet sélectionné.","cfss.errorDisplayingOptions":"Erreur lors de l\'affichage des options.","cfss.noWallsYet":"Aucun mur ajouté pour l\'instant.","cfss.noWallsAddedYet":"Aucun mur ajouté pour l\'instant.","cfss.wallsAdded":["","count"," mur(s) ajouté(s)"],"cfss.wallSaved":"Mur enregistré avec succès !","cfss.wallUpdated":"Mur mis à jour avec succès !","cfss.wallImages":"Images du mur","cfss.dropImagesOrPaste":"Déposer ou coller des images ici (Ctrl+V)","cfss.dropImageOrPaste":"Déposer ou coller une image ici (Ctrl+V)","cfss.maxTwoImagesWall":"Un mur peut avoir un maximum de 2 images.","cfss.remainingImageSlots":["Seulement ","remaining"," emplacement(s) d\'image restant(s)."],"cfss.selectValidImages":"Veuillez sélectionner des fichiers image valides.","cfss.confirmDeleteWallAndImages":"Êtes-vous sûr de vouloir supprimer ce mur et toutes ses images ?","cfss.confirmDeleteWallNamed":["Êtes-vous sûr de vouloir supprimer le mur « ","name"," » et toutes ses images ?"],"cfss.confirmDeleteWall":"Êtes-vous sûr de vouloir supprimer ce mur ?","cfss.failedSaveWall":"Échec de l\'enregistrement du mur.","cfss.errorSavingWall":"Erreur lors de l\'enregistrement du mur","cfss.errorSavingWalls":"Erreur lors de l\'enregistrement des murs","cfss.errorSavingWallChanges":"Erreur lors de l\'enregistrement des modifications du mur","cfss.errorDisplayingWallDetails":"Erreur lors de l\'affichage des détails du mur","cfss.enterFloor":"Veuillez entrer un numéro d\'étage.","cfss.enterHeightValue":"Veuillez entrer une valeur de hauteur.","cfss.selectUnits":"Veuillez sélectionner les unités.","cfss.selectAnEspacement":"Veuillez sélectionner un espacement.","cfss.selectMontantMetallique":"Veuillez sélectionner un montant métallique.","cfss.selectMontantMetallique2":"Veuillez sélectionner un montant métallique pour le jeu 2.","cfss.selectEspacement":"Veuillez sélectionner un espacement.","cfss.selectEspacement2":"Veuillez sélectionner un espacement pour le jeu 2.","cfss.enterLisseInferieure":"Veuillez entrer la lisse inférieure.","cfss.enterLisseSuperieure":"Veuillez entrer la lisse supérieure.","cfss.enterLisseInferieure2":"Veuillez entrer la lisse inférieure pour le jeu 2.","cfss.enterLisseSuperieure2":"Veuillez entrer la lisse supérieure pour le jeu 2.","cfss.selectEntremise":"Veuillez sélectionner une entremise.","cfss.selectEntremise2":"Veuillez sélectionner une entremise pour le jeu 2.","cfss.selectEntremiseSpacing":"Veuillez sélectionner un espacement d\'entremise.","cfss.enterHauteurMax":"Veuillez entrer une hauteur maximale.","cfss.selectHauteurMaxUnit":"Veuillez sélectionner une unité pour la hauteur maximale.","cfss.enterConcreteAnchor":"Entrer l\'ancrage au béton...","cfss.enterSteelAnchor":"Entrer l\'ancrage à l\'acier...","cfss.noWallsInRevision":"Aucun mur trouvé dans la révision sélectionnée.","cfss.noParapetsYet":"Aucun parapet ajouté pour l\'instant.","cfss.noParapetsAddedYet":"Aucun parapet ajouté pour l\'instant.","cfss.parapetsAdded":["","count"," parapet(s) ajouté(s)"],"cfss.parapetSaved":"Parapet enregistré avec succès !","cfss.parapetUpdated":"Parapet mis à jour avec succès !","cfss.parapetUpdatedSuccessfully":"Parapet mis à jour avec succès !","cfss.parapetDeleted":"Parapet supprimé avec succès !","cfss.parapetNotFound":"Parapet non trouvé.","cfss.parapetImage":"Image du parapet","cfss.errorSavingParapet":"Erreur lors de l\'enregistrement du parapet","cfss.errorUpdatingParapet":"Erreur lors de la mise à jour du parapet","cfss.confirmDeleteParapet":"Êtes-vous sûr de vouloir supprimer ce parapet ?","cfss.maxOneImageParapet":"Un parapet ne peut avoir qu\'une seule image. Veuillez d\'abord retirer l\'image existante.","cfss.maxOneImageParapetShort":"Maximum 1 image par parapet.","cfss.mustHaveOneComposition":"Vous devez avoir au moins un élément de composition.","cfss.maxCompositionsReached":["Maximum de ","max"," compositions atteint."],"cfss.maxComps":["Max (","max",")"],"cfss.noWindowsYet":"Aucune fenêtre ajoutée pour l\'instant.","cfss.noWindowsAddedYet":"Aucune fenêtre ajoutée pour l\'instant.","cfss.windowsAdded":["","count"," fenêtre(s) ajoutée(s)"],"cfss.windowSaved":"Fenêtre enregistrée avec succès !","cfss.windowUpdated":"Fenêtre mise à jour avec succès !","cfss.windowUpdatedSuccessfully":"Fenêtre mise à jour avec succès !","cfss.windowNotFound":"Fenêtre non trouvée.","cfss.windowFormNotFound":"Formulaire de fenêtre non trouvé.","cfss.confirmDeleteWindow":"Êtes-vous sûr de vouloir supprimer cette fenêtre ?","cfss.selectWindowType":"Veuillez sélectionner un type de fenêtre.","cfss.enterValidDimensions":"Veuillez entrer des dimensions valides.","cfss.errorUpdatingWindow":"Erreur lors de la mise à jour de la fenêtre","cfss.errorSavingWindows":"Erreur lors de l\'enregistrement des fenêtres","cfss.soffitesAdded":["","count"," soffite(s) ajouté(s)"],"cfss.noSoffitesAddedYet":"Aucun soffite ajouté pour l\'instant.","cfss.confirmDeleteSoffite":"Êtes-vous sûr de vouloir supprimer ce soffite ?","cfss.errorSavingSoffites":"Erreur lors de l\'enregistrement des soffites","cfss.noImagesSaveSoffiteAnyway":"Aucune image sélectionnée. Enregistrer le soffite quand même ?","cfss.optionsSelected":["","count"," option(s) sélectionnée(s)"],"cfss.optionsSaved":["","count"," option(s) enregistrée(s) avec succès !"],"cfss.savingOptions":"Enregistrement des options...","cfss.errorSavingOptions":"Erreur lors de l\'enregistrement des options","cfss.noPermissionModifyOptions":"Vous n\'avez pas la permission de modifier les options.","cfss.noPermissionAddWalls":"Vous n\'avez pas la permission d\'ajouter des murs.","cfss.noPermissionEditWalls":"Vous n\'avez pas la permission de modifier les murs.","cfss.noPermissionDeleteWalls":"Vous n\'avez pas la permission de supprimer les murs.","cfss.noPermissionAddParapets":"Vous n\'avez pas la permission d\'ajouter des parapets.","cfss.noPermissionEditWindows":"Vous n\'avez pas la permission de modifier les fenêtres.","cfss.noPermissionAddCFSSData":"Vous n\'avez pas la permission d\'ajouter des données CFSS.","cfss.noPermissionModifyCFSSData":"Vous n\'avez pas la permission de modifier les données CFSS.","cfss.noPermissionToView":"Vous n\'avez pas la permission de voir ce projet.","cfss.addCFSSData":"Ajouter des données CFSS","cfss.editCFSSData":"Modifier les données CFSS","cfss.hideCFSSData":"Masquer les données CFSS","cfss.editCFSSDataFloors":["Modifier les données CFSS (","count"," étages)"],"cfss.editCFSSDataFloorsSpecs":["Modifier les données CFSS (","floors"," étages, ","specs"," spéc.)"],"cfss.addValidFloorData":"Veuillez ajouter des données d\'étage valides avant d\'enregistrer.","cfss.dataSaved":"Données enregistrées avec succès !","cfss.errorSavingCFSSData":"Erreur lors de l\'enregistrement des données CFSS","cfss.selectFileLabel":"Sélectionner un fichier","cfss.pasteLinkLabel":"Coller un lien","cfss.enterLinkUrl":"Veuillez entrer une URL de lien.","cfss.fileUploaded":"Fichier téléversé avec succès !","cfss.errorUploadingFile":"Erreur lors du téléversement du fichier","cfss.fileNotFound":"Fichier non trouvé.","cfss.errorDownloadingFile":"Erreur lors du téléchargement du fichier","cfss.confirmDeleteFile":"Êtes-vous sûr de vouloir supprimer ce fichier ?","cfss.fileDeleted":"Fichier supprimé avec succès !","cfss.errorDeletingFile":"Erreur lors de la suppression du fichier","cfss.stateSaved":"État enregistré avec succès !","cfss.errorSavingState":"Erreur lors de l\'enregistrement de l\'état","cfss.errorSavingDescription":"Erreur lors de l\'enregistrement de la description","cfss.errorReloadingData":"Erreur lors du rechargement des données","cfss.errorUploadingImage":["Erreur lors du téléversement de l\'image « ","name"," » : ","error",""],"cfss.customPagesAdded":["","count"," page(s) personnalisée(s) ajoutée(s)"],"cfss.noCustomPagesYet":"Aucune page personnalisée pour l\'instant.","cfss.fillWindCalcFields":"Veuillez remplir tous les champs de calcul de vent.","cfss.noBreakdownAvailable":"Aucune ventilation disponible pour cet étage.","cfss.exteriorWallCalc":"Calcul de mur extérieur","cfss.selectAtLeast2Floors":"Veuillez sélectionner au moins 2 étages à regrouper.","cfss.selectConsecutiveFloors":"Veuillez sélectionner des étages consécutifs uniquement.","cfss.floorsAlreadyGrouped":"Un ou plusieurs étages sélectionnés sont déjà regroupés.","cfss.failedSaveGrouping":"Échec de l\'enregistrement du regroupement d\'étages.","cfss.atLeastOneFloorRequired":"Au moins un étage est requis.","cfss.floorsSavedSuccessfully":"Étages enregistrés avec succès !","cfss.colombageSet1":"Colombage jeu 1","cfss.colombageSet2":"Colombage jeu 2","cfss.deflexionSet1":"Déflexion jeu 1","cfss.deflexionSet2":"Déflexion jeu 2","cfss.set1":"Jeu 1","cfss.set2":"Jeu 2","cfss.montant":"Montant","cfss.espacement":"Espacement","cfss.dimensions":"Dimensions","cfss.height":"Hauteur","cfss.type":"Type","cfss.widthLargeur":"Largeur","cfss.heightHauteur":"Hauteur","cfss.reference":"Référence","cfss.images":"Images","cfss.noImages":"Aucune image","cfss.selectValidImageFiles":"Veuillez sélectionner des fichiers image valides.","cfss.max2Images":"Max 2 images.","cfss.max2ImagesWall":"Maximum 2 images par mur.","cfss.max2ImagesParapet":"Maximum 2 images par parapet.","cfss.max2ImagesSoffite":"Maximum 2 images par soffite.","cfss.max2ImagesRemoveFirst":"Maximum 2 images. Veuillez d\'abord retirer une image.","cfss.maxImagesReached":"Nombre maximum d\'images atteint","cfss.submit":"Soumettre","cfss.submitting":"Soumission...","cfss.updateSubmission":"Mettre à jour la soumission","cfss.projectSubmittedSuccessfully":"Projet soumis avec succès !","cfss.projectUpdatedSuccessfully":"Projet mis à jour avec succès !","cfss.errorSubmittingProject":"Erreur lors de la soumission du projet","cfss.projectHasBeenSubmitted":"Ce projet a été soumis.","cfss.lastSubmitted":"Dernière soumission","cfss.addCustomPage":"Ajouter une page personnalisée","cfss.addElements":"Ajouter des éléments","cfss.addNewFloor":"Ajouter un nouvel étage","cfss.addNewWindow":"Ajouter une nouvelle fenêtre","cfss.addSoffitesPage":"Ajouter une page de soffites","cfss.backToDashboard":"Retour au tableau de bord","cfss.bearingLengthIn":"Longueur d\'appui (po) :","cfss.bridgingSpacingIn":"Espacement d\'entremise (po) :","cfss.calculationResults":"Résultats du calcul","cfss.claddingType":"Type de revêtement :","cfss.claddingWeight":"Poids du revêtement :","cfss.deflectionLimit":"Limite de déflexion :","cfss.enterMaxDeflection":"Entrer la déflexion max...","cfss.enterMaxSpacing":"Entrer l\'espacement max...","cfss.enterModel":"Entrer le modèle...","cfss.enterWeight":"Entrer le poids...","cfss.enterFramingAssembly":"Assemblage de colombage :","cfss.fastenerType":"Type d\'attache :","cfss.fillWallInfo":"Remplir les informations du mur","cfss.generateWallDataSheet":"Générer la fiche de données du mur","cfss.heading":"En-tête","cfss.image":"Image","cfss.jambageComposition":"Composition du jambage :","cfss.jambageType":"Type de jambage :","cfss.linteauComposition":"Composition du linteau :","cfss.linteauType":"Type de linteau :","cfss.loginToViewDetails":"Veuillez vous connecter pour voir les détails du projet.","cfss.model":"Modèle :","cfss.noFilesUploaded":"Aucun fichier téléversé.","cfss.optionalNote":"Note optionnelle...","cfss.pageTitle":"Détails du projet CFSS","cfss.projectDetails":"Détails du projet","cfss.properties":"Propriétés","cfss.review":"Révision","cfss.reviewCustomPages":"Réviser les pages personnalisées","cfss.reviewOptions":"Réviser les options","cfss.reviewParapets":"Réviser les parapets","cfss.reviewWalls":"Réviser les murs","cfss.reviewWindows":"Réviser les fenêtres","cfss.saveCFSSData":"Enregistrer les données CFSS","cfss.savePage":"Enregistrer la page","cfss.selectCladdingType":"Sélectionner le type de revêtement...","cfss.selectElementToEdit":"Sélectionner un élément à modifier","cfss.selectJambageType":"Sélectionner le type de jambage...","cfss.selectLinteauType":"Sélectionner le type de linteau...","cfss.selectMontant":"Sélectionner le montant...","cfss.selectSeuilType":"Sélectionner le type de seuil...","cfss.sendReportToClients":"Envoyer le rapport aux clients","cfss.seuilComposition":"Composition du seuil :","cfss.seuilType":"Type de seuil :","cfss.soffitesPages":"Pages de soffites","cfss.soffitesPagesAdded":["","count"," page(s) de soffites ajoutée(s)"],"cfss.spacingHorizontalIn":"Espacement horizontal (po) :","cfss.spacingIn":"Espacement (po) :","cfss.spacingVerticalIn":"Espacement vertical (po) :","cfss.textBlock":"Bloc de texte","cfss.thermoclip":"Thermoclip :","cfss.thermoclipDetails":"Détails du thermoclip :","cfss.wallDetails":"Détails du mur","cfss.weightSupportByStud":"Poids supporté par montant :","cfss.windData":"Données de vent","cfss.windloadResistanceULS":"Résistance à la charge de vent ULS :","users.userManagement":"Gestion des utilisateurs","users.searchUsers":"Rechercher par nom ou courriel...","users.allUsers":"Tous les utilisateurs","users.adminsOnly":"Administrateurs seulement","users.regularUsers":"Utilisateurs réguliers","users.limitedUsers":"Utilisateurs limités","users.allDomains":"Tous les domaines","users.toggleDebug":"Basculer débogage","users.totalUsers":"Total utilisateurs","users.admins":"Admins","users.regular":"Régulier","users.limited":"Limité","users.activeUsers":"Actif","users.company":"Entreprise :","users.domainLabel":"Domaine :","users.statusLabel":"Statut :","users.joined":"Inscrit :","users.statusActive":"Actif","users.statusDisabled":"Désactivé","users.approve":"Approuver","users.promoteToAdmin":"Promouvoir en admin","users.demoteToRegular":"Rétrograder en régulier","users.demoteToLimited":"Rétrograder en limité","users.promoteToRegular":"Promouvoir en régulier","users.deleteUser":"Supprimer l\'utilisateur","users.noUsersFound":"Aucun utilisateur trouvé correspondant à vos critères.","users.accessDenied":"Accès refusé. Privilèges d\'administrateur requis.","users.cannotDemoteSelf":"Vous ne pouvez pas vous rétrograder vous-même !","users.cannotDeleteSelf":"Vous ne pouvez pas vous supprimer vous-même !","users.confirmPromote":["Êtes-vous sûr de vouloir promouvoir ","email"," en administrateur ?"],"users.confirmDemote":["Êtes-vous sûr de vouloir retirer les privilèges d\'administrateur de ","email"," ?"],"users.confirmDemoteToLimited":["Êtes-vous sûr de vouloir rétrograder ","email"," en utilisateur limité ?\\n\\nLes utilisateurs limités ne peuvent accéder qu\'aux projets CFSS avec des fonctionnalités simplifiées."],"users.confirmPromoteToRegular":["Êtes-vous sûr de vouloir promouvoir ","email"," en utilisateur régulier ?"],"users.confirmDelete":["Êtes-vous sûr de vouloir supprimer définitivement ","email"," ?\\n\\nCette action est irréversible."],"users.confirmApprove":["Approuver le compte de ","email"," ?"],"users.promotedSuccess":["","email"," a été promu administrateur avec succès !\\n\\nL\'utilisateur devra se déconnecter et se reconnecter pour voir les fonctionnalités administrateur."],"users.demotedSuccess":["","email"," a été rétrogradé avec succès !\\n\\nL\'utilisateur devra se déconnecter et se reconnecter pour que les changements prennent effet."],"users.demotedToLimitedSuccess":["","email"," a été rétrogradé en utilisateur limité !\\n\\nL\'utilisateur devra se déconnecter et se reconnecter pour que les changements prennent effet."],"users.promotedToRegularSuccess":["","email"," a été promu en utilisateur régulier !\\n\\nL\'utilisateur devra se déconnecter et se reconnecter pour que les changements prennent effet."],"users.deletedSuccess":["","email"," a été supprimé définitivement !"],"users.approvedSuccess":["","email"," a été approuvé et peut maintenant se connecter !"],"users.errorPromoting":"Erreur lors de la promotion : ","users.errorDemoting":"Erreur lors de la rétrogradation : ","users.errorDeleting":"Erreur lors de la suppression : ","users.errorApproving":"Erreur lors de l\'approbation : ","users.errorDemotingToLimited":"Erreur lors de la rétrogradation en limité : ","users.errorPromotingToRegular":"Erreur lors de la promotion en régulier : ","users.adminDeleteWarning":["","email"," est un utilisateur ADMIN.\\n\\nPour supprimer un admin en toute sécurité :\\n1. D\'abord le rétrograder en utilisateur régulier\\n2. Ensuite le supprimer\\nVoulez-vous d\'abord le rétrograder ?"],"users.sampleDataWarning":"Impossible de charger les utilisateurs réels depuis l\'API. Affichage de données d\'exemple.\\n\\nCeci est normal en mode démonstration. Cliquez sur « Basculer débogage » pour les détails techniques.","bulkVerify.title":"Vérifier les projets en lot","bulkVerify.uploadPDFs":"Téléverser les PDF","bulkVerify.processing":"Traitement en cours...","bulkVerify.verifyAndSign":"Vérifier et signer","bulkVerify.downloadProcessed":"Télécharger les traités","bulkVerify.clearedAllFiles":"Tous les fichiers ont été effacés.","bulkVerify.clearList":"Effacer la liste","bulkVerify.description":"Téléverser des fichiers PDF pour vérifier, signer et aplatir.","bulkVerify.downloadsStarted":"Téléchargements démarrés.","bulkVerify.downloadToDrive":"Télécharger vers Drive","bulkVerify.downloadToPC":"Télécharger sur le PC","bulkVerify.driveUploadStarted":["","count"," fichier(s) envoyé(s) vers Google Drive."],"bulkVerify.dropzoneBrowse":"ou cliquer pour parcourir","bulkVerify.dropzoneDrag":"Glisser-déposer des fichiers PDF ici","bulkVerify.failedToProcess":["","count"," fichier(s) n\'ont pas pu être traités."],"bulkVerify.failedToSendToDrive":"Échec de l\'envoi vers Google Drive","bulkVerify.failedToUpload":["","count"," fichier(s) n\'ont pas pu être téléversés."],"bulkVerify.failedToUploadFiles":"Échec du téléversement des fichiers","bulkVerify.failedToVerifyFiles":"Échec de la vérification des fichiers","bulkVerify.fileNotReadyForDownload":"Fichier non prêt pour le téléchargement.","bulkVerify.filesAddedToQueue":["","count"," fichier(s) ajouté(s) à la file d\'attente."],"bulkVerify.filesFailedCloudUpload":["","count"," fichier(s) ont échoué lors du téléversement : ","fileNames",""],"bulkVerify.flattenAfterSignFailed":"L\'aplatissement après signature a échoué","bulkVerify.flattenedStillProcessing":"Fichiers aplatis encore en cours de traitement...","bulkVerify.hoursAgo":["Il y a ","count"," heure(s)"],"bulkVerify.justNow":"À l\'instant","bulkVerify.minutesAgo":["Il y a ","count"," minute(s)"],"bulkVerify.noFilesForDriveTransfer":"Aucun fichier pour le transfert vers Drive.","bulkVerify.noFilesQueuedYet":"Aucun fichier en file d\'attente.","bulkVerify.noNewFilesToUpload":"Aucun nouveau fichier à téléverser.","bulkVerify.noProcessedFilesToDownload":"Aucun fichier traité à télécharger.","bulkVerify.noVerifiedFilesForDrive":"Aucun fichier vérifié pour le transfert vers Drive.","bulkVerify.onlyPdfAllowed":"Seuls les fichiers PDF sont autorisés.","bulkVerify.processedDescription":"Les fichiers traités apparaîtront ici.","bulkVerify.processedFiles":"Fichiers traités","bulkVerify.processedFilesWillAppear":"Les fichiers traités apparaîtront ici.","bulkVerify.s3UploadFailed":["Échec du téléversement S3 : ","message",""],"bulkVerify.signAndFlatten":"Signer et aplatir","bulkVerify.signed":"Signé","bulkVerify.statusError":"Erreur","bulkVerify.statusPending":"En attente","bulkVerify.statusUploaded":"Téléversé","bulkVerify.statusUploading":"Téléversement","bulkVerify.statusVerified":"Vérifié","bulkVerify.statusVerifying":"Vérification","bulkVerify.successfullyProcessed":["","count"," fichier(s) traité(s) avec succès."],"bulkVerify.unableToStartDownload":"Impossible de démarrer le téléchargement.","bulkVerify.unableToStartDownloads":"Impossible de démarrer les téléchargements.","bulkVerify.noFilesToProcess":"Aucun fichier à traiter. Ajoutez d\'abord des fichiers PDF.","bulkVerify.noFilesUploadedSuccessfully":"Aucun fichier téléversé avec succès. Impossible de procéder à la vérification.","bulkVerify.uploadedFiles":["","count"," fichier(s) téléversé(s)."],"bulkVerify.waitBeforeRemoving":"Veuillez patienter avant de retirer.","bulkVerify.waitForCurrentOperation":"Veuillez attendre la fin de l\'opération en cours.","email.title":"Classifications des courriels","email.review":"Révision","email.date":"Date","email.from":"De","email.subject":"Sujet","email.content":"Contenu","email.vietnameseTranslation":"Traduction vietnamienne","email.emailLink":"Lien du courriel","email.summary":"Résumé","email.aiCategory":"Catégorie IA","email.correctCategory":"Catégorie correcte","email.processed":"Traité","email.client":"Client","email.projectNumber":"Numéro de projet trouvé","email.allTime":"Toutes les périodes","email.clearFilters":"Effacer les filtres","email.dateRange":"Période","email.deleteSelected":"Supprimer la sélection","email.filterByColumn":"Filtrer par colonne","email.filterValue":"Valeur du filtre","email.selectColumn":"Sélectionner une colonne...","email.showing":"Affichage","email.thisMonth":"Ce mois-ci","email.thisWeek":"Cette semaine","email.thisYear":"Cette année","email.today":"Aujourd\'hui","email.total":"Total","email.typeToFilter":"Taper pour filtrer...","bulk.deleteCount":["Supprimer ","count"," projet(s) sélectionné(s) ? Cette action est irréversible."],"bulk.deleteCFSSCount":["Supprimer ","count"," projet(s) CFSS sélectionné(s) ? Cette action est irréversible."],"bulk.deletedCount":["","success"," projet(s) supprimé(s). ","fail"," échoué(s)."],"customPages.alignCenter":"Centrer","customPages.alignLeft":"Gauche","customPages.alignment":"Alignement","customPages.alignRight":"Droite","customPages.aspectRatioPreserved":"Rapport d\'aspect préservé","customPages.clickToEditText":"Cliquer pour modifier le texte...","customPages.color":"Couleur","customPages.confirmDeletePage":"Êtes-vous sûr de vouloir supprimer cette page personnalisée ?","customPages.confirmDeleteSoffitesPage":"Êtes-vous sûr de vouloir supprimer cette page de soffites ?","customPages.dragAndDropElements":"Glisser-déposer les éléments ici","customPages.dropOrPasteHere":"Déposer ou coller une image ici...","customPages.elements":"éléments","customPages.enterPageTitle":"Veuillez entrer un titre de page.","customPages.errorDeletingSoffitesPage":"Erreur lors de la suppression de la page de soffites","customPages.errorSavingPage":"Erreur lors de l\'enregistrement de la page","customPages.errorSavingSoffitesPage":"Erreur lors de l\'enregistrement de la page de soffites","customPages.errorUploadingImage":"Erreur lors du téléversement de l\'image","customPages.font":"Police","customPages.fontSize":"Taille de police","customPages.height":"Hauteur","customPages.imagePastedSuccess":"Image collée avec succès !","customPages.lastModified":"Dernière modification","customPages.newHeading":"Nouveau titre","customPages.noCustomPagesYet":"Aucune page personnalisée pour l\'instant.","customPages.noSoffitesPagesYet":"Aucune page de soffites pour l\'instant.","customPages.pageSavedSuccess":"Page enregistrée avec succès !","customPages.position":"Position","customPages.positionX":"X","customPages.positionY":"Y","customPages.selectElementToEdit":"Sélectionner un élément pour modifier ses propriétés","customPages.selectValidImage":"Veuillez sélectionner un fichier image valide.","customPages.size":"Taille","customPages.soffitesPagesAdded":"page(s) de soffites ajoutée(s)","customPages.soffitesPageSavedSuccess":"Page de soffites enregistrée avec succès !","customPages.typeface":"Police de caractères","customPages.untitledPage":"Page sans titre","customPages.width":"Largeur","dataExport.comingSoon":"Fonctionnalité d\'exportation bientôt disponible !","errors.checkConsole":"Vérifiez la console pour les détails","errors.errorLoadingStats":"Erreur de chargement des statistiques : HTTP ","errors.statsUnavailable":"Statistiques non disponibles","reassign.title":"Assigner le projet","reassign.currentOwner":"Propriétaire actuel","reassign.searchPlaceholder":"Rechercher par nom, courriel ou entreprise...","reassign.searchPrompt":"Tapez pour rechercher des utilisateurs","reassign.noUsersFound":"Aucun utilisateur trouvé correspondant à votre recherche.","reassign.noCompany":"Aucune entreprise","reassign.assignBtn":"Assigner la sélection","reassign.assigning":"Assignation...","reassign.assignedTo":"Assigné à :","reassign.confirmMessage":["Assigner ce projet à ","count"," utilisateur(s) : ","names"," ?"],"reassign.differentCompanyWarning":"Attention : Certains utilisateurs sélectionnés sont d\'une entreprise différente du propriétaire actuel. Êtes-vous sûr de vouloir continuer ?","reassign.success":"Projet assigné avec succès. Tous les utilisateurs assignés ont été notifiés par courriel.","reassign.error":["Échec de l\'assignation du projet : ","error",""],"reassign.loading":"Chargement des utilisateurs..."}');
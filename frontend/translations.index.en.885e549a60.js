@@ -0,0 +1,2 @@
+// Generated by _replace_strings.py --build-translations. Do not edit.
+(self.translationsFlat || (self.translationsFlat = {}))["en"] = JSON.parse('{"common.delete":"Delete","common.view":"View","common.admin":"ADMIN","common.limited":"LIMITED","nav.protectionSismique":"Protection Sismique","dashboard.projectDashboard":"Project Dashboard","dashboard.createNewProject":"Create New Project","dashboard.allProjects":"All Projects","dashboard.noProjectsBasic":"No projects found. Create your first project to get started!","dashboard.errorFiltering":"Error filtering projects: ","status.planning":"Planning","status.inProgress":"In Progress","status.completed":"Completed","project.address":"Address:","project.deleteConfirm":"Are you sure you want to delete this project?","project.type":"Type:","project.domain":"Domain:","project.created":"Created","project.deleteSuccess":"Project deleted successfully!","project.deleteError":"Error deleting project: "}');
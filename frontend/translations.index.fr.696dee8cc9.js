@@ -0,0 +1,2 @@
+// Generated by _replace_strings.py --build-translations. Do not edit.
+(self.translationsFlat || (self.translationsFlat = {}))["fr"] = JSON.parse('{"common.delete":"Supprimer","common.view":"Voir","common.admin":"ADMIN","common.limited":"LIMITÉ","nav.protectionSismique":"Protection Sismique","dashboard.projectDashboard":"Tableau de bord des projets","dashboard.createNewProject":"Créer un nouveau projet","dashboard.allProjects":"Tous les projets","dashboard.noProjectsBasic":"Aucun projet trouvé. Créez votre premier projet pour commencer !","dashboard.errorFiltering":"Erreur de filtrage des projets : ","status.planning":"Planification","status.inProgress":"En cours","status.completed":"Terminé","project.address":"Adresse :","project.deleteConfirm":"Êtes-vous sûr de vouloir supprimer ce projet ?","project.type":"Type :","project.domain":"Domaine :","project.created":"Créé le","project.deleteSuccess":"Projet supprimé avec succès !","project.deleteError":"Erreur de suppression du projet : "}');
@@ -0,0 +1,2 @@
+// Generated by _replace_strings.py --build-translations. Do not edit.
+(self.translationsFlat || (self.translationsFlat = {}))["en"] = JSON.parse('{"common.dashboard":"Dashboard","common.admin":"ADMIN","common.limited":"LIMITED","createProject.createNewCFSSProject":"Create New CFSS Project","createProject.projectName":"Project Name:","createProject.clientName":"Client Name:","createProject.description":"Description:","createProject.addressLine1":"Address Line 1:","createProject.addressLine2":"Address Line 2:","createProject.city":"City:","createProject.province":"Province:","createProject.country":"Country:","createProject.createCFSSProject":"Create CFSS Project","createProject.companyName":"Company Name:","createProject.deflectionMax":"Deflection Max:","createProject.enterClientName":"Enter client name...","createProject.enterDescription":"Enter description...","createProject.enterLocation":"Enter location...","createProject.enterProjectName":"Enter project name...","createProject.selectDeflection":"Select deflection max...","createProject.selectThickness":"Select thickness min...","createProject.thicknessMin":"Thickness Min:","project.errorCreating":"Error creating project: ","project.enterProjectName":"Please enter a project name","project.cfssProjectCreatedSuccess":"CFSS Project created successfully!","project.errorInitPage":"Error initializing page: "}');
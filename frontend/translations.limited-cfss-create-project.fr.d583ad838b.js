@@ -0,0 +1,2 @@
+// Generated by _replace_strings.py --build-translations. Do not edit.
+(self.translationsFlat || (self.translationsFlat = {}))["fr"] = JSON.parse('{"common.dashboard":"Tableau de bord","common.admin":"ADMIN","common.limited":"LIMITÉ","createProject.createNewCFSSProject":"Créer un nouveau projet CFSS","createProject.projectName":"Nom du projet :","createProject.clientName":"Nom du client :","createProject.description":"Description :","createProject.addressLine1":"Adresse ligne 1 :","createProject.addressLine2":"Adresse ligne 2 :","createProject.city":"Ville :","createProject.province":"Province :","createProject.country":"Pays :","createProject.createCFSSProject":"Créer le projet CFSS","createProject.companyName":"Nom de l\'entreprise :","createProject.deflectionMax":"Déflexion max :","createProject.enterClientName":"Entrer le nom du client...","createProject.enterDescription":"Entrer la description...","createProject.enterLocation":"Entrer l\'emplacement...","createProject.enterProjectName":"Entrer le nom du projet...","createProject.selectDeflection":"Sélectionner la déflexion max...","createProject.selectThickness":"Sélectionner l\'épaisseur min...","createProject.thicknessMin":"Épaisseur min :","project.errorCreating":"Erreur de création du projet : ","project.enterProjectName":"Veuillez entrer un nom de projet","project.cfssProjectCreatedSuccess":"Projet CFSS créé avec succès !","project.errorInitPage":"Erreur d\'initialisation de la page : "}');
@@ -0,0 +1,2 @@
+// Generated by _replace_strings.py --build-translations. Do not edit.
+(self.translationsFlat || (self.translationsFlat = {}))["en"] = JSON.parse('{"common.loadingProjects":"Loading CFSS Projects...","common.delete":"Delete","common.view":"View","common.admin":"ADMIN","common.limited":"LIMITED","dashboard.cfssProjects":"CFSS Projects","dashboard.searchProjects":"Search projects...","dashboard.allStatus":"All Status","dashboard.noCFSSProjectsFound":"No CFSS projects found. Create your first CFSS project to get started!","dashboard.newCFSSProject":"New CFSS Project","dashboard.totalCFSS":"Total CFSS","dashboard.planning":"Planning","dashboard.active":"Active","dashboard.done":"Done","dashboard.errorInitDashboard":"Error initializing dashboard: ","dashboard.errorDeletingCFSS":"Error deleting CFSS project: ","status.planning":"Planning","status.inProgress":"In Progress","status.completed":"Completed","project.deleteCFSSConfirm":"Are you sure you want to delete this CFSS project?","project.noAddress":"No address","project.cfssProject":"CFSS Project"}');
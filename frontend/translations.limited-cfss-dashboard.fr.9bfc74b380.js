@@ -0,0 +1,2 @@
+// Generated by _replace_strings.py --build-translations. Do not edit.
+(self.translationsFlat || (self.translationsFlat = {}))["fr"] = JSON.parse('{"common.loadingProjects":"Chargement des projets CFSS...","common.delete":"Supprimer","common.view":"Voir","common.admin":"ADMIN","common.limited":"LIMITÉ","dashboard.cfssProjects":"Projets CFSS","dashboard.searchProjects":"Rechercher des projets...","dashboard.allStatus":"Tous les statuts","dashboard.noCFSSProjectsFound":"Aucun projet CFSS trouvé. Créez votre premier projet CFSS pour commencer !","dashboard.newCFSSProject":"Nouveau projet CFSS","dashboard.totalCFSS":"Total CFSS","dashboard.planning":"Planification","dashboard.active":"Actif","dashboard.done":"Terminé","dashboard.errorInitDashboard":"Erreur d\'initialisation du tableau de bord : ","dashboard.errorDeletingCFSS":"Erreur de suppression du projet CFSS : ","status.planning":"Planification","status.inProgress":"En cours","status.completed":"Terminé","project.deleteCFSSConfirm":"Êtes-vous sûr de vouloir supprimer ce projet CFSS ?","project.noAddress":"Pas d\'adresse","project.cfssProject":"Projet CFSS"}');
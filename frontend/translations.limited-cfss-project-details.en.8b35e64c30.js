@@ -0,0 +1,2 @@
+// Generated by _replace_strings.py --build-translations. Do not edit.
+(self.translationsFlat || (self.translationsFlat = {}))["en"] = JSON.parse('{"common.loading":"Loading...","common.save":"Save","common.cancel":"Cancel","common.delete":"Delete","common.edit":"Edit","common.upload":"Upload","common.submit":"Submit","common.dashboard":"Dashboard","common.admin":"ADMIN","common.limited":"LIMITED","common.browse":"Browse","common.details":"Details","common.duplicate":"Duplicate","common.hide":"Hide","common.hideForm":"Hide Form","common.saveChanges":"Save Changes","common.uploading":"Uploading...","common.adding":"Adding...","common.noDescription":"No description","common.notSpecified":"Not specified","nav.protectionSismiqueCFSS":"Protection Sismique - CFSS","nav.backToDashboard":"Back to Dashboard","auth.authenticationRequired":"Authentication Required","auth.pleaseLoginCFSSDetails":"Please log in to view CFSS project details.","auth.goToLogin":"Go to Login","auth.accessDenied":"Access Denied","auth.noPermissionCFSS":"You don\'t have permission to view this CFSS project.","status.planning":"Planning","status.inProgress":"In Progress","status.completed":"Completed","project.cfssProjectDetails":"CFSS Project Details","project.status":"Status:","project.address":"Address:","project.pleaseWaitLoading":"Please wait while we load the project details.","project.projectName":"Project Name:","project.companyName":"Company Name:","project.clientName":"Client Name:","project.description":"Description:","project.errorLoadingProject":"Error loading project","project.selectFile":"Select File","project.pasteLink":"Paste Link","project.enterFileName":"Please enter a file name.","project.onlyHttpsAllowed":"Only HTTPS links are allowed.","project.enterValidUrl":"Please enter a valid URL.","project.linkAddedSuccessfully":"Link added successfully!","project.errorAddingLink":"Error adding link","project.fileUploadedSuccessfully":"File uploaded successfully!","project.errorUploadingFile":"Error uploading file","project.fileNotFound":"File not found.","project.errorDownloadingFile":"Error downloading file","project.confirmDeleteFile":"Are you sure you want to delete this file?","project.fileDeletedSuccessfully":"File deleted successfully!","project.errorDeletingFile":"Error deleting file","project.errorSavingProject":"Error saving project","project.projectNotLoaded":"Project not loaded.","project.noProjectId":"No project ID specified.","cfss.deflectionMax":"Deflection Max:","cfss.thicknessMin":"Thickness Min:","cfss.projectFiles":"Project Files","cfss.uploadFile":"Upload File","cfss.pasteLink":"Paste Link","cfss.fileName":"File Name","cfss.selectFile":"Select File","cfss.addWall":"Add Wall","cfss.addWindow":"Add Window","cfss.floorCalculations":"Floor Calculations","cfss.floor":"Floor","cfss.addFloor":"Add Floor","cfss.source":"Source:","cfss.enterFileName":"Enter file name...","cfss.fileType":"Type","cfss.fileDate":"Date","cfss.actions":"Actions","cfss.noFilesYet":"No files uploaded yet. Click \\"Upload File\\" to add files.","cfss.submitProjectToAdmin":"Submit Project to Admin","cfss.sendForAdminReview":"Send this project for admin review and processing.","cfss.optionList":"Option List","cfss.wallList":"Wall List","cfss.parapetList":"Parapet List","cfss.windowList":"Window List","cfss.soffitesList":"Soffites List","cfss.saveOptions":"Save Options","cfss.lisseTrouee":"Lisse Trouee","cfss.doubleLisse":"Double Lisse","cfss.lisseBasse":"Lisse Basse","cfss.parapet":"Parapet","cfss.fenetre":"Fenetre","cfss.jambagesLinteauxSeuils":"Jambages, Linteaux & Seuils","cfss.addParapet":"Add Parapet","cfss.addSoffites":"Add Soffites","cfss.newWall":"New Wall","cfss.wallName":"Wall Name:","cfss.enterWallName":"Enter wall name...","cfss.floorLabel":"Floor:","cfss.floorPlaceholder":"e.g., 2-5","cfss.floorPlaceholderParapet":"e.g., NV2 - NV3","cfss.hauteurMax":"Hauteur Max:","cfss.colombage":"Colombage:","cfss.deflexionMax":"Deflexion Max:","cfss.selectDeflexionMax":"Select deflexion max...","cfss.note":"Note:","cfss.optionalNotePlaceholder":"Optional note (max 100 characters)...","cfss.saveWall":"Save Wall","cfss.browse":"Browse","cfss.uploadImages":"Upload Images","cfss.uploadImage":"Upload Image","cfss.dropOrPasteImages":"Drop or paste images here (Ctrl+V)","cfss.dropOrPasteImage":"Drop or paste image here (Ctrl+V)","cfss.newParapet":"New Parapet","cfss.parapetName":"Parapet Name:","cfss.enterParapetName":"Enter parapet name...","cfss.parapetType":"Parapet Type:","cfss.selectParapetType":"Select Parapet Type","cfss.selectAType":"Select a type","cfss.saveParapet":"Save Parapet","cfss.newWindow":"New Window","cfss.windowType":"Window Type:","cfss.enterWindowType":"Enter window type...","cfss.selectColombage":"Select colombage...","cfss.largeurMax":"Largeur Max:","cfss.l1":"L1:","cfss.l2":"L2:","cfss.saveWindow":"Save Window","cfss.imageNotAvailable":"Image not available","cfss.newSoffite":"New Soffite","cfss.soffiteName":"Soffite name:","cfss.enterSoffiteName":"Enter soffite name...","cfss.soffiteImages":"Soffite images:","cfss.soffiteImagesHelp":"Max 2 images. Drag & drop, browse, or paste (Ctrl+V).","cfss.imageDescription":"Image description:","cfss.descriptionForImage1":"Description for image 1...","cfss.image2Description":"Image 2 description:","cfss.descriptionForImage2":"Description for image 2...","cfss.saveSoffite":"Save Soffite","cfss.noWallsAddedYet":"No walls added yet.","cfss.wallsAdded":["","count"," wall(s) added"],"cfss.confirmDeleteWall":"Are you sure you want to delete this wall?","cfss.noParapetsAddedYet":"No parapets added yet.","cfss.parapetsAdded":["","count"," parapet(s) added"],"cfss.parapetUpdatedSuccessfully":"Parapet updated successfully!","cfss.confirmDeleteParapet":"Are you sure you want to delete this parapet?","cfss.noWindowsAddedYet":"No windows added yet.","cfss.windowsAdded":["","count"," window(s) added"],"cfss.windowUpdatedSuccessfully":"Window updated successfully!","cfss.confirmDeleteWindow":"Are you sure you want to delete this window?","cfss.soffitesAdded":["","count"," soffite(s) added"],"cfss.noSoffitesAddedYet":"No soffites added yet.","cfss.confirmDeleteSoffite":"Are you sure you want to delete this soffite?","cfss.noImagesSaveSoffiteAnyway":"No images selected. Save soffite anyway?","cfss.optionsSelected":["","count"," option(s) selected"],"cfss.errorSavingOptions":"Error saving options","cfss.atLeastOneFloorRequired":"At least one floor is required.","cfss.floorsSavedSuccessfully":"Floors saved successfully!","cfss.colombageSet1":"Colombage Set 1","cfss.colombageSet2":"Colombage Set 2","cfss.deflexionSet1":"Deflexion Set 1","cfss.deflexionSet2":"Deflexion Set 2","cfss.set1":"Set 1","cfss.set2":"Set 2","cfss.montant":"Montant","cfss.espacement":"Espacement","cfss.dimensions":"Dimensions","cfss.height":"Height","cfss.type":"Type","cfss.widthLargeur":"Width (Largeur)","cfss.heightHauteur":"Height (Hauteur)","cfss.reference":"Reference","cfss.images":"Images","cfss.noImages":"No images","cfss.selectValidImageFiles":"Please select valid image files.","cfss.max2Images":"Max 2 images.","cfss.max2ImagesWall":"Maximum 2 images per wall.","cfss.max2ImagesParapet":"Maximum 2 images per parapet.","cfss.max2ImagesSoffite":"Maximum 2 images per soffite.","cfss.max2ImagesRemoveFirst":"Maximum 2 images. Please remove an image first.","cfss.maxImagesReached":"Maximum images reached","cfss.submit":"Submit","cfss.submitting":"Submitting...","cfss.updateSubmission":"Update Submission","cfss.projectSubmittedSuccessfully":"Project submitted successfully!","cfss.projectUpdatedSuccessfully":"Project updated successfully!","cfss.errorSubmittingProject":"Error submitting project","cfss.projectHasBeenSubmitted":"This project has been submitted.","cfss.lastSubmitted":"Last submitted"}');
@@ -0,0 +1,2 @@
+// Generated by _replace_strings.py --build-translations. Do not edit.
+(self.translationsFlat || (self.translationsFlat = {}))["fr"] = JSON.parse('{"common.loading":"Chargement...","common.save":"Enregistrer","common.cancel":"Annuler","common.delete":"Supprimer","common.edit":"Modifier","common.upload":"Téléverser","common.submit":"Soumettre","common.dashboard":"Tableau de bord","common.admin":"ADMIN","common.limited":"LIMITÉ","common.browse":"Parcourir","common.details":"Détails","common.duplicate":"Dupliquer","common.hide":"Masquer","common.hideForm":"Masquer le formulaire","common.saveChanges":"Enregistrer les modifications","common.uploading":"Téléversement...","common.adding":"Ajout...","common.noDescription":"Aucune description","common.notSpecified":"Non spécifié","nav.protectionSismiqueCFSS":"Protection Sismique - CFSS","nav.backToDashboard":"Retour au tableau de bord","auth.authenticationRequired":"Authentification requise","auth.pleaseLoginCFSSDetails":"Veuillez vous connecter pour voir les détails du projet CFSS.","auth.goToLogin":"Aller à la connexion","auth.accessDenied":"Accès refusé","auth.noPermissionCFSS":"Vous n\'avez pas la permission de voir ce projet CFSS.","status.planning":"Planification","status.inProgress":"En cours","status.completed":"Terminé","project.cfssProjectDetails":"Détails du projet CFSS","project.status":"Statut :","project.address":"Adresse :","project.pleaseWaitLoading":"Veuillez patienter pendant le chargement des détails du projet.","project.projectName":"Nom du projet :","project.companyName":"Nom de l\'entreprise :","project.clientName":"Nom du client :","project.description":"Description :","project.errorLoadingProject":"Erreur de chargement du projet","project.selectFile":"Sélectionner un fichier","project.pasteLink":"Coller un lien","project.enterFileName":"Veuillez entrer un nom de fichier.","project.onlyHttpsAllowed":"Seuls les liens HTTPS sont autorisés.","project.enterValidUrl":"Veuillez entrer une URL valide.","project.linkAddedSuccessfully":"Lien ajouté avec succès !","project.errorAddingLink":"Erreur lors de l\'ajout du lien","project.fileUploadedSuccessfully":"Fichier téléversé avec succès !","project.errorUploadingFile":"Erreur lors du téléversement du fichier","project.fileNotFound":"Fichier introuvable.","project.errorDownloadingFile":"Erreur lors du téléchargement du fichier","project.confirmDeleteFile":"Êtes-vous sûr de vouloir supprimer ce fichier ?","project.fileDeletedSuccessfully":"Fichier supprimé avec succès !","project.errorDeletingFile":"Erreur lors de la suppression du fichier","project.errorSavingProject":"Erreur lors de l\'enregistrement du projet","project.projectNotLoaded":"Projet non chargé.","project.noProjectId":"Aucun identifiant de projet spécifié.","cfss.deflectionMax":"Déflexion max :","cfss.thicknessMin":"Épaisseur min :","cfss.projectFiles":"Fichiers du projet","cfss.uploadFile":"Téléverser un fichier","cfss.pasteLink":"Coller un lien","cfss.fileName":"Nom du fichier","cfss.selectFile":"Sélectionner un fichier","cfss.addWall":"Ajouter un mur","cfss.addWindow":"Ajouter une fenêtre","cfss.floorCalculations":"Calculs par étage","cfss.floor":"Étage","cfss.addFloor":"Ajouter un étage","cfss.source":"Source :","cfss.enterFileName":"Entrer le nom du fichier...","cfss.fileType":"Type","cfss.fileDate":"Date","cfss.actions":"Actions","cfss.noFilesYet":"Aucun fichier téléversé. Cliquez sur « Téléverser un fichier » pour ajouter des fichiers.","cfss.submitProjectToAdmin":"Soumettre le projet à l\'administrateur","cfss.sendForAdminReview":"Envoyer ce projet pour révision et traitement par l\'administrateur.","cfss.optionList":"Liste d\'options","cfss.wallList":"Liste des murs","cfss.parapetList":"Liste des parapets","cfss.windowList":"Liste des fenêtres","cfss.soffitesList":"Liste des soffites","cfss.saveOptions":"Enregistrer les options","cfss.lisseTrouee":"Lisse Trouée","cfss.doubleLisse":"Double Lisse","cfss.lisseBasse":"Lisse Basse","cfss.parapet":"Parapet","cfss.fenetre":"Fenêtre","cfss.jambagesLinteauxSeuils":"Jambages, Linteaux & Seuils","cfss.addParapet":"Ajouter un parapet","cfss.addSoffites":"Ajouter des soffites","cfss.newWall":"Nouveau mur","cfss.wallName":"Nom du mur :","cfss.enterWallName":"Entrer le nom du mur...","cfss.floorLabel":"Étage :","cfss.floorPlaceholder":"ex. : 2-5","cfss.floorPlaceholderParapet":"ex. : NV2 - NV3","cfss.hauteurMax":"Hauteur max :","cfss.colombage":"Colombage :","cfss.deflexionMax":"Déflexion max :","cfss.selectDeflexionMax":"Sélectionner la déflexion max...","cfss.note":"Note :","cfss.optionalNotePlaceholder":"Note optionnelle (max 100 caractères)...","cfss.saveWall":"Enregistrer le mur","cfss.browse":"Parcourir","cfss.uploadImages":"Téléverser des images","cfss.uploadImage":"Téléverser une image","cfss.dropOrPasteImages":"Déposer ou coller des images ici (Ctrl+V)","cfss.dropOrPasteImage":"Déposer ou coller une image ici (Ctrl+V)","cfss.newParapet":"Nouveau parapet","cfss.parapetName":"Nom du parapet :","cfss.enterParapetName":"Entrer le nom du parapet...","cfss.parapetType":"Type de parapet :","cfss.selectParapetType":"Sélectionner le type de parapet","cfss.selectAType":"Sélectionner un type","cfss.saveParapet":"Enregistrer le parapet","cfss.newWindow":"Nouvelle fenêtre","cfss.windowType":"Type de fenêtre :","cfss.enterWindowType":"Entrer le type de fenêtre...","cfss.selectColombage":"Sélectionner le colombage...","cfss.largeurMax":"Largeur max :","cfss.l1":"L1 :","cfss.l2":"L2 :","cfss.saveWindow":"Enregistrer la fenêtre","cfss.imageNotAvailable":"Image non disponible","cfss.newSoffite":"Nouveau soffite","cfss.soffiteName":"Nom du soffite :","cfss.enterSoffiteName":"Entrer le nom du soffite...","cfss.soffiteImages":"Images du soffite :","cfss.soffiteImagesHelp":"Max 2 images. Glisser-déposer, parcourir ou coller (Ctrl+V).","cfss.imageDescription":"Description de l\'image :","cfss.descriptionForImage1":"Description pour l\'image 1...","cfss.image2Description":"Description de l\'image 2 :","cfss.descriptionForImage2":"Description pour l\'image 2...","cfss.saveSoffite":"Enregistrer le soffite","cfss.noWallsAddedYet":"Aucun mur ajouté pour l\'instant.","cfss.wallsAdded":["","count"," mur(s) ajouté(s)"],"cfss.confirmDeleteWall":"Êtes-vous sûr de vouloir supprimer ce mur ?","cfss.noParapetsAddedYet":"Aucun parapet ajouté pour l\'instant.","cfss.parapetsAdded":["","count"," parapet(s) ajouté(s)"],"cfss.parapetUpdatedSuccessfully":"Parapet mis à jour avec succès !","cfss.confirmDeleteParapet":"Êtes-vous sûr de vouloir supprimer ce parapet ?","cfss.noWindowsAddedYet":"Aucune fenêtre ajoutée pour l\'instant.","cfss.windowsAdded":["","count"," fenêtre(s) ajoutée(s)"],"cfss.windowUpdatedSuccessfully":"Fenêtre mise à jour avec succès !","cfss.confirmDeleteWindow":"Êtes-vous sûr de vouloir supprimer cette fenêtre ?","cfss.soffitesAdded":["","count"," soffite(s) ajouté(s)"],"cfss.noSoffitesAddedYet":"Aucun soffite ajouté pour l\'instant.","cfss.confirmDeleteSoffite":"Êtes-vous sûr de vouloir supprimer ce soffite ?","cfss.noImagesSaveSoffiteAnyway":"Aucune image sélectionnée. Enregistrer le soffite quand même ?","cfss.optionsSelected":["","count"," option(s) sélectionnée(s)"],"cfss.errorSavingOptions":"Erreur lors de l\'enregistrement des options","cfss.atLeastOneFloorRequired":"Au moins un étage est requis.","cfss.floorsSavedSuccessfully":"Étages enregistrés avec succès !","cfss.colombageSet1":"Colombage jeu 1","cfss.colombageSet2":"Colombage jeu 2","cfss.deflexionSet1":"Déflexion jeu 1","cfss.deflexionSet2":"Déflexion jeu 2","cfss.set1":"Jeu 1","cfss.set2":"Jeu 2","cfss.montant":"Montant","cfss.espacement":"Espacement","cfss.dimensions":"Dimensions","cfss.height":"Hauteur","cfss.type":"Type","cfss.widthLargeur":"Largeur","cfss.heightHauteur":"Hauteur","cfss.reference":"Référence","cfss.images":"Images","cfss.noImages":"Aucune image","cfss.selectValidImageFiles":"Veuillez sélectionner des fichiers image valides.","cfss.max2Images":"Max 2 images.","cfss.max2ImagesWall":"Maximum 2 images par mur.","cfss.max2ImagesParapet":"Maximum 2 images par parapet.","cfss.max2ImagesSoffite":"Maximum 2 images par soffite.","cfss.max2ImagesRemoveFirst":"Maximum 2 images. Veuillez d\'abord retirer une image.","cfss.maxImagesReached":"Nombre maximum d\'images atteint","cfss.submit":"Soumettre","cfss.submitting":"Soumission...","cfss.updateSubmission":"Mettre à jour la soumission","cfss.projectSubmittedSuccessfully":"Projet soumis avec succès !","cfss.projectUpdatedSuccessfully":"Projet mis à jour avec succès !","cfss.errorSubmittingProject":"Erreur lors de la soumission du projet","cfss.projectHasBeenSubmitted":"Ce projet a été soumis.","cfss.lastSubmitted":"Dernière soumission"}');
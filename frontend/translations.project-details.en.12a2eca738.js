@@ -0,0 +1,2 @@
+// Generated by _replace_strings.py --build-translations. Do not edit.
+(self.translationsFlat || (self.translationsFlat = {}))["en"] = JSON.parse('{"common.loading":"Loading...","common.loadingProject":"Loading Project...","common.save":"Save","common.saving":"Saving...","common.cancel":"Cancel","common.delete":"Delete","common.yes":"Yes","common.no":"No","common.selectAll":"Select All","common.deleteSelected":"Delete Selected","common.admin":"ADMIN","common.limited":"LIMITED","common.unknown":"Unknown","common.remove":"Remove","common.details":"Details","common.duplicate":"Duplicate","common.hideDetails":"Hide Details","common.calculate":"Calculate","common.loadingImage":"Loading image...","nav.protectionSismique":"Protection Sismique","nav.dashboard":"Dashboard","nav.backToDashboard":"Back to Dashboard","status.planning":"Planning","status.inProgress":"In Progress","status.completed":"Completed","project.projectDetails":"Project Details","project.seismicParameters":"Seismic Parameters","project.equipmentList":"Equipment List","project.addEquipment":"Add Equipment","project.model":"Model","project.tag":"Tag","project.level":"Level","project.generateReport":"Generate Report","project.deleteEquipmentConfirm":"Are you sure you want to delete this equipment?","project.logoutConfirm":"Are you sure you want to logout?","project.status":"Status:","project.address":"Address:","project.numberOfFloors":"Number of Floors:","project.lat":"Lat:","project.long":"Long:","project.finalRisk":"Final Risk:","project.type":"Type:","project.domain":"Domain:","project.createdBy":"Created by","project.pleaseWaitLoading":"Please wait while we load the project details.","project.authRequired":"Authentication Required","project.pleaseLoginToView":"Please log in to view project details.","project.goToLogin":"Go to Login","project.accessDenied":"Access Denied","project.noPermission":"You don\'t have permission to view this project.","project.projectName":"Project Name:","project.description":"Description:","project.newEquipment":"New Equipment","project.equipment":"Equipment:","project.selectOrTypeEquipment":"Select or type equipment...","project.voiceMode":"Voice Mode","project.voiceModeActive":"Voice mode active — tap any field to speak","project.modelLabel":"Model: (optional)","project.enterModel":"Enter equipment model...","project.tagLabel":"Tag: (optional)","project.enterTag":"Enter equipment tag...","project.levelLabel":"Level: (optional)","project.whatWouldYouLikeToDo":"What would you like to do?","project.seismicCalculation":"Seismic Calculation","project.fullEngineeringAnalysis":"Full engineering analysis","project.addPhotosForCertification":"Add Photos for Certification","project.documentationOnly":"Documentation only","project.switch":"Switch","project.nbcCategory":"NBC Category:","project.selectNbcCategory":"Select NBC category...","project.pipeType":"Pipe Type:","project.selectPipeType":"Select pipe type...","project.steelPipe":"Steel Pipe","project.copperPipe":"Copper Pipe","project.pvcPipe":"PVC Pipe","project.noHubPipe":"No Hub Pipe","project.installMethodLabel":"Install Method:","project.selectInstallMethod":"Select install method...","project.fixedToSlab":"Fixed to Slab","project.fixedToWall":"Fixed to Wall","project.fixedToStructure":"Fixed to Structure","project.fixedToCeiling":"Fixed to Ceiling","project.fixedToRoof":"Fixed to Roof","project.fixedToInteriorWall":"Fixed to Interior Wall","project.fixedToWoodenSleeper":"Fixed to Wooden Sleeper","project.weight":"Weight:","project.dimensions":"Dimensions HxWxL (inches):","project.height":"Height","project.width":"Width","project.length":"Length","project.hxLabel":"Equipment Height Above Base (hx) in meters:","project.pipeWeightPerFoot":"Pipe Weight per Foot (lb/ft):","project.pipeDiameter":"Pipe Diameter:","project.selectDiameter":"Select diameter...","project.supportType":"Support Type:","project.individualClevis":"Individual Clevis","project.trapeze":"Trapeze","project.structureType":"Structure Type:","project.concreteSlab":"Concrete Slab","project.concreteDeck":"Concrete Deck","project.structuralSteel":"Structural Steel","project.woodStructure":"Wood Structure","project.numberOfAnchors":"Number of Anchors:","project.anchorTypeLabel":"Anchor Type:","project.selectAnchorType":"Select anchor type...","project.expansionAnchor":"KWIK BOLT TZ2 Expansion anchor","project.screwAnchor":"KWIK HUS EZ Screw anchor","project.anchorDiameter":"Anchor Diameter (inches):","project.selectAnchorTypeFirst":"Select anchor type first...","project.slabThickness":"Slab Thickness (inches):","project.selectFc":"Select f\'c...","project.mountingTypeLabel":"Mounting Type:","project.selectMountingType":"Select mounting type...","project.noIsolators":"1. No isolators","project.type31":"2. Restrained with Type 3-1 vibration isolators","project.type32":"3. Restrained with Type 3-2 vibration isolators","project.type35a":"4. Restrained with Type 3-5A vibration isolators","project.type35b":"5. Restrained with Type 3-5B vibration isolators","project.type35c":"6. Restrained with Type 3-5C vibration isolators","project.type35d":"7. Restrained with Type 3-5D vibration isolators","project.type310":"8. Restrained with Type 3-10 seismic snubbers","project.type311":"9. Restrained with Type 3-11 seismic snubbers","project.isolatorWidth":"Isolator/Snubber Width (B) in inches:","project.restraintHeight":"Height to Restraint Connection (H) in inches:","project.edgeDistanceA":"Edge Distance A (a) in inches:","project.edgeDistanceB":"Edge Distance B (b) in inches:","project.numberOfIsolators":"Number of Isolators/Snubbers (N):","project.hnLabel":"Total Building Height (hn) in meters:","project.images":"Images:","project.browse":"Browse","project.uploadImages":"Upload Images","project.dropOrPasteImages":"Drop or paste images here (Ctrl+V)","project.calculate":"Calculate","project.saveAndCloseForm":"Save and Close Form","project.equipmentImage":"Equipment Image","project.selectEquipmentToViewImage":"Select equipment and installation method to view image","project.calculationResults":"Calculation Results","project.clickCalculate":"Click \\"Calculate\\" to see detailed analysis and calculations","project.projectSetupRequired":"Project Setup Required","project.floorsRequiredMessage":"To perform seismic calculations, we need to know the total number of floors in this building.","project.numberOfFloorsRequired":"Number of Floors *","project.enterTotalFloors":"Enter total floors","project.saveAndContinue":"Save & Continue","project.installMethod.fixedToSlab":"Fixed to Slab","project.installMethod.fixedToWall":"Fixed to Wall","project.installMethod.fixedToStructure":"Fixed to Structure","project.installMethod.fixedToCeiling":"Fixed to Ceiling","project.installMethod.fixedToRoof":"Fixed to Roof","project.installMethod.fixedToInteriorWall":"Fixed to Interior Wall","project.installMethod.fixedToWoodenSleeper":"Fixed to Wooden Sleeper","project.mountingType.noIsolators":"No Isolators","project.mountingType.type31":"Type 3-1 vibration isolators","project.mountingType.type32":"Type 3-2 vibration isolators","project.mountingType.type35a":"Type 3-5A vibration isolators","project.mountingType.type35b":"Type 3-5B vibration isolators","project.mountingType.type35c":"Type 3-5C vibration isolators","project.mountingType.type35d":"Type 3-5D vibration isolators","project.mountingType.type310":"Type 3-10 seismic snubbers","project.mountingType.type311":"Type 3-11 seismic snubbers","project.mountingType.unknown":"Unknown mounting type","project.anchorType.expansion":"Expansion anchor","project.anchorType.screw":"Screw anchor","project.anchorType.unknown":"Unknown anchor type","project.projectNumber":"Project Number:","project.createdOn":"Created on","project.lastUpdated":"Last Updated","project.noProjectIdSpecified":"No project ID specified.","project.errorLoadingProject":"Error loading project","project.actionRequired":"Action Required","project.aircraftCable":"Aircraft Cable","project.allowableShear":"Allowable Shear","project.allowableTension":"Allowable Tension","project.amplificationFactor":"Amplification Factor","project.analysisResults":"Analysis Results","project.anchor":"Anchor","project.anchorBoltShear":"Anchor Bolt Shear","project.anchorBoltTension":"Anchor Bolt Tension","project.anchorCannotProvideSufficientCapacity":["The ⌀","diameter","\\" anchor cannot provide sufficient capacity"],"project.anchorDiameterRecommendation":"Anchor Diameter Recommendation","project.anchors":"anchors","project.ashraeAnchorBoltAnalysis":"ASHRAE Anchor Bolt Analysis","project.ashraeCalcRequiresParams":"ASHRAE calculation requires equipment parameters","project.ashraeTboltCalcTitle":"ASHRAE Anchor Bolt Tension (Tbolt) Calculation","project.ashraeVboltCalcTitle":"ASHRAE Anchor Bolt Shear (Vbolt) Calculation","project.boltShear":"Bolt Shear","project.boltTension":"Bolt Tension","project.bothFormulasPass":"Both formulas pass","project.braceMembers":"Brace Members","project.bracePosition":"Brace Position","project.breakdown":"Breakdown","project.breakingStrength":"Breaking Strength","project.buildingHeight":"Building Height","project.cableBrace":"Cable Brace","project.cableBraceOption":"Cable Brace Option","project.cableBraceOptions":"Cable Brace Options","project.cableRequired":"Cable Required","project.cableSize":"Cable Size","project.calcOnlyVibrationIsolated":"This calculation is only available for vibration-isolated equipment","project.calculatedAs":"calculated as","project.calculation":"Calculation","project.cancelRequest":"Cancel Request","project.cantFindImage":["Cannot find image: ","name",""],"project.centerOfGravity":"center of gravity","project.cfsCalcTitle":"CFS Seismic Force Coefficient Calculation","project.changeAnchorDiameter":"Change anchor diameter in the equipment form","project.channelStrut":"Channel Strut","project.clickCalculateToSeeDetails":"Click \\"Calculate\\" to see detailed analysis","project.clickToSeeASHRAETboltDetails":"Click to see ASHRAE Tbolt details","project.clickToSeeASHRAEVboltDetails":"Click to see ASHRAE Vbolt details","project.clickToSeeBracingSpecs":"Click to see bracing specifications","project.clickToSeeCableDetails":"Click to see cable details","project.clickToSeeCFSDetails":"Click to see CFS calculation details","project.clickToSeeCompleteSpecs":"Click to see complete specifications","project.clickToSeeConcreteEmbedmentDetails":"Click to see concrete embedment details","project.clickToSeeEmbedmentDetails":"Click to see embedment details","project.clickToSeeFinalEmbedmentCalc":"Click to see final embedment calculation","project.clickToSeeFormula1Details":"Click to see Formula 1 details","project.clickToSeeFormula2Details":"Click to see Formula 2 details","project.clickToSeeHangerRodSpecs":"Click to see hanger rod specifications","project.clickToSeeLateralForceDetails":"Click to see lateral force calculation details","project.clickToSeeMaxCompressionDetails":"Click to see maximum compression details","project.clickToSeeMaxShearDetails":"Click to see maximum shear details","project.clickToSeeMaxTensionDetails":"Click to see maximum tension details","project.clickToSeeNBCVpDetails":"Click to see NBC Vp calculation details","project.clickToSeeOTMDetails":"Click to see OTM details","project.clickToSeeRMDetails":"Click to see RM details","project.clickToSeeShearDetails":"Click to see shear calculation details","project.clickToSeeSteelEmbedmentDetails":"Click to see steel embedment details","project.clickToSeeTensionDetails":"Click to see tension calculation details","project.clips":"Clips","project.coeffLateralSeismicForce":"Coefficient of Lateral Seismic Force","project.componentFactor":"Component Factor","project.concrete":"Concrete","project.concreteAnalysisNotAvailable":"Concrete analysis not available for this equipment","project.concreteFailure":"Concrete Failure","project.concreteFailureEmbedmentTitle":"Concrete Failure Embedment Analysis","project.concreteFormula1Title":"ASHRAE Concrete Structural Analysis - Formula (11-36)","project.concreteFormula2Title":"ASHRAE Concrete Structural Analysis - Formula (11-37)","project.concreteStrength":"Concrete Strength","project.concreteTensionCapacity":"Concrete Tension Capacity","project.connectionType":"Connection Type","project.constant":"Constant","project.currentAnchorInsufficient":"Current anchor diameter is insufficient","project.currentBadge":"Current","project.currentConfiguration":"Current Configuration","project.currentDiameterInsufficient":["Current ⌀","diameter","\\" diameter is insufficient"],"project.deleteImage":"Delete image","project.deleteImageConfirm":"Are you sure you want to delete this image?","project.deleteSelectedConfirm":["Delete ","count"," selected equipment item(s)? This cannot be undone."],"project.designRule":"Design Rule","project.determineMinEmbedment":"Determine minimum embedment depth","project.diameter":"Diameter","project.dropImageHere":"Drop image here","project.dropOrPasteImagesCount":["","count"," image(s) selected"],"project.dropOrPasteToAddMore":"Drop or paste to add more","project.editEquipment":"Edit Equipment","project.embedmentAnalysisNotAvailable":"Embedment analysis not available","project.equipmentHeight":"Equipment Height","project.equipmentImages":"Equipment Images","project.equipmentNotFound":"Equipment not found","project.equipmentSaved":"Equipment saved successfully!","project.equipmentUpdated":"Equipment updated successfully!","project.equipmentUpdatedSuccess":"Equipment updated successfully!","project.equipmentWeight":"Equipment Weight","project.errorCalculatingEquipment":"Error calculating equipment","project.errorDeletingEquipment":"Error deleting equipment","project.errorGeneratingReport":"Error generating report","project.errorLoadingImage":"Error loading image","project.errorNoProjectSelected":"No project selected","project.errorSavingEquipment":"Error saving equipment","project.errorSavingEquipmentChanges":"Error saving equipment changes","project.errorSavingFloors":"Error saving floors","project.errorUpdatingImageRequest":"Error updating image request","project.fail":"FAIL","project.failedDeleteImage":"Failed to delete image","project.failedDuplicateEquipment":"Failed to duplicate equipment","project.failedToProcessFile":["Failed to process file: ","name",""],"project.failedToUpload":"Failed to upload","project.finalMinEmbedmentResult":"Final Minimum Embedment","project.finalMinEmbedmentTitle":"Final Minimum Embedment","project.force":"Force","project.forces":"Forces","project.formula":"Formula","project.formula1":"Formula 1","project.formula2":"Formula 2","project.formulaVariesByMountingType":"Formula varies by mounting type","project.fromCFSCalc":"from CFS calculation","project.generatingPDF":"Generating PDF...","project.geometry":"Geometry","project.geometryAngles":"Geometry and Angles","project.governingEmbedmentNote":"The governing embedment is the largest required by all applicable checks","project.governingRequirement":"Governing Requirement","project.greaterConcreteBreakoutCapacity":"Greater concrete breakout capacity","project.hangerRod":"Hanger Rod","project.hangerRods":"Hanger Rods","project.hangerRodSpecs":"Hanger Rod Specifications","project.heightAboveBase":"Height Above Base","project.heightCoefficient":"Height Coefficient","project.heightFactor":"Height Factor","project.heightLower":"height","project.heightToRestraint":"Height to Restraint","project.higherSteelShearCapacity":"Higher steel shear capacity","project.higherSteelTensileCapacity":"Higher steel tensile capacity","project.horizontalForce":"Horizontal Force","project.horizontalSeismicForce":"Horizontal Seismic Force","project.image":"Image","project.imageNotAvailable":"Image not available","project.imageOf":"Image of","project.imageRequestAdditional":"Request additional image","project.imageRequestSent":"Image request sent","project.imageRequestSuccess":["Image request ","action"," successfully"],"project.imageRequestUpload":"Upload image","project.imageUploadFailedWarning":"Image upload failed. Equipment saved without image.","project.imagesUploadedSuccess":["","count"," image(s) uploaded successfully"],"project.importanceFactor":"Importance Factor","project.insufficient":"insufficient","project.largerAnchorsHave":"Larger anchors have:","project.largerDiameter":"larger diameter","project.largerOfTwoEmbedments":"Larger of the two embedment values","project.largestCableInsufficient":"Largest available cable is insufficient","project.lateralForce":"Lateral Force","project.lateralForceCalcTitle":"Lateral Seismic Force Calculation","project.lbsMinBreakingStrength":"lbs min breaking strength","project.lbsPerBolt":"lbs/bolt","project.limitedBetweenPerNBC":"limited between min and max values per NBC","project.maxImagesAllowed":["Maximum ","max"," images allowed"],"project.maxImagesReached":["Maximum of ","max"," images reached"],"project.maxImagesReachedCount":["Max ","max"," images reached"],"project.maxImagesReachedShort":"Max images reached","project.maximumLength":"Maximum Length","project.maximumShear":"Maximum Shear","project.maximumTension":"Maximum Tension","project.maxLength":"Max Length","project.maxUnbraced":"Max Unbraced","project.maxUnbracedLength":"Max Unbraced Length","project.microphoneAccessDenied":"Microphone access denied","project.minimumEmbedment":"Minimum Embedment","project.minimumEmbedmentAnalysis":"Minimum Embedment Analysis","project.missingEquipmentOrInstallData":"Missing equipment or installation data","project.missingPipeTypeData":"Missing pipe type data","project.momentOfInertia":"Moment of Inertia","project.moreEmbedmentOptions":"More embedment depth options","project.neitherCapacityAdequate":"Neither capacity is adequate","project.newBadge":"New","project.newImage":"New image","project.noCalculationsForType":"No calculations available for this equipment type","project.noEquipmentSelected":"No equipment selected","project.noEquipmentYet":"No equipment added yet","project.noImagesYet":"No images yet","project.noPermissionAddEquipment":"You do not have permission to add equipment","project.noPermissionDeleteEquipment":"You do not have permission to delete equipment","project.noPermissionEditEquipment":"You do not have permission to edit equipment","project.noPermissionModify":"You do not have permission to modify this project","project.noteWeightNotIncluded":"Note: Equipment weight not included for ceiling-mounted equipment","project.numberOfAnchorBolts":"Number of Anchor Bolts","project.ofEquipmentHeight":"of equipment height","project.oneOrMoreFormulasFail":"One or more formulas fail","project.onlyAdminsCanRequestImages":"Only admins can request images","project.onlyMoreImagesCanBeAdded":["Only ","count"," more image(s) can be added"],"project.onlyUploadingImages":["Only uploading ","count"," images (max ","max",")"],"project.orClickButtonToSelect":"or click button to select","project.otmCalcTitle":"Overturning Moment (OTM) Calculation","project.overallStatus":"Overall Status","project.overturningAnalysis":"Overturning Analysis","project.overturningMoment":"Overturning Moment","project.overturningOnlyRigid":"Overturning analysis is only available for rigid mounting (no isolators)","project.parameters":"Parameters","project.pass":"PASS","project.pcCalcTitle":"Pc (Maximum Compression Force) Calculation","project.pdfGenerationTimedOut":"PDF generation timed out","project.pipe":"Pipe","project.pipeWeightExceedsTableLimits":"Pipe weight exceeds table limits","project.pipeWeightExceedsTableWarning":"⚠ Pipe weight exceeds table limits","project.pipeWeightLabel":"Pipe Weight","project.pleaseEnterEquipmentName":"Please enter equipment name","project.pleaseEnterValidFloors":"Please enter a valid number of floors","project.pleaseEnterValidPipeWeight":"Please enter a valid pipe weight","project.pleaseSelectPipeDiameter":"Please select a pipe diameter","project.pleaseSelectPipeType":"Please select a pipe type","project.pleaseSelectValidImages":"Please select valid image files","project.prestretchedCable":"Pre-stretched Cable","project.problem":"Problem","project.processingImages":["Processing ","count"," image(s)..."],"project.psCalcTitle":"Ps (Shear Force per Anchor) Calculation","project.reason":"Reason","project.recommendation":"Recommendation","project.reference":"Reference","project.removeImageToAddMore":"Remove an image to add more","project.requestImage":"Request Image","project.requiredForces":"Required Forces","project.requiredMinEmbedment":"Required Min. Embedment","project.requiredShear":"Required Shear","project.requiredTension":"Required Tension","project.requiredValues":"Required Values","project.requirements":"Requirements","project.rerunAnalysis":"Re-run the analysis","project.resistingMoment":"Resisting Moment","project.responseModificationFactor":"Response Modification Factor","project.result":"Result","project.rmCalcTitle":"Resisting Moment (RM) Calculation","project.sameAsPtCalc":"Same as Pt calculation","project.seismic":"Seismic","project.seismicLevel":"Seismic Level","project.seismicLoad":"Seismic Load","project.seismicRiskCoeff":"Seismic Risk Coefficient","project.selectNBCCategory":"Select NBC Category...","project.shearCalcTitle":"Anchor Bolt Shear (V) Calculation","project.shoppingList":"Shopping List","project.siteAccelerationCoeff":"Site Acceleration Coefficient","project.solidBrace":"Solid Brace","project.solidBraceOption":"Solid Brace Option","project.solidBraceOptions":"Solid Brace Options","project.solution":"Solution","project.spectralResponseValue":"Spectral Response Value","project.standardCable":"Standard Cable","project.steel":"Steel","project.steelAngle":"Steel Angle","project.steelFailure":"Steel Failure","project.steelFailureEmbedmentTitle":"Steel Failure Embedment Analysis","project.steelSeismicShearCapacity":"Steel Seismic Shear Capacity","project.steelStructure":"Steel Structure","project.steelTensileCapacity":"Steel Tensile Capacity","project.step":"Step","project.structuralConnection":"Structural Connection","project.structuralConnections":"Structural Connections","project.sum":"Sum","project.suspendedEquipmentBracing":"Suspended Equipment Bracing","project.suspendedEquipmentBracingASHRAE10":"Suspended Equipment Bracing (ASHRAE Ch. 10)","project.suspendedPipingBracing":"Suspended Piping Bracing","project.suspendedPipingBracingSpecs":"Suspended Piping Bracing Specifications","project.tableRefExpansionConcrete":"HILTI Expansion Anchor - Concrete Embedment Table","project.tableRefExpansionSteel":"HILTI Expansion Anchor - Steel Embedment Table","project.tableRefScrewConcrete":"HILTI Screw Anchor - Concrete Embedment Table","project.tableRefScrewSteel":"HILTI Screw Anchor - Steel Embedment Table","project.tensileStrength":"Tensile Strength","project.tensionCalcTitle":"Anchor Bolt Tension (T) Calculation","project.tensionCapacity":"Tension Capacity","project.thimble":"Thimble","project.totalShear":"Total Shear","project.totalTension":"Total Tension","project.tryLargerAnchor":["Try a ","size"," anchor"],"project.turnbuckle":"Turnbuckle","project.type31VibrationIsolatorsSnubbers":"Type 3-1 Vibration Isolators / Snubbers","project.type32VibrationIsolators":"Type 3-2 Vibration Isolators","project.uploadImage":"Upload Image","project.useEmbedmentGreaterThan":["Use embedment depth greater than ","value","\\""],"project.useLargerAnchorDiameter":"Use a larger anchor diameter","project.useLargerDiameterAndReanalyze":"Use a larger diameter and reanalyze","project.valuesUsed":"Values Used","project.verticalForce":"Vertical Force","project.verticalSeismicForce":"Vertical Seismic Force","project.vibrationIsolatedEquipment":"Vibration Isolated Equipment","project.viewImage":"View image","project.voiceInputNotSupported":"Voice input is not supported in this browser","project.widthLower":"width","project.workingLoad":"Working Load","project.workLoadLimit":"Work Load Limit","project.worstAngle":"Worst Angle","project.noSufficientEmbedmentFound":"No sufficient embedment found"}');
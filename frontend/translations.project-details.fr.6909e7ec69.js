@@ -0,0 +1,2 @@
+// Generated by _replace_strings.py --build-translations. Do not edit.
+(self.translationsFlat || (self.translationsFlat = {}))["fr"] = JSON.parse('{"common.loading":"Chargement...","common.loadingProject":"Chargement du projet...","common.save":"Enregistrer","common.saving":"Enregistrement...","common.cancel":"Annuler","common.delete":"Supprimer","common.yes":"Oui","common.no":"Non","common.selectAll":"Tout sélectionner","common.deleteSelected":"Supprimer la sélection","common.admin":"ADMIN","common.limited":"LIMITÉ","common.unknown":"Inconnu","common.remove":"Retirer","common.details":"Détails","common.duplicate":"Dupliquer","common.hideDetails":"Masquer les détails","common.calculate":"Calculer","common.loadingImage":"Chargement de l\'image...","nav.protectionSismique":"Protection Sismique","nav.dashboard":"Tableau de bord","nav.backToDashboard":"Retour au tableau de bord","status.planning":"Planification","status.inProgress":"En cours","status.completed":"Terminé","project.projectDetails":"Détails du projet","project.seismicParameters":"Paramètres sismiques","project.equipmentList":"Liste d\'équipements","project.addEquipment":"Ajouter un équipement","project.model":"Modèle","project.tag":"Étiquette","project.level":"Niveau","project.generateReport":"Générer le rapport","project.deleteEquipmentConfirm":"Êtes-vous sûr de vouloir supprimer cet équipement ?","project.logoutConfirm":"Êtes-vous sûr de vouloir vous déconnecter ?","project.status":"Statut :","project.address":"Adresse :","project.numberOfFloors":"Nombre d\'étages :","project.lat":"Lat :","project.long":"Long :","project.finalRisk":"Risque final :","project.type":"Type :","project.domain":"Domaine :","project.createdBy":"Créé par","project.pleaseWaitLoading":"Veuillez patienter pendant le chargement des détails du projet.","project.authRequired":"Authentification requise","project.pleaseLoginToView":"Veuillez vous connecter pour voir les détails du projet.","project.goToLogin":"Aller à la connexion","project.accessDenied":"Accès refusé","project.noPermission":"Vous n\'avez pas la permission de voir ce projet.","project.projectName":"Nom du projet :","project.description":"Description :","project.newEquipment":"Nouvel équipement","project.equipment":"Équipement :","project.selectOrTypeEquipment":"Sélectionner ou saisir un équipement...","project.voiceMode":"Mode vocal","project.voiceModeActive":"Mode vocal actif — touchez un champ pour parler","project.modelLabel":"Modèle : (optionnel)","project.enterModel":"Entrer le modèle d\'équipement...","project.tagLabel":"Étiquette : (optionnel)","project.enterTag":"Entrer l\'étiquette d\'équipement...","project.levelLabel":"Niveau : (optionnel)","project.whatWouldYouLikeToDo":"Que souhaitez-vous faire ?","project.seismicCalculation":"Calcul sismique","project.fullEngineeringAnalysis":"Analyse d\'ingénierie complète","project.addPhotosForCertification":"Ajouter des photos pour certification","project.documentationOnly":"Documentation uniquement","project.switch":"Changer","project.nbcCategory":"Catégorie NBC :","project.selectNbcCategory":"Sélectionner la catégorie NBC...","project.pipeType":"Type de tuyau :","project.selectPipeType":"Sélectionner le type de tuyau...","project.steelPipe":"Tuyau en acier","project.copperPipe":"Tuyau en cuivre","project.pvcPipe":"Tuyau en PVC","project.noHubPipe":"Tuyau sans moyeu","project.installMethodLabel":"Méthode d\'installation :","project.selectInstallMethod":"Sélectionner la méthode d\'installation...","project.fixedToSlab":"Fixé à la dalle","project.fixedToWall":"Fixé au mur","project.fixedToStructure":"Fixé à la structure","project.fixedToCeiling":"Fixé au plafond","project.fixedToRoof":"Fixé au toit","project.fixedToInteriorWall":"Fixé au mur intérieur","project.fixedToWoodenSleeper":"Fixé au dormant en bois","project.weight":"Poids :","project.dimensions":"Dimensions HxLxL (pouces) :","project.height":"Hauteur","project.width":"Largeur","project.length":"Longueur","project.hxLabel":"Hauteur de l\'équipement au-dessus de la base (hx) en mètres :","project.pipeWeightPerFoot":"Poids du tuyau par pied (lb/pi) :","project.pipeDiameter":"Diamètre du tuyau :","project.selectDiameter":"Sélectionner le diamètre...","project.supportType":"Type de support :","project.individualClevis":"Chape individuelle","project.trapeze":"Trapèze","project.structureType":"Type de structure :","project.concreteSlab":"Dalle de béton","project.concreteDeck":"Pont de béton","project.structuralSteel":"Acier structural","project.woodStructure":"Structure en bois","project.numberOfAnchors":"Nombre d\'ancrages :","project.anchorTypeLabel":"Type d\'ancrage :","project.selectAnchorType":"Sélectionner le type d\'ancrage...","project.expansionAnchor":"Ancrage à expansion KWIK BOLT TZ2","project.screwAnchor":"Ancrage à vis KWIK HUS EZ","project.anchorDiameter":"Diamètre d\'ancrage (pouces) :","project.selectAnchorTypeFirst":"Sélectionner d\'abord le type d\'ancrage...","project.slabThickness":"Épaisseur de la dalle (pouces) :","project.selectFc":"Sélectionner f\'c...","project.mountingTypeLabel":"Type de montage :","project.selectMountingType":"Sélectionner le type de montage...","project.noIsolators":"1. Sans isolateurs","project.type31":"2. Retenu avec isolateurs de vibration Type 3-1","project.type32":"3. Retenu avec isolateurs de vibration Type 3-2","project.type35a":"4. Retenu avec isolateurs de vibration Type 3-5A","project.type35b":"5. Retenu avec isolateurs de vibration Type 3-5B","project.type35c":"6. Retenu avec isolateurs de vibration Type 3-5C","project.type35d":"7. Retenu avec isolateurs de vibration Type 3-5D","project.type310":"8. Retenu avec amortisseurs sismiques Type 3-10","project.type311":"9. Retenu avec amortisseurs sismiques Type 3-11","project.isolatorWidth":"Largeur de l\'isolateur/amortisseur (B) en pouces :","project.restraintHeight":"Hauteur de connexion de retenue (H) en pouces :","project.edgeDistanceA":"Distance au bord A (a) en pouces :","project.edgeDistanceB":"Distance au bord B (b) en pouces :","project.numberOfIsolators":"Nombre d\'isolateurs/amortisseurs (N) :","project.hnLabel":"Hauteur totale du bâtiment (hn) en mètres :","project.images":"Images :","project.browse":"Parcourir","project.uploadImages":"Téléverser des images","project.dropOrPasteImages":"Déposer ou coller des images ici (Ctrl+V)","project.calculate":"Calculer","project.saveAndCloseForm":"Enregistrer et fermer le formulaire","project.equipmentImage":"Image de l\'équipement","project.selectEquipmentToViewImage":"Sélectionner l\'équipement et la méthode d\'installation pour voir l\'image","project.calculationResults":"Résultats du calcul","project.clickCalculate":"Cliquer sur « Calculer » pour voir l\'analyse détaillée et les calculs","project.projectSetupRequired":"Configuration du projet requise","project.floorsRequiredMessage":"Pour effectuer les calculs sismiques, nous devons connaître le nombre total d\'étages de ce bâtiment.","project.numberOfFloorsRequired":"Nombre d\'étages *","project.enterTotalFloors":"Entrer le nombre total d\'étages","project.saveAndContinue":"Enregistrer et continuer","project.installMethod.fixedToSlab":"Fixé à la dalle","project.installMethod.fixedToWall":"Fixé au mur","project.installMethod.fixedToStructure":"Fixé à la structure","project.installMethod.fixedToCeiling":"Fixé au plafond","project.installMethod.fixedToRoof":"Fixé au toit","project.installMethod.fixedToInteriorWall":"Fixé au mur intérieur","project.installMethod.fixedToWoodenSleeper":"Fixé au dormant en bois","project.mountingType.noIsolators":"Sans isolateurs","project.mountingType.type31":"Isolateurs de vibration Type 3-1","project.mountingType.type32":"Isolateurs de vibration Type 3-2","project.mountingType.type35a":"Isolateurs de vibration Type 3-5A","project.mountingType.type35b":"Isolateurs de vibration Type 3-5B","project.mountingType.type35c":"Isolateurs de vibration Type 3-5C","project.mountingType.type35d":"Isolateurs de vibration Type 3-5D","project.mountingType.type310":"Amortisseurs sismiques Type 3-10","project.mountingType.type311":"Amortisseurs sismiques Type 3-11","project.mountingType.unknown":"Type de montage inconnu","project.anchorType.expansion":"Ancrage à expansion","project.anchorType.screw":"Ancrage à vis","project.anchorType.unknown":"Type d\'ancrage inconnu","project.projectNumber":"Numéro de projet :","project.createdOn":"Créé le","project.lastUpdated":"Dernière mise à jour","project.noProjectIdSpecified":"Aucun identifiant de projet spécifié.","project.errorLoadingProject":"Erreur de chargement du projet","project.actionRequired":"Action requise","project.aircraftCable":"Câble en acier galvanisé","project.allowableShear":"Cisaillement admissible","project.allowableTension":"Tension admissible","project.amplificationFactor":"Facteur d\'amplification","project.analysisResults":"Résultats de l\'analyse","project.anchor":"Ancrage","project.anchorBoltShear":"Cisaillement du boulon d\'ancrage","project.anchorBoltTension":"Tension du boulon d\'ancrage","project.anchorCannotProvideSufficientCapacity":["L\'ancrage ⌀","diameter","\\" ne peut pas fournir une capacité suffisante"],"project.anchorDiameterRecommendation":"Recommandation de diamètre d\'ancrage","project.anchors":"ancrages","project.ashraeAnchorBoltAnalysis":"Analyse des boulons d\'ancrage ASHRAE","project.ashraeCalcRequiresParams":"Le calcul ASHRAE nécessite les paramètres de l\'équipement","project.ashraeTboltCalcTitle":"Calcul de la tension du boulon d\'ancrage ASHRAE (Tbolt)","project.ashraeVboltCalcTitle":"Calcul du cisaillement du boulon d\'ancrage ASHRAE (Vbolt)","project.boltShear":"Cisaillement du boulon","project.boltTension":"Tension du boulon","project.bothFormulasPass":"Les deux formules sont satisfaites","project.braceMembers":"Éléments de contreventement","project.bracePosition":"Position du contreventement","project.breakdown":"Décomposition","project.breakingStrength":"Résistance à la rupture","project.buildingHeight":"Hauteur du bâtiment","project.cableBrace":"Câble de contreventement","project.cableBraceOption":"Option de câble de contreventement","project.cableBraceOptions":"Options de câble de contreventement","project.cableRequired":"Câble requis","project.cableSize":"Taille du câble","project.calcOnlyVibrationIsolated":"Ce calcul n\'est disponible que pour les équipements à isolation de vibration","project.calculatedAs":"calculé comme","project.calculation":"Calcul","project.cancelRequest":"Annuler la demande","project.cantFindImage":["Impossible de trouver l\'image : ","name",""],"project.centerOfGravity":"centre de gravité","project.cfsCalcTitle":"Calcul du coefficient de force sismique CFS","project.changeAnchorDiameter":"Modifier le diamètre d\'ancrage dans le formulaire d\'équipement","project.channelStrut":"Profilé en U","project.clickCalculateToSeeDetails":"Cliquer sur « Calculer » pour voir l\'analyse détaillée","project.clickToSeeASHRAETboltDetails":"Cliquer pour voir les détails du Tbolt ASHRAE","project.clickToSeeASHRAEVboltDetails":"Cliquer pour voir les détails du Vbolt ASHRAE","project.clickToSeeBracingSpecs":"Cliquer pour voir les spécifications de contreventement","project.clickToSeeCableDetails":"Cliquer pour voir les détails du câble","project.clickToSeeCFSDetails":"Cliquer pour voir les détails du calcul CFS","project.clickToSeeCompleteSpecs":"Cliquer pour voir les spécifications complètes","project.clickToSeeConcreteEmbedmentDetails":"Cliquer pour voir les détails d\'encastrement dans le béton","project.clickToSeeEmbedmentDetails":"Cliquer pour voir les détails d\'encastrement","project.clickToSeeFinalEmbedmentCalc":"Cliquer pour voir le calcul d\'encastrement final","project.clickToSeeFormula1Details":"Cliquer pour voir les détails de la Formule 1","project.clickToSeeFormula2Details":"Cliquer pour voir les détails de la Formule 2","project.clickToSeeHangerRodSpecs":"Cliquer pour voir les spécifications de la tige de suspension","project.clickToSeeLateralForceDetails":"Cliquer pour voir les détails du calcul de la force latérale","project.clickToSeeMaxCompressionDetails":"Cliquer pour voir les détails de la compression maximale","project.clickToSeeMaxShearDetails":"Cliquer pour voir les détails du cisaillement maximal","project.clickToSeeMaxTensionDetails":"Cliquer pour voir les détails de la tension maximale","project.clickToSeeNBCVpDetails":"Cliquer pour voir les détails du calcul Vp selon le CNB","project.clickToSeeOTMDetails":"Cliquer pour voir les détails de l\'OTM","project.clickToSeeRMDetails":"Cliquer pour voir les détails du RM","project.clickToSeeShearDetails":"Cliquer pour voir les détails du calcul de cisaillement","project.clickToSeeSteelEmbedmentDetails":"Cliquer pour voir les détails d\'encastrement dans l\'acier","project.clickToSeeTensionDetails":"Cliquer pour voir les détails du calcul de tension","project.clips":"Colliers","project.coeffLateralSeismicForce":"Coefficient de force sismique latérale","project.componentFactor":"Facteur de composant","project.concrete":"Béton","project.concreteAnalysisNotAvailable":"Analyse du béton non disponible pour cet équipement","project.concreteFailure":"Rupture du béton","project.concreteFailureEmbedmentTitle":"Analyse d\'encastrement - Rupture du béton","project.concreteFormula1Title":"Analyse structurale ASHRAE du béton - Formule (11-36)","project.concreteFormula2Title":"Analyse structurale ASHRAE du béton - Formule (11-37)","project.concreteStrength":"Résistance du béton","project.concreteTensionCapacity":"Capacité en tension du béton","project.connectionType":"Type de connexion","project.constant":"Constante","project.currentAnchorInsufficient":"Le diamètre d\'ancrage actuel est insuffisant","project.currentBadge":"Actuel","project.currentConfiguration":"Configuration actuelle","project.currentDiameterInsufficient":["Le diamètre actuel ⌀","diameter","\\" est insuffisant"],"project.deleteImage":"Supprimer l\'image","project.deleteImageConfirm":"Êtes-vous sûr de vouloir supprimer cette image ?","project.deleteSelectedConfirm":["Supprimer ","count"," équipement(s) sélectionné(s) ? Cette action est irréversible."],"project.designRule":"Règle de conception","project.determineMinEmbedment":"Déterminer la profondeur d\'encastrement minimale","project.diameter":"Diamètre","project.dropImageHere":"Déposer l\'image ici","project.dropOrPasteImagesCount":["","count"," image(s) sélectionnée(s)"],"project.dropOrPasteToAddMore":"Déposer ou coller pour en ajouter d\'autres","project.editEquipment":"Modifier l\'équipement","project.embedmentAnalysisNotAvailable":"Analyse d\'encastrement non disponible","project.equipmentHeight":"Hauteur de l\'équipement","project.equipmentImages":"Images d\'équipement","project.equipmentNotFound":"Équipement introuvable","project.equipmentSaved":"Équipement enregistré avec succès !","project.equipmentUpdated":"Équipement mis à jour avec succès !","project.equipmentUpdatedSuccess":"Équipement mis à jour avec succès !","project.equipmentWeight":"Poids de l\'équipement","project.errorCalculatingEquipment":"Erreur lors du calcul de l\'équipement","project.errorDeletingEquipment":"Erreur lors de la suppression de l\'équipement","project.errorGeneratingReport":"Erreur lors de la génération du rapport","project.errorLoadingImage":"Erreur de chargement de l\'image","project.errorNoProjectSelected":"Aucun projet sélectionné","project.errorSavingEquipment":"Erreur lors de l\'enregistrement de l\'équipement","project.errorSavingEquipmentChanges":"Erreur lors de l\'enregistrement des modifications de l\'équipement","project.errorSavingFloors":"Erreur lors de l\'enregistrement du nombre d\'étages","project.errorUpdatingImageRequest":"Erreur lors de la mise à jour de la demande d\'image","project.fail":"ÉCHOUÉ","project.failedDeleteImage":"Échec de la suppression de l\'image","project.failedDuplicateEquipment":"Échec de la duplication de l\'équipement","project.failedToProcessFile":["Échec du traitement du fichier : ","name",""],"project.failedToUpload":"Échec du téléversement","project.finalMinEmbedmentResult":"Encastrement minimal final","project.finalMinEmbedmentTitle":"Encastrement minimal final","project.force":"Force","project.forces":"Forces","project.formula":"Formule","project.formula1":"Formule 1","project.formula2":"Formule 2","project.formulaVariesByMountingType":"La formule varie selon le type de montage","project.fromCFSCalc":"issu du calcul CFS","project.generatingPDF":"Génération du PDF...","project.geometry":"Géométrie","project.geometryAngles":"Géométrie et angles","project.governingEmbedmentNote":"L\'encastrement déterminant est le plus grand requis par tous les contrôles applicables","project.governingRequirement":"Exigence déterminante","project.greaterConcreteBreakoutCapacity":"Capacité d\'arrachement du béton plus grande","project.hangerRod":"Tige de suspension","project.hangerRods":"Tiges de suspension","project.hangerRodSpecs":"Spécifications de la tige de suspension","project.heightAboveBase":"Hauteur au-dessus de la base","project.heightCoefficient":"Coefficient de hauteur","project.heightFactor":"Facteur de hauteur","project.heightLower":"hauteur","project.heightToRestraint":"Hauteur jusqu\'à la retenue","project.higherSteelShearCapacity":"Capacité en cisaillement de l\'acier plus élevée","project.higherSteelTensileCapacity":"Capacité en traction de l\'acier plus élevée","project.horizontalForce":"Force horizontale","project.horizontalSeismicForce":"Force sismique horizontale","project.image":"Image","project.imageNotAvailable":"Image non disponible","project.imageOf":"Image de","project.imageRequestAdditional":"Demander une image supplémentaire","project.imageRequestSent":"Demande d\'image envoyée","project.imageRequestSuccess":["Demande d\'image ","action"," avec succès"],"project.imageRequestUpload":"Téléverser une image","project.imageUploadFailedWarning":"Le téléversement de l\'image a échoué. Équipement enregistré sans image.","project.imagesUploadedSuccess":["","count"," image(s) téléversée(s) avec succès"],"project.importanceFactor":"Facteur d\'importance","project.insufficient":"insuffisant","project.largerAnchorsHave":"Les ancrages plus grands ont :","project.largerDiameter":"diamètre plus grand","project.largerOfTwoEmbedments":"La plus grande des deux valeurs d\'encastrement","project.largestCableInsufficient":"Le plus grand câble disponible est insuffisant","project.lateralForce":"Force latérale","project.lateralForceCalcTitle":"Calcul de la force sismique latérale","project.lbsMinBreakingStrength":"lbs résistance à la rupture min","project.lbsPerBolt":"lb/boulon","project.limitedBetweenPerNBC":"limité entre les valeurs min et max selon le CNB","project.maxImagesAllowed":["Maximum ","max"," images autorisées"],"project.maxImagesReached":["Maximum de ","max"," images atteint"],"project.maxImagesReachedCount":["Max ","max"," images atteint"],"project.maxImagesReachedShort":"Maximum d\'images atteint","project.maximumLength":"Longueur maximale","project.maximumShear":"Cisaillement maximal","project.maximumTension":"Tension maximale","project.maxLength":"Longueur max","project.maxUnbraced":"Max. sans contreventement","project.maxUnbracedLength":"Longueur max sans contreventement","project.microphoneAccessDenied":"Accès au microphone refusé","project.minimumEmbedment":"Encastrement minimal","project.minimumEmbedmentAnalysis":"Analyse d\'encastrement minimal","project.missingEquipmentOrInstallData":"Données d\'équipement ou d\'installation manquantes","project.missingPipeTypeData":"Données de type de tuyau manquantes","project.momentOfInertia":"Moment d\'inertie","project.moreEmbedmentOptions":"Plus d\'options de profondeur d\'encastrement","project.neitherCapacityAdequate":"Aucune capacité n\'est adéquate","project.newBadge":"Nouveau","project.newImage":"Nouvelle image","project.noCalculationsForType":"Aucun calcul disponible pour ce type d\'équipement","project.noEquipmentSelected":"Aucun équipement sélectionné","project.noEquipmentYet":"Aucun équipement ajouté pour l\'instant","project.noImagesYet":"Aucune image pour l\'instant","project.noPermissionAddEquipment":"Vous n\'avez pas la permission d\'ajouter de l\'équipement","project.noPermissionDeleteEquipment":"Vous n\'avez pas la permission de supprimer l\'équipement","project.noPermissionEditEquipment":"Vous n\'avez pas la permission de modifier l\'équipement","project.noPermissionModify":"Vous n\'avez pas la permission de modifier ce projet","project.noteWeightNotIncluded":"Note : Poids de l\'équipement non inclus pour les équipements montés au plafond","project.numberOfAnchorBolts":"Nombre de boulons d\'ancrage","project.ofEquipmentHeight":"de la hauteur de l\'équipement","project.oneOrMoreFormulasFail":"Une ou plusieurs formules échouent","project.onlyAdminsCanRequestImages":"Seuls les administrateurs peuvent demander des images","project.onlyMoreImagesCanBeAdded":["Seulement ","count"," image(s) supplémentaire(s) peut être ajoutée"],"project.onlyUploadingImages":["Téléversement de ","count"," images seulement (max ","max",")"],"project.orClickButtonToSelect":"ou cliquer sur le bouton pour sélectionner","project.otmCalcTitle":"Calcul du moment de renversement (OTM)","project.overallStatus":"Statut global","project.overturningAnalysis":"Analyse de renversement","project.overturningMoment":"Moment de renversement","project.overturningOnlyRigid":"L\'analyse de renversement n\'est disponible que pour le montage rigide (sans isolateurs)","project.parameters":"Paramètres","project.pass":"RÉUSSI","project.pcCalcTitle":"Calcul de Pc (force de compression maximale)","project.pdfGenerationTimedOut":"La génération du PDF a expiré","project.pipe":"Tuyau","project.pipeWeightExceedsTableLimits":"Le poids du tuyau dépasse les limites du tableau","project.pipeWeightExceedsTableWarning":"⚠ Le poids du tuyau dépasse les limites du tableau","project.pipeWeightLabel":"Poids du tuyau","project.pleaseEnterEquipmentName":"Veuillez entrer le nom de l\'équipement","project.pleaseEnterValidFloors":"Veuillez entrer un nombre d\'étages valide","project.pleaseEnterValidPipeWeight":"Veuillez entrer un poids de tuyau valide","project.pleaseSelectPipeDiameter":"Veuillez sélectionner un diamètre de tuyau","project.pleaseSelectPipeType":"Veuillez sélectionner un type de tuyau","project.pleaseSelectValidImages":"Veuillez sélectionner des fichiers image valides","project.prestretchedCable":"Câble prétendu","project.problem":"Problème","project.processingImages":["Traitement de ","count"," image(s)..."],"project.psCalcTitle":"Calcul de Ps (force de cisaillement par ancrage)","project.reason":"Raison","project.recommendation":"Recommandation","project.reference":"Référence","project.removeImageToAddMore":"Supprimer une image pour en ajouter d\'autres","project.requestImage":"Demander une image","project.requiredForces":"Forces requises","project.requiredMinEmbedment":"Encastrement min. requis","project.requiredShear":"Cisaillement requis","project.requiredTension":"Tension requise","project.requiredValues":"Valeurs requises","project.requirements":"Exigences","project.rerunAnalysis":"Relancer l\'analyse","project.resistingMoment":"Moment résistant","project.responseModificationFactor":"Facteur de modification de réponse","project.result":"Résultat","project.rmCalcTitle":"Calcul du moment résistant (RM)","project.sameAsPtCalc":"Identique au calcul Pt","project.seismic":"Sismique","project.seismicLevel":"Niveau sismique","project.seismicLoad":"Charge sismique","project.seismicRiskCoeff":"Coefficient de risque sismique","project.selectNBCCategory":"Sélectionner la catégorie NBC...","project.shearCalcTitle":"Calcul du cisaillement du boulon d\'ancrage (V)","project.shoppingList":"Liste d\'achats","project.siteAccelerationCoeff":"Coefficient d\'accélération du site","project.solidBrace":"Contreventement rigide","project.solidBraceOption":"Option de contreventement rigide","project.solidBraceOptions":"Options de contreventement rigide","project.solution":"Solution","project.spectralResponseValue":"Valeur de réponse spectrale","project.standardCable":"Câble standard","project.steel":"Acier","project.steelAngle":"Cornière d\'acier","project.steelFailure":"Rupture de l\'acier","project.steelFailureEmbedmentTitle":"Analyse d\'encastrement - Rupture de l\'acier","project.steelSeismicShearCapacity":"Capacité sismique en cisaillement de l\'acier","project.steelStructure":"Structure en acier","project.steelTensileCapacity":"Capacité en traction de l\'acier","project.step":"Étape","project.structuralConnection":"Connexion structurale","project.structuralConnections":"Connexions structurales","project.sum":"Somme","project.suspendedEquipmentBracing":"Contreventement d\'équipement suspendu","project.suspendedEquipmentBracingASHRAE10":"Contreventement d\'équipement suspendu (ASHRAE Ch. 10)","project.suspendedPipingBracing":"Contreventement de tuyauterie suspendue","project.suspendedPipingBracingSpecs":"Spécifications de contreventement de tuyauterie suspendue","project.tableRefExpansionConcrete":"HILTI Ancrage à expansion - Tableau d\'encastrement dans le béton","project.tableRefExpansionSteel":"HILTI Ancrage à expansion - Tableau d\'encastrement dans l\'acier","project.tableRefScrewConcrete":"HILTI Ancrage à vis - Tableau d\'encastrement dans le béton","project.tableRefScrewSteel":"HILTI Ancrage à vis - Tableau d\'encastrement dans l\'acier","project.tensileStrength":"Résistance en traction","project.tensionCalcTitle":"Calcul de la tension du boulon d\'ancrage (T)","project.tensionCapacity":"Capacité en tension","project.thimble":"Cosse","project.totalShear":"Cisaillement total","project.totalTension":"Tension totale","project.tryLargerAnchor":["Essayez un ancrage ","size",""],"project.turnbuckle":"Ridoir","project.type31VibrationIsolatorsSnubbers":"Isolateurs de vibration / Amortisseurs Type 3-1","project.type32VibrationIsolators":"Isolateurs de vibration Type 3-2","project.uploadImage":"Téléverser une image","project.useEmbedmentGreaterThan":["Utiliser une profondeur d\'encastrement supérieure à ","value","\\""],"project.useLargerAnchorDiameter":"Utiliser un diamètre d\'ancrage plus grand","project.useLargerDiameterAndReanalyze":"Utiliser un diamètre plus grand et réanalyser","project.valuesUsed":"Valeurs utilisées","project.verticalForce":"Force verticale","project.verticalSeismicForce":"Force sismique verticale","project.vibrationIsolatedEquipment":"Équipement à isolation de vibration","project.viewImage":"Voir l\'image","project.voiceInputNotSupported":"La saisie vocale n\'est pas prise en charge dans ce navigateur","project.widthLower":"largeur","project.workingLoad":"Charge de travail","project.workLoadLimit":"Charge de travail limite","project.worstAngle":"Angle critique","project.noSufficientEmbedmentFound":"Aucun encastrement suffisant trouvé"}');
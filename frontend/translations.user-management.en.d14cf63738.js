@@ -0,0 +1,2 @@
+// Generated by _replace_strings.py --build-translations. Do not edit.
+(self.translationsFlat || (self.translationsFlat = {}))["en"] = JSON.parse('{"common.loadingUsers":"Loading users...","common.dashboard":"Dashboard","common.admin":"ADMIN","common.limited":"LIMITED","common.thisIsYou":"This is you","nav.backToDashboard":"Back to Dashboard","domains.plumbing":"Plumbing","domains.electricity":"Electricity","domains.interiorSystem":"Interior System","domains.sprinklers":"Sprinklers","domains.ventilation":"Ventilation","users.userManagement":"User Management","users.searchUsers":"Search users by name or email...","users.allUsers":"All Users","users.adminsOnly":"Admins Only","users.regularUsers":"Regular Users","users.limitedUsers":"Limited Users","users.allDomains":"All Domains","users.totalUsers":"Total Users","users.admins":"Admins","users.regular":"Regular","users.limited":"Limited","users.company":"Company:","users.domainLabel":"Domain:","users.joined":"Joined:","users.approve":"Approve","users.promoteToAdmin":"Promote to Admin","users.demoteToRegular":"Demote to Regular","users.demoteToLimited":"Demote to Limited","users.promoteToRegular":"Promote to Regular","users.deleteUser":"Delete User","users.noUsersFound":"No users found matching your criteria.","users.accessDenied":"Access denied. Admin privileges required.","users.cannotDemoteSelf":"You cannot demote yourself!","users.cannotDeleteSelf":"You cannot delete yourself!","users.confirmPromote":["Are you sure you want to promote ","email"," to admin?"],"users.confirmDemote":["Are you sure you want to remove admin privileges from ","email","?"],"users.confirmDemoteToLimited":["Are you sure you want to demote ","email"," to limited user?\\n\\nLimited users can only access CFSS projects with simplified features."],"users.confirmPromoteToRegular":["Are you sure you want to promote ","email"," to regular user?"],"users.confirmDelete":["Are you sure you want to permanently delete ","email","?\\n\\nThis action cannot be undone."],"users.confirmApprove":["Approve account for ","email","?"],"users.deletedSuccess":["","email"," has been permanently deleted!"],"users.approvedSuccess":["","email"," has been approved and can now log in!"],"users.errorPromoting":"Error promoting user: ","users.errorDemoting":"Error demoting user: ","users.errorDeleting":"Error deleting user: ","users.errorApproving":"Error approving user: ","users.errorDemotingToLimited":"Error demoting user to limited: ","users.errorPromotingToRegular":"Error promoting user to regular: ","users.adminDeleteWarning":["","email"," is an ADMIN user.\\n\\nTo safely delete an admin:\\n1. First demote them to regular user\\n2. Then delete them\\nWould you like to demote them first?"],"users.sampleDataWarning":"Could not load real users from API. Showing sample data instead.\\n\\nThis is normal in demo mode. Click \\"Toggle Debug\\" to see technical details."}');
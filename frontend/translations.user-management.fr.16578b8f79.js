@@ -0,0 +1,2 @@
+// Generated by _replace_strings.py --build-translations. Do not edit.
+(self.translationsFlat || (self.translationsFlat = {}))["fr"] = JSON.parse('{"common.loadingUsers":"Chargement des utilisateurs...","common.dashboard":"Tableau de bord","common.admin":"ADMIN","common.limited":"LIMITÉ","common.thisIsYou":"C\'est vous","nav.backToDashboard":"Retour au tableau de bord","domains.plumbing":"Plomberie","domains.electricity":"Électricité","domains.interiorSystem":"Système intérieur","domains.sprinklers":"Gicleurs","domains.ventilation":"Ventilation","users.userManagement":"Gestion des utilisateurs","users.searchUsers":"Rechercher par nom ou courriel...","users.allUsers":"Tous les utilisateurs","users.adminsOnly":"Administrateurs seulement","users.regularUsers":"Utilisateurs réguliers","users.limitedUsers":"Utilisateurs limités","users.allDomains":"Tous les domaines","users.totalUsers":"Total utilisateurs","users.admins":"Admins","users.regular":"Régulier","users.limited":"Limité","users.company":"Entreprise :","users.domainLabel":"Domaine :","users.joined":"Inscrit :","users.approve":"Approuver","users.promoteToAdmin":"Promouvoir en admin","users.demoteToRegular":"Rétrograder en régulier","users.demoteToLimited":"Rétrograder en limité","users.promoteToRegular":"Promouvoir en régulier","users.deleteUser":"Supprimer l\'utilisateur","users.noUsersFound":"Aucun utilisateur trouvé correspondant à vos critères.","users.accessDenied":"Accès refusé. Privilèges d\'administrateur requis.","users.cannotDemoteSelf":"Vous ne pouvez pas vous rétrograder vous-même !","users.cannotDeleteSelf":"Vous ne pouvez pas vous supprimer vous-même !","users.confirmPromote":["Êtes-vous sûr de vouloir promouvoir ","email"," en administrateur ?"],"users.confirmDemote":["Êtes-vous sûr de vouloir retirer les privilèges d\'administrateur de ","email"," ?"],"users.confirmDemoteToLimited":["Êtes-vous sûr de vouloir rétrograder ","email"," en utilisateur limité ?\\n\\nLes utilisateurs limités ne peuvent accéder qu\'aux projets CFSS avec des fonctionnalités simplifiées."],"users.confirmPromoteToRegular":["Êtes-vous sûr de vouloir promouvoir ","email"," en utilisateur régulier ?"],"users.confirmDelete":["Êtes-vous sûr de vouloir supprimer définitivement ","email"," ?\\n\\nCette action est irréversible."],"users.confirmApprove":["Approuver le compte de ","email"," ?"],"users.deletedSuccess":["","email"," a été supprimé définitivement !"],"users.approvedSuccess":["","email"," a été approuvé et peut maintenant se connecter !"],"users.errorPromoting":"Erreur lors de la promotion : ","users.errorDemoting":"Erreur lors de la rétrogradation : ","users.errorDeleting":"Erreur lors de la suppression : ","users.errorApproving":"Erreur lors de l\'approbation : ","users.errorDemotingToLimited":"Erreur lors de la rétrogradation en limité : ","users.errorPromotingToRegular":"Erreur lors de la promotion en régulier : ","users.adminDeleteWarning":["","email"," est un utilisateur ADMIN.\\n\\nPour supprimer un admin en toute sécurité :\\n1. D\'abord le rétrograder en utilisateur régulier\\n2. Ensuite le supprimer\\nVoulez-vous d\'abord le rétrograder ?"],"users.sampleDataWarning":"Impossible de charger les utilisateurs réels depuis l\'API. Affichage de données d\'exemple.\\n\\nCeci est normal en mode démonstration. Cliquez sur « Basculer débogage » pour les détails techniques."}');